@@ -5,6 +5,10 @@ from typing import List, Optional
 from definition_tooling.converter import CamelCaseModel, DataProductDefinition
 from pydantic import Field
 
+from codelists.iso3166 import ISO_3166_1_Alpha_2
+from codelists.legal_forms import EntityLegalForm
+from codelists.nace import Activity
+
 
 class BasicInformationRequest(CamelCaseModel):
     national_identifier: str = Field(
@@ -15,4513 +19,6 @@ class BasicInformationRequest(CamelCaseModel):
     )
 
 
-class EntityLegalForm(str, Enum):
-    ISO_20275_8888 = "8888"
-    ISO_20275_9999 = "9999"
-    ISO_20275_CDOV = "CDOV"
-    ISO_20275_F0A6 = "F0A6"
-    ISO_20275_HZ6C = "HZ6C"
-    ISO_20275_WUAZ = "WUAZ"
-    ISO_20275_CRL9 = "CRL9"
-    ISO_20275_CYW2 = "CYW2"
-    ISO_20275_GAJN = "GAJN"
-    ISO_20275_M27U = "M27U"
-    ISO_20275_OLAI = "OLAI"
-    ISO_20275_P65N = "P65N"
-    ISO_20275_PCRJ = "PCRJ"
-    ISO_20275_PT6C = "PT6C"
-    ISO_20275_REUP = "REUP"
-    ISO_20275_T5RL = "T5RL"
-    ISO_20275_UV8T = "UV8T"
-    ISO_20275_V905 = "V905"
-    ISO_20275_YCV2 = "YCV2"
-    ISO_20275_6W6X = "6W6X"
-    ISO_20275_7TPC = "7TPC"
-    ISO_20275_ADXG = "ADXG"
-    ISO_20275_BC38 = "BC38"
-    ISO_20275_J4JC = "J4JC"
-    ISO_20275_LZFR = "LZFR"
-    ISO_20275_PQHL = "PQHL"
-    ISO_20275_Q82Q = "Q82Q"
-    ISO_20275_R4KK = "R4KK"
-    ISO_20275_TXVC = "TXVC"
-    ISO_20275_XHCV = "XHCV"
-    ISO_20275_1NOX = "1NOX"
-    ISO_20275_5WWO = "5WWO"
-    ISO_20275_69H1 = "69H1"
-    ISO_20275_8XDW = "8XDW"
-    ISO_20275_AAL7 = "AAL7"
-    ISO_20275_AXSB = "AXSB"
-    ISO_20275_CAQ1 = "CAQ1"
-    ISO_20275_DM88 = "DM88"
-    ISO_20275_DX6Z = "DX6Z"
-    ISO_20275_E9OX = "E9OX"
-    ISO_20275_ECWU = "ECWU"
-    ISO_20275_EQOV = "EQOV"
-    ISO_20275_G3R6 = "G3R6"
-    ISO_20275_GVPD = "GVPD"
-    ISO_20275_JJYT = "JJYT"
-    ISO_20275_JQOI = "JQOI"
-    ISO_20275_JTAV = "JTAV"
-    ISO_20275_JUHG = "JUHG"
-    ISO_20275_NIJH = "NIJH"
-    ISO_20275_NNLI = "NNLI"
-    ISO_20275_O65B = "O65B"
-    ISO_20275_ONF1 = "ONF1"
-    ISO_20275_UI81 = "UI81"
-    ISO_20275_52TH = "52TH"
-    ISO_20275_6JHZ = "6JHZ"
-    ISO_20275_DWEA = "DWEA"
-    ISO_20275_HKL3 = "HKL3"
-    ISO_20275_K81Q = "K81Q"
-    ISO_20275_M4LU = "M4LU"
-    ISO_20275_MEJT = "MEJT"
-    ISO_20275_PITR = "PITR"
-    ISO_20275_SLXJ = "SLXJ"
-    ISO_20275_TD56 = "TD56"
-    ISO_20275_U0SP = "U0SP"
-    ISO_20275_ZD74 = "ZD74"
-    ISO_20275_1W6I = "1W6I"
-    ISO_20275_78QF = "78QF"
-    ISO_20275_98A8 = "98A8"
-    ISO_20275_A9N4 = "A9N4"
-    ISO_20275_DAEG = "DAEG"
-    ISO_20275_HNSU = "HNSU"
-    ISO_20275_HP0B = "HP0B"
-    ISO_20275_PB7W = "PB7W"
-    ISO_20275_PICJ = "PICJ"
-    ISO_20275_SQ8U = "SQ8U"
-    ISO_20275_VVOW = "VVOW"
-    ISO_20275_XDKS = "XDKS"
-    ISO_20275_2T7B = "2T7B"
-    ISO_20275_5IL6 = "5IL6"
-    ISO_20275_7FCS = "7FCS"
-    ISO_20275_EKJG = "EKJG"
-    ISO_20275_HTBY = "HTBY"
-    ISO_20275_KYFD = "KYFD"
-    ISO_20275_Q9Y1 = "Q9Y1"
-    ISO_20275_T4KB = "T4KB"
-    ISO_20275_TEPY = "TEPY"
-    ISO_20275_X2X1 = "X2X1"
-    ISO_20275_106J = "106J"
-    ISO_20275_9X63 = "9X63"
-    ISO_20275_AABD = "AABD"
-    ISO_20275_JLR3 = "JLR3"
-    ISO_20275_MR85 = "MR85"
-    ISO_20275_1TX8 = "1TX8"
-    ISO_20275_28FE = "28FE"
-    ISO_20275_2QSA = "2QSA"
-    ISO_20275_36KV = "36KV"
-    ISO_20275_3LMA = "3LMA"
-    ISO_20275_3N94 = "3N94"
-    ISO_20275_3W7E = "3W7E"
-    ISO_20275_4E5P = "4E5P"
-    ISO_20275_7SJP = "7SJP"
-    ISO_20275_8E2A = "8E2A"
-    ISO_20275_8YLB = "8YLB"
-    ISO_20275_B910 = "B910"
-    ISO_20275_C609 = "C609"
-    ISO_20275_CFH5 = "CFH5"
-    ISO_20275_EDMK = "EDMK"
-    ISO_20275_EXY8 = "EXY8"
-    ISO_20275_J5OU = "J5OU"
-    ISO_20275_JAM3 = "JAM3"
-    ISO_20275_JNAD = "JNAD"
-    ISO_20275_KLBO = "KLBO"
-    ISO_20275_KM6O = "KM6O"
-    ISO_20275_L05H = "L05H"
-    ISO_20275_LWHF = "LWHF"
-    ISO_20275_LWV6 = "LWV6"
-    ISO_20275_MQH3 = "MQH3"
-    ISO_20275_N5NT = "N5NT"
-    ISO_20275_O59C = "O59C"
-    ISO_20275_O5HQ = "O5HQ"
-    ISO_20275_PVT3 = "PVT3"
-    ISO_20275_QZIS = "QZIS"
-    ISO_20275_R85P = "R85P"
-    ISO_20275_T922 = "T922"
-    ISO_20275_TPTU = "TPTU"
-    ISO_20275_U2PN = "U2PN"
-    ISO_20275_U5KF = "U5KF"
-    ISO_20275_UCT9 = "UCT9"
-    ISO_20275_UW1Y = "UW1Y"
-    ISO_20275_V03J = "V03J"
-    ISO_20275_V7FT = "V7FT"
-    ISO_20275_V8L7 = "V8L7"
-    ISO_20275_W3WH = "W3WH"
-    ISO_20275_WTLP = "WTLP"
-    ISO_20275_X8ZK = "X8ZK"
-    ISO_20275_XLEO = "XLEO"
-    ISO_20275_XQZX = "XQZX"
-    ISO_20275_Y1Q4 = "Y1Q4"
-    ISO_20275_YBHM = "YBHM"
-    ISO_20275_ZOK2 = "ZOK2"
-    ISO_20275_ZSFX = "ZSFX"
-    ISO_20275_ZUHK = "ZUHK"
-    ISO_20275_84DD = "84DD"
-    ISO_20275_AO0O = "AO0O"
-    ISO_20275_D1SL = "D1SL"
-    ISO_20275_EAD0 = "EAD0"
-    ISO_20275_GJKF = "GJKF"
-    ISO_20275_ZHT0 = "ZHT0"
-    ISO_20275_7AS7 = "7AS7"
-    ISO_20275_7HCE = "7HCE"
-    ISO_20275_7MGJ = "7MGJ"
-    ISO_20275_9TCY = "9TCY"
-    ISO_20275_ASR5 = "ASR5"
-    ISO_20275_CW38 = "CW38"
-    ISO_20275_EURM = "EURM"
-    ISO_20275_LC2L = "LC2L"
-    ISO_20275_MBVS = "MBVS"
-    ISO_20275_NAQG = "NAQG"
-    ISO_20275_UZWE = "UZWE"
-    ISO_20275_VFXJ = "VFXJ"
-    ISO_20275_WF3Q = "WF3Q"
-    ISO_20275_ZLTD = "ZLTD"
-    ISO_20275_38JQ = "38JQ"
-    ISO_20275_5T3W = "5T3W"
-    ISO_20275_70BS = "70BS"
-    ISO_20275_DSML = "DSML"
-    ISO_20275_JYAN = "JYAN"
-    ISO_20275_LJYQ = "LJYQ"
-    ISO_20275_LN9O = "LN9O"
-    ISO_20275_MGOU = "MGOU"
-    ISO_20275_PJ29 = "PJ29"
-    ISO_20275_PM48 = "PM48"
-    ISO_20275_RXJN = "RXJN"
-    ISO_20275_TNHO = "TNHO"
-    ISO_20275_XTCQ = "XTCQ"
-    ISO_20275_1A0A = "1A0A"
-    ISO_20275_3Y5C = "3Y5C"
-    ISO_20275_4S4Z = "4S4Z"
-    ISO_20275_4ZBE = "4ZBE"
-    ISO_20275_51WZ = "51WZ"
-    ISO_20275_56MU = "56MU"
-    ISO_20275_92JZ = "92JZ"
-    ISO_20275_AS4W = "AS4W"
-    ISO_20275_B2UK = "B2UK"
-    ISO_20275_DQMJ = "DQMJ"
-    ISO_20275_FCPM = "FCPM"
-    ISO_20275_IPTQ = "IPTQ"
-    ISO_20275_JFQ5 = "JFQ5"
-    ISO_20275_KSHL = "KSHL"
-    ISO_20275_NPFB = "NPFB"
-    ISO_20275_SNRI = "SNRI"
-    ISO_20275_VHIY = "VHIY"
-    ISO_20275_X088 = "X088"
-    ISO_20275_XL51 = "XL51"
-    ISO_20275_4IXL = "4IXL"
-    ISO_20275_771I = "771I"
-    ISO_20275_QK1F = "QK1F"
-    ISO_20275_Y2L3 = "Y2L3"
-    ISO_20275_4LKN = "4LKN"
-    ISO_20275_529B = "529B"
-    ISO_20275_8GEA = "8GEA"
-    ISO_20275_9BIS = "9BIS"
-    ISO_20275_ANHM = "ANHM"
-    ISO_20275_I4T1 = "I4T1"
-    ISO_20275_J7G9 = "J7G9"
-    ISO_20275_OB5J = "OB5J"
-    ISO_20275_PC5A = "PC5A"
-    ISO_20275_QHW1 = "QHW1"
-    ISO_20275_WBEC = "WBEC"
-    ISO_20275_X0SD = "X0SD"
-    ISO_20275_X2ZT = "X2ZT"
-    ISO_20275_XQRI = "XQRI"
-    ISO_20275_2DGO = "2DGO"
-    ISO_20275_EULU = "EULU"
-    ISO_20275_3FUP = "3FUP"
-    ISO_20275_3HLJ = "3HLJ"
-    ISO_20275_3SHX = "3SHX"
-    ISO_20275_45D7 = "45D7"
-    ISO_20275_946C = "946C"
-    ISO_20275_9F78 = "9F78"
-    ISO_20275_CTCH = "CTCH"
-    ISO_20275_EJ06 = "EJ06"
-    ISO_20275_FPP2 = "FPP2"
-    ISO_20275_HN63 = "HN63"
-    ISO_20275_LECS = "LECS"
-    ISO_20275_O15N = "O15N"
-    ISO_20275_PW3Y = "PW3Y"
-    ISO_20275_QZAU = "QZAU"
-    ISO_20275_RYDY = "RYDY"
-    ISO_20275_S94S = "S94S"
-    ISO_20275_SZW0 = "SZW0"
-    ISO_20275_TCGV = "TCGV"
-    ISO_20275_U8LM = "U8LM"
-    ISO_20275_UFG8 = "UFG8"
-    ISO_20275_VJ3G = "VJ3G"
-    ISO_20275_WTK4 = "WTK4"
-    ISO_20275_WVIN = "WVIN"
-    ISO_20275_15BP = "15BP"
-    ISO_20275_BQ0P = "BQ0P"
-    ISO_20275_D3UY = "D3UY"
-    ISO_20275_KD84 = "KD84"
-    ISO_20275_Z4YC = "Z4YC"
-    ISO_20275_ZCFU = "ZCFU"
-    ISO_20275_1EQC = "1EQC"
-    ISO_20275_60MF = "60MF"
-    ISO_20275_8ZH8 = "8ZH8"
-    ISO_20275_94UQ = "94UQ"
-    ISO_20275_B69V = "B69V"
-    ISO_20275_BASA = "BASA"
-    ISO_20275_BH5D = "BH5D"
-    ISO_20275_C9KZ = "C9KZ"
-    ISO_20275_DK7L = "DK7L"
-    ISO_20275_G65S = "G65S"
-    ISO_20275_J3C5 = "J3C5"
-    ISO_20275_K1QX = "K1QX"
-    ISO_20275_KVC1 = "KVC1"
-    ISO_20275_PXPK = "PXPK"
-    ISO_20275_R0KX = "R0KX"
-    ISO_20275_RHVP = "RHVP"
-    ISO_20275_RN4K = "RN4K"
-    ISO_20275_TRO6 = "TRO6"
-    ISO_20275_TS9O = "TS9O"
-    ISO_20275_U938 = "U938"
-    ISO_20275_VHXN = "VHXN"
-    ISO_20275_1CML = "1CML"
-    ISO_20275_23V9 = "23V9"
-    ISO_20275_AW80 = "AW80"
-    ISO_20275_F9J3 = "F9J3"
-    ISO_20275_HLBQ = "HLBQ"
-    ISO_20275_LNBY = "LNBY"
-    ISO_20275_LRRN = "LRRN"
-    ISO_20275_O13B = "O13B"
-    ISO_20275_OTU7 = "OTU7"
-    ISO_20275_QODJ = "QODJ"
-    ISO_20275_S3K4 = "S3K4"
-    ISO_20275_TGLV = "TGLV"
-    ISO_20275_WFPH = "WFPH"
-    ISO_20275_XOYI = "XOYI"
-    ISO_20275_YG5M = "YG5M"
-    ISO_20275_59T2 = "59T2"
-    ISO_20275_6TRA = "6TRA"
-    ISO_20275_D90J = "D90J"
-    ISO_20275_M4IF = "M4IF"
-    ISO_20275_MGE0 = "MGE0"
-    ISO_20275_UDLA = "UDLA"
-    ISO_20275_5ONY = "5ONY"
-    ISO_20275_9D1K = "9D1K"
-    ISO_20275_FN6X = "FN6X"
-    ISO_20275_G9PJ = "G9PJ"
-    ISO_20275_GM04 = "GM04"
-    ISO_20275_HBCT = "HBCT"
-    ISO_20275_LV28 = "LV28"
-    ISO_20275_MXLT = "MXLT"
-    ISO_20275_OPRT = "OPRT"
-    ISO_20275_RBBY = "RBBY"
-    ISO_20275_SS1V = "SS1V"
-    ISO_20275_Y485 = "Y485"
-    ISO_20275_3Q15 = "3Q15"
-    ISO_20275_40JO = "40JO"
-    ISO_20275_44LR = "44LR"
-    ISO_20275_4M62 = "4M62"
-    ISO_20275_56KZ = "56KZ"
-    ISO_20275_64XG = "64XG"
-    ISO_20275_6U2Q = "6U2Q"
-    ISO_20275_7P8Y = "7P8Y"
-    ISO_20275_8MEC = "8MEC"
-    ISO_20275_AXW3 = "AXW3"
-    ISO_20275_B3RX = "B3RX"
-    ISO_20275_D8UQ = "D8UQ"
-    ISO_20275_DHGI = "DHGI"
-    ISO_20275_EKRT = "EKRT"
-    ISO_20275_EPFN = "EPFN"
-    ISO_20275_FGSL = "FGSL"
-    ISO_20275_GF6X = "GF6X"
-    ISO_20275_GLX2 = "GLX2"
-    ISO_20275_GPG0 = "GPG0"
-    ISO_20275_IDBS = "IDBS"
-    ISO_20275_IKMB = "IKMB"
-    ISO_20275_IKSU = "IKSU"
-    ISO_20275_ILON = "ILON"
-    ISO_20275_JBBW = "JBBW"
-    ISO_20275_M53U = "M53U"
-    ISO_20275_MY4W = "MY4W"
-    ISO_20275_NONB = "NONB"
-    ISO_20275_QJ3A = "QJ3A"
-    ISO_20275_QNSC = "QNSC"
-    ISO_20275_TSQ7 = "TSQ7"
-    ISO_20275_WI0P = "WI0P"
-    ISO_20275_ZACY = "ZACY"
-    ISO_20275_ZY4E = "ZY4E"
-    ISO_20275_1E9M = "1E9M"
-    ISO_20275_3Y5V = "3Y5V"
-    ISO_20275_ASWX = "ASWX"
-    ISO_20275_EBYQ = "EBYQ"
-    ISO_20275_ER0H = "ER0H"
-    ISO_20275_GTBR = "GTBR"
-    ISO_20275_IKGM = "IKGM"
-    ISO_20275_SYPT = "SYPT"
-    ISO_20275_1ADH = "1ADH"
-    ISO_20275_85EC = "85EC"
-    ISO_20275_CS15 = "CS15"
-    ISO_20275_KAM9 = "KAM9"
-    ISO_20275_PIDT = "PIDT"
-    ISO_20275_QN8Y = "QN8Y"
-    ISO_20275_QR4F = "QR4F"
-    ISO_20275_TA98 = "TA98"
-    ISO_20275_TPZ2 = "TPZ2"
-    ISO_20275_VAPN = "VAPN"
-    ISO_20275_W126 = "W126"
-    ISO_20275_2FHC = "2FHC"
-    ISO_20275_3M14 = "3M14"
-    ISO_20275_42GN = "42GN"
-    ISO_20275_876U = "876U"
-    ISO_20275_8M03 = "8M03"
-    ISO_20275_8OZ0 = "8OZ0"
-    ISO_20275_9XHE = "9XHE"
-    ISO_20275_FQJ9 = "FQJ9"
-    ISO_20275_GG0S = "GG0S"
-    ISO_20275_T0CV = "T0CV"
-    ISO_20275_TY0S = "TY0S"
-    ISO_20275_ULJ1 = "ULJ1"
-    ISO_20275_W8XG = "W8XG"
-    ISO_20275_Y80K = "Y80K"
-    ISO_20275_1JGX = "1JGX"
-    ISO_20275_456Q = "456Q"
-    ISO_20275_7VKC = "7VKC"
-    ISO_20275_BOYK = "BOYK"
-    ISO_20275_CMB6 = "CMB6"
-    ISO_20275_EIDL = "EIDL"
-    ISO_20275_ESVK = "ESVK"
-    ISO_20275_FBQL = "FBQL"
-    ISO_20275_HQKE = "HQKE"
-    ISO_20275_O90R = "O90R"
-    ISO_20275_PCO0 = "PCO0"
-    ISO_20275_487P = "487P"
-    ISO_20275_5SGE = "5SGE"
-    ISO_20275_790T = "790T"
-    ISO_20275_CUQF = "CUQF"
-    ISO_20275_E281 = "E281"
-    ISO_20275_HK03 = "HK03"
-    ISO_20275_I5NO = "I5NO"
-    ISO_20275_JOGO = "JOGO"
-    ISO_20275_LT1Y = "LT1Y"
-    ISO_20275_N745 = "N745"
-    ISO_20275_PFPW = "PFPW"
-    ISO_20275_QZMH = "QZMH"
-    ISO_20275_W4DB = "W4DB"
-    ISO_20275_X6N9 = "X6N9"
-    ISO_20275_Y33B = "Y33B"
-    ISO_20275_10UR = "10UR"
-    ISO_20275_16GH = "16GH"
-    ISO_20275_16RL = "16RL"
-    ISO_20275_1VTA = "1VTA"
-    ISO_20275_27WJ = "27WJ"
-    ISO_20275_2ODA = "2ODA"
-    ISO_20275_2U3G = "2U3G"
-    ISO_20275_30IT = "30IT"
-    ISO_20275_3C5P = "3C5P"
-    ISO_20275_3FP6 = "3FP6"
-    ISO_20275_4B4B = "4B4B"
-    ISO_20275_50Z9 = "50Z9"
-    ISO_20275_52CK = "52CK"
-    ISO_20275_6ZCO = "6ZCO"
-    ISO_20275_702U = "702U"
-    ISO_20275_814Y = "814Y"
-    ISO_20275_87OW = "87OW"
-    ISO_20275_95EN = "95EN"
-    ISO_20275_9CB2 = "9CB2"
-    ISO_20275_9CEN = "9CEN"
-    ISO_20275_9IF2 = "9IF2"
-    ISO_20275_A7KA = "A7KA"
-    ISO_20275_AS7L = "AS7L"
-    ISO_20275_CG81 = "CG81"
-    ISO_20275_CT3J = "CT3J"
-    ISO_20275_D2T8 = "D2T8"
-    ISO_20275_F9CT = "F9CT"
-    ISO_20275_GAMO = "GAMO"
-    ISO_20275_HVWR = "HVWR"
-    ISO_20275_I3UX = "I3UX"
-    ISO_20275_J5SC = "J5SC"
-    ISO_20275_JBU2 = "JBU2"
-    ISO_20275_JI4V = "JI4V"
-    ISO_20275_JLE0 = "JLE0"
-    ISO_20275_JLZW = "JLZW"
-    ISO_20275_JQNA = "JQNA"
-    ISO_20275_JVMD = "JVMD"
-    ISO_20275_JXO5 = "JXO5"
-    ISO_20275_K08P = "K08P"
-    ISO_20275_L26C = "L26C"
-    ISO_20275_L3XH = "L3XH"
-    ISO_20275_LN3N = "LN3N"
-    ISO_20275_MCY8 = "MCY8"
-    ISO_20275_MK1I = "MK1I"
-    ISO_20275_MQT7 = "MQT7"
-    ISO_20275_MR95 = "MR95"
-    ISO_20275_NVXN = "NVXN"
-    ISO_20275_OMUP = "OMUP"
-    ISO_20275_Q8NY = "Q8NY"
-    ISO_20275_QB2W = "QB2W"
-    ISO_20275_RC3D = "RC3D"
-    ISO_20275_RPGT = "RPGT"
-    ISO_20275_RQIC = "RQIC"
-    ISO_20275_S72N = "S72N"
-    ISO_20275_T1LR = "T1LR"
-    ISO_20275_TA7J = "TA7J"
-    ISO_20275_TKAB = "TKAB"
-    ISO_20275_TWLR = "TWLR"
-    ISO_20275_UG3Z = "UG3Z"
-    ISO_20275_UVCG = "UVCG"
-    ISO_20275_V5IH = "V5IH"
-    ISO_20275_V9GU = "V9GU"
-    ISO_20275_VGP6 = "VGP6"
-    ISO_20275_VRVJ = "VRVJ"
-    ISO_20275_WGEA = "WGEA"
-    ISO_20275_XS49 = "XS49"
-    ISO_20275_XW5K = "XW5K"
-    ISO_20275_YBMJ = "YBMJ"
-    ISO_20275_YIIS = "YIIS"
-    ISO_20275_YRUJ = "YRUJ"
-    ISO_20275_Z6MF = "Z6MF"
-    ISO_20275_ZGEX = "ZGEX"
-    ISO_20275_ZQQU = "ZQQU"
-    ISO_20275_ZX1F = "ZX1F"
-    ISO_20275_3OVJ = "3OVJ"
-    ISO_20275_5D9I = "5D9I"
-    ISO_20275_5EEA = "5EEA"
-    ISO_20275_7IKZ = "7IKZ"
-    ISO_20275_7XZL = "7XZL"
-    ISO_20275_8KL5 = "8KL5"
-    ISO_20275_FYYY = "FYYY"
-    ISO_20275_I8VP = "I8VP"
-    ISO_20275_JNCJ = "JNCJ"
-    ISO_20275_KZDW = "KZDW"
-    ISO_20275_L2NN = "L2NN"
-    ISO_20275_LMSY = "LMSY"
-    ISO_20275_UWMY = "UWMY"
-    ISO_20275_4XP8 = "4XP8"
-    ISO_20275_6XB7 = "6XB7"
-    ISO_20275_8HR7 = "8HR7"
-    ISO_20275_JDX6 = "JDX6"
-    ISO_20275_K575 = "K575"
-    ISO_20275_MP7S = "MP7S"
-    ISO_20275_MPUG = "MPUG"
-    ISO_20275_OSBR = "OSBR"
-    ISO_20275_SNUK = "SNUK"
-    ISO_20275_T5UM = "T5UM"
-    ISO_20275_XAQA = "XAQA"
-    ISO_20275_2UZP = "2UZP"
-    ISO_20275_78VN = "78VN"
-    ISO_20275_7T6S = "7T6S"
-    ISO_20275_7ZMX = "7ZMX"
-    ISO_20275_B8OI = "B8OI"
-    ISO_20275_C6AH = "C6AH"
-    ISO_20275_CVDP = "CVDP"
-    ISO_20275_CZCE = "CZCE"
-    ISO_20275_EE3W = "EE3W"
-    ISO_20275_KUUZ = "KUUZ"
-    ISO_20275_OA6N = "OA6N"
-    ISO_20275_Q1J0 = "Q1J0"
-    ISO_20275_QFYC = "QFYC"
-    ISO_20275_RNQ0 = "RNQ0"
-    ISO_20275_VZ3G = "VZ3G"
-    ISO_20275_Y8F1 = "Y8F1"
-    ISO_20275_YDNQ = "YDNQ"
-    ISO_20275_ZHHH = "ZHHH"
-    ISO_20275_1IWK = "1IWK"
-    ISO_20275_2M6Y = "2M6Y"
-    ISO_20275_5A9K = "5A9K"
-    ISO_20275_5GXA = "5GXA"
-    ISO_20275_6KC0 = "6KC0"
-    ISO_20275_6NSC = "6NSC"
-    ISO_20275_8XAW = "8XAW"
-    ISO_20275_B5UZ = "B5UZ"
-    ISO_20275_BDTI = "BDTI"
-    ISO_20275_C38B = "C38B"
-    ISO_20275_CYV6 = "CYV6"
-    ISO_20275_DLEK = "DLEK"
-    ISO_20275_E4FG = "E4FG"
-    ISO_20275_E4YV = "E4YV"
-    ISO_20275_E88S = "E88S"
-    ISO_20275_ECAK = "ECAK"
-    ISO_20275_ESZ8 = "ESZ8"
-    ISO_20275_GGZ5 = "GGZ5"
-    ISO_20275_GPHT = "GPHT"
-    ISO_20275_I39S = "I39S"
-    ISO_20275_IBEM = "IBEM"
-    ISO_20275_LURL = "LURL"
-    ISO_20275_NWJX = "NWJX"
-    ISO_20275_OH9O = "OH9O"
-    ISO_20275_OMUD = "OMUD"
-    ISO_20275_R3O0 = "R3O0"
-    ISO_20275_RV48 = "RV48"
-    ISO_20275_S9UH = "S9UH"
-    ISO_20275_SH05 = "SH05"
-    ISO_20275_T0KK = "T0KK"
-    ISO_20275_TBG2 = "TBG2"
-    ISO_20275_UMCR = "UMCR"
-    ISO_20275_V251 = "V251"
-    ISO_20275_V816 = "V816"
-    ISO_20275_WEUX = "WEUX"
-    ISO_20275_YXJ5 = "YXJ5"
-    ISO_20275_1PAD = "1PAD"
-    ISO_20275_3RHN = "3RHN"
-    ISO_20275_4OYE = "4OYE"
-    ISO_20275_6Z8B = "6Z8B"
-    ISO_20275_D2T3 = "D2T3"
-    ISO_20275_DEJ0 = "DEJ0"
-    ISO_20275_IUIY = "IUIY"
-    ISO_20275_KC51 = "KC51"
-    ISO_20275_KYVO = "KYVO"
-    ISO_20275_N1TE = "N1TE"
-    ISO_20275_SJB8 = "SJB8"
-    ISO_20275_WX45 = "WX45"
-    ISO_20275_70NZ = "70NZ"
-    ISO_20275_A7G6 = "A7G6"
-    ISO_20275_KNIC = "KNIC"
-    ISO_20275_N00R = "N00R"
-    ISO_20275_YCQM = "YCQM"
-    ISO_20275_Z3Y2 = "Z3Y2"
-    ISO_20275_4SFS = "4SFS"
-    ISO_20275_4Y4D = "4Y4D"
-    ISO_20275_72BT = "72BT"
-    ISO_20275_DUXT = "DUXT"
-    ISO_20275_E26K = "E26K"
-    ISO_20275_EFE3 = "EFE3"
-    ISO_20275_G5RR = "G5RR"
-    ISO_20275_H2BW = "H2BW"
-    ISO_20275_HSX9 = "HSX9"
-    ISO_20275_KZMF = "KZMF"
-    ISO_20275_LQVG = "LQVG"
-    ISO_20275_M0X8 = "M0X8"
-    ISO_20275_O4X3 = "O4X3"
-    ISO_20275_P864 = "P864"
-    ISO_20275_Q4J1 = "Q4J1"
-    ISO_20275_SBQF = "SBQF"
-    ISO_20275_SMWM = "SMWM"
-    ISO_20275_YFZL = "YFZL"
-    ISO_20275_YOIW = "YOIW"
-    ISO_20275_YP63 = "YP63"
-    ISO_20275_YW6W = "YW6W"
-    ISO_20275_YYZO = "YYZO"
-    ISO_20275_24EG = "24EG"
-    ISO_20275_274G = "274G"
-    ISO_20275_28RA = "28RA"
-    ISO_20275_2FED = "2FED"
-    ISO_20275_3OW3 = "3OW3"
-    ISO_20275_6Q6D = "6Q6D"
-    ISO_20275_6RD2 = "6RD2"
-    ISO_20275_8VRU = "8VRU"
-    ISO_20275_9D9U = "9D9U"
-    ISO_20275_9PZC = "9PZC"
-    ISO_20275_E9CM = "E9CM"
-    ISO_20275_EYKU = "EYKU"
-    ISO_20275_G5RH = "G5RH"
-    ISO_20275_IVVD = "IVVD"
-    ISO_20275_KP34 = "KP34"
-    ISO_20275_LUMA = "LUMA"
-    ISO_20275_MF7P = "MF7P"
-    ISO_20275_NRTG = "NRTG"
-    ISO_20275_OQWO = "OQWO"
-    ISO_20275_SPJ7 = "SPJ7"
-    ISO_20275_TSA0 = "TSA0"
-    ISO_20275_XQLW = "XQLW"
-    ISO_20275_YA9S = "YA9S"
-    ISO_20275_ZFQS = "ZFQS"
-    ISO_20275_ZMY8 = "ZMY8"
-    ISO_20275_1SVL = "1SVL"
-    ISO_20275_1T06 = "1T06"
-    ISO_20275_2J66 = "2J66"
-    ISO_20275_36AO = "36AO"
-    ISO_20275_5OZV = "5OZV"
-    ISO_20275_9E0Q = "9E0Q"
-    ISO_20275_ADF8 = "ADF8"
-    ISO_20275_IHD0 = "IHD0"
-    ISO_20275_KM1T = "KM1T"
-    ISO_20275_MZB1 = "MZB1"
-    ISO_20275_SS3A = "SS3A"
-    ISO_20275_WV3I = "WV3I"
-    ISO_20275_ZKTC = "ZKTC"
-    ISO_20275_1MBR = "1MBR"
-    ISO_20275_233U = "233U"
-    ISO_20275_8BL9 = "8BL9"
-    ISO_20275_8VZ0 = "8VZ0"
-    ISO_20275_BCF5 = "BCF5"
-    ISO_20275_FV0K = "FV0K"
-    ISO_20275_GLCH = "GLCH"
-    ISO_20275_HIL6 = "HIL6"
-    ISO_20275_I8RE = "I8RE"
-    ISO_20275_INTY = "INTY"
-    ISO_20275_K9L6 = "K9L6"
-    ISO_20275_MYKG = "MYKG"
-    ISO_20275_P12B = "P12B"
-    ISO_20275_P5JT = "P5JT"
-    ISO_20275_RCPI = "RCPI"
-    ISO_20275_T1JS = "T1JS"
-    ISO_20275_U24X = "U24X"
-    ISO_20275_W86L = "W86L"
-    ISO_20275_1JK6 = "1JK6"
-    ISO_20275_2DK3 = "2DK3"
-    ISO_20275_2N9X = "2N9X"
-    ISO_20275_3BX3 = "3BX3"
-    ISO_20275_3G3D = "3G3D"
-    ISO_20275_3RMA = "3RMA"
-    ISO_20275_4A26 = "4A26"
-    ISO_20275_4OTK = "4OTK"
-    ISO_20275_4UB2 = "4UB2"
-    ISO_20275_4YAK = "4YAK"
-    ISO_20275_5AP3 = "5AP3"
-    ISO_20275_5KU5 = "5KU5"
-    ISO_20275_6CQN = "6CQN"
-    ISO_20275_6D9L = "6D9L"
-    ISO_20275_6FAI = "6FAI"
-    ISO_20275_6OMW = "6OMW"
-    ISO_20275_747U = "747U"
-    ISO_20275_74W6 = "74W6"
-    ISO_20275_7OZQ = "7OZQ"
-    ISO_20275_84J8 = "84J8"
-    ISO_20275_8K5T = "8K5T"
-    ISO_20275_917C = "917C"
-    ISO_20275_95G8 = "95G8"
-    ISO_20275_971Y = "971Y"
-    ISO_20275_9HLU = "9HLU"
-    ISO_20275_9RVC = "9RVC"
-    ISO_20275_9XDB = "9XDB"
-    ISO_20275_AM3T = "AM3T"
-    ISO_20275_APEN = "APEN"
-    ISO_20275_BL4B = "BL4B"
-    ISO_20275_C4Q2 = "C4Q2"
-    ISO_20275_C5FE = "C5FE"
-    ISO_20275_C7GZ = "C7GZ"
-    ISO_20275_CATU = "CATU"
-    ISO_20275_CD28 = "CD28"
-    ISO_20275_CHJR = "CHJR"
-    ISO_20275_CIO8 = "CIO8"
-    ISO_20275_CUKQ = "CUKQ"
-    ISO_20275_CZUA = "CZUA"
-    ISO_20275_D1VK = "D1VK"
-    ISO_20275_D35X = "D35X"
-    ISO_20275_ET6Z = "ET6Z"
-    ISO_20275_FIPS = "FIPS"
-    ISO_20275_FY1B = "FY1B"
-    ISO_20275_G2I3 = "G2I3"
-    ISO_20275_H4XQ = "H4XQ"
-    ISO_20275_H6WW = "H6WW"
-    ISO_20275_HQPK = "HQPK"
-    ISO_20275_HS5W = "HS5W"
-    ISO_20275_HSNC = "HSNC"
-    ISO_20275_HY6K = "HY6K"
-    ISO_20275_I32F = "I32F"
-    ISO_20275_I68R = "I68R"
-    ISO_20275_IQ9O = "IQ9O"
-    ISO_20275_J8PB = "J8PB"
-    ISO_20275_JCAD = "JCAD"
-    ISO_20275_JJYB = "JJYB"
-    ISO_20275_KM6Z = "KM6Z"
-    ISO_20275_LEDI = "LEDI"
-    ISO_20275_LJ92 = "LJ92"
-    ISO_20275_LJL0 = "LJL0"
-    ISO_20275_LPCQ = "LPCQ"
-    ISO_20275_MAVU = "MAVU"
-    ISO_20275_MBUU = "MBUU"
-    ISO_20275_NI3I = "NI3I"
-    ISO_20275_NJ87 = "NJ87"
-    ISO_20275_NPH3 = "NPH3"
-    ISO_20275_NQHQ = "NQHQ"
-    ISO_20275_O9PW = "O9PW"
-    ISO_20275_OVKW = "OVKW"
-    ISO_20275_P3YF = "P3YF"
-    ISO_20275_PFE5 = "PFE5"
-    ISO_20275_PQJE = "PQJE"
-    ISO_20275_Q25I = "Q25I"
-    ISO_20275_QIEL = "QIEL"
-    ISO_20275_QJ0F = "QJ0F"
-    ISO_20275_QJWK = "QJWK"
-    ISO_20275_QQ49 = "QQ49"
-    ISO_20275_QS6A = "QS6A"
-    ISO_20275_R2XE = "R2XE"
-    ISO_20275_RBGQ = "RBGQ"
-    ISO_20275_RHFQ = "RHFQ"
-    ISO_20275_RP0E = "RP0E"
-    ISO_20275_SNWJ = "SNWJ"
-    ISO_20275_T1FT = "T1FT"
-    ISO_20275_T3Q1 = "T3Q1"
-    ISO_20275_TNBA = "TNBA"
-    ISO_20275_U95A = "U95A"
-    ISO_20275_UFDA = "UFDA"
-    ISO_20275_V6YH = "V6YH"
-    ISO_20275_VIE3 = "VIE3"
-    ISO_20275_VQU7 = "VQU7"
-    ISO_20275_WJ30 = "WJ30"
-    ISO_20275_WL83 = "WL83"
-    ISO_20275_WO0T = "WO0T"
-    ISO_20275_WUFK = "WUFK"
-    ISO_20275_WVZF = "WVZF"
-    ISO_20275_XG70 = "XG70"
-    ISO_20275_XRK7 = "XRK7"
-    ISO_20275_Y18E = "Y18E"
-    ISO_20275_Z3BF = "Z3BF"
-    ISO_20275_ZQO8 = "ZQO8"
-    ISO_20275_ZU32 = "ZU32"
-    ISO_20275_1MWR = "1MWR"
-    ISO_20275_37UT = "37UT"
-    ISO_20275_40R4 = "40R4"
-    ISO_20275_599X = "599X"
-    ISO_20275_5QS7 = "5QS7"
-    ISO_20275_7WRN = "7WRN"
-    ISO_20275_9KSX = "9KSX"
-    ISO_20275_D4PU = "D4PU"
-    ISO_20275_F7JY = "F7JY"
-    ISO_20275_FUKI = "FUKI"
-    ISO_20275_FW7S = "FW7S"
-    ISO_20275_GFXN = "GFXN"
-    ISO_20275_GULL = "GULL"
-    ISO_20275_H8VP = "H8VP"
-    ISO_20275_LWOD = "LWOD"
-    ISO_20275_NUL8 = "NUL8"
-    ISO_20275_PIOI = "PIOI"
-    ISO_20275_PMJW = "PMJW"
-    ISO_20275_PZ6Y = "PZ6Y"
-    ISO_20275_TB2C = "TB2C"
-    ISO_20275_UA1O = "UA1O"
-    ISO_20275_WU7R = "WU7R"
-    ISO_20275_ZRPO = "ZRPO"
-    ISO_20275_3ZBR = "3ZBR"
-    ISO_20275_8WQ9 = "8WQ9"
-    ISO_20275_B35X = "B35X"
-    ISO_20275_DQAU = "DQAU"
-    ISO_20275_K4CD = "K4CD"
-    ISO_20275_LSWY = "LSWY"
-    ISO_20275_SWO8 = "SWO8"
-    ISO_20275_T4LC = "T4LC"
-    ISO_20275_6TPE = "6TPE"
-    ISO_20275_FKVG = "FKVG"
-    ISO_20275_J3T2 = "J3T2"
-    ISO_20275_N9QH = "N9QH"
-    ISO_20275_XOAD = "XOAD"
-    ISO_20275_1NKP = "1NKP"
-    ISO_20275_3UPJ = "3UPJ"
-    ISO_20275_6I0P = "6I0P"
-    ISO_20275_752Q = "752Q"
-    ISO_20275_8ZQE = "8ZQE"
-    ISO_20275_9LJA = "9LJA"
-    ISO_20275_CKOS = "CKOS"
-    ISO_20275_GA3A = "GA3A"
-    ISO_20275_I1UP = "I1UP"
-    ISO_20275_J34T = "J34T"
-    ISO_20275_JC0Y = "JC0Y"
-    ISO_20275_LA47 = "LA47"
-    ISO_20275_LVEQ = "LVEQ"
-    ISO_20275_PMOF = "PMOF"
-    ISO_20275_PRTB = "PRTB"
-    ISO_20275_RXTT = "RXTT"
-    ISO_20275_VSEV = "VSEV"
-    ISO_20275_1AFG = "1AFG"
-    ISO_20275_1YIR = "1YIR"
-    ISO_20275_2RK5 = "2RK5"
-    ISO_20275_37GR = "37GR"
-    ISO_20275_4H61 = "4H61"
-    ISO_20275_5WI2 = "5WI2"
-    ISO_20275_6PEQ = "6PEQ"
-    ISO_20275_760X = "760X"
-    ISO_20275_883O = "883O"
-    ISO_20275_8HGS = "8HGS"
-    ISO_20275_8WJ7 = "8WJ7"
-    ISO_20275_97PB = "97PB"
-    ISO_20275_9AUC = "9AUC"
-    ISO_20275_AUPV = "AUPV"
-    ISO_20275_BKQO = "BKQO"
-    ISO_20275_BKVI = "BKVI"
-    ISO_20275_BQ19 = "BQ19"
-    ISO_20275_C51L = "C51L"
-    ISO_20275_DAFV = "DAFV"
-    ISO_20275_DKUW = "DKUW"
-    ISO_20275_DL9Z = "DL9Z"
-    ISO_20275_DMT8 = "DMT8"
-    ISO_20275_EDN7 = "EDN7"
-    ISO_20275_EDZP = "EDZP"
-    ISO_20275_EE90 = "EE90"
-    ISO_20275_EMC8 = "EMC8"
-    ISO_20275_HBR3 = "HBR3"
-    ISO_20275_HEOB = "HEOB"
-    ISO_20275_HNWB = "HNWB"
-    ISO_20275_HTT9 = "HTT9"
-    ISO_20275_IX7U = "IX7U"
-    ISO_20275_IYF9 = "IYF9"
-    ISO_20275_JI3A = "JI3A"
-    ISO_20275_K09E = "K09E"
-    ISO_20275_K2G8 = "K2G8"
-    ISO_20275_K6VE = "K6VE"
-    ISO_20275_KHI5 = "KHI5"
-    ISO_20275_L7XJ = "L7XJ"
-    ISO_20275_LBQS = "LBQS"
-    ISO_20275_MBPY = "MBPY"
-    ISO_20275_MRW9 = "MRW9"
-    ISO_20275_N3LC = "N3LC"
-    ISO_20275_NV7C = "NV7C"
-    ISO_20275_OXLO = "OXLO"
-    ISO_20275_PPMX = "PPMX"
-    ISO_20275_R39F = "R39F"
-    ISO_20275_R5ZC = "R5ZC"
-    ISO_20275_R6UB = "R6UB"
-    ISO_20275_SDPE = "SDPE"
-    ISO_20275_SJL9 = "SJL9"
-    ISO_20275_SKGX = "SKGX"
-    ISO_20275_SQS1 = "SQS1"
-    ISO_20275_SUHV = "SUHV"
-    ISO_20275_T31U = "T31U"
-    ISO_20275_T3K4 = "T3K4"
-    ISO_20275_TZ1U = "TZ1U"
-    ISO_20275_UAV1 = "UAV1"
-    ISO_20275_UMF0 = "UMF0"
-    ISO_20275_UXEW = "UXEW"
-    ISO_20275_V0TJ = "V0TJ"
-    ISO_20275_V42B = "V42B"
-    ISO_20275_VKKN = "VKKN"
-    ISO_20275_VOTI = "VOTI"
-    ISO_20275_XGKW = "XGKW"
-    ISO_20275_XJH3 = "XJH3"
-    ISO_20275_YK5G = "YK5G"
-    ISO_20275_Z38E = "Z38E"
-    ISO_20275_ZMTL = "ZMTL"
-    ISO_20275_157O = "157O"
-    ISO_20275_1B88 = "1B88"
-    ISO_20275_1GNM = "1GNM"
-    ISO_20275_1L24 = "1L24"
-    ISO_20275_1NF1 = "1NF1"
-    ISO_20275_1Q16 = "1Q16"
-    ISO_20275_1Y0C = "1Y0C"
-    ISO_20275_211B = "211B"
-    ISO_20275_29FA = "29FA"
-    ISO_20275_2N4L = "2N4L"
-    ISO_20275_2NL6 = "2NL6"
-    ISO_20275_2ONM = "2ONM"
-    ISO_20275_2WMP = "2WMP"
-    ISO_20275_2XIK = "2XIK"
-    ISO_20275_34QS = "34QS"
-    ISO_20275_3AZY = "3AZY"
-    ISO_20275_3FCU = "3FCU"
-    ISO_20275_3NJL = "3NJL"
-    ISO_20275_3OK3 = "3OK3"
-    ISO_20275_3S6E = "3S6E"
-    ISO_20275_3XTE = "3XTE"
-    ISO_20275_487E = "487E"
-    ISO_20275_491H = "491H"
-    ISO_20275_4DZU = "4DZU"
-    ISO_20275_4H0F = "4H0F"
-    ISO_20275_4JS0 = "4JS0"
-    ISO_20275_4RT7 = "4RT7"
-    ISO_20275_4TNX = "4TNX"
-    ISO_20275_4VD7 = "4VD7"
-    ISO_20275_59F9 = "59F9"
-    ISO_20275_5AJO = "5AJO"
-    ISO_20275_5H68 = "5H68"
-    ISO_20275_5K0Q = "5K0Q"
-    ISO_20275_5VCF = "5VCF"
-    ISO_20275_61WE = "61WE"
-    ISO_20275_66JQ = "66JQ"
-    ISO_20275_6CHY = "6CHY"
-    ISO_20275_6CJJ = "6CJJ"
-    ISO_20275_6DYI = "6DYI"
-    ISO_20275_6IIE = "6IIE"
-    ISO_20275_6KWU = "6KWU"
-    ISO_20275_6RUE = "6RUE"
-    ISO_20275_6SYJ = "6SYJ"
-    ISO_20275_6YHU = "6YHU"
-    ISO_20275_74HH = "74HH"
-    ISO_20275_7O94 = "7O94"
-    ISO_20275_7SZH = "7SZH"
-    ISO_20275_7UHA = "7UHA"
-    ISO_20275_82QO = "82QO"
-    ISO_20275_87VO = "87VO"
-    ISO_20275_8FZW = "8FZW"
-    ISO_20275_8G07 = "8G07"
-    ISO_20275_8GTU = "8GTU"
-    ISO_20275_8II5 = "8II5"
-    ISO_20275_8IWA = "8IWA"
-    ISO_20275_8LX5 = "8LX5"
-    ISO_20275_8OKM = "8OKM"
-    ISO_20275_8R2G = "8R2G"
-    ISO_20275_8TYA = "8TYA"
-    ISO_20275_8VDW = "8VDW"
-    ISO_20275_8VWR = "8VWR"
-    ISO_20275_8WH8 = "8WH8"
-    ISO_20275_8XDK = "8XDK"
-    ISO_20275_94WO = "94WO"
-    ISO_20275_97PZ = "97PZ"
-    ISO_20275_9HC8 = "9HC8"
-    ISO_20275_9KU7 = "9KU7"
-    ISO_20275_9N1F = "9N1F"
-    ISO_20275_9O0S = "9O0S"
-    ISO_20275_9T5S = "9T5S"
-    ISO_20275_A0VZ = "A0VZ"
-    ISO_20275_AHBR = "AHBR"
-    ISO_20275_AMFI = "AMFI"
-    ISO_20275_B645 = "B645"
-    ISO_20275_B7I7 = "B7I7"
-    ISO_20275_BAK2 = "BAK2"
-    ISO_20275_BAUQ = "BAUQ"
-    ISO_20275_BDDP = "BDDP"
-    ISO_20275_BEWI = "BEWI"
-    ISO_20275_BRGA = "BRGA"
-    ISO_20275_BYZF = "BYZF"
-    ISO_20275_C42J = "C42J"
-    ISO_20275_C4D7 = "C4D7"
-    ISO_20275_CAX5 = "CAX5"
-    ISO_20275_CBO2 = "CBO2"
-    ISO_20275_CF56 = "CF56"
-    ISO_20275_CNSS = "CNSS"
-    ISO_20275_CNXL = "CNXL"
-    ISO_20275_CQJI = "CQJI"
-    ISO_20275_CVH6 = "CVH6"
-    ISO_20275_D2I2 = "D2I2"
-    ISO_20275_DEG4 = "DEG4"
-    ISO_20275_DRQM = "DRQM"
-    ISO_20275_DTAX = "DTAX"
-    ISO_20275_DWYD = "DWYD"
-    ISO_20275_DXQH = "DXQH"
-    ISO_20275_E0YF = "E0YF"
-    ISO_20275_E6YB = "E6YB"
-    ISO_20275_EABD = "EABD"
-    ISO_20275_EAC8 = "EAC8"
-    ISO_20275_ECUL = "ECUL"
-    ISO_20275_EVYY = "EVYY"
-    ISO_20275_EYRI = "EYRI"
-    ISO_20275_F0B6 = "F0B6"
-    ISO_20275_F6SZ = "F6SZ"
-    ISO_20275_F72Z = "F72Z"
-    ISO_20275_F8UD = "F8UD"
-    ISO_20275_F93F = "F93F"
-    ISO_20275_FBYB = "FBYB"
-    ISO_20275_FEEA = "FEEA"
-    ISO_20275_FFQL = "FFQL"
-    ISO_20275_FKG2 = "FKG2"
-    ISO_20275_FOUY = "FOUY"
-    ISO_20275_FY0F = "FY0F"
-    ISO_20275_FYBN = "FYBN"
-    ISO_20275_G7Z2 = "G7Z2"
-    ISO_20275_G8LP = "G8LP"
-    ISO_20275_G98S = "G98S"
-    ISO_20275_GFN6 = "GFN6"
-    ISO_20275_GJJJ = "GJJJ"
-    ISO_20275_GLN8 = "GLN8"
-    ISO_20275_GQV4 = "GQV4"
-    ISO_20275_GXL6 = "GXL6"
-    ISO_20275_GZCQ = "GZCQ"
-    ISO_20275_H1U2 = "H1U2"
-    ISO_20275_H3Z4 = "H3Z4"
-    ISO_20275_H3ZD = "H3ZD"
-    ISO_20275_H4VR = "H4VR"
-    ISO_20275_HA3N = "HA3N"
-    ISO_20275_HATI = "HATI"
-    ISO_20275_HC8N = "HC8N"
-    ISO_20275_HF2L = "HF2L"
-    ISO_20275_HMEI = "HMEI"
-    ISO_20275_HSYZ = "HSYZ"
-    ISO_20275_I0MH = "I0MH"
-    ISO_20275_I8TE = "I8TE"
-    ISO_20275_IAP3 = "IAP3"
-    ISO_20275_IC8G = "IC8G"
-    ISO_20275_IC98 = "IC98"
-    ISO_20275_IF7H = "IF7H"
-    ISO_20275_IGSV = "IGSV"
-    ISO_20275_IQR2 = "IQR2"
-    ISO_20275_J9OZ = "J9OZ"
-    ISO_20275_JBIQ = "JBIQ"
-    ISO_20275_JFET = "JFET"
-    ISO_20275_JIYK = "JIYK"
-    ISO_20275_JM1W = "JM1W"
-    ISO_20275_JMO0 = "JMO0"
-    ISO_20275_JN2P = "JN2P"
-    ISO_20275_JR7T = "JR7T"
-    ISO_20275_JU82 = "JU82"
-    ISO_20275_K39X = "K39X"
-    ISO_20275_K5KA = "K5KA"
-    ISO_20275_K65D = "K65D"
-    ISO_20275_K69X = "K69X"
-    ISO_20275_K7XQ = "K7XQ"
-    ISO_20275_K99N = "K99N"
-    ISO_20275_KBEQ = "KBEQ"
-    ISO_20275_KCN5 = "KCN5"
-    ISO_20275_KFR1 = "KFR1"
-    ISO_20275_KMPN = "KMPN"
-    ISO_20275_KQH7 = "KQH7"
-    ISO_20275_KS9B = "KS9B"
-    ISO_20275_KWI4 = "KWI4"
-    ISO_20275_L25Z = "L25Z"
-    ISO_20275_L6QO = "L6QO"
-    ISO_20275_LARO = "LARO"
-    ISO_20275_LGME = "LGME"
-    ISO_20275_LU8S = "LU8S"
-    ISO_20275_LUIN = "LUIN"
-    ISO_20275_M1BJ = "M1BJ"
-    ISO_20275_M673 = "M673"
-    ISO_20275_MG2O = "MG2O"
-    ISO_20275_MMA4 = "MMA4"
-    ISO_20275_MOUL = "MOUL"
-    ISO_20275_MQPZ = "MQPZ"
-    ISO_20275_MQU9 = "MQU9"
-    ISO_20275_MX8J = "MX8J"
-    ISO_20275_NBA8 = "NBA8"
-    ISO_20275_NFCV = "NFCV"
-    ISO_20275_NM07 = "NM07"
-    ISO_20275_NOI8 = "NOI8"
-    ISO_20275_NQCT = "NQCT"
-    ISO_20275_NUMY = "NUMY"
-    ISO_20275_OAGA = "OAGA"
-    ISO_20275_OIQA = "OIQA"
-    ISO_20275_OLJ1 = "OLJ1"
-    ISO_20275_OSLZ = "OSLZ"
-    ISO_20275_OWUN = "OWUN"
-    ISO_20275_P3J5 = "P3J5"
-    ISO_20275_P714 = "P714"
-    ISO_20275_PESN = "PESN"
-    ISO_20275_PL6V = "PL6V"
-    ISO_20275_PWKL = "PWKL"
-    ISO_20275_PZLG = "PZLG"
-    ISO_20275_Q2A1 = "Q2A1"
-    ISO_20275_Q634 = "Q634"
-    ISO_20275_Q8E2 = "Q8E2"
-    ISO_20275_QCWO = "QCWO"
-    ISO_20275_QU3G = "QU3G"
-    ISO_20275_QUB4 = "QUB4"
-    ISO_20275_QV2O = "QV2O"
-    ISO_20275_QVPB = "QVPB"
-    ISO_20275_R0B6 = "R0B6"
-    ISO_20275_R1JO = "R1JO"
-    ISO_20275_R59A = "R59A"
-    ISO_20275_R6WQ = "R6WQ"
-    ISO_20275_RD0Z = "RD0Z"
-    ISO_20275_RFWH = "RFWH"
-    ISO_20275_RNJZ = "RNJZ"
-    ISO_20275_RNSB = "RNSB"
-    ISO_20275_RT39 = "RT39"
-    ISO_20275_RT6Y = "RT6Y"
-    ISO_20275_RWMC = "RWMC"
-    ISO_20275_S0X8 = "S0X8"
-    ISO_20275_S82R = "S82R"
-    ISO_20275_SMZ6 = "SMZ6"
-    ISO_20275_SOXQ = "SOXQ"
-    ISO_20275_SSHN = "SSHN"
-    ISO_20275_SWPX = "SWPX"
-    ISO_20275_SZ63 = "SZ63"
-    ISO_20275_T25Y = "T25Y"
-    ISO_20275_TGRE = "TGRE"
-    ISO_20275_TNPO = "TNPO"
-    ISO_20275_TOL2 = "TOL2"
-    ISO_20275_TPNT = "TPNT"
-    ISO_20275_TUE5 = "TUE5"
-    ISO_20275_UFM7 = "UFM7"
-    ISO_20275_UHKH = "UHKH"
-    ISO_20275_UQRY = "UQRY"
-    ISO_20275_UUT8 = "UUT8"
-    ISO_20275_UV02 = "UV02"
-    ISO_20275_UZY3 = "UZY3"
-    ISO_20275_V1Z5 = "V1Z5"
-    ISO_20275_V5SV = "V5SV"
-    ISO_20275_V6G1 = "V6G1"
-    ISO_20275_V9QP = "V9QP"
-    ISO_20275_VBC7 = "VBC7"
-    ISO_20275_VBQP = "VBQP"
-    ISO_20275_VD7Z = "VD7Z"
-    ISO_20275_VJV5 = "VJV5"
-    ISO_20275_VO18 = "VO18"
-    ISO_20275_VTFS = "VTFS"
-    ISO_20275_W3LD = "W3LD"
-    ISO_20275_W4G1 = "W4G1"
-    ISO_20275_WGCY = "WGCY"
-    ISO_20275_WXNU = "WXNU"
-    ISO_20275_X78I = "X78I"
-    ISO_20275_XH8C = "XH8C"
-    ISO_20275_XK4T = "XK4T"
-    ISO_20275_XPX6 = "XPX6"
-    ISO_20275_XQBA = "XQBA"
-    ISO_20275_Y1W1 = "Y1W1"
-    ISO_20275_Y4VA = "Y4VA"
-    ISO_20275_Y7G8 = "Y7G8"
-    ISO_20275_Y8WC = "Y8WC"
-    ISO_20275_YADL = "YADL"
-    ISO_20275_YHI5 = "YHI5"
-    ISO_20275_YJM5 = "YJM5"
-    ISO_20275_YUCL = "YUCL"
-    ISO_20275_YX4E = "YX4E"
-    ISO_20275_Z0JP = "Z0JP"
-    ISO_20275_Z2FQ = "Z2FQ"
-    ISO_20275_Z5WG = "Z5WG"
-    ISO_20275_Z9K8 = "Z9K8"
-    ISO_20275_ZECH = "ZECH"
-    ISO_20275_ZM5P = "ZM5P"
-    ISO_20275_ZPEZ = "ZPEZ"
-    ISO_20275_ZQ9B = "ZQ9B"
-    ISO_20275_ZQIT = "ZQIT"
-    ISO_20275_ZXHJ = "ZXHJ"
-    ISO_20275_ZY9X = "ZY9X"
-    ISO_20275_ZZ0X = "ZZ0X"
-    ISO_20275_13AV = "13AV"
-    ISO_20275_2HBR = "2HBR"
-    ISO_20275_2YZO = "2YZO"
-    ISO_20275_40DB = "40DB"
-    ISO_20275_63KS = "63KS"
-    ISO_20275_6QQB = "6QQB"
-    ISO_20275_79H0 = "79H0"
-    ISO_20275_7J3S = "7J3S"
-    ISO_20275_8CM0 = "8CM0"
-    ISO_20275_8Z6G = "8Z6G"
-    ISO_20275_9JGX = "9JGX"
-    ISO_20275_AMKW = "AMKW"
-    ISO_20275_AZFE = "AZFE"
-    ISO_20275_D40E = "D40E"
-    ISO_20275_FR3V = "FR3V"
-    ISO_20275_JMVF = "JMVF"
-    ISO_20275_JNDX = "JNDX"
-    ISO_20275_OL20 = "OL20"
-    ISO_20275_QZ3L = "QZ3L"
-    ISO_20275_SCE1 = "SCE1"
-    ISO_20275_SGST = "SGST"
-    ISO_20275_SQKS = "SQKS"
-    ISO_20275_SUA1 = "SUA1"
-    ISO_20275_T0YJ = "T0YJ"
-    ISO_20275_US8E = "US8E"
-    ISO_20275_V2YH = "V2YH"
-    ISO_20275_XLWA = "XLWA"
-    ISO_20275_YA01 = "YA01"
-    ISO_20275_YJ4C = "YJ4C"
-    ISO_20275_4HD1 = "4HD1"
-    ISO_20275_56NA = "56NA"
-    ISO_20275_I0X7 = "I0X7"
-    ISO_20275_J5RC = "J5RC"
-    ISO_20275_PH5T = "PH5T"
-    ISO_20275_T69Z = "T69Z"
-    ISO_20275_VBJW = "VBJW"
-    ISO_20275_W9ZD = "W9ZD"
-    ISO_20275_WP5I = "WP5I"
-    ISO_20275_XWPT = "XWPT"
-    ISO_20275_7U4R = "7U4R"
-    ISO_20275_CB98 = "CB98"
-    ISO_20275_GCCT = "GCCT"
-    ISO_20275_M4TI = "M4TI"
-    ISO_20275_QFLH = "QFLH"
-    ISO_20275_TKPE = "TKPE"
-    ISO_20275_UUYB = "UUYB"
-    ISO_20275_VJRL = "VJRL"
-    ISO_20275_WBKH = "WBKH"
-    ISO_20275_Y8CL = "Y8CL"
-    ISO_20275_3RHO = "3RHO"
-    ISO_20275_54AL = "54AL"
-    ISO_20275_CQ5X = "CQ5X"
-    ISO_20275_H6OR = "H6OR"
-    ISO_20275_HKVP = "HKVP"
-    ISO_20275_J3VJ = "J3VJ"
-    ISO_20275_JYKN = "JYKN"
-    ISO_20275_L6IY = "L6IY"
-    ISO_20275_L8D6 = "L8D6"
-    ISO_20275_MCWR = "MCWR"
-    ISO_20275_QCA0 = "QCA0"
-    ISO_20275_QNWW = "QNWW"
-    ISO_20275_QSYQ = "QSYQ"
-    ISO_20275_TIZ2 = "TIZ2"
-    ISO_20275_UCU5 = "UCU5"
-    ISO_20275_VKSR = "VKSR"
-    ISO_20275_W2NK = "W2NK"
-    ISO_20275_5I7B = "5I7B"
-    ISO_20275_GNYB = "GNYB"
-    ISO_20275_KJ1Y = "KJ1Y"
-    ISO_20275_TMK1 = "TMK1"
-    ISO_20275_U5RF = "U5RF"
-    ISO_20275_YB1Q = "YB1Q"
-    ISO_20275_YNEH = "YNEH"
-    ISO_20275_F0IC = "F0IC"
-    ISO_20275_GY0L = "GY0L"
-    ISO_20275_RK88 = "RK88"
-    ISO_20275_W9T7 = "W9T7"
-    ISO_20275_XH5R = "XH5R"
-    ISO_20275_BVOE = "BVOE"
-    ISO_20275_UO3D = "UO3D"
-    ISO_20275_1Q2B = "1Q2B"
-    ISO_20275_NDC3 = "NDC3"
-    ISO_20275_UY66 = "UY66"
-    ISO_20275_2AUN = "2AUN"
-    ISO_20275_4C0J = "4C0J"
-    ISO_20275_75XK = "75XK"
-    ISO_20275_9XFK = "9XFK"
-    ISO_20275_E6J3 = "E6J3"
-    ISO_20275_MCQP = "MCQP"
-    ISO_20275_NGR5 = "NGR5"
-    ISO_20275_OT3Y = "OT3Y"
-    ISO_20275_Q49K = "Q49K"
-    ISO_20275_QJBA = "QJBA"
-    ISO_20275_YVZD = "YVZD"
-    ISO_20275_12F9 = "12F9"
-    ISO_20275_6ETM = "6ETM"
-    ISO_20275_E7JZ = "E7JZ"
-    ISO_20275_JUDZ = "JUDZ"
-    ISO_20275_O2M6 = "O2M6"
-    ISO_20275_RF41 = "RF41"
-    ISO_20275_XE7O = "XE7O"
-    ISO_20275_254M = "254M"
-    ISO_20275_2QMJ = "2QMJ"
-    ISO_20275_85VD = "85VD"
-    ISO_20275_E1SE = "E1SE"
-    ISO_20275_EPG7 = "EPG7"
-    ISO_20275_KSUS = "KSUS"
-    ISO_20275_N3VO = "N3VO"
-    ISO_20275_S2E3 = "S2E3"
-    ISO_20275_UDG6 = "UDG6"
-    ISO_20275_XPE5 = "XPE5"
-    ISO_20275_2A44 = "2A44"
-    ISO_20275_2LB5 = "2LB5"
-    ISO_20275_4C5L = "4C5L"
-    ISO_20275_4QRE = "4QRE"
-    ISO_20275_4WV7 = "4WV7"
-    ISO_20275_876R = "876R"
-    ISO_20275_8UEG = "8UEG"
-    ISO_20275_8UMK = "8UMK"
-    ISO_20275_8VH3 = "8VH3"
-    ISO_20275_995K = "995K"
-    ISO_20275_BJ8Q = "BJ8Q"
-    ISO_20275_BKUX = "BKUX"
-    ISO_20275_BMYJ = "BMYJ"
-    ISO_20275_BSK1 = "BSK1"
-    ISO_20275_DN6F = "DN6F"
-    ISO_20275_DPY1 = "DPY1"
-    ISO_20275_EO9F = "EO9F"
-    ISO_20275_ESTU = "ESTU"
-    ISO_20275_HTJD = "HTJD"
-    ISO_20275_J6MO = "J6MO"
-    ISO_20275_LNY0 = "LNY0"
-    ISO_20275_M1DW = "M1DW"
-    ISO_20275_NZAI = "NZAI"
-    ISO_20275_OII5 = "OII5"
-    ISO_20275_P9F2 = "P9F2"
-    ISO_20275_QYV5 = "QYV5"
-    ISO_20275_S3DA = "S3DA"
-    ISO_20275_TQ3O = "TQ3O"
-    ISO_20275_TSVO = "TSVO"
-    ISO_20275_UD8K = "UD8K"
-    ISO_20275_V3LT = "V3LT"
-    ISO_20275_X0SX = "X0SX"
-    ISO_20275_XW5U = "XW5U"
-    ISO_20275_Y64R = "Y64R"
-    ISO_20275_ZQAQ = "ZQAQ"
-    ISO_20275_2OJP = "2OJP"
-    ISO_20275_8T79 = "8T79"
-    ISO_20275_CMHQ = "CMHQ"
-    ISO_20275_E4KB = "E4KB"
-    ISO_20275_M8SS = "M8SS"
-    ISO_20275_180P = "180P"
-    ISO_20275_2DVA = "2DVA"
-    ISO_20275_2Y95 = "2Y95"
-    ISO_20275_36YD = "36YD"
-    ISO_20275_3VSP = "3VSP"
-    ISO_20275_4QIE = "4QIE"
-    ISO_20275_70GJ = "70GJ"
-    ISO_20275_8ZLF = "8ZLF"
-    ISO_20275_9ME5 = "9ME5"
-    ISO_20275_A0PS = "A0PS"
-    ISO_20275_DDKQ = "DDKQ"
-    ISO_20275_DW2W = "DW2W"
-    ISO_20275_EX8U = "EX8U"
-    ISO_20275_FC7L = "FC7L"
-    ISO_20275_FPZK = "FPZK"
-    ISO_20275_HBQK = "HBQK"
-    ISO_20275_I47Z = "I47Z"
-    ISO_20275_JKJX = "JKJX"
-    ISO_20275_K361 = "K361"
-    ISO_20275_K4OX = "K4OX"
-    ISO_20275_KJ0B = "KJ0B"
-    ISO_20275_NBCI = "NBCI"
-    ISO_20275_NFPC = "NFPC"
-    ISO_20275_OYDA = "OYDA"
-    ISO_20275_QCSO = "QCSO"
-    ISO_20275_U5S6 = "U5S6"
-    ISO_20275_U8NM = "U8NM"
-    ISO_20275_VX5J = "VX5J"
-    ISO_20275_W0G7 = "W0G7"
-    ISO_20275_W9FI = "W9FI"
-    ISO_20275_X4IT = "X4IT"
-    ISO_20275_XTZG = "XTZG"
-    ISO_20275_YSP9 = "YSP9"
-    ISO_20275_72I6 = "72I6"
-    ISO_20275_B8VT = "B8VT"
-    ISO_20275_BJT3 = "BJT3"
-    ISO_20275_HELT = "HELT"
-    ISO_20275_JAJS = "JAJS"
-    ISO_20275_UD1V = "UD1V"
-    ISO_20275_V05A = "V05A"
-    ISO_20275_XFHP = "XFHP"
-    ISO_20275_2GV9 = "2GV9"
-    ISO_20275_363J = "363J"
-    ISO_20275_54SK = "54SK"
-    ISO_20275_5AX8 = "5AX8"
-    ISO_20275_9BPE = "9BPE"
-    ISO_20275_C58S = "C58S"
-    ISO_20275_DWS3 = "DWS3"
-    ISO_20275_FF1D = "FF1D"
-    ISO_20275_HNJK = "HNJK"
-    ISO_20275_JXDX = "JXDX"
-    ISO_20275_KMFX = "KMFX"
-    ISO_20275_LGWG = "LGWG"
-    ISO_20275_LMIM = "LMIM"
-    ISO_20275_LZIC = "LZIC"
-    ISO_20275_MNQ7 = "MNQ7"
-    ISO_20275_URQH = "URQH"
-    ISO_20275_VYAX = "VYAX"
-    ISO_20275_ZJS8 = "ZJS8"
-    ISO_20275_1G26 = "1G26"
-    ISO_20275_5ABK = "5ABK"
-    ISO_20275_CDXK = "CDXK"
-    ISO_20275_EMLA = "EMLA"
-    ISO_20275_FI4M = "FI4M"
-    ISO_20275_FMPL = "FMPL"
-    ISO_20275_G4V6 = "G4V6"
-    ISO_20275_JHC4 = "JHC4"
-    ISO_20275_M44Y = "M44Y"
-    ISO_20275_OESH = "OESH"
-    ISO_20275_QZTT = "QZTT"
-    ISO_20275_SAI8 = "SAI8"
-    ISO_20275_SP9F = "SP9F"
-    ISO_20275_TE79 = "TE79"
-    ISO_20275_TQ3Z = "TQ3Z"
-    ISO_20275_TV5P = "TV5P"
-    ISO_20275_VC3E = "VC3E"
-    ISO_20275_ZGPY = "ZGPY"
-    ISO_20275_135L = "135L"
-    ISO_20275_1RI9 = "1RI9"
-    ISO_20275_1TON = "1TON"
-    ISO_20275_2J7Z = "2J7Z"
-    ISO_20275_2SZI = "2SZI"
-    ISO_20275_2XXH = "2XXH"
-    ISO_20275_5ODO = "5ODO"
-    ISO_20275_634M = "634M"
-    ISO_20275_70X0 = "70X0"
-    ISO_20275_75WC = "75WC"
-    ISO_20275_8AXV = "8AXV"
-    ISO_20275_8GU1 = "8GU1"
-    ISO_20275_9KGS = "9KGS"
-    ISO_20275_ADAZ = "ADAZ"
-    ISO_20275_ARJF = "ARJF"
-    ISO_20275_B5TO = "B5TO"
-    ISO_20275_BL52 = "BL52"
-    ISO_20275_C1IC = "C1IC"
-    ISO_20275_CGSO = "CGSO"
-    ISO_20275_CTNS = "CTNS"
-    ISO_20275_DCRK = "DCRK"
-    ISO_20275_DLS4 = "DLS4"
-    ISO_20275_DSSD = "DSSD"
-    ISO_20275_H7D4 = "H7D4"
-    ISO_20275_HN75 = "HN75"
-    ISO_20275_IMHA = "IMHA"
-    ISO_20275_K021 = "K021"
-    ISO_20275_K26L = "K26L"
-    ISO_20275_KCHO = "KCHO"
-    ISO_20275_KCSG = "KCSG"
-    ISO_20275_KXZT = "KXZT"
-    ISO_20275_L1ZJ = "L1ZJ"
-    ISO_20275_LHBB = "LHBB"
-    ISO_20275_LZZD = "LZZD"
-    ISO_20275_NDEW = "NDEW"
-    ISO_20275_OQ8C = "OQ8C"
-    ISO_20275_OV32 = "OV32"
-    ISO_20275_P418 = "P418"
-    ISO_20275_PHMS = "PHMS"
-    ISO_20275_QRZJ = "QRZJ"
-    ISO_20275_RWZD = "RWZD"
-    ISO_20275_SBQN = "SBQN"
-    ISO_20275_SSP9 = "SSP9"
-    ISO_20275_T2X1 = "T2X1"
-    ISO_20275_VA1V = "VA1V"
-    ISO_20275_VDRB = "VDRB"
-    ISO_20275_VUPE = "VUPE"
-    ISO_20275_W2PE = "W2PE"
-    ISO_20275_W9SC = "W9SC"
-    ISO_20275_WPED = "WPED"
-    ISO_20275_WRU2 = "WRU2"
-    ISO_20275_X32V = "X32V"
-    ISO_20275_X62Z = "X62Z"
-    ISO_20275_ZG6S = "ZG6S"
-    ISO_20275_ZU9S = "ZU9S"
-    ISO_20275_ZZOG = "ZZOG"
-    ISO_20275_7ZU4 = "7ZU4"
-    ISO_20275_EBRQ = "EBRQ"
-    ISO_20275_HCBE = "HCBE"
-    ISO_20275_N97C = "N97C"
-    ISO_20275_PFY0 = "PFY0"
-    ISO_20275_TLCB = "TLCB"
-    ISO_20275_WVQN = "WVQN"
-    ISO_20275_2NRQ = "2NRQ"
-    ISO_20275_5MVV = "5MVV"
-    ISO_20275_7QQ0 = "7QQ0"
-    ISO_20275_DYQK = "DYQK"
-    ISO_20275_IUVI = "IUVI"
-    ISO_20275_MXMH = "MXMH"
-    ISO_20275_N3JU = "N3JU"
-    ISO_20275_R4LR = "R4LR"
-    ISO_20275_T417 = "T417"
-    ISO_20275_VQLD = "VQLD"
-    ISO_20275_21F4 = "21F4"
-    ISO_20275_33IP = "33IP"
-    ISO_20275_40A7 = "40A7"
-    ISO_20275_7RZH = "7RZH"
-    ISO_20275_JOX1 = "JOX1"
-    ISO_20275_LO9A = "LO9A"
-    ISO_20275_SQXV = "SQXV"
-    ISO_20275_UBWU = "UBWU"
-    ISO_20275_2R82 = "2R82"
-    ISO_20275_6B39 = "6B39"
-    ISO_20275_6KSC = "6KSC"
-    ISO_20275_9NBN = "9NBN"
-    ISO_20275_BL60 = "BL60"
-    ISO_20275_FZAC = "FZAC"
-    ISO_20275_IXQK = "IXQK"
-    ISO_20275_SAST = "SAST"
-    ISO_20275_12KO = "12KO"
-    ISO_20275_5RCH = "5RCH"
-    ISO_20275_AHJG = "AHJG"
-    ISO_20275_AKF5 = "AKF5"
-    ISO_20275_AXEQ = "AXEQ"
-    ISO_20275_BW92 = "BW92"
-    ISO_20275_EO0G = "EO0G"
-    ISO_20275_GF7G = "GF7G"
-    ISO_20275_J3U5 = "J3U5"
-    ISO_20275_QU16 = "QU16"
-    ISO_20275_UDJG = "UDJG"
-    ISO_20275_UGVB = "UGVB"
-    ISO_20275_VTH4 = "VTH4"
-    ISO_20275_WUJC = "WUJC"
-    ISO_20275_3YUD = "3YUD"
-    ISO_20275_B56A = "B56A"
-    ISO_20275_CRX3 = "CRX3"
-    ISO_20275_D37H = "D37H"
-    ISO_20275_OZDY = "OZDY"
-    ISO_20275_Q22D = "Q22D"
-    ISO_20275_QZEN = "QZEN"
-    ISO_20275_T2X0 = "T2X0"
-    ISO_20275_W5H8 = "W5H8"
-    ISO_20275_W7KV = "W7KV"
-    ISO_20275_1IPK = "1IPK"
-    ISO_20275_3LCY = "3LCY"
-    ISO_20275_5ULL = "5ULL"
-    ISO_20275_AZTM = "AZTM"
-    ISO_20275_BS22 = "BS22"
-    ISO_20275_ES2D = "ES2D"
-    ISO_20275_VJBO = "VJBO"
-    ISO_20275_CD8F = "CD8F"
-    ISO_20275_K6G7 = "K6G7"
-    ISO_20275_S02Y = "S02Y"
-    ISO_20275_S779 = "S779"
-    ISO_20275_1DGT = "1DGT"
-    ISO_20275_1SOY = "1SOY"
-    ISO_20275_32HC = "32HC"
-    ISO_20275_53QF = "53QF"
-    ISO_20275_7RRP = "7RRP"
-    ISO_20275_ANSR = "ANSR"
-    ISO_20275_BSZ8 = "BSZ8"
-    ISO_20275_IF49 = "IF49"
-    ISO_20275_K98U = "K98U"
-    ISO_20275_NDID = "NDID"
-    ISO_20275_TMU1 = "TMU1"
-    ISO_20275_TV8Y = "TV8Y"
-    ISO_20275_WAK8 = "WAK8"
-    ISO_20275_Y8LH = "Y8LH"
-    ISO_20275_13T9 = "13T9"
-    ISO_20275_4ZF3 = "4ZF3"
-    ISO_20275_5BY2 = "5BY2"
-    ISO_20275_5CIE = "5CIE"
-    ISO_20275_5TA8 = "5TA8"
-    ISO_20275_6JDN = "6JDN"
-    ISO_20275_81KA = "81KA"
-    ISO_20275_A2GC = "A2GC"
-    ISO_20275_A338 = "A338"
-    ISO_20275_BGPJ = "BGPJ"
-    ISO_20275_BPLS = "BPLS"
-    ISO_20275_DLCX = "DLCX"
-    ISO_20275_E4HU = "E4HU"
-    ISO_20275_F2TQ = "F2TQ"
-    ISO_20275_F2ZF = "F2ZF"
-    ISO_20275_HGMH = "HGMH"
-    ISO_20275_HJ1Y = "HJ1Y"
-    ISO_20275_K4GR = "K4GR"
-    ISO_20275_KWBA = "KWBA"
-    ISO_20275_LUGM = "LUGM"
-    ISO_20275_LUOA = "LUOA"
-    ISO_20275_NVPY = "NVPY"
-    ISO_20275_Q4A3 = "Q4A3"
-    ISO_20275_Q8UI = "Q8UI"
-    ISO_20275_QG9Y = "QG9Y"
-    ISO_20275_QRXD = "QRXD"
-    ISO_20275_SFK9 = "SFK9"
-    ISO_20275_SFYA = "SFYA"
-    ISO_20275_UHNL = "UHNL"
-    ISO_20275_WQRG = "WQRG"
-    ISO_20275_X8J8 = "X8J8"
-    ISO_20275_YRXK = "YRXK"
-    ISO_20275_2IGL = "2IGL"
-    ISO_20275_2JEI = "2JEI"
-    ISO_20275_2S2U = "2S2U"
-    ISO_20275_5DWL = "5DWL"
-    ISO_20275_5GGB = "5GGB"
-    ISO_20275_63P9 = "63P9"
-    ISO_20275_68J6 = "68J6"
-    ISO_20275_7SIZ = "7SIZ"
-    ISO_20275_81G5 = "81G5"
-    ISO_20275_9C91 = "9C91"
-    ISO_20275_AIR5 = "AIR5"
-    ISO_20275_ATQY = "ATQY"
-    ISO_20275_BEAN = "BEAN"
-    ISO_20275_BKAB = "BKAB"
-    ISO_20275_DVXS = "DVXS"
-    ISO_20275_EUT4 = "EUT4"
-    ISO_20275_FG84 = "FG84"
-    ISO_20275_HHR4 = "HHR4"
-    ISO_20275_JIWD = "JIWD"
-    ISO_20275_LCR0 = "LCR0"
-    ISO_20275_SQ1A = "SQ1A"
-    ISO_20275_STBC = "STBC"
-    ISO_20275_U8KA = "U8KA"
-    ISO_20275_UDY2 = "UDY2"
-    ISO_20275_V19Y = "V19Y"
-    ISO_20275_V5OS = "V5OS"
-    ISO_20275_V7QY = "V7QY"
-    ISO_20275_WCEP = "WCEP"
-    ISO_20275_ZFFA = "ZFFA"
-    ISO_20275_7OYN = "7OYN"
-    ISO_20275_SP51 = "SP51"
-    ISO_20275_SV3F = "SV3F"
-    ISO_20275_XEOV = "XEOV"
-    ISO_20275_2SPI = "2SPI"
-    ISO_20275_6HT0 = "6HT0"
-    ISO_20275_95AW = "95AW"
-    ISO_20275_JH78 = "JH78"
-    ISO_20275_LA66 = "LA66"
-    ISO_20275_MEHL = "MEHL"
-    ISO_20275_NO8C = "NO8C"
-    ISO_20275_NY3P = "NY3P"
-    ISO_20275_OO14 = "OO14"
-    ISO_20275_P0LR = "P0LR"
-    ISO_20275_P0TZ = "P0TZ"
-    ISO_20275_PBQH = "PBQH"
-    ISO_20275_PWX8 = "PWX8"
-    ISO_20275_QOO6 = "QOO6"
-    ISO_20275_S7R4 = "S7R4"
-    ISO_20275_SP0A = "SP0A"
-    ISO_20275_T5HS = "T5HS"
-    ISO_20275_T635 = "T635"
-    ISO_20275_TGWE = "TGWE"
-    ISO_20275_TXCW = "TXCW"
-    ISO_20275_ZWYK = "ZWYK"
-    ISO_20275_3U3Y = "3U3Y"
-    ISO_20275_9QHJ = "9QHJ"
-    ISO_20275_BVJ0 = "BVJ0"
-    ISO_20275_C061 = "C061"
-    ISO_20275_CR7N = "CR7N"
-    ISO_20275_DJ2D = "DJ2D"
-    ISO_20275_F5X7 = "F5X7"
-    ISO_20275_J4S1 = "J4S1"
-    ISO_20275_JOZN = "JOZN"
-    ISO_20275_V89C = "V89C"
-    ISO_20275_YB0U = "YB0U"
-    ISO_20275_DSII = "DSII"
-    ISO_20275_EZL8 = "EZL8"
-    ISO_20275_S69C = "S69C"
-    ISO_20275_UW1C = "UW1C"
-    ISO_20275_4AJY = "4AJY"
-    ISO_20275_6M6Z = "6M6Z"
-    ISO_20275_AOS4 = "AOS4"
-    ISO_20275_B0LD = "B0LD"
-    ISO_20275_BVPF = "BVPF"
-    ISO_20275_G7H0 = "G7H0"
-    ISO_20275_J76S = "J76S"
-    ISO_20275_JWWT = "JWWT"
-    ISO_20275_O786 = "O786"
-    ISO_20275_RJYT = "RJYT"
-    ISO_20275_RTVE = "RTVE"
-    ISO_20275_S2J1 = "S2J1"
-    ISO_20275_XXCZ = "XXCZ"
-    ISO_20275_ZTUI = "ZTUI"
-    ISO_20275_23XJ = "23XJ"
-    ISO_20275_2LNV = "2LNV"
-    ISO_20275_2NAI = "2NAI"
-    ISO_20275_2RVP = "2RVP"
-    ISO_20275_31N9 = "31N9"
-    ISO_20275_3WVI = "3WVI"
-    ISO_20275_449I = "449I"
-    ISO_20275_4HBI = "4HBI"
-    ISO_20275_5AWU = "5AWU"
-    ISO_20275_5K70 = "5K70"
-    ISO_20275_6EYT = "6EYT"
-    ISO_20275_761Z = "761Z"
-    ISO_20275_776G = "776G"
-    ISO_20275_784B = "784B"
-    ISO_20275_7G15 = "7G15"
-    ISO_20275_7H63 = "7H63"
-    ISO_20275_7L83 = "7L83"
-    ISO_20275_7PKK = "7PKK"
-    ISO_20275_8AGD = "8AGD"
-    ISO_20275_8M3D = "8M3D"
-    ISO_20275_8MY7 = "8MY7"
-    ISO_20275_8QZA = "8QZA"
-    ISO_20275_8RRB = "8RRB"
-    ISO_20275_8ZUV = "8ZUV"
-    ISO_20275_96OC = "96OC"
-    ISO_20275_A2A8 = "A2A8"
-    ISO_20275_ANXC = "ANXC"
-    ISO_20275_AOKU = "AOKU"
-    ISO_20275_B3WQ = "B3WQ"
-    ISO_20275_B8CE = "B8CE"
-    ISO_20275_BFIV = "BFIV"
-    ISO_20275_BOF1 = "BOF1"
-    ISO_20275_C4Z4 = "C4Z4"
-    ISO_20275_CAF9 = "CAF9"
-    ISO_20275_COVJ = "COVJ"
-    ISO_20275_CU5R = "CU5R"
-    ISO_20275_CU68 = "CU68"
-    ISO_20275_DBU3 = "DBU3"
-    ISO_20275_DHY2 = "DHY2"
-    ISO_20275_DNF1 = "DNF1"
-    ISO_20275_DU8H = "DU8H"
-    ISO_20275_E0YZ = "E0YZ"
-    ISO_20275_EHWD = "EHWD"
-    ISO_20275_F3L5 = "F3L5"
-    ISO_20275_FVTS = "FVTS"
-    ISO_20275_G3JV = "G3JV"
-    ISO_20275_G522 = "G522"
-    ISO_20275_G73Q = "G73Q"
-    ISO_20275_GNNT = "GNNT"
-    ISO_20275_GW1T = "GW1T"
-    ISO_20275_GXBE = "GXBE"
-    ISO_20275_H725 = "H725"
-    ISO_20275_HKWO = "HKWO"
-    ISO_20275_ICXT = "ICXT"
-    ISO_20275_IWNQ = "IWNQ"
-    ISO_20275_JGV1 = "JGV1"
-    ISO_20275_JN6Y = "JN6Y"
-    ISO_20275_JRAQ = "JRAQ"
-    ISO_20275_JSTL = "JSTL"
-    ISO_20275_JZ1I = "JZ1I"
-    ISO_20275_L2MQ = "L2MQ"
-    ISO_20275_L9JC = "L9JC"
-    ISO_20275_LBPW = "LBPW"
-    ISO_20275_LJTR = "LJTR"
-    ISO_20275_LOB9 = "LOB9"
-    ISO_20275_LVRX = "LVRX"
-    ISO_20275_M0SL = "M0SL"
-    ISO_20275_M44Q = "M44Q"
-    ISO_20275_MAM6 = "MAM6"
-    ISO_20275_MB35 = "MB35"
-    ISO_20275_N0JF = "N0JF"
-    ISO_20275_N124 = "N124"
-    ISO_20275_NA09 = "NA09"
-    ISO_20275_NHBK = "NHBK"
-    ISO_20275_NSZI = "NSZI"
-    ISO_20275_O15R = "O15R"
-    ISO_20275_OZ3O = "OZ3O"
-    ISO_20275_P28E = "P28E"
-    ISO_20275_P7VS = "P7VS"
-    ISO_20275_P8D7 = "P8D7"
-    ISO_20275_PG49 = "PG49"
-    ISO_20275_Q7WY = "Q7WY"
-    ISO_20275_QAUY = "QAUY"
-    ISO_20275_QM7Z = "QM7Z"
-    ISO_20275_QZB4 = "QZB4"
-    ISO_20275_R8PY = "R8PY"
-    ISO_20275_RCE0 = "RCE0"
-    ISO_20275_RCJS = "RCJS"
-    ISO_20275_RKLI = "RKLI"
-    ISO_20275_RQDD = "RQDD"
-    ISO_20275_RR3L = "RR3L"
-    ISO_20275_S6M8 = "S6M8"
-    ISO_20275_S8DM = "S8DM"
-    ISO_20275_SKO4 = "SKO4"
-    ISO_20275_TPJZ = "TPJZ"
-    ISO_20275_TTIF = "TTIF"
-    ISO_20275_TYW0 = "TYW0"
-    ISO_20275_U77P = "U77P"
-    ISO_20275_U901 = "U901"
-    ISO_20275_UBV0 = "UBV0"
-    ISO_20275_VATV = "VATV"
-    ISO_20275_VIOQ = "VIOQ"
-    ISO_20275_VN3F = "VN3F"
-    ISO_20275_W9WS = "W9WS"
-    ISO_20275_X9J8 = "X9J8"
-    ISO_20275_XDGC = "XDGC"
-    ISO_20275_XEN5 = "XEN5"
-    ISO_20275_XLVZ = "XLVZ"
-    ISO_20275_XSZY = "XSZY"
-    ISO_20275_YRI0 = "YRI0"
-    ISO_20275_ZAIS = "ZAIS"
-    ISO_20275_ZXVG = "ZXVG"
-    ISO_20275_528Z = "528Z"
-    ISO_20275_CWTQ = "CWTQ"
-    ISO_20275_DA06 = "DA06"
-    ISO_20275_GWZF = "GWZF"
-    ISO_20275_TU6A = "TU6A"
-    ISO_20275_X7W6 = "X7W6"
-    ISO_20275_33MN = "33MN"
-    ISO_20275_4QXM = "4QXM"
-    ISO_20275_54M6 = "54M6"
-    ISO_20275_5WU6 = "5WU6"
-    ISO_20275_62Y3 = "62Y3"
-    ISO_20275_9AAK = "9AAK"
-    ISO_20275_A0W7 = "A0W7"
-    ISO_20275_B5PM = "B5PM"
-    ISO_20275_BBEB = "BBEB"
-    ISO_20275_CODH = "CODH"
-    ISO_20275_DEO1 = "DEO1"
-    ISO_20275_EZQW = "EZQW"
-    ISO_20275_GNXT = "GNXT"
-    ISO_20275_JHK5 = "JHK5"
-    ISO_20275_L7HX = "L7HX"
-    ISO_20275_M1IZ = "M1IZ"
-    ISO_20275_NFFH = "NFFH"
-    ISO_20275_UNJ2 = "UNJ2"
-    ISO_20275_V44D = "V44D"
-    ISO_20275_Y3ZB = "Y3ZB"
-    ISO_20275_4LEA = "4LEA"
-    ISO_20275_F7KI = "F7KI"
-    ISO_20275_P2R9 = "P2R9"
-    ISO_20275_Z6ZU = "Z6ZU"
-    ISO_20275_149O = "149O"
-    ISO_20275_DTIU = "DTIU"
-    ISO_20275_HEXO = "HEXO"
-    ISO_20275_JCK1 = "JCK1"
-    ISO_20275_KHAB = "KHAB"
-    ISO_20275_KXDY = "KXDY"
-    ISO_20275_VPFY = "VPFY"
-    ISO_20275_XH7Z = "XH7Z"
-    ISO_20275_326Y = "326Y"
-    ISO_20275_3C7U = "3C7U"
-    ISO_20275_3L58 = "3L58"
-    ISO_20275_4ZRR = "4ZRR"
-    ISO_20275_50TD = "50TD"
-    ISO_20275_5ZTZ = "5ZTZ"
-    ISO_20275_8S9H = "8S9H"
-    ISO_20275_9DI1 = "9DI1"
-    ISO_20275_AEV1 = "AEV1"
-    ISO_20275_BJ65 = "BJ65"
-    ISO_20275_CF5L = "CF5L"
-    ISO_20275_DRPL = "DRPL"
-    ISO_20275_EXD7 = "EXD7"
-    ISO_20275_FSBD = "FSBD"
-    ISO_20275_GYY6 = "GYY6"
-    ISO_20275_IQGE = "IQGE"
-    ISO_20275_K5P8 = "K5P8"
-    ISO_20275_LJJW = "LJJW"
-    ISO_20275_M9IQ = "M9IQ"
-    ISO_20275_O0EU = "O0EU"
-    ISO_20275_O7LB = "O7LB"
-    ISO_20275_PB3V = "PB3V"
-    ISO_20275_Q0Q1 = "Q0Q1"
-    ISO_20275_R71C = "R71C"
-    ISO_20275_V06W = "V06W"
-    ISO_20275_YI42 = "YI42"
-    ISO_20275_YTMC = "YTMC"
-    ISO_20275_ZQ0Q = "ZQ0Q"
-    ISO_20275_4XMS = "4XMS"
-    ISO_20275_7IYW = "7IYW"
-    ISO_20275_88OX = "88OX"
-    ISO_20275_LH0Q = "LH0Q"
-    ISO_20275_MOI8 = "MOI8"
-    ISO_20275_QR25 = "QR25"
-    ISO_20275_RKYF = "RKYF"
-    ISO_20275_VQV6 = "VQV6"
-    ISO_20275_XBK3 = "XBK3"
-    ISO_20275_6TPA = "6TPA"
-    ISO_20275_BSN7 = "BSN7"
-    ISO_20275_GDT9 = "GDT9"
-    ISO_20275_JS13 = "JS13"
-    ISO_20275_PY5Y = "PY5Y"
-    ISO_20275_UNCO = "UNCO"
-    ISO_20275_V5VG = "V5VG"
-    ISO_20275_VIMA = "VIMA"
-    ISO_20275_6UED = "6UED"
-    ISO_20275_WHCV = "WHCV"
-    ISO_20275_ZE1G = "ZE1G"
-    ISO_20275_48X2 = "48X2"
-    ISO_20275_4QBB = "4QBB"
-    ISO_20275_78SG = "78SG"
-    ISO_20275_IJAO = "IJAO"
-    ISO_20275_K08V = "K08V"
-    ISO_20275_LNG8 = "LNG8"
-    ISO_20275_1MQ6 = "1MQ6"
-    ISO_20275_37G2 = "37G2"
-    ISO_20275_3LHF = "3LHF"
-    ISO_20275_4LCX = "4LCX"
-    ISO_20275_649C = "649C"
-    ISO_20275_73C0 = "73C0"
-    ISO_20275_AABQ = "AABQ"
-    ISO_20275_CHX6 = "CHX6"
-    ISO_20275_H8G2 = "H8G2"
-    ISO_20275_I695 = "I695"
-    ISO_20275_P53M = "P53M"
-    ISO_20275_PKRY = "PKRY"
-    ISO_20275_QQWG = "QQWG"
-    ISO_20275_RFJT = "RFJT"
-    ISO_20275_YMBC = "YMBC"
-    ISO_20275_76ME = "76ME"
-    ISO_20275_IODM = "IODM"
-    ISO_20275_KJOW = "KJOW"
-    ISO_20275_SPX9 = "SPX9"
-    ISO_20275_WHGH = "WHGH"
-    ISO_20275_ZJEX = "ZJEX"
-    ISO_20275_13ZV = "13ZV"
-    ISO_20275_3BJG = "3BJG"
-    ISO_20275_5F76 = "5F76"
-    ISO_20275_60BG = "60BG"
-    ISO_20275_629I = "629I"
-    ISO_20275_6LUM = "6LUM"
-    ISO_20275_6OYI = "6OYI"
-    ISO_20275_85PM = "85PM"
-    ISO_20275_8TOF = "8TOF"
-    ISO_20275_96XK = "96XK"
-    ISO_20275_AL9T = "AL9T"
-    ISO_20275_B21W = "B21W"
-    ISO_20275_BSJT = "BSJT"
-    ISO_20275_CY1M = "CY1M"
-    ISO_20275_EU0T = "EU0T"
-    ISO_20275_F21U = "F21U"
-    ISO_20275_FANM = "FANM"
-    ISO_20275_FJ0E = "FJ0E"
-    ISO_20275_FQ5Y = "FQ5Y"
-    ISO_20275_GZE5 = "GZE5"
-    ISO_20275_H7OD = "H7OD"
-    ISO_20275_HOT8 = "HOT8"
-    ISO_20275_J3A3 = "J3A3"
-    ISO_20275_JCKO = "JCKO"
-    ISO_20275_KM66 = "KM66"
-    ISO_20275_LT9U = "LT9U"
-    ISO_20275_O7XB = "O7XB"
-    ISO_20275_OMX0 = "OMX0"
-    ISO_20275_P1L1 = "P1L1"
-    ISO_20275_QUX1 = "QUX1"
-    ISO_20275_QYL4 = "QYL4"
-    ISO_20275_RBHP = "RBHP"
-    ISO_20275_RUCO = "RUCO"
-    ISO_20275_SMIS = "SMIS"
-    ISO_20275_SP4S = "SP4S"
-    ISO_20275_SVA3 = "SVA3"
-    ISO_20275_T7PB = "T7PB"
-    ISO_20275_WNX1 = "WNX1"
-    ISO_20275_WOK7 = "WOK7"
-    ISO_20275_WUJ2 = "WUJ2"
-    ISO_20275_YLZL = "YLZL"
-    ISO_20275_ZVVM = "ZVVM"
-    ISO_20275_ZZKE = "ZZKE"
-    ISO_20275_1HGD = "1HGD"
-    ISO_20275_5KVH = "5KVH"
-    ISO_20275_68PD = "68PD"
-    ISO_20275_6IK8 = "6IK8"
-    ISO_20275_6L6P = "6L6P"
-    ISO_20275_99JD = "99JD"
-    ISO_20275_A8CT = "A8CT"
-    ISO_20275_ALPT = "ALPT"
-    ISO_20275_D7OA = "D7OA"
-    ISO_20275_DFE5 = "DFE5"
-    ISO_20275_IX01 = "IX01"
-    ISO_20275_KUUV = "KUUV"
-    ISO_20275_MFHR = "MFHR"
-    ISO_20275_N66B = "N66B"
-    ISO_20275_NIQY = "NIQY"
-    ISO_20275_OXUC = "OXUC"
-    ISO_20275_P5S3 = "P5S3"
-    ISO_20275_PIDC = "PIDC"
-    ISO_20275_QFXD = "QFXD"
-    ISO_20275_USOG = "USOG"
-    ISO_20275_V6YL = "V6YL"
-    ISO_20275_VF4C = "VF4C"
-    ISO_20275_W9W3 = "W9W3"
-    ISO_20275_XD16 = "XD16"
-    ISO_20275_XMXM = "XMXM"
-    ISO_20275_YMLD = "YMLD"
-    ISO_20275_Z0NE = "Z0NE"
-    ISO_20275_ZILA = "ZILA"
-    ISO_20275_ZSWE = "ZSWE"
-    ISO_20275_IKBN = "IKBN"
-    ISO_20275_Z7ZX = "Z7ZX"
-    ISO_20275_194I = "194I"
-    ISO_20275_1TG4 = "1TG4"
-    ISO_20275_35RF = "35RF"
-    ISO_20275_3QX8 = "3QX8"
-    ISO_20275_4XY9 = "4XY9"
-    ISO_20275_6DE6 = "6DE6"
-    ISO_20275_7JAI = "7JAI"
-    ISO_20275_81YI = "81YI"
-    ISO_20275_87N3 = "87N3"
-    ISO_20275_9EGO = "9EGO"
-    ISO_20275_A4MM = "A4MM"
-    ISO_20275_BQ6L = "BQ6L"
-    ISO_20275_C907 = "C907"
-    ISO_20275_D5L6 = "D5L6"
-    ISO_20275_D8XQ = "D8XQ"
-    ISO_20275_DE7H = "DE7H"
-    ISO_20275_E85L = "E85L"
-    ISO_20275_EQQP = "EQQP"
-    ISO_20275_ERUM = "ERUM"
-    ISO_20275_GCP3 = "GCP3"
-    ISO_20275_GL33 = "GL33"
-    ISO_20275_GRH5 = "GRH5"
-    ISO_20275_I1WG = "I1WG"
-    ISO_20275_I6FV = "I6FV"
-    ISO_20275_INDH = "INDH"
-    ISO_20275_JJ1V = "JJ1V"
-    ISO_20275_ME4Y = "ME4Y"
-    ISO_20275_O2JM = "O2JM"
-    ISO_20275_O4QG = "O4QG"
-    ISO_20275_O8XV = "O8XV"
-    ISO_20275_RA5B = "RA5B"
-    ISO_20275_SOQ1 = "SOQ1"
-    ISO_20275_SQXC = "SQXC"
-    ISO_20275_T2JS = "T2JS"
-    ISO_20275_TEGV = "TEGV"
-    ISO_20275_TPFL = "TPFL"
-    ISO_20275_UL6C = "UL6C"
-    ISO_20275_VKSV = "VKSV"
-    ISO_20275_W6NI = "W6NI"
-    ISO_20275_XK6L = "XK6L"
-    ISO_20275_XUYT = "XUYT"
-    ISO_20275_Y21X = "Y21X"
-    ISO_20275_Y3T2 = "Y3T2"
-    ISO_20275_Y7LW = "Y7LW"
-    ISO_20275_YS16 = "YS16"
-    ISO_20275_ADV0 = "ADV0"
-    ISO_20275_B4L0 = "B4L0"
-    ISO_20275_KHBL = "KHBL"
-    ISO_20275_OR18 = "OR18"
-    ISO_20275_QZ84 = "QZ84"
-    ISO_20275_RN1W = "RN1W"
-    ISO_20275_W50Q = "W50Q"
-    ISO_20275_1CDX = "1CDX"
-    ISO_20275_37II = "37II"
-    ISO_20275_4V0A = "4V0A"
-    ISO_20275_5NCK = "5NCK"
-    ISO_20275_7B9H = "7B9H"
-    ISO_20275_7W9B = "7W9B"
-    ISO_20275_85K5 = "85K5"
-    ISO_20275_8FD2 = "8FD2"
-    ISO_20275_AI01 = "AI01"
-    ISO_20275_ANDT = "ANDT"
-    ISO_20275_CTBD = "CTBD"
-    ISO_20275_CUGP = "CUGP"
-    ISO_20275_DUGD = "DUGD"
-    ISO_20275_EFBR = "EFBR"
-    ISO_20275_F0BK = "F0BK"
-    ISO_20275_F68H = "F68H"
-    ISO_20275_FJQ8 = "FJQ8"
-    ISO_20275_GT4V = "GT4V"
-    ISO_20275_I15K = "I15K"
-    ISO_20275_I9BB = "I9BB"
-    ISO_20275_NFRJ = "NFRJ"
-    ISO_20275_SWMK = "SWMK"
-    ISO_20275_TH8A = "TH8A"
-    ISO_20275_UWEE = "UWEE"
-    ISO_20275_V0FL = "V0FL"
-    ISO_20275_XHN1 = "XHN1"
-    ISO_20275_15A2 = "15A2"
-    ISO_20275_17R7 = "17R7"
-    ISO_20275_1MJ0 = "1MJ0"
-    ISO_20275_1RJ2 = "1RJ2"
-    ISO_20275_1U7Y = "1U7Y"
-    ISO_20275_24TU = "24TU"
-    ISO_20275_2H36 = "2H36"
-    ISO_20275_2OTW = "2OTW"
-    ISO_20275_2R46 = "2R46"
-    ISO_20275_37YG = "37YG"
-    ISO_20275_3AMJ = "3AMJ"
-    ISO_20275_3EAX = "3EAX"
-    ISO_20275_3F98 = "3F98"
-    ISO_20275_3TOV = "3TOV"
-    ISO_20275_3U8X = "3U8X"
-    ISO_20275_4PZX = "4PZX"
-    ISO_20275_4TYO = "4TYO"
-    ISO_20275_4VTZ = "4VTZ"
-    ISO_20275_5VMR = "5VMR"
-    ISO_20275_6H83 = "6H83"
-    ISO_20275_8B9A = "8B9A"
-    ISO_20275_8JWV = "8JWV"
-    ISO_20275_8MQM = "8MQM"
-    ISO_20275_8NF7 = "8NF7"
-    ISO_20275_8NZE = "8NZE"
-    ISO_20275_8RIH = "8RIH"
-    ISO_20275_8XDD = "8XDD"
-    ISO_20275_9M15 = "9M15"
-    ISO_20275_9RQZ = "9RQZ"
-    ISO_20275_AS78 = "AS78"
-    ISO_20275_B5GH = "B5GH"
-    ISO_20275_BLVV = "BLVV"
-    ISO_20275_BQ3A = "BQ3A"
-    ISO_20275_BZQL = "BZQL"
-    ISO_20275_C3RQ = "C3RQ"
-    ISO_20275_C7TI = "C7TI"
-    ISO_20275_CKTA = "CKTA"
-    ISO_20275_CN7I = "CN7I"
-    ISO_20275_D094 = "D094"
-    ISO_20275_D84J = "D84J"
-    ISO_20275_DO25 = "DO25"
-    ISO_20275_DZSY = "DZSY"
-    ISO_20275_E0VI = "E0VI"
-    ISO_20275_EH3M = "EH3M"
-    ISO_20275_EWQF = "EWQF"
-    ISO_20275_FWGK = "FWGK"
-    ISO_20275_FZKX = "FZKX"
-    ISO_20275_G2CW = "G2CW"
-    ISO_20275_GHC5 = "GHC5"
-    ISO_20275_GQRJ = "GQRJ"
-    ISO_20275_GWHK = "GWHK"
-    ISO_20275_GZF9 = "GZF9"
-    ISO_20275_H2AF = "H2AF"
-    ISO_20275_H2P4 = "H2P4"
-    ISO_20275_H4NY = "H4NY"
-    ISO_20275_HKKL = "HKKL"
-    ISO_20275_HUET = "HUET"
-    ISO_20275_HUR1 = "HUR1"
-    ISO_20275_I9O1 = "I9O1"
-    ISO_20275_I9V2 = "I9V2"
-    ISO_20275_IBSS = "IBSS"
-    ISO_20275_IC46 = "IC46"
-    ISO_20275_ILY0 = "ILY0"
-    ISO_20275_J18N = "J18N"
-    ISO_20275_J7NW = "J7NW"
-    ISO_20275_JPMQ = "JPMQ"
-    ISO_20275_JZBN = "JZBN"
-    ISO_20275_KLA2 = "KLA2"
-    ISO_20275_KOYR = "KOYR"
-    ISO_20275_KVSH = "KVSH"
-    ISO_20275_KZC6 = "KZC6"
-    ISO_20275_LLL8 = "LLL8"
-    ISO_20275_LYTH = "LYTH"
-    ISO_20275_MG22 = "MG22"
-    ISO_20275_MT3A = "MT3A"
-    ISO_20275_MV1C = "MV1C"
-    ISO_20275_MVSF = "MVSF"
-    ISO_20275_NRK9 = "NRK9"
-    ISO_20275_NZ85 = "NZ85"
-    ISO_20275_O1KO = "O1KO"
-    ISO_20275_OCIS = "OCIS"
-    ISO_20275_OPLQ = "OPLQ"
-    ISO_20275_OVLN = "OVLN"
-    ISO_20275_P9CF = "P9CF"
-    ISO_20275_PA5X = "PA5X"
-    ISO_20275_PDYW = "PDYW"
-    ISO_20275_PJRZ = "PJRZ"
-    ISO_20275_Q9FA = "Q9FA"
-    ISO_20275_QCRH = "QCRH"
-    ISO_20275_QFGM = "QFGM"
-    ISO_20275_QKFU = "QKFU"
-    ISO_20275_QMEH = "QMEH"
-    ISO_20275_QQS1 = "QQS1"
-    ISO_20275_QSXT = "QSXT"
-    ISO_20275_QUMQ = "QUMQ"
-    ISO_20275_R71T = "R71T"
-    ISO_20275_RJUK = "RJUK"
-    ISO_20275_SDVV = "SDVV"
-    ISO_20275_SIPP = "SIPP"
-    ISO_20275_TLDB = "TLDB"
-    ISO_20275_TMIG = "TMIG"
-    ISO_20275_UTBN = "UTBN"
-    ISO_20275_UY49 = "UY49"
-    ISO_20275_VA0A = "VA0A"
-    ISO_20275_VAB6 = "VAB6"
-    ISO_20275_VE1P = "VE1P"
-    ISO_20275_VEOU = "VEOU"
-    ISO_20275_VEX5 = "VEX5"
-    ISO_20275_VIGZ = "VIGZ"
-    ISO_20275_VOUU = "VOUU"
-    ISO_20275_WJXS = "WJXS"
-    ISO_20275_WYNO = "WYNO"
-    ISO_20275_XBRI = "XBRI"
-    ISO_20275_XIGI = "XIGI"
-    ISO_20275_XINV = "XINV"
-    ISO_20275_XJJR = "XJJR"
-    ISO_20275_XNKN = "XNKN"
-    ISO_20275_YA7H = "YA7H"
-    ISO_20275_YGHZ = "YGHZ"
-    ISO_20275_YJ6A = "YJ6A"
-    ISO_20275_Z2AQ = "Z2AQ"
-    ISO_20275_Z3SH = "Z3SH"
-    ISO_20275_Z3Y0 = "Z3Y0"
-    ISO_20275_ZGYA = "ZGYA"
-    ISO_20275_ZH3O = "ZH3O"
-    ISO_20275_ZKAF = "ZKAF"
-    ISO_20275_ZNHF = "ZNHF"
-    ISO_20275_29OB = "29OB"
-    ISO_20275_AHRM = "AHRM"
-    ISO_20275_I93O = "I93O"
-    ISO_20275_KYOI = "KYOI"
-    ISO_20275_WFYL = "WFYL"
-    ISO_20275_ZJZB = "ZJZB"
-    ISO_20275_2F0A = "2F0A"
-    ISO_20275_4EP1 = "4EP1"
-    ISO_20275_7Z3M = "7Z3M"
-    ISO_20275_BXZH = "BXZH"
-    ISO_20275_EF4Y = "EF4Y"
-    ISO_20275_H64R = "H64R"
-    ISO_20275_HW77 = "HW77"
-    ISO_20275_I03S = "I03S"
-    ISO_20275_I8G4 = "I8G4"
-    ISO_20275_OTE3 = "OTE3"
-    ISO_20275_10ST = "10ST"
-    ISO_20275_1PWF = "1PWF"
-    ISO_20275_3QSG = "3QSG"
-    ISO_20275_5EKE = "5EKE"
-    ISO_20275_ABII = "ABII"
-    ISO_20275_FG2L = "FG2L"
-    ISO_20275_I9K6 = "I9K6"
-    ISO_20275_LCVA = "LCVA"
-    ISO_20275_QYZD = "QYZD"
-    ISO_20275_REVF = "REVF"
-    ISO_20275_RY5B = "RY5B"
-    ISO_20275_S1OK = "S1OK"
-    ISO_20275_U5AR = "U5AR"
-    ISO_20275_XY6R = "XY6R"
-    ISO_20275_YN9Y = "YN9Y"
-    ISO_20275_1RPE = "1RPE"
-    ISO_20275_7WL9 = "7WL9"
-    ISO_20275_BCM3 = "BCM3"
-    ISO_20275_M6YY = "M6YY"
-    ISO_20275_QWFD = "QWFD"
-    ISO_20275_SXY3 = "SXY3"
-    ISO_20275_TOMA = "TOMA"
-    ISO_20275_78VH = "78VH"
-    ISO_20275_B3JS = "B3JS"
-    ISO_20275_DW9N = "DW9N"
-    ISO_20275_N10C = "N10C"
-    ISO_20275_PT6M = "PT6M"
-    ISO_20275_T2NA = "T2NA"
-    ISO_20275_TTE8 = "TTE8"
-    ISO_20275_WHCI = "WHCI"
-    ISO_20275_YVGA = "YVGA"
-    ISO_20275_Z9IE = "Z9IE"
-    ISO_20275_6UPM = "6UPM"
-    ISO_20275_73PZ = "73PZ"
-    ISO_20275_88TX = "88TX"
-    ISO_20275_9O67 = "9O67"
-    ISO_20275_DEF6 = "DEF6"
-    ISO_20275_E7W8 = "E7W8"
-    ISO_20275_KIU5 = "KIU5"
-    ISO_20275_YVPW = "YVPW"
-    ISO_20275_ZPOY = "ZPOY"
-    ISO_20275_3YUS = "3YUS"
-    ISO_20275_6MS4 = "6MS4"
-    ISO_20275_7QEH = "7QEH"
-    ISO_20275_7XUS = "7XUS"
-    ISO_20275_BB5Y = "BB5Y"
-    ISO_20275_CDYY = "CDYY"
-    ISO_20275_E3YL = "E3YL"
-    ISO_20275_G6M8 = "G6M8"
-    ISO_20275_H35I = "H35I"
-    ISO_20275_H987 = "H987"
-    ISO_20275_KGUS = "KGUS"
-    ISO_20275_KOFC = "KOFC"
-    ISO_20275_P3YJ = "P3YJ"
-    ISO_20275_Q9VK = "Q9VK"
-    ISO_20275_VA1X = "VA1X"
-    ISO_20275_WKFR = "WKFR"
-    ISO_20275_17FJ = "17FJ"
-    ISO_20275_2PHU = "2PHU"
-    ISO_20275_5SGV = "5SGV"
-    ISO_20275_KEMH = "KEMH"
-    ISO_20275_LWXI = "LWXI"
-    ISO_20275_1CSZ = "1CSZ"
-    ISO_20275_2CC3 = "2CC3"
-    ISO_20275_2UBX = "2UBX"
-    ISO_20275_52AV = "52AV"
-    ISO_20275_66T3 = "66T3"
-    ISO_20275_8W32 = "8W32"
-    ISO_20275_B4OI = "B4OI"
-    ISO_20275_FBX9 = "FBX9"
-    ISO_20275_FI9R = "FI9R"
-    ISO_20275_NWT1 = "NWT1"
-    ISO_20275_SXX9 = "SXX9"
-    ISO_20275_YXX0 = "YXX0"
-    ISO_20275_14NU = "14NU"
-    ISO_20275_189Q = "189Q"
-    ISO_20275_1CSW = "1CSW"
-    ISO_20275_1GLU = "1GLU"
-    ISO_20275_1HEP = "1HEP"
-    ISO_20275_1K73 = "1K73"
-    ISO_20275_1W8B = "1W8B"
-    ISO_20275_2EEG = "2EEG"
-    ISO_20275_2KMA = "2KMA"
-    ISO_20275_2XNE = "2XNE"
-    ISO_20275_3P3W = "3P3W"
-    ISO_20275_43MZ = "43MZ"
-    ISO_20275_46CD = "46CD"
-    ISO_20275_4CKX = "4CKX"
-    ISO_20275_4GX1 = "4GX1"
-    ISO_20275_5AM3 = "5AM3"
-    ISO_20275_5J5Y = "5J5Y"
-    ISO_20275_5YBL = "5YBL"
-    ISO_20275_5Z8W = "5Z8W"
-    ISO_20275_6R72 = "6R72"
-    ISO_20275_72R7 = "72R7"
-    ISO_20275_73MQ = "73MQ"
-    ISO_20275_7EG2 = "7EG2"
-    ISO_20275_7O89 = "7O89"
-    ISO_20275_7QSE = "7QSE"
-    ISO_20275_8KHD = "8KHD"
-    ISO_20275_8RE3 = "8RE3"
-    ISO_20275_8UE6 = "8UE6"
-    ISO_20275_90YN = "90YN"
-    ISO_20275_93WZ = "93WZ"
-    ISO_20275_95MS = "95MS"
-    ISO_20275_9L9V = "9L9V"
-    ISO_20275_9NSV = "9NSV"
-    ISO_20275_AGSR = "AGSR"
-    ISO_20275_BKEB = "BKEB"
-    ISO_20275_BUMI = "BUMI"
-    ISO_20275_C4PZ = "C4PZ"
-    ISO_20275_CS8B = "CS8B"
-    ISO_20275_D18J = "D18J"
-    ISO_20275_DAQC = "DAQC"
-    ISO_20275_E1VK = "E1VK"
-    ISO_20275_E4CI = "E4CI"
-    ISO_20275_E9SH = "E9SH"
-    ISO_20275_ED84 = "ED84"
-    ISO_20275_ER02 = "ER02"
-    ISO_20275_F560 = "F560"
-    ISO_20275_FDVU = "FDVU"
-    ISO_20275_FMUC = "FMUC"
-    ISO_20275_FQRE = "FQRE"
-    ISO_20275_GL07 = "GL07"
-    ISO_20275_GY5R = "GY5R"
-    ISO_20275_HZG7 = "HZG7"
-    ISO_20275_HZI2 = "HZI2"
-    ISO_20275_I7AS = "I7AS"
-    ISO_20275_ISCZ = "ISCZ"
-    ISO_20275_IW8Z = "IW8Z"
-    ISO_20275_J8DW = "J8DW"
-    ISO_20275_JKC5 = "JKC5"
-    ISO_20275_KB52 = "KB52"
-    ISO_20275_KVQU = "KVQU"
-    ISO_20275_KWFE = "KWFE"
-    ISO_20275_KZ3R = "KZ3R"
-    ISO_20275_L1M7 = "L1M7"
-    ISO_20275_L9WT = "L9WT"
-    ISO_20275_MSGT = "MSGT"
-    ISO_20275_MY1S = "MY1S"
-    ISO_20275_N5MX = "N5MX"
-    ISO_20275_N7I1 = "N7I1"
-    ISO_20275_N9QW = "N9QW"
-    ISO_20275_NC88 = "NC88"
-    ISO_20275_NL31 = "NL31"
-    ISO_20275_NLI7 = "NLI7"
-    ISO_20275_NO20 = "NO20"
-    ISO_20275_O0Y2 = "O0Y2"
-    ISO_20275_O7TC = "O7TC"
-    ISO_20275_OKAZ = "OKAZ"
-    ISO_20275_P6XJ = "P6XJ"
-    ISO_20275_PX29 = "PX29"
-    ISO_20275_QACV = "QACV"
-    ISO_20275_QCJ9 = "QCJ9"
-    ISO_20275_R9GT = "R9GT"
-    ISO_20275_RF3D = "RF3D"
-    ISO_20275_S5E1 = "S5E1"
-    ISO_20275_SIRY = "SIRY"
-    ISO_20275_SMUS = "SMUS"
-    ISO_20275_SPIE = "SPIE"
-    ISO_20275_SQ4I = "SQ4I"
-    ISO_20275_SQFW = "SQFW"
-    ISO_20275_STUP = "STUP"
-    ISO_20275_SUH3 = "SUH3"
-    ISO_20275_T0KQ = "T0KQ"
-    ISO_20275_TAV3 = "TAV3"
-    ISO_20275_TG3X = "TG3X"
-    ISO_20275_U3QQ = "U3QQ"
-    ISO_20275_U5IM = "U5IM"
-    ISO_20275_U7QK = "U7QK"
-    ISO_20275_UCTO = "UCTO"
-    ISO_20275_VATN = "VATN"
-    ISO_20275_VRJP = "VRJP"
-    ISO_20275_VSC1 = "VSC1"
-    ISO_20275_VSZS = "VSZS"
-    ISO_20275_WQCR = "WQCR"
-    ISO_20275_XLXU = "XLXU"
-    ISO_20275_Y1X5 = "Y1X5"
-    ISO_20275_Y45Q = "Y45Q"
-    ISO_20275_YB59 = "YB59"
-    ISO_20275_YF99 = "YF99"
-    ISO_20275_YGN4 = "YGN4"
-    ISO_20275_YRIU = "YRIU"
-    ISO_20275_YVE8 = "YVE8"
-    ISO_20275_YVWB = "YVWB"
-    ISO_20275_ZG2I = "ZG2I"
-    ISO_20275_14AT = "14AT"
-    ISO_20275_1OR3 = "1OR3"
-    ISO_20275_2CTG = "2CTG"
-    ISO_20275_34PA = "34PA"
-    ISO_20275_4A8T = "4A8T"
-    ISO_20275_5LXY = "5LXY"
-    ISO_20275_6MPY = "6MPY"
-    ISO_20275_8ER6 = "8ER6"
-    ISO_20275_D64E = "D64E"
-    ISO_20275_E01X = "E01X"
-    ISO_20275_HJCS = "HJCS"
-    ISO_20275_I7MN = "I7MN"
-    ISO_20275_ICQT = "ICQT"
-    ISO_20275_JQA2 = "JQA2"
-    ISO_20275_KBKD = "KBKD"
-    ISO_20275_KH4O = "KH4O"
-    ISO_20275_LNYR = "LNYR"
-    ISO_20275_M84A = "M84A"
-    ISO_20275_OPDJ = "OPDJ"
-    ISO_20275_Q2EV = "Q2EV"
-    ISO_20275_QUEA = "QUEA"
-    ISO_20275_QW8S = "QW8S"
-    ISO_20275_QYQ5 = "QYQ5"
-    ISO_20275_RAX7 = "RAX7"
-    ISO_20275_RG9Z = "RG9Z"
-    ISO_20275_S1UI = "S1UI"
-    ISO_20275_SD81 = "SD81"
-    ISO_20275_TMVE = "TMVE"
-    ISO_20275_UDQJ = "UDQJ"
-    ISO_20275_UESF = "UESF"
-    ISO_20275_UG0E = "UG0E"
-    ISO_20275_WZ78 = "WZ78"
-    ISO_20275_X94Z = "X94Z"
-    ISO_20275_8PIA = "8PIA"
-    ISO_20275_A7VA = "A7VA"
-    ISO_20275_YSBJ = "YSBJ"
-    ISO_20275_Z4ZP = "Z4ZP"
-    ISO_20275_4YUU = "4YUU"
-    ISO_20275_CXWJ = "CXWJ"
-    ISO_20275_GQVQ = "GQVQ"
-    ISO_20275_J7L0 = "J7L0"
-    ISO_20275_MZT6 = "MZT6"
-    ISO_20275_R155 = "R155"
-    ISO_20275_R59V = "R59V"
-    ISO_20275_U89P = "U89P"
-    ISO_20275_XE4Z = "XE4Z"
-    ISO_20275_ZE81 = "ZE81"
-    ISO_20275_1G29 = "1G29"
-    ISO_20275_1QU8 = "1QU8"
-    ISO_20275_1SL4 = "1SL4"
-    ISO_20275_1ZHJ = "1ZHJ"
-    ISO_20275_4S57 = "4S57"
-    ISO_20275_4SJR = "4SJR"
-    ISO_20275_5RDO = "5RDO"
-    ISO_20275_7U8O = "7U8O"
-    ISO_20275_8EHB = "8EHB"
-    ISO_20275_956I = "956I"
-    ISO_20275_9FPZ = "9FPZ"
-    ISO_20275_A0J6 = "A0J6"
-    ISO_20275_A97B = "A97B"
-    ISO_20275_AJ9U = "AJ9U"
-    ISO_20275_ARDP = "ARDP"
-    ISO_20275_AXS5 = "AXS5"
-    ISO_20275_B0V5 = "B0V5"
-    ISO_20275_BI3B = "BI3B"
-    ISO_20275_CUIH = "CUIH"
-    ISO_20275_DDES = "DDES"
-    ISO_20275_DP3Q = "DP3Q"
-    ISO_20275_FCJF = "FCJF"
-    ISO_20275_FH4R = "FH4R"
-    ISO_20275_GJL1 = "GJL1"
-    ISO_20275_GJTL = "GJTL"
-    ISO_20275_HRQA = "HRQA"
-    ISO_20275_I2WU = "I2WU"
-    ISO_20275_IAS6 = "IAS6"
-    ISO_20275_IT6N = "IT6N"
-    ISO_20275_JB2M = "JB2M"
-    ISO_20275_JTV5 = "JTV5"
-    ISO_20275_K0RI = "K0RI"
-    ISO_20275_K6L9 = "K6L9"
-    ISO_20275_MDOL = "MDOL"
-    ISO_20275_QMUM = "QMUM"
-    ISO_20275_R2L8 = "R2L8"
-    ISO_20275_R6UT = "R6UT"
-    ISO_20275_S0Z5 = "S0Z5"
-    ISO_20275_S6MS = "S6MS"
-    ISO_20275_S6X7 = "S6X7"
-    ISO_20275_SS0L = "SS0L"
-    ISO_20275_TDD5 = "TDD5"
-    ISO_20275_TUHS = "TUHS"
-    ISO_20275_UJ35 = "UJ35"
-    ISO_20275_VFIU = "VFIU"
-    ISO_20275_XYGP = "XYGP"
-    ISO_20275_8MS6 = "8MS6"
-    ISO_20275_K4ZA = "K4ZA"
-    ISO_20275_KJZ3 = "KJZ3"
-    ISO_20275_OBTO = "OBTO"
-    ISO_20275_QPC9 = "QPC9"
-    ISO_20275_QWWY = "QWWY"
-    ISO_20275_R6BI = "R6BI"
-    ISO_20275_TCVB = "TCVB"
-    ISO_20275_WBWC = "WBWC"
-    ISO_20275_1TN0 = "1TN0"
-    ISO_20275_2UAX = "2UAX"
-    ISO_20275_381R = "381R"
-    ISO_20275_54P7 = "54P7"
-    ISO_20275_9YIP = "9YIP"
-    ISO_20275_AZTO = "AZTO"
-    ISO_20275_BEAY = "BEAY"
-    ISO_20275_BYQJ = "BYQJ"
-    ISO_20275_C61P = "C61P"
-    ISO_20275_CX05 = "CX05"
-    ISO_20275_G04R = "G04R"
-    ISO_20275_M0Y0 = "M0Y0"
-    ISO_20275_O1QI = "O1QI"
-    ISO_20275_OJ9I = "OJ9I"
-    ISO_20275_PDQ0 = "PDQ0"
-    ISO_20275_RLJO = "RLJO"
-    ISO_20275_RYFP = "RYFP"
-    ISO_20275_SSOM = "SSOM"
-    ISO_20275_WZDB = "WZDB"
-    ISO_20275_XJHM = "XJHM"
-    ISO_20275_1BL5 = "1BL5"
-    ISO_20275_1RKS = "1RKS"
-    ISO_20275_2B81 = "2B81"
-    ISO_20275_2JZ4 = "2JZ4"
-    ISO_20275_2WFG = "2WFG"
-    ISO_20275_2XJA = "2XJA"
-    ISO_20275_3EKS = "3EKS"
-    ISO_20275_54WI = "54WI"
-    ISO_20275_5BEZ = "5BEZ"
-    ISO_20275_7MNN = "7MNN"
-    ISO_20275_AZA0 = "AZA0"
-    ISO_20275_BF9N = "BF9N"
-    ISO_20275_CQMY = "CQMY"
-    ISO_20275_DP2E = "DP2E"
-    ISO_20275_E0NE = "E0NE"
-    ISO_20275_FFTN = "FFTN"
-    ISO_20275_FJG4 = "FJG4"
-    ISO_20275_FLNB = "FLNB"
-    ISO_20275_GP8M = "GP8M"
-    ISO_20275_H781 = "H781"
-    ISO_20275_HX77 = "HX77"
-    ISO_20275_JB25 = "JB25"
-    ISO_20275_KJ9Q = "KJ9Q"
-    ISO_20275_L5DU = "L5DU"
-    ISO_20275_M848 = "M848"
-    ISO_20275_MRSY = "MRSY"
-    ISO_20275_MVII = "MVII"
-    ISO_20275_OBFU = "OBFU"
-    ISO_20275_QSI2 = "QSI2"
-    ISO_20275_R9TC = "R9TC"
-    ISO_20275_TL87 = "TL87"
-    ISO_20275_UNA9 = "UNA9"
-    ISO_20275_VPRH = "VPRH"
-    ISO_20275_W6A7 = "W6A7"
-    ISO_20275_XJOT = "XJOT"
-    ISO_20275_YRGM = "YRGM"
-    ISO_20275_UZUP = "UZUP"
-    ISO_20275_ZQEN = "ZQEN"
-    ISO_20275_AF67 = "AF67"
-    ISO_20275_F502 = "F502"
-    ISO_20275_WSE1 = "WSE1"
-    ISO_20275_YVSL = "YVSL"
-    ISO_20275_5T3H = "5T3H"
-    ISO_20275_JMQU = "JMQU"
-    ISO_20275_ONVA = "ONVA"
-    ISO_20275_R5UT = "R5UT"
-    ISO_20275_W2SQ = "W2SQ"
-    ISO_20275_F8VX = "F8VX"
-    ISO_20275_JGNU = "JGNU"
-    ISO_20275_LOL8 = "LOL8"
-    ISO_20275_MV4S = "MV4S"
-    ISO_20275_RWVW = "RWVW"
-    ISO_20275_WR09 = "WR09"
-    ISO_20275_4VPM = "4VPM"
-    ISO_20275_6H9F = "6H9F"
-    ISO_20275_9I58 = "9I58"
-    ISO_20275_9U6F = "9U6F"
-    ISO_20275_B13W = "B13W"
-    ISO_20275_FE4G = "FE4G"
-    ISO_20275_GU5E = "GU5E"
-    ISO_20275_H8MU = "H8MU"
-    ISO_20275_HECG = "HECG"
-    ISO_20275_KAEM = "KAEM"
-    ISO_20275_LZ3H = "LZ3H"
-    ISO_20275_OSE2 = "OSE2"
-    ISO_20275_PNX6 = "PNX6"
-    ISO_20275_R2YL = "R2YL"
-    ISO_20275_VKZD = "VKZD"
-    ISO_20275_375P = "375P"
-    ISO_20275_3P03 = "3P03"
-    ISO_20275_46QC = "46QC"
-    ISO_20275_70EO = "70EO"
-    ISO_20275_AIR0 = "AIR0"
-    ISO_20275_F3UE = "F3UE"
-    ISO_20275_RWX4 = "RWX4"
-    ISO_20275_V2PA = "V2PA"
-    ISO_20275_VTIP = "VTIP"
-    ISO_20275_35BX = "35BX"
-    ISO_20275_FHRL = "FHRL"
-    ISO_20275_GQ8F = "GQ8F"
-    ISO_20275_HNPH = "HNPH"
-    ISO_20275_QJVN = "QJVN"
-    ISO_20275_UAES = "UAES"
-    ISO_20275_Z3P8 = "Z3P8"
-    ISO_20275_17R0 = "17R0"
-    ISO_20275_1W62 = "1W62"
-    ISO_20275_468Q = "468Q"
-    ISO_20275_4A3J = "4A3J"
-    ISO_20275_4GJI = "4GJI"
-    ISO_20275_55MA = "55MA"
-    ISO_20275_57V7 = "57V7"
-    ISO_20275_5FRT = "5FRT"
-    ISO_20275_60IF = "60IF"
-    ISO_20275_7T8N = "7T8N"
-    ISO_20275_7VVZ = "7VVZ"
-    ISO_20275_8CF0 = "8CF0"
-    ISO_20275_9B78 = "9B78"
-    ISO_20275_A2X8 = "A2X8"
-    ISO_20275_AVYY = "AVYY"
-    ISO_20275_B6ES = "B6ES"
-    ISO_20275_BX6Y = "BX6Y"
-    ISO_20275_C605 = "C605"
-    ISO_20275_CDOT = "CDOT"
-    ISO_20275_E12O = "E12O"
-    ISO_20275_FVGZ = "FVGZ"
-    ISO_20275_G12F = "G12F"
-    ISO_20275_H0PO = "H0PO"
-    ISO_20275_HHYT = "HHYT"
-    ISO_20275_HX6D = "HX6D"
-    ISO_20275_ID30 = "ID30"
-    ISO_20275_IYXU = "IYXU"
-    ISO_20275_JTCO = "JTCO"
-    ISO_20275_NAUO = "NAUO"
-    ISO_20275_NBTW = "NBTW"
-    ISO_20275_Q0M5 = "Q0M5"
-    ISO_20275_STX7 = "STX7"
-    ISO_20275_T61R = "T61R"
-    ISO_20275_TT2H = "TT2H"
-    ISO_20275_TYJK = "TYJK"
-    ISO_20275_U6R9 = "U6R9"
-    ISO_20275_UTY8 = "UTY8"
-    ISO_20275_VV0W = "VV0W"
-    ISO_20275_VYF8 = "VYF8"
-    ISO_20275_WBQU = "WBQU"
-    ISO_20275_WJ0A = "WJ0A"
-    ISO_20275_XLZV = "XLZV"
-    ISO_20275_Z0EY = "Z0EY"
-    ISO_20275_ZQ6S = "ZQ6S"
-    ISO_20275_ZZGG = "ZZGG"
-    ISO_20275_380O = "380O"
-    ISO_20275_3MM4 = "3MM4"
-    ISO_20275_62VJ = "62VJ"
-    ISO_20275_Z7ER = "Z7ER"
-    ISO_20275_CR3H = "CR3H"
-    ISO_20275_CWRI = "CWRI"
-    ISO_20275_FIP8 = "FIP8"
-    ISO_20275_HFGV = "HFGV"
-    ISO_20275_HN8W = "HN8W"
-    ISO_20275_JPZW = "JPZW"
-    ISO_20275_QUNR = "QUNR"
-    ISO_20275_V65U = "V65U"
-    ISO_20275_WDT2 = "WDT2"
-    ISO_20275_7GTR = "7GTR"
-    ISO_20275_7QKB = "7QKB"
-    ISO_20275_9A4Q = "9A4Q"
-    ISO_20275_BRO8 = "BRO8"
-    ISO_20275_C0VE = "C0VE"
-    ISO_20275_D4YS = "D4YS"
-    ISO_20275_EQAQ = "EQAQ"
-    ISO_20275_K2BJ = "K2BJ"
-    ISO_20275_M886 = "M886"
-    ISO_20275_OVBT = "OVBT"
-    ISO_20275_TRS2 = "TRS2"
-    ISO_20275_VXDE = "VXDE"
-    ISO_20275_WNKG = "WNKG"
-    ISO_20275_1T9S = "1T9S"
-    ISO_20275_5MNR = "5MNR"
-    ISO_20275_78H5 = "78H5"
-    ISO_20275_A9AW = "A9AW"
-    ISO_20275_D8PB = "D8PB"
-    ISO_20275_FGVH = "FGVH"
-    ISO_20275_IMDT = "IMDT"
-    ISO_20275_IVQQ = "IVQQ"
-    ISO_20275_N69M = "N69M"
-    ISO_20275_O85W = "O85W"
-    ISO_20275_P24O = "P24O"
-    ISO_20275_QEEJ = "QEEJ"
-    ISO_20275_QUJ5 = "QUJ5"
-    ISO_20275_RSWJ = "RSWJ"
-    ISO_20275_S68T = "S68T"
-    ISO_20275_ST2Q = "ST2Q"
-    ISO_20275_UGE3 = "UGE3"
-    ISO_20275_VKPN = "VKPN"
-    ISO_20275_1K9U = "1K9U"
-    ISO_20275_EJX1 = "EJX1"
-    ISO_20275_GD6J = "GD6J"
-    ISO_20275_JR6U = "JR6U"
-    ISO_20275_KGZ8 = "KGZ8"
-    ISO_20275_L2DM = "L2DM"
-    ISO_20275_M4FO = "M4FO"
-    ISO_20275_MJJZ = "MJJZ"
-    ISO_20275_4JCS = "4JCS"
-    ISO_20275_5HQ4 = "5HQ4"
-    ISO_20275_5Y1L = "5Y1L"
-    ISO_20275_7CDL = "7CDL"
-    ISO_20275_BADE = "BADE"
-    ISO_20275_CVXK = "CVXK"
-    ISO_20275_EI4J = "EI4J"
-    ISO_20275_G1P6 = "G1P6"
-    ISO_20275_H1UM = "H1UM"
-    ISO_20275_K7YU = "K7YU"
-    ISO_20275_KQXA = "KQXA"
-    ISO_20275_LYRX = "LYRX"
-    ISO_20275_N295 = "N295"
-    ISO_20275_PZR6 = "PZR6"
-    ISO_20275_SQ7B = "SQ7B"
-    ISO_20275_1JXS = "1JXS"
-    ISO_20275_81WV = "81WV"
-    ISO_20275_BC32 = "BC32"
-    ISO_20275_HLCG = "HLCG"
-    ISO_20275_I3Z9 = "I3Z9"
-    ISO_20275_L10T = "L10T"
-    ISO_20275_LDHG = "LDHG"
-    ISO_20275_M64D = "M64D"
-    ISO_20275_OWR6 = "OWR6"
-    ISO_20275_PDLV = "PDLV"
-    ISO_20275_TOBE = "TOBE"
-    ISO_20275_WE9D = "WE9D"
-    ISO_20275_ZCHO = "ZCHO"
-    ISO_20275_7W53 = "7W53"
-    ISO_20275_JKOT = "JKOT"
-    ISO_20275_L7HH = "L7HH"
-    ISO_20275_LIEA = "LIEA"
-    ISO_20275_LKQ2 = "LKQ2"
-    ISO_20275_SHCN = "SHCN"
-    ISO_20275_T5X4 = "T5X4"
-    ISO_20275_T80N = "T80N"
-    ISO_20275_WT0G = "WT0G"
-    ISO_20275_Y182 = "Y182"
-    ISO_20275_12N6 = "12N6"
-    ISO_20275_1HXP = "1HXP"
-    ISO_20275_4FSX = "4FSX"
-    ISO_20275_9ASJ = "9ASJ"
-    ISO_20275_HZEH = "HZEH"
-    ISO_20275_JU79 = "JU79"
-    ISO_20275_MIPY = "MIPY"
-    ISO_20275_QF4W = "QF4W"
-    ISO_20275_T91T = "T91T"
-    ISO_20275_TGMR = "TGMR"
-    ISO_20275_XTIQ = "XTIQ"
-    ISO_20275_74LJ = "74LJ"
-    ISO_20275_9AQ8 = "9AQ8"
-    ISO_20275_CNQ3 = "CNQ3"
-    ISO_20275_IPGV = "IPGV"
-    ISO_20275_O35K = "O35K"
-    ISO_20275_SQOE = "SQOE"
-    ISO_20275_TJ6V = "TJ6V"
-    ISO_20275_VNIU = "VNIU"
-    ISO_20275_ZJPG = "ZJPG"
-    ISO_20275_3LXM = "3LXM"
-    ISO_20275_3N55 = "3N55"
-    ISO_20275_5DS0 = "5DS0"
-    ISO_20275_72CA = "72CA"
-    ISO_20275_8N21 = "8N21"
-    ISO_20275_D155 = "D155"
-    ISO_20275_E4LW = "E4LW"
-    ISO_20275_TRI2 = "TRI2"
-    ISO_20275_6IIM = "6IIM"
-    ISO_20275_AD0H = "AD0H"
-    ISO_20275_ALW3 = "ALW3"
-    ISO_20275_ASC7 = "ASC7"
-    ISO_20275_EY94 = "EY94"
-    ISO_20275_GR2X = "GR2X"
-    ISO_20275_H5G0 = "H5G0"
-    ISO_20275_MFYJ = "MFYJ"
-    ISO_20275_S7VR = "S7VR"
-    ISO_20275_6MB6 = "6MB6"
-    ISO_20275_982Z = "982Z"
-    ISO_20275_9G8O = "9G8O"
-    ISO_20275_AQBO = "AQBO"
-    ISO_20275_B38Q = "B38Q"
-    ISO_20275_DX2N = "DX2N"
-    ISO_20275_FTNW = "FTNW"
-    ISO_20275_IWRC = "IWRC"
-    ISO_20275_L2QV = "L2QV"
-    ISO_20275_L5BO = "L5BO"
-    ISO_20275_M2KR = "M2KR"
-    ISO_20275_QJ1G = "QJ1G"
-    ISO_20275_S0BB = "S0BB"
-    ISO_20275_SBF3 = "SBF3"
-    ISO_20275_TTTV = "TTTV"
-    ISO_20275_VPBH = "VPBH"
-    ISO_20275_WMTY = "WMTY"
-    ISO_20275_YOUG = "YOUG"
-    ISO_20275_ZLIW = "ZLIW"
-    ISO_20275_530K = "530K"
-    ISO_20275_EVE6 = "EVE6"
-    ISO_20275_H1J5 = "H1J5"
-    ISO_20275_JXUC = "JXUC"
-    ISO_20275_QLWR = "QLWR"
-    ISO_20275_RU6X = "RU6X"
-    ISO_20275_U9HL = "U9HL"
-    ISO_20275_UK9P = "UK9P"
-    ISO_20275_1WZP = "1WZP"
-    ISO_20275_22SC = "22SC"
-    ISO_20275_8RLE = "8RLE"
-    ISO_20275_AZUK = "AZUK"
-    ISO_20275_COKS = "COKS"
-    ISO_20275_F5VL = "F5VL"
-    ISO_20275_HSPI = "HSPI"
-    ISO_20275_QY7A = "QY7A"
-    ISO_20275_VUXH = "VUXH"
-    ISO_20275_YTY3 = "YTY3"
-    ISO_20275_78PB = "78PB"
-    ISO_20275_8Z76 = "8Z76"
-    ISO_20275_95W7 = "95W7"
-    ISO_20275_9FD9 = "9FD9"
-    ISO_20275_C639 = "C639"
-    ISO_20275_D92T = "D92T"
-    ISO_20275_DQBZ = "DQBZ"
-    ISO_20275_EW9A = "EW9A"
-    ISO_20275_EZ08 = "EZ08"
-    ISO_20275_G4YY = "G4YY"
-    ISO_20275_M1FY = "M1FY"
-    ISO_20275_N0YQ = "N0YQ"
-    ISO_20275_P91Q = "P91Q"
-    ISO_20275_QR5I = "QR5I"
-    ISO_20275_R0BI = "R0BI"
-    ISO_20275_V5G5 = "V5G5"
-    ISO_20275_V89I = "V89I"
-    ISO_20275_VCQZ = "VCQZ"
-    ISO_20275_X4EB = "X4EB"
-    ISO_20275_32AX = "32AX"
-    ISO_20275_7XPF = "7XPF"
-    ISO_20275_8VLM = "8VLM"
-    ISO_20275_DU35 = "DU35"
-    ISO_20275_GDH0 = "GDH0"
-    ISO_20275_HPKC = "HPKC"
-    ISO_20275_HUSW = "HUSW"
-    ISO_20275_L22N = "L22N"
-    ISO_20275_T7D4 = "T7D4"
-    ISO_20275_VVPD = "VVPD"
-    ISO_20275_VWY9 = "VWY9"
-    ISO_20275_35QN = "35QN"
-    ISO_20275_7U8S = "7U8S"
-    ISO_20275_AREY = "AREY"
-    ISO_20275_CANT = "CANT"
-    ISO_20275_F9I4 = "F9I4"
-    ISO_20275_FBN0 = "FBN0"
-    ISO_20275_FEC4 = "FEC4"
-    ISO_20275_FGT5 = "FGT5"
-    ISO_20275_GCU5 = "GCU5"
-    ISO_20275_JIF7 = "JIF7"
-    ISO_20275_VBVM = "VBVM"
-    ISO_20275_WC8Q = "WC8Q"
-    ISO_20275_X4TB = "X4TB"
-    ISO_20275_XQEC = "XQEC"
-    ISO_20275_3MMY = "3MMY"
-    ISO_20275_5RRE = "5RRE"
-    ISO_20275_6GEC = "6GEC"
-    ISO_20275_85YQ = "85YQ"
-    ISO_20275_A9VQ = "A9VQ"
-    ISO_20275_DAVB = "DAVB"
-    ISO_20275_EBP8 = "EBP8"
-    ISO_20275_F2QV = "F2QV"
-    ISO_20275_HH12 = "HH12"
-    ISO_20275_LU9O = "LU9O"
-    ISO_20275_MBKN = "MBKN"
-    ISO_20275_MY61 = "MY61"
-    ISO_20275_NJ57 = "NJ57"
-    ISO_20275_O5PH = "O5PH"
-    ISO_20275_OFGO = "OFGO"
-    ISO_20275_QWPR = "QWPR"
-    ISO_20275_T362 = "T362"
-    ISO_20275_VE28 = "VE28"
-    ISO_20275_1V0I = "1V0I"
-    ISO_20275_6DVA = "6DVA"
-    ISO_20275_6EDK = "6EDK"
-    ISO_20275_6R7O = "6R7O"
-    ISO_20275_8PUO = "8PUO"
-    ISO_20275_9L6B = "9L6B"
-    ISO_20275_C1F4 = "C1F4"
-    ISO_20275_CD9O = "CD9O"
-    ISO_20275_EO9A = "EO9A"
-    ISO_20275_HQYG = "HQYG"
-    ISO_20275_LTKC = "LTKC"
-    ISO_20275_MQU4 = "MQU4"
-    ISO_20275_N71W = "N71W"
-    ISO_20275_NI44 = "NI44"
-    ISO_20275_NV9X = "NV9X"
-    ISO_20275_O6QP = "O6QP"
-    ISO_20275_ONJ1 = "ONJ1"
-    ISO_20275_Q8RV = "Q8RV"
-    ISO_20275_SJKV = "SJKV"
-    ISO_20275_TDBW = "TDBW"
-    ISO_20275_TZDZ = "TZDZ"
-    ISO_20275_WP6R = "WP6R"
-    ISO_20275_XFUO = "XFUO"
-    ISO_20275_Z016 = "Z016"
-    ISO_20275_ZQZW = "ZQZW"
-    ISO_20275_2XXG = "2XXG"
-    ISO_20275_53DC = "53DC"
-    ISO_20275_5KRB = "5KRB"
-    ISO_20275_AT9F = "AT9F"
-    ISO_20275_IIZ4 = "IIZ4"
-    ISO_20275_JR3Z = "JR3Z"
-    ISO_20275_M9A1 = "M9A1"
-    ISO_20275_P1VP = "P1VP"
-    ISO_20275_TTB3 = "TTB3"
-    ISO_20275_BSLM = "BSLM"
-    ISO_20275_EW8U = "EW8U"
-    ISO_20275_GMFE = "GMFE"
-    ISO_20275_HLR4 = "HLR4"
-    ISO_20275_J5NM = "J5NM"
-    ISO_20275_JJ9M = "JJ9M"
-    ISO_20275_LKD5 = "LKD5"
-    ISO_20275_OCVJ = "OCVJ"
-    ISO_20275_R2PI = "R2PI"
-    ISO_20275_XHT1 = "XHT1"
-    ISO_20275_ZVS9 = "ZVS9"
-    ISO_20275_1XME = "1XME"
-    ISO_20275_672E = "672E"
-    ISO_20275_6I75 = "6I75"
-    ISO_20275_7G8G = "7G8G"
-    ISO_20275_BE3O = "BE3O"
-    ISO_20275_BYFU = "BYFU"
-    ISO_20275_CAGH = "CAGH"
-    ISO_20275_G76T = "G76T"
-    ISO_20275_GOGQ = "GOGQ"
-    ISO_20275_KU3O = "KU3O"
-    ISO_20275_NETO = "NETO"
-    ISO_20275_QX9N = "QX9N"
-    ISO_20275_R7QO = "R7QO"
-    ISO_20275_YP04 = "YP04"
-    ISO_20275_Z73Z = "Z73Z"
-    ISO_20275_ZJTK = "ZJTK"
-    ISO_20275_47LQ = "47LQ"
-    ISO_20275_58N0 = "58N0"
-    ISO_20275_6E4G = "6E4G"
-    ISO_20275_6RZK = "6RZK"
-    ISO_20275_88XU = "88XU"
-    ISO_20275_HQJV = "HQJV"
-    ISO_20275_IN4H = "IN4H"
-    ISO_20275_LJH5 = "LJH5"
-    ISO_20275_MI0H = "MI0H"
-    ISO_20275_NK3V = "NK3V"
-    ISO_20275_NR96 = "NR96"
-    ISO_20275_TPO4 = "TPO4"
-    ISO_20275_U7HC = "U7HC"
-    ISO_20275_UJZB = "UJZB"
-    ISO_20275_XTOF = "XTOF"
-    ISO_20275_1ASH = "1ASH"
-    ISO_20275_1ONH = "1ONH"
-    ISO_20275_37F5 = "37F5"
-    ISO_20275_43LY = "43LY"
-    ISO_20275_6VCW = "6VCW"
-    ISO_20275_6ZAR = "6ZAR"
-    ISO_20275_8OK2 = "8OK2"
-    ISO_20275_9HKD = "9HKD"
-    ISO_20275_9I4Y = "9I4Y"
-    ISO_20275_BQRL = "BQRL"
-    ISO_20275_DEMP = "DEMP"
-    ISO_20275_IYZI = "IYZI"
-    ISO_20275_LDBS = "LDBS"
-    ISO_20275_OXAZ = "OXAZ"
-    ISO_20275_S2K8 = "S2K8"
-    ISO_20275_S968 = "S968"
-    ISO_20275_SGT8 = "SGT8"
-    ISO_20275_T4OL = "T4OL"
-    ISO_20275_TBN1 = "TBN1"
-    ISO_20275_TS1K = "TS1K"
-    ISO_20275_UJ49 = "UJ49"
-    ISO_20275_VSDJ = "VSDJ"
-    ISO_20275_7WQO = "7WQO"
-    ISO_20275_8YBQ = "8YBQ"
-    ISO_20275_BG8P = "BG8P"
-    ISO_20275_HDOD = "HDOD"
-    ISO_20275_NDBR = "NDBR"
-    ISO_20275_O4NK = "O4NK"
-    ISO_20275_U7GR = "U7GR"
-    ISO_20275_WPCN = "WPCN"
-    ISO_20275_XST3 = "XST3"
-    ISO_20275_1ADA = "1ADA"
-    ISO_20275_21OE = "21OE"
-    ISO_20275_7F5B = "7F5B"
-    ISO_20275_9BH2 = "9BH2"
-    ISO_20275_EMLK = "EMLK"
-    ISO_20275_J1JO = "J1JO"
-    ISO_20275_KC7Z = "KC7Z"
-    ISO_20275_QSHG = "QSHG"
-    ISO_20275_R8SH = "R8SH"
-    ISO_20275_SU5T = "SU5T"
-    ISO_20275_U7OR = "U7OR"
-    ISO_20275_1S9L = "1S9L"
-    ISO_20275_1XOG = "1XOG"
-    ISO_20275_30PQ = "30PQ"
-    ISO_20275_30TX = "30TX"
-    ISO_20275_40SO = "40SO"
-    ISO_20275_5AE9 = "5AE9"
-    ISO_20275_5MRP = "5MRP"
-    ISO_20275_7OS8 = "7OS8"
-    ISO_20275_93CA = "93CA"
-    ISO_20275_9OSW = "9OSW"
-    ISO_20275_9STD = "9STD"
-    ISO_20275_A770 = "A770"
-    ISO_20275_AEK0 = "AEK0"
-    ISO_20275_B2F4 = "B2F4"
-    ISO_20275_HEMZ = "HEMZ"
-    ISO_20275_JGPP = "JGPP"
-    ISO_20275_KPH8 = "KPH8"
-    ISO_20275_L1PM = "L1PM"
-    ISO_20275_LPLY = "LPLY"
-    ISO_20275_LXI4 = "LXI4"
-    ISO_20275_MY93 = "MY93"
-    ISO_20275_OOX5 = "OOX5"
-    ISO_20275_PNF3 = "PNF3"
-    ISO_20275_Q6K2 = "Q6K2"
-    ISO_20275_QB0A = "QB0A"
-    ISO_20275_SCX8 = "SCX8"
-    ISO_20275_SW88 = "SW88"
-    ISO_20275_T91C = "T91C"
-    ISO_20275_WRF9 = "WRF9"
-    ISO_20275_XVC6 = "XVC6"
-    ISO_20275_3GTV = "3GTV"
-    ISO_20275_4TMV = "4TMV"
-    ISO_20275_4WTP = "4WTP"
-    ISO_20275_5OET = "5OET"
-    ISO_20275_639V = "639V"
-    ISO_20275_6ICB = "6ICB"
-    ISO_20275_7BQ5 = "7BQ5"
-    ISO_20275_8APW = "8APW"
-    ISO_20275_8HNT = "8HNT"
-    ISO_20275_B843 = "B843"
-    ISO_20275_BJ2V = "BJ2V"
-    ISO_20275_CXIO = "CXIO"
-    ISO_20275_D2MO = "D2MO"
-    ISO_20275_DFPP = "DFPP"
-    ISO_20275_ECLT = "ECLT"
-    ISO_20275_GEXT = "GEXT"
-    ISO_20275_HV3B = "HV3B"
-    ISO_20275_IOWN = "IOWN"
-    ISO_20275_KFPS = "KFPS"
-    ISO_20275_LQZC = "LQZC"
-    ISO_20275_MPFG = "MPFG"
-    ISO_20275_NGZJ = "NGZJ"
-    ISO_20275_O256 = "O256"
-    ISO_20275_Q17J = "Q17J"
-    ISO_20275_R22H = "R22H"
-    ISO_20275_R3J6 = "R3J6"
-    ISO_20275_R7JP = "R7JP"
-    ISO_20275_RH6N = "RH6N"
-    ISO_20275_T172 = "T172"
-    ISO_20275_V4RX = "V4RX"
-    ISO_20275_VYEO = "VYEO"
-    ISO_20275_XBKP = "XBKP"
-    ISO_20275_XUVE = "XUVE"
-    ISO_20275_Y7BG = "Y7BG"
-    ISO_20275_YQDQ = "YQDQ"
-    ISO_20275_YWK0 = "YWK0"
-    ISO_20275_ZEZ2 = "ZEZ2"
-    ISO_20275_62L3 = "62L3"
-    ISO_20275_7K6U = "7K6U"
-    ISO_20275_8WM4 = "8WM4"
-    ISO_20275_HCTP = "HCTP"
-    ISO_20275_IY8C = "IY8C"
-    ISO_20275_K3J6 = "K3J6"
-    ISO_20275_MM8M = "MM8M"
-    ISO_20275_SUEQ = "SUEQ"
-    ISO_20275_Y9F2 = "Y9F2"
-    ISO_20275_2JB4 = "2JB4"
-    ISO_20275_3LNE = "3LNE"
-    ISO_20275_520I = "520I"
-    ISO_20275_6M6O = "6M6O"
-    ISO_20275_9M2Q = "9M2Q"
-    ISO_20275_G66U = "G66U"
-    ISO_20275_OJ9K = "OJ9K"
-    ISO_20275_P3LZ = "P3LZ"
-    ISO_20275_RCNI = "RCNI"
-    ISO_20275_S97G = "S97G"
-    ISO_20275_W1DV = "W1DV"
-    ISO_20275_7HY7 = "7HY7"
-    ISO_20275_FFBM = "FFBM"
-    ISO_20275_G42I = "G42I"
-    ISO_20275_N508 = "N508"
-    ISO_20275_P7RH = "P7RH"
-    ISO_20275_T4M6 = "T4M6"
-    ISO_20275_VWC5 = "VWC5"
-    ISO_20275_XSNP = "XSNP"
-    ISO_20275_4YOA = "4YOA"
-    ISO_20275_7GMS = "7GMS"
-    ISO_20275_F69V = "F69V"
-    ISO_20275_POG3 = "POG3"
-    ISO_20275_VG3S = "VG3S"
-    ISO_20275_W0U4 = "W0U4"
-    ISO_20275_Y1ZD = "Y1ZD"
-    ISO_20275_4VH5 = "4VH5"
-    ISO_20275_51RC = "51RC"
-    ISO_20275_BO6L = "BO6L"
-    ISO_20275_EPCY = "EPCY"
-    ISO_20275_M0ER = "M0ER"
-    ISO_20275_PJ10 = "PJ10"
-    ISO_20275_SDX0 = "SDX0"
-    ISO_20275_XIZI = "XIZI"
-    ISO_20275_YVSB = "YVSB"
-    ISO_20275_1QMT = "1QMT"
-    ISO_20275_358I = "358I"
-    ISO_20275_3DXJ = "3DXJ"
-    ISO_20275_4LKE = "4LKE"
-    ISO_20275_5AAO = "5AAO"
-    ISO_20275_5JAL = "5JAL"
-    ISO_20275_6NI8 = "6NI8"
-    ISO_20275_8N0C = "8N0C"
-    ISO_20275_8QMN = "8QMN"
-    ISO_20275_ARON = "ARON"
-    ISO_20275_CJ58 = "CJ58"
-    ISO_20275_F99D = "F99D"
-    ISO_20275_IHLF = "IHLF"
-    ISO_20275_JF6D = "JF6D"
-    ISO_20275_Q4F9 = "Q4F9"
-    ISO_20275_Q6EM = "Q6EM"
-    ISO_20275_SIST = "SIST"
-    ISO_20275_U94O = "U94O"
-    ISO_20275_UFIY = "UFIY"
-    ISO_20275_UKX4 = "UKX4"
-    ISO_20275_UVH6 = "UVH6"
-    ISO_20275_WY1B = "WY1B"
-    ISO_20275_X0MP = "X0MP"
-    ISO_20275_X1EL = "X1EL"
-    ISO_20275_Y5L0 = "Y5L0"
-    ISO_20275_YJZ3 = "YJZ3"
-    ISO_20275_2WJZ = "2WJZ"
-    ISO_20275_4U9V = "4U9V"
-    ISO_20275_64HG = "64HG"
-    ISO_20275_6JCE = "6JCE"
-    ISO_20275_AZYL = "AZYL"
-    ISO_20275_CPK1 = "CPK1"
-    ISO_20275_DLEW = "DLEW"
-    ISO_20275_EO24 = "EO24"
-    ISO_20275_ER7C = "ER7C"
-    ISO_20275_FK53 = "FK53"
-    ISO_20275_GHB2 = "GHB2"
-    ISO_20275_J1V0 = "J1V0"
-    ISO_20275_LF4E = "LF4E"
-    ISO_20275_MTDW = "MTDW"
-    ISO_20275_NHGN = "NHGN"
-    ISO_20275_NJA5 = "NJA5"
-    ISO_20275_OGHV = "OGHV"
-    ISO_20275_OVCL = "OVCL"
-    ISO_20275_S745 = "S745"
-    ISO_20275_U87X = "U87X"
-    ISO_20275_WIU6 = "WIU6"
-    ISO_20275_YOB3 = "YOB3"
-    ISO_20275_ZULC = "ZULC"
-    ISO_20275_2EPF = "2EPF"
-    ISO_20275_2R1N = "2R1N"
-    ISO_20275_52U0 = "52U0"
-    ISO_20275_7VK5 = "7VK5"
-    ISO_20275_95OK = "95OK"
-    ISO_20275_AEJF = "AEJF"
-    ISO_20275_BTQ1 = "BTQ1"
-    ISO_20275_EZNQ = "EZNQ"
-    ISO_20275_FZMT = "FZMT"
-    ISO_20275_JBQI = "JBQI"
-    ISO_20275_N566 = "N566"
-    ISO_20275_ZD39 = "ZD39"
-    ISO_20275_30D6 = "30D6"
-    ISO_20275_B8XC = "B8XC"
-    ISO_20275_BGH4 = "BGH4"
-    ISO_20275_EDOR = "EDOR"
-    ISO_20275_GIPE = "GIPE"
-    ISO_20275_OJDX = "OJDX"
-    ISO_20275_PQXK = "PQXK"
-    ISO_20275_VJXH = "VJXH"
-    ISO_20275_4BEM = "4BEM"
-    ISO_20275_GEE0 = "GEE0"
-    ISO_20275_LGVF = "LGVF"
-    ISO_20275_QK2J = "QK2J"
-    ISO_20275_R18M = "R18M"
-    ISO_20275_T2DF = "T2DF"
-    ISO_20275_T5ZE = "T5ZE"
-    ISO_20275_U1EG = "U1EG"
-    ISO_20275_UQWQ = "UQWQ"
-    ISO_20275_UZ83 = "UZ83"
-    ISO_20275_V10Q = "V10Q"
-    ISO_20275_WQLU = "WQLU"
-    ISO_20275_Z9C5 = "Z9C5"
-    ISO_20275_23Q4 = "23Q4"
-    ISO_20275_3JTE = "3JTE"
-    ISO_20275_3L7Q = "3L7Q"
-    ISO_20275_51AN = "51AN"
-    ISO_20275_9C19 = "9C19"
-    ISO_20275_9EJ6 = "9EJ6"
-    ISO_20275_B8KO = "B8KO"
-    ISO_20275_HSEV = "HSEV"
-    ISO_20275_R9OY = "R9OY"
-    ISO_20275_4NMI = "4NMI"
-    ISO_20275_5E0K = "5E0K"
-    ISO_20275_7RLC = "7RLC"
-    ISO_20275_AVLE = "AVLE"
-    ISO_20275_C2O4 = "C2O4"
-    ISO_20275_DRSE = "DRSE"
-    ISO_20275_FW66 = "FW66"
-    ISO_20275_HA7M = "HA7M"
-    ISO_20275_MG8V = "MG8V"
-    ISO_20275_N263 = "N263"
-    ISO_20275_QMI2 = "QMI2"
-    ISO_20275_RZ5R = "RZ5R"
-    ISO_20275_Z54A = "Z54A"
-    ISO_20275_ZHZP = "ZHZP"
-    ISO_20275_11GD = "11GD"
-    ISO_20275_5DBJ = "5DBJ"
-    ISO_20275_7QV2 = "7QV2"
-    ISO_20275_D2EI = "D2EI"
-    ISO_20275_DBGD = "DBGD"
-    ISO_20275_G0HE = "G0HE"
-    ISO_20275_G6VI = "G6VI"
-    ISO_20275_N10D = "N10D"
-    ISO_20275_PNSZ = "PNSZ"
-    ISO_20275_WTWK = "WTWK"
-    ISO_20275_YS05 = "YS05"
-    ISO_20275_15JS = "15JS"
-    ISO_20275_4LZW = "4LZW"
-    ISO_20275_6TGS = "6TGS"
-    ISO_20275_C276 = "C276"
-    ISO_20275_JZWN = "JZWN"
-    ISO_20275_PXNI = "PXNI"
-    ISO_20275_UX5E = "UX5E"
-    ISO_20275_Z9CH = "Z9CH"
-    ISO_20275_7TJ1 = "7TJ1"
-    ISO_20275_8MBD = "8MBD"
-    ISO_20275_C8HJ = "C8HJ"
-    ISO_20275_DE0G = "DE0G"
-    ISO_20275_DQUB = "DQUB"
-    ISO_20275_I2XB = "I2XB"
-    ISO_20275_ND93 = "ND93"
-    ISO_20275_QJ9F = "QJ9F"
-    ISO_20275_RD1T = "RD1T"
-    ISO_20275_9AAS = "9AAS"
-    ISO_20275_C5K7 = "C5K7"
-    ISO_20275_FE1L = "FE1L"
-    ISO_20275_HTV5 = "HTV5"
-    ISO_20275_MXWB = "MXWB"
-    ISO_20275_N5OS = "N5OS"
-    ISO_20275_OGSS = "OGSS"
-    ISO_20275_TCLA = "TCLA"
-    ISO_20275_WYG5 = "WYG5"
-    ISO_20275_YY5A = "YY5A"
-    ISO_20275_1CZS = "1CZS"
-    ISO_20275_2I4P = "2I4P"
-    ISO_20275_3ZXC = "3ZXC"
-    ISO_20275_65B6 = "65B6"
-    ISO_20275_6OGF = "6OGF"
-    ISO_20275_7AJT = "7AJT"
-    ISO_20275_7H0X = "7H0X"
-    ISO_20275_B12O = "B12O"
-    ISO_20275_GIN3 = "GIN3"
-    ISO_20275_IDFN = "IDFN"
-    ISO_20275_NOBH = "NOBH"
-    ISO_20275_Q1N4 = "Q1N4"
-    ISO_20275_RC44 = "RC44"
-    ISO_20275_T0XH = "T0XH"
-    ISO_20275_UEKV = "UEKV"
-    ISO_20275_YQLO = "YQLO"
-    ISO_20275_8XN0 = "8XN0"
-    ISO_20275_AMV2 = "AMV2"
-    ISO_20275_FXHR = "FXHR"
-    ISO_20275_GZMZ = "GZMZ"
-    ISO_20275_JWTD = "JWTD"
-    ISO_20275_K4MF = "K4MF"
-    ISO_20275_LPEE = "LPEE"
-    ISO_20275_NYUD = "NYUD"
-    ISO_20275_OE6T = "OE6T"
-    ISO_20275_PNZI = "PNZI"
-    ISO_20275_R8O9 = "R8O9"
-    ISO_20275_TCC0 = "TCC0"
-    ISO_20275_UF6Y = "UF6Y"
-    ISO_20275_456O = "456O"
-    ISO_20275_4WN7 = "4WN7"
-    ISO_20275_8KA4 = "8KA4"
-    ISO_20275_BOEX = "BOEX"
-    ISO_20275_DQMV = "DQMV"
-    ISO_20275_HOV4 = "HOV4"
-    ISO_20275_OF3Q = "OF3Q"
-    ISO_20275_PLMC = "PLMC"
-    ISO_20275_Q28E = "Q28E"
-    ISO_20275_S4U2 = "S4U2"
-    ISO_20275_VVJ3 = "VVJ3"
-    ISO_20275_F8DD = "F8DD"
-    ISO_20275_FQLY = "FQLY"
-    ISO_20275_LBJ1 = "LBJ1"
-    ISO_20275_NHYA = "NHYA"
-    ISO_20275_PM3Y = "PM3Y"
-    ISO_20275_RR8G = "RR8G"
-    ISO_20275_RRXD = "RRXD"
-    ISO_20275_VUUU = "VUUU"
-    ISO_20275_724Q = "724Q"
-    ISO_20275_DURX = "DURX"
-    ISO_20275_IJHI = "IJHI"
-    ISO_20275_O1EZ = "O1EZ"
-    ISO_20275_O9MN = "O9MN"
-    ISO_20275_OJBU = "OJBU"
-    ISO_20275_PXGA = "PXGA"
-    ISO_20275_QDZK = "QDZK"
-    ISO_20275_R27J = "R27J"
-    ISO_20275_RC5L = "RC5L"
-    ISO_20275_SSN4 = "SSN4"
-    ISO_20275_SUMS = "SUMS"
-    ISO_20275_6S32 = "6S32"
-    ISO_20275_B5YE = "B5YE"
-    ISO_20275_C0CR = "C0CR"
-    ISO_20275_EVBW = "EVBW"
-    ISO_20275_JNYX = "JNYX"
-    ISO_20275_M5RM = "M5RM"
-    ISO_20275_QSJ1 = "QSJ1"
-    ISO_20275_WNV6 = "WNV6"
-    ISO_20275_Y7PW = "Y7PW"
-    ISO_20275_Z92A = "Z92A"
-    ISO_20275_ZXZ7 = "ZXZ7"
-    ISO_20275_1YA4 = "1YA4"
-    ISO_20275_71ZI = "71ZI"
-    ISO_20275_9GXA = "9GXA"
-    ISO_20275_HXKE = "HXKE"
-    ISO_20275_NB58 = "NB58"
-    ISO_20275_PUJR = "PUJR"
-    ISO_20275_QR4Y = "QR4Y"
-    ISO_20275_RDQZ = "RDQZ"
-    ISO_20275_S6TP = "S6TP"
-    ISO_20275_A35I = "A35I"
-    ISO_20275_JTJE = "JTJE"
-    ISO_20275_WMJ9 = "WMJ9"
-    ISO_20275_6EH6 = "6EH6"
-    ISO_20275_BST2 = "BST2"
-    ISO_20275_GLCI = "GLCI"
-    ISO_20275_JS65 = "JS65"
-    ISO_20275_N28C = "N28C"
-    ISO_20275_Q62B = "Q62B"
-    ISO_20275_YOP9 = "YOP9"
-    ISO_20275_ZHED = "ZHED"
-    ISO_20275_6QCE = "6QCE"
-    ISO_20275_A30N = "A30N"
-    ISO_20275_AN8Z = "AN8Z"
-    ISO_20275_CHWX = "CHWX"
-    ISO_20275_DMNZ = "DMNZ"
-    ISO_20275_MGUM = "MGUM"
-    ISO_20275_MH3L = "MH3L"
-    ISO_20275_NNLM = "NNLM"
-    ISO_20275_PKZ2 = "PKZ2"
-    ISO_20275_Q367 = "Q367"
-    ISO_20275_SOX5 = "SOX5"
-    ISO_20275_TA9Z = "TA9Z"
-    ISO_20275_UZ9W = "UZ9W"
-
-
-class Activity(str, Enum):
-    NACE_01 = "01"
-    NACE_01_1 = "01.1"
-    NACE_01_11 = "01.11"
-    NACE_01_12 = "01.12"
-    NACE_01_13 = "01.13"
-    NACE_01_14 = "01.14"
-    NACE_01_15 = "01.15"
-    NACE_01_16 = "01.16"
-    NACE_01_19 = "01.19"
-    NACE_01_2 = "01.2"
-    NACE_01_21 = "01.21"
-    NACE_01_22 = "01.22"
-    NACE_01_23 = "01.23"
-    NACE_01_24 = "01.24"
-    NACE_01_25 = "01.25"
-    NACE_01_26 = "01.26"
-    NACE_01_27 = "01.27"
-    NACE_01_28 = "01.28"
-    NACE_01_29 = "01.29"
-    NACE_01_3 = "01.3"
-    NACE_01_30 = "01.30"
-    NACE_01_4 = "01.4"
-    NACE_01_41 = "01.41"
-    NACE_01_42 = "01.42"
-    NACE_01_43 = "01.43"
-    NACE_01_44 = "01.44"
-    NACE_01_45 = "01.45"
-    NACE_01_46 = "01.46"
-    NACE_01_47 = "01.47"
-    NACE_01_49 = "01.49"
-    NACE_01_5 = "01.5"
-    NACE_01_50 = "01.50"
-    NACE_01_6 = "01.6"
-    NACE_01_61 = "01.61"
-    NACE_01_62 = "01.62"
-    NACE_01_63 = "01.63"
-    NACE_01_64 = "01.64"
-    NACE_01_7 = "01.7"
-    NACE_01_70 = "01.70"
-    NACE_02 = "02"
-    NACE_02_1 = "02.1"
-    NACE_02_10 = "02.10"
-    NACE_02_2 = "02.2"
-    NACE_02_20 = "02.20"
-    NACE_02_3 = "02.3"
-    NACE_02_30 = "02.30"
-    NACE_02_4 = "02.4"
-    NACE_02_40 = "02.40"
-    NACE_03 = "03"
-    NACE_03_1 = "03.1"
-    NACE_03_11 = "03.11"
-    NACE_03_12 = "03.12"
-    NACE_03_2 = "03.2"
-    NACE_03_21 = "03.21"
-    NACE_03_22 = "03.22"
-    NACE_05 = "05"
-    NACE_05_1 = "05.1"
-    NACE_05_10 = "05.10"
-    NACE_05_2 = "05.2"
-    NACE_05_20 = "05.20"
-    NACE_06 = "06"
-    NACE_06_1 = "06.1"
-    NACE_06_10 = "06.10"
-    NACE_06_2 = "06.2"
-    NACE_06_20 = "06.20"
-    NACE_07 = "07"
-    NACE_07_1 = "07.1"
-    NACE_07_10 = "07.10"
-    NACE_07_2 = "07.2"
-    NACE_07_21 = "07.21"
-    NACE_07_29 = "07.29"
-    NACE_08 = "08"
-    NACE_08_1 = "08.1"
-    NACE_08_11 = "08.11"
-    NACE_08_12 = "08.12"
-    NACE_08_9 = "08.9"
-    NACE_08_91 = "08.91"
-    NACE_08_92 = "08.92"
-    NACE_08_93 = "08.93"
-    NACE_08_99 = "08.99"
-    NACE_09 = "09"
-    NACE_09_1 = "09.1"
-    NACE_09_10 = "09.10"
-    NACE_09_9 = "09.9"
-    NACE_09_90 = "09.90"
-    NACE_10 = "10"
-    NACE_10_1 = "10.1"
-    NACE_10_11 = "10.11"
-    NACE_10_12 = "10.12"
-    NACE_10_13 = "10.13"
-    NACE_10_2 = "10.2"
-    NACE_10_20 = "10.20"
-    NACE_10_3 = "10.3"
-    NACE_10_31 = "10.31"
-    NACE_10_32 = "10.32"
-    NACE_10_39 = "10.39"
-    NACE_10_4 = "10.4"
-    NACE_10_41 = "10.41"
-    NACE_10_42 = "10.42"
-    NACE_10_5 = "10.5"
-    NACE_10_51 = "10.51"
-    NACE_10_52 = "10.52"
-    NACE_10_6 = "10.6"
-    NACE_10_61 = "10.61"
-    NACE_10_62 = "10.62"
-    NACE_10_7 = "10.7"
-    NACE_10_71 = "10.71"
-    NACE_10_72 = "10.72"
-    NACE_10_73 = "10.73"
-    NACE_10_8 = "10.8"
-    NACE_10_81 = "10.81"
-    NACE_10_82 = "10.82"
-    NACE_10_83 = "10.83"
-    NACE_10_84 = "10.84"
-    NACE_10_85 = "10.85"
-    NACE_10_86 = "10.86"
-    NACE_10_89 = "10.89"
-    NACE_10_9 = "10.9"
-    NACE_10_91 = "10.91"
-    NACE_10_92 = "10.92"
-    NACE_11 = "11"
-    NACE_11_0 = "11.0"
-    NACE_11_01 = "11.01"
-    NACE_11_02 = "11.02"
-    NACE_11_03 = "11.03"
-    NACE_11_04 = "11.04"
-    NACE_11_05 = "11.05"
-    NACE_11_06 = "11.06"
-    NACE_11_07 = "11.07"
-    NACE_12 = "12"
-    NACE_12_0 = "12.0"
-    NACE_12_00 = "12.00"
-    NACE_13 = "13"
-    NACE_13_1 = "13.1"
-    NACE_13_10 = "13.10"
-    NACE_13_2 = "13.2"
-    NACE_13_20 = "13.20"
-    NACE_13_3 = "13.3"
-    NACE_13_30 = "13.30"
-    NACE_13_9 = "13.9"
-    NACE_13_91 = "13.91"
-    NACE_13_92 = "13.92"
-    NACE_13_93 = "13.93"
-    NACE_13_94 = "13.94"
-    NACE_13_95 = "13.95"
-    NACE_13_96 = "13.96"
-    NACE_13_99 = "13.99"
-    NACE_14 = "14"
-    NACE_14_1 = "14.1"
-    NACE_14_11 = "14.11"
-    NACE_14_12 = "14.12"
-    NACE_14_13 = "14.13"
-    NACE_14_14 = "14.14"
-    NACE_14_19 = "14.19"
-    NACE_14_2 = "14.2"
-    NACE_14_20 = "14.20"
-    NACE_14_3 = "14.3"
-    NACE_14_31 = "14.31"
-    NACE_14_39 = "14.39"
-    NACE_15 = "15"
-    NACE_15_1 = "15.1"
-    NACE_15_11 = "15.11"
-    NACE_15_12 = "15.12"
-    NACE_15_2 = "15.2"
-    NACE_15_20 = "15.20"
-    NACE_16 = "16"
-    NACE_16_1 = "16.1"
-    NACE_16_10 = "16.10"
-    NACE_16_2 = "16.2"
-    NACE_16_21 = "16.21"
-    NACE_16_22 = "16.22"
-    NACE_16_23 = "16.23"
-    NACE_16_24 = "16.24"
-    NACE_16_29 = "16.29"
-    NACE_17 = "17"
-    NACE_17_1 = "17.1"
-    NACE_17_11 = "17.11"
-    NACE_17_12 = "17.12"
-    NACE_17_2 = "17.2"
-    NACE_17_21 = "17.21"
-    NACE_17_22 = "17.22"
-    NACE_17_23 = "17.23"
-    NACE_17_24 = "17.24"
-    NACE_17_29 = "17.29"
-    NACE_18 = "18"
-    NACE_18_1 = "18.1"
-    NACE_18_11 = "18.11"
-    NACE_18_12 = "18.12"
-    NACE_18_13 = "18.13"
-    NACE_18_14 = "18.14"
-    NACE_18_2 = "18.2"
-    NACE_18_20 = "18.20"
-    NACE_19 = "19"
-    NACE_19_1 = "19.1"
-    NACE_19_10 = "19.10"
-    NACE_19_2 = "19.2"
-    NACE_19_20 = "19.20"
-    NACE_20 = "20"
-    NACE_20_1 = "20.1"
-    NACE_20_11 = "20.11"
-    NACE_20_12 = "20.12"
-    NACE_20_13 = "20.13"
-    NACE_20_14 = "20.14"
-    NACE_20_15 = "20.15"
-    NACE_20_16 = "20.16"
-    NACE_20_17 = "20.17"
-    NACE_20_2 = "20.2"
-    NACE_20_20 = "20.20"
-    NACE_20_3 = "20.3"
-    NACE_20_30 = "20.30"
-    NACE_20_4 = "20.4"
-    NACE_20_41 = "20.41"
-    NACE_20_42 = "20.42"
-    NACE_20_5 = "20.5"
-    NACE_20_51 = "20.51"
-    NACE_20_52 = "20.52"
-    NACE_20_53 = "20.53"
-    NACE_20_59 = "20.59"
-    NACE_20_6 = "20.6"
-    NACE_20_60 = "20.60"
-    NACE_21 = "21"
-    NACE_21_1 = "21.1"
-    NACE_21_10 = "21.10"
-    NACE_21_2 = "21.2"
-    NACE_21_20 = "21.20"
-    NACE_22 = "22"
-    NACE_22_1 = "22.1"
-    NACE_22_11 = "22.11"
-    NACE_22_19 = "22.19"
-    NACE_22_2 = "22.2"
-    NACE_22_21 = "22.21"
-    NACE_22_22 = "22.22"
-    NACE_22_23 = "22.23"
-    NACE_22_29 = "22.29"
-    NACE_23 = "23"
-    NACE_23_1 = "23.1"
-    NACE_23_11 = "23.11"
-    NACE_23_12 = "23.12"
-    NACE_23_13 = "23.13"
-    NACE_23_14 = "23.14"
-    NACE_23_19 = "23.19"
-    NACE_23_2 = "23.2"
-    NACE_23_20 = "23.20"
-    NACE_23_3 = "23.3"
-    NACE_23_31 = "23.31"
-    NACE_23_32 = "23.32"
-    NACE_23_4 = "23.4"
-    NACE_23_41 = "23.41"
-    NACE_23_42 = "23.42"
-    NACE_23_43 = "23.43"
-    NACE_23_44 = "23.44"
-    NACE_23_49 = "23.49"
-    NACE_23_5 = "23.5"
-    NACE_23_51 = "23.51"
-    NACE_23_52 = "23.52"
-    NACE_23_6 = "23.6"
-    NACE_23_61 = "23.61"
-    NACE_23_62 = "23.62"
-    NACE_23_63 = "23.63"
-    NACE_23_64 = "23.64"
-    NACE_23_65 = "23.65"
-    NACE_23_69 = "23.69"
-    NACE_23_7 = "23.7"
-    NACE_23_70 = "23.70"
-    NACE_23_9 = "23.9"
-    NACE_23_91 = "23.91"
-    NACE_23_99 = "23.99"
-    NACE_24 = "24"
-    NACE_24_1 = "24.1"
-    NACE_24_10 = "24.10"
-    NACE_24_2 = "24.2"
-    NACE_24_20 = "24.20"
-    NACE_24_3 = "24.3"
-    NACE_24_31 = "24.31"
-    NACE_24_32 = "24.32"
-    NACE_24_33 = "24.33"
-    NACE_24_34 = "24.34"
-    NACE_24_4 = "24.4"
-    NACE_24_41 = "24.41"
-    NACE_24_42 = "24.42"
-    NACE_24_43 = "24.43"
-    NACE_24_44 = "24.44"
-    NACE_24_45 = "24.45"
-    NACE_24_46 = "24.46"
-    NACE_24_5 = "24.5"
-    NACE_24_51 = "24.51"
-    NACE_24_52 = "24.52"
-    NACE_24_53 = "24.53"
-    NACE_24_54 = "24.54"
-    NACE_25 = "25"
-    NACE_25_1 = "25.1"
-    NACE_25_11 = "25.11"
-    NACE_25_12 = "25.12"
-    NACE_25_2 = "25.2"
-    NACE_25_21 = "25.21"
-    NACE_25_29 = "25.29"
-    NACE_25_3 = "25.3"
-    NACE_25_30 = "25.30"
-    NACE_25_4 = "25.4"
-    NACE_25_40 = "25.40"
-    NACE_25_5 = "25.5"
-    NACE_25_50 = "25.50"
-    NACE_25_6 = "25.6"
-    NACE_25_61 = "25.61"
-    NACE_25_62 = "25.62"
-    NACE_25_7 = "25.7"
-    NACE_25_71 = "25.71"
-    NACE_25_72 = "25.72"
-    NACE_25_73 = "25.73"
-    NACE_25_9 = "25.9"
-    NACE_25_91 = "25.91"
-    NACE_25_92 = "25.92"
-    NACE_25_93 = "25.93"
-    NACE_25_94 = "25.94"
-    NACE_25_99 = "25.99"
-    NACE_26 = "26"
-    NACE_26_1 = "26.1"
-    NACE_26_11 = "26.11"
-    NACE_26_12 = "26.12"
-    NACE_26_2 = "26.2"
-    NACE_26_20 = "26.20"
-    NACE_26_3 = "26.3"
-    NACE_26_30 = "26.30"
-    NACE_26_4 = "26.4"
-    NACE_26_40 = "26.40"
-    NACE_26_5 = "26.5"
-    NACE_26_51 = "26.51"
-    NACE_26_52 = "26.52"
-    NACE_26_6 = "26.6"
-    NACE_26_60 = "26.60"
-    NACE_26_7 = "26.7"
-    NACE_26_70 = "26.70"
-    NACE_26_8 = "26.8"
-    NACE_26_80 = "26.80"
-    NACE_27 = "27"
-    NACE_27_1 = "27.1"
-    NACE_27_11 = "27.11"
-    NACE_27_12 = "27.12"
-    NACE_27_2 = "27.2"
-    NACE_27_20 = "27.20"
-    NACE_27_3 = "27.3"
-    NACE_27_31 = "27.31"
-    NACE_27_32 = "27.32"
-    NACE_27_33 = "27.33"
-    NACE_27_4 = "27.4"
-    NACE_27_40 = "27.40"
-    NACE_27_5 = "27.5"
-    NACE_27_51 = "27.51"
-    NACE_27_52 = "27.52"
-    NACE_27_9 = "27.9"
-    NACE_27_90 = "27.90"
-    NACE_28 = "28"
-    NACE_28_1 = "28.1"
-    NACE_28_11 = "28.11"
-    NACE_28_12 = "28.12"
-    NACE_28_13 = "28.13"
-    NACE_28_14 = "28.14"
-    NACE_28_15 = "28.15"
-    NACE_28_2 = "28.2"
-    NACE_28_21 = "28.21"
-    NACE_28_22 = "28.22"
-    NACE_28_23 = "28.23"
-    NACE_28_24 = "28.24"
-    NACE_28_25 = "28.25"
-    NACE_28_29 = "28.29"
-    NACE_28_3 = "28.3"
-    NACE_28_30 = "28.30"
-    NACE_28_4 = "28.4"
-    NACE_28_41 = "28.41"
-    NACE_28_49 = "28.49"
-    NACE_28_9 = "28.9"
-    NACE_28_91 = "28.91"
-    NACE_28_92 = "28.92"
-    NACE_28_93 = "28.93"
-    NACE_28_94 = "28.94"
-    NACE_28_95 = "28.95"
-    NACE_28_96 = "28.96"
-    NACE_28_99 = "28.99"
-    NACE_29 = "29"
-    NACE_29_1 = "29.1"
-    NACE_29_10 = "29.10"
-    NACE_29_2 = "29.2"
-    NACE_29_20 = "29.20"
-    NACE_29_3 = "29.3"
-    NACE_29_31 = "29.31"
-    NACE_29_32 = "29.32"
-    NACE_30 = "30"
-    NACE_30_1 = "30.1"
-    NACE_30_11 = "30.11"
-    NACE_30_12 = "30.12"
-    NACE_30_2 = "30.2"
-    NACE_30_20 = "30.20"
-    NACE_30_3 = "30.3"
-    NACE_30_30 = "30.30"
-    NACE_30_4 = "30.4"
-    NACE_30_40 = "30.40"
-    NACE_30_9 = "30.9"
-    NACE_30_91 = "30.91"
-    NACE_30_92 = "30.92"
-    NACE_30_99 = "30.99"
-    NACE_31 = "31"
-    NACE_31_0 = "31.0"
-    NACE_31_01 = "31.01"
-    NACE_31_02 = "31.02"
-    NACE_31_03 = "31.03"
-    NACE_31_09 = "31.09"
-    NACE_32 = "32"
-    NACE_32_1 = "32.1"
-    NACE_32_11 = "32.11"
-    NACE_32_12 = "32.12"
-    NACE_32_13 = "32.13"
-    NACE_32_2 = "32.2"
-    NACE_32_20 = "32.20"
-    NACE_32_3 = "32.3"
-    NACE_32_30 = "32.30"
-    NACE_32_4 = "32.4"
-    NACE_32_40 = "32.40"
-    NACE_32_5 = "32.5"
-    NACE_32_50 = "32.50"
-    NACE_32_9 = "32.9"
-    NACE_32_91 = "32.91"
-    NACE_32_99 = "32.99"
-    NACE_33 = "33"
-    NACE_33_1 = "33.1"
-    NACE_33_11 = "33.11"
-    NACE_33_12 = "33.12"
-    NACE_33_13 = "33.13"
-    NACE_33_14 = "33.14"
-    NACE_33_15 = "33.15"
-    NACE_33_16 = "33.16"
-    NACE_33_17 = "33.17"
-    NACE_33_19 = "33.19"
-    NACE_33_2 = "33.2"
-    NACE_33_20 = "33.20"
-    NACE_35 = "35"
-    NACE_35_1 = "35.1"
-    NACE_35_11 = "35.11"
-    NACE_35_12 = "35.12"
-    NACE_35_13 = "35.13"
-    NACE_35_14 = "35.14"
-    NACE_35_2 = "35.2"
-    NACE_35_21 = "35.21"
-    NACE_35_22 = "35.22"
-    NACE_35_23 = "35.23"
-    NACE_35_3 = "35.3"
-    NACE_35_30 = "35.30"
-    NACE_36 = "36"
-    NACE_36_0 = "36.0"
-    NACE_36_00 = "36.00"
-    NACE_37 = "37"
-    NACE_37_0 = "37.0"
-    NACE_37_00 = "37.00"
-    NACE_38 = "38"
-    NACE_38_1 = "38.1"
-    NACE_38_11 = "38.11"
-    NACE_38_12 = "38.12"
-    NACE_38_2 = "38.2"
-    NACE_38_21 = "38.21"
-    NACE_38_22 = "38.22"
-    NACE_38_3 = "38.3"
-    NACE_38_31 = "38.31"
-    NACE_38_32 = "38.32"
-    NACE_39 = "39"
-    NACE_39_0 = "39.0"
-    NACE_39_00 = "39.00"
-    NACE_41 = "41"
-    NACE_41_1 = "41.1"
-    NACE_41_10 = "41.10"
-    NACE_41_2 = "41.2"
-    NACE_41_20 = "41.20"
-    NACE_42 = "42"
-    NACE_42_1 = "42.1"
-    NACE_42_11 = "42.11"
-    NACE_42_12 = "42.12"
-    NACE_42_13 = "42.13"
-    NACE_42_2 = "42.2"
-    NACE_42_21 = "42.21"
-    NACE_42_22 = "42.22"
-    NACE_42_9 = "42.9"
-    NACE_42_91 = "42.91"
-    NACE_42_99 = "42.99"
-    NACE_43 = "43"
-    NACE_43_1 = "43.1"
-    NACE_43_11 = "43.11"
-    NACE_43_12 = "43.12"
-    NACE_43_13 = "43.13"
-    NACE_43_2 = "43.2"
-    NACE_43_21 = "43.21"
-    NACE_43_22 = "43.22"
-    NACE_43_29 = "43.29"
-    NACE_43_3 = "43.3"
-    NACE_43_31 = "43.31"
-    NACE_43_32 = "43.32"
-    NACE_43_33 = "43.33"
-    NACE_43_34 = "43.34"
-    NACE_43_39 = "43.39"
-    NACE_43_9 = "43.9"
-    NACE_43_91 = "43.91"
-    NACE_43_99 = "43.99"
-    NACE_45 = "45"
-    NACE_45_1 = "45.1"
-    NACE_45_11 = "45.11"
-    NACE_45_19 = "45.19"
-    NACE_45_2 = "45.2"
-    NACE_45_20 = "45.20"
-    NACE_45_3 = "45.3"
-    NACE_45_31 = "45.31"
-    NACE_45_32 = "45.32"
-    NACE_45_4 = "45.4"
-    NACE_45_40 = "45.40"
-    NACE_46 = "46"
-    NACE_46_1 = "46.1"
-    NACE_46_11 = "46.11"
-    NACE_46_12 = "46.12"
-    NACE_46_13 = "46.13"
-    NACE_46_14 = "46.14"
-    NACE_46_15 = "46.15"
-    NACE_46_16 = "46.16"
-    NACE_46_17 = "46.17"
-    NACE_46_18 = "46.18"
-    NACE_46_19 = "46.19"
-    NACE_46_2 = "46.2"
-    NACE_46_21 = "46.21"
-    NACE_46_22 = "46.22"
-    NACE_46_23 = "46.23"
-    NACE_46_24 = "46.24"
-    NACE_46_3 = "46.3"
-    NACE_46_31 = "46.31"
-    NACE_46_32 = "46.32"
-    NACE_46_33 = "46.33"
-    NACE_46_34 = "46.34"
-    NACE_46_35 = "46.35"
-    NACE_46_36 = "46.36"
-    NACE_46_37 = "46.37"
-    NACE_46_38 = "46.38"
-    NACE_46_39 = "46.39"
-    NACE_46_4 = "46.4"
-    NACE_46_41 = "46.41"
-    NACE_46_42 = "46.42"
-    NACE_46_43 = "46.43"
-    NACE_46_44 = "46.44"
-    NACE_46_45 = "46.45"
-    NACE_46_46 = "46.46"
-    NACE_46_47 = "46.47"
-    NACE_46_48 = "46.48"
-    NACE_46_49 = "46.49"
-    NACE_46_5 = "46.5"
-    NACE_46_51 = "46.51"
-    NACE_46_52 = "46.52"
-    NACE_46_6 = "46.6"
-    NACE_46_61 = "46.61"
-    NACE_46_62 = "46.62"
-    NACE_46_63 = "46.63"
-    NACE_46_64 = "46.64"
-    NACE_46_65 = "46.65"
-    NACE_46_66 = "46.66"
-    NACE_46_69 = "46.69"
-    NACE_46_7 = "46.7"
-    NACE_46_71 = "46.71"
-    NACE_46_72 = "46.72"
-    NACE_46_73 = "46.73"
-    NACE_46_74 = "46.74"
-    NACE_46_75 = "46.75"
-    NACE_46_76 = "46.76"
-    NACE_46_77 = "46.77"
-    NACE_46_9 = "46.9"
-    NACE_46_90 = "46.90"
-    NACE_47 = "47"
-    NACE_47_1 = "47.1"
-    NACE_47_11 = "47.11"
-    NACE_47_19 = "47.19"
-    NACE_47_2 = "47.2"
-    NACE_47_21 = "47.21"
-    NACE_47_22 = "47.22"
-    NACE_47_23 = "47.23"
-    NACE_47_24 = "47.24"
-    NACE_47_25 = "47.25"
-    NACE_47_26 = "47.26"
-    NACE_47_29 = "47.29"
-    NACE_47_3 = "47.3"
-    NACE_47_30 = "47.30"
-    NACE_47_4 = "47.4"
-    NACE_47_41 = "47.41"
-    NACE_47_42 = "47.42"
-    NACE_47_43 = "47.43"
-    NACE_47_5 = "47.5"
-    NACE_47_51 = "47.51"
-    NACE_47_52 = "47.52"
-    NACE_47_53 = "47.53"
-    NACE_47_54 = "47.54"
-    NACE_47_59 = "47.59"
-    NACE_47_6 = "47.6"
-    NACE_47_61 = "47.61"
-    NACE_47_62 = "47.62"
-    NACE_47_63 = "47.63"
-    NACE_47_64 = "47.64"
-    NACE_47_65 = "47.65"
-    NACE_47_7 = "47.7"
-    NACE_47_71 = "47.71"
-    NACE_47_72 = "47.72"
-    NACE_47_73 = "47.73"
-    NACE_47_74 = "47.74"
-    NACE_47_75 = "47.75"
-    NACE_47_76 = "47.76"
-    NACE_47_77 = "47.77"
-    NACE_47_78 = "47.78"
-    NACE_47_79 = "47.79"
-    NACE_47_8 = "47.8"
-    NACE_47_81 = "47.81"
-    NACE_47_82 = "47.82"
-    NACE_47_89 = "47.89"
-    NACE_47_9 = "47.9"
-    NACE_47_91 = "47.91"
-    NACE_47_99 = "47.99"
-    NACE_49 = "49"
-    NACE_49_1 = "49.1"
-    NACE_49_10 = "49.10"
-    NACE_49_2 = "49.2"
-    NACE_49_20 = "49.20"
-    NACE_49_3 = "49.3"
-    NACE_49_31 = "49.31"
-    NACE_49_32 = "49.32"
-    NACE_49_39 = "49.39"
-    NACE_49_4 = "49.4"
-    NACE_49_41 = "49.41"
-    NACE_49_42 = "49.42"
-    NACE_49_5 = "49.5"
-    NACE_49_50 = "49.50"
-    NACE_50 = "50"
-    NACE_50_1 = "50.1"
-    NACE_50_10 = "50.10"
-    NACE_50_2 = "50.2"
-    NACE_50_20 = "50.20"
-    NACE_50_3 = "50.3"
-    NACE_50_30 = "50.30"
-    NACE_50_4 = "50.4"
-    NACE_50_40 = "50.40"
-    NACE_51 = "51"
-    NACE_51_1 = "51.1"
-    NACE_51_10 = "51.10"
-    NACE_51_2 = "51.2"
-    NACE_51_21 = "51.21"
-    NACE_51_22 = "51.22"
-    NACE_52 = "52"
-    NACE_52_1 = "52.1"
-    NACE_52_10 = "52.10"
-    NACE_52_2 = "52.2"
-    NACE_52_21 = "52.21"
-    NACE_52_22 = "52.22"
-    NACE_52_23 = "52.23"
-    NACE_52_24 = "52.24"
-    NACE_52_29 = "52.29"
-    NACE_53 = "53"
-    NACE_53_1 = "53.1"
-    NACE_53_10 = "53.10"
-    NACE_53_2 = "53.2"
-    NACE_53_20 = "53.20"
-    NACE_55 = "55"
-    NACE_55_1 = "55.1"
-    NACE_55_10 = "55.10"
-    NACE_55_2 = "55.2"
-    NACE_55_20 = "55.20"
-    NACE_55_3 = "55.3"
-    NACE_55_30 = "55.30"
-    NACE_55_9 = "55.9"
-    NACE_55_90 = "55.90"
-    NACE_56 = "56"
-    NACE_56_1 = "56.1"
-    NACE_56_10 = "56.10"
-    NACE_56_2 = "56.2"
-    NACE_56_21 = "56.21"
-    NACE_56_29 = "56.29"
-    NACE_56_3 = "56.3"
-    NACE_56_30 = "56.30"
-    NACE_58 = "58"
-    NACE_58_1 = "58.1"
-    NACE_58_11 = "58.11"
-    NACE_58_12 = "58.12"
-    NACE_58_13 = "58.13"
-    NACE_58_14 = "58.14"
-    NACE_58_19 = "58.19"
-    NACE_58_2 = "58.2"
-    NACE_58_21 = "58.21"
-    NACE_58_29 = "58.29"
-    NACE_59 = "59"
-    NACE_59_1 = "59.1"
-    NACE_59_11 = "59.11"
-    NACE_59_12 = "59.12"
-    NACE_59_13 = "59.13"
-    NACE_59_14 = "59.14"
-    NACE_59_2 = "59.2"
-    NACE_59_20 = "59.20"
-    NACE_60 = "60"
-    NACE_60_1 = "60.1"
-    NACE_60_10 = "60.10"
-    NACE_60_2 = "60.2"
-    NACE_60_20 = "60.20"
-    NACE_61 = "61"
-    NACE_61_1 = "61.1"
-    NACE_61_10 = "61.10"
-    NACE_61_2 = "61.2"
-    NACE_61_20 = "61.20"
-    NACE_61_3 = "61.3"
-    NACE_61_30 = "61.30"
-    NACE_61_9 = "61.9"
-    NACE_61_90 = "61.90"
-    NACE_62 = "62"
-    NACE_62_0 = "62.0"
-    NACE_62_01 = "62.01"
-    NACE_62_02 = "62.02"
-    NACE_62_03 = "62.03"
-    NACE_62_09 = "62.09"
-    NACE_63 = "63"
-    NACE_63_1 = "63.1"
-    NACE_63_11 = "63.11"
-    NACE_63_12 = "63.12"
-    NACE_63_9 = "63.9"
-    NACE_63_91 = "63.91"
-    NACE_63_99 = "63.99"
-    NACE_64 = "64"
-    NACE_64_1 = "64.1"
-    NACE_64_11 = "64.11"
-    NACE_64_19 = "64.19"
-    NACE_64_2 = "64.2"
-    NACE_64_20 = "64.20"
-    NACE_64_3 = "64.3"
-    NACE_64_30 = "64.30"
-    NACE_64_9 = "64.9"
-    NACE_64_91 = "64.91"
-    NACE_64_92 = "64.92"
-    NACE_64_99 = "64.99"
-    NACE_65 = "65"
-    NACE_65_1 = "65.1"
-    NACE_65_11 = "65.11"
-    NACE_65_12 = "65.12"
-    NACE_65_2 = "65.2"
-    NACE_65_20 = "65.20"
-    NACE_65_3 = "65.3"
-    NACE_65_30 = "65.30"
-    NACE_66 = "66"
-    NACE_66_1 = "66.1"
-    NACE_66_11 = "66.11"
-    NACE_66_12 = "66.12"
-    NACE_66_19 = "66.19"
-    NACE_66_2 = "66.2"
-    NACE_66_21 = "66.21"
-    NACE_66_22 = "66.22"
-    NACE_66_29 = "66.29"
-    NACE_66_3 = "66.3"
-    NACE_66_30 = "66.30"
-    NACE_68 = "68"
-    NACE_68_1 = "68.1"
-    NACE_68_10 = "68.10"
-    NACE_68_2 = "68.2"
-    NACE_68_20 = "68.20"
-    NACE_68_3 = "68.3"
-    NACE_68_31 = "68.31"
-    NACE_68_32 = "68.32"
-    NACE_69 = "69"
-    NACE_69_1 = "69.1"
-    NACE_69_10 = "69.10"
-    NACE_69_2 = "69.2"
-    NACE_69_20 = "69.20"
-    NACE_70 = "70"
-    NACE_70_1 = "70.1"
-    NACE_70_10 = "70.10"
-    NACE_70_2 = "70.2"
-    NACE_70_21 = "70.21"
-    NACE_70_22 = "70.22"
-    NACE_71 = "71"
-    NACE_71_1 = "71.1"
-    NACE_71_11 = "71.11"
-    NACE_71_12 = "71.12"
-    NACE_71_2 = "71.2"
-    NACE_71_20 = "71.20"
-    NACE_72 = "72"
-    NACE_72_1 = "72.1"
-    NACE_72_11 = "72.11"
-    NACE_72_19 = "72.19"
-    NACE_72_2 = "72.2"
-    NACE_72_20 = "72.20"
-    NACE_73 = "73"
-    NACE_73_1 = "73.1"
-    NACE_73_11 = "73.11"
-    NACE_73_12 = "73.12"
-    NACE_73_2 = "73.2"
-    NACE_73_20 = "73.20"
-    NACE_74 = "74"
-    NACE_74_1 = "74.1"
-    NACE_74_10 = "74.10"
-    NACE_74_2 = "74.2"
-    NACE_74_20 = "74.20"
-    NACE_74_3 = "74.3"
-    NACE_74_30 = "74.30"
-    NACE_74_9 = "74.9"
-    NACE_74_90 = "74.90"
-    NACE_75 = "75"
-    NACE_75_0 = "75.0"
-    NACE_75_00 = "75.00"
-    NACE_77 = "77"
-    NACE_77_1 = "77.1"
-    NACE_77_11 = "77.11"
-    NACE_77_12 = "77.12"
-    NACE_77_2 = "77.2"
-    NACE_77_21 = "77.21"
-    NACE_77_22 = "77.22"
-    NACE_77_29 = "77.29"
-    NACE_77_3 = "77.3"
-    NACE_77_31 = "77.31"
-    NACE_77_32 = "77.32"
-    NACE_77_33 = "77.33"
-    NACE_77_34 = "77.34"
-    NACE_77_35 = "77.35"
-    NACE_77_39 = "77.39"
-    NACE_77_4 = "77.4"
-    NACE_77_40 = "77.40"
-    NACE_78 = "78"
-    NACE_78_1 = "78.1"
-    NACE_78_10 = "78.10"
-    NACE_78_2 = "78.2"
-    NACE_78_20 = "78.20"
-    NACE_78_3 = "78.3"
-    NACE_78_30 = "78.30"
-    NACE_79 = "79"
-    NACE_79_1 = "79.1"
-    NACE_79_11 = "79.11"
-    NACE_79_12 = "79.12"
-    NACE_79_9 = "79.9"
-    NACE_79_90 = "79.90"
-    NACE_80 = "80"
-    NACE_80_1 = "80.1"
-    NACE_80_10 = "80.10"
-    NACE_80_2 = "80.2"
-    NACE_80_20 = "80.20"
-    NACE_80_3 = "80.3"
-    NACE_80_30 = "80.30"
-    NACE_81 = "81"
-    NACE_81_1 = "81.1"
-    NACE_81_10 = "81.10"
-    NACE_81_2 = "81.2"
-    NACE_81_21 = "81.21"
-    NACE_81_22 = "81.22"
-    NACE_81_29 = "81.29"
-    NACE_81_3 = "81.3"
-    NACE_81_30 = "81.30"
-    NACE_82 = "82"
-    NACE_82_1 = "82.1"
-    NACE_82_11 = "82.11"
-    NACE_82_19 = "82.19"
-    NACE_82_2 = "82.2"
-    NACE_82_20 = "82.20"
-    NACE_82_3 = "82.3"
-    NACE_82_30 = "82.30"
-    NACE_82_9 = "82.9"
-    NACE_82_91 = "82.91"
-    NACE_82_92 = "82.92"
-    NACE_82_99 = "82.99"
-    NACE_84 = "84"
-    NACE_84_1 = "84.1"
-    NACE_84_11 = "84.11"
-    NACE_84_12 = "84.12"
-    NACE_84_13 = "84.13"
-    NACE_84_2 = "84.2"
-    NACE_84_21 = "84.21"
-    NACE_84_22 = "84.22"
-    NACE_84_23 = "84.23"
-    NACE_84_24 = "84.24"
-    NACE_84_25 = "84.25"
-    NACE_84_3 = "84.3"
-    NACE_84_30 = "84.30"
-    NACE_85 = "85"
-    NACE_85_1 = "85.1"
-    NACE_85_10 = "85.10"
-    NACE_85_2 = "85.2"
-    NACE_85_20 = "85.20"
-    NACE_85_3 = "85.3"
-    NACE_85_31 = "85.31"
-    NACE_85_32 = "85.32"
-    NACE_85_4 = "85.4"
-    NACE_85_41 = "85.41"
-    NACE_85_42 = "85.42"
-    NACE_85_5 = "85.5"
-    NACE_85_51 = "85.51"
-    NACE_85_52 = "85.52"
-    NACE_85_53 = "85.53"
-    NACE_85_59 = "85.59"
-    NACE_85_6 = "85.6"
-    NACE_85_60 = "85.60"
-    NACE_86 = "86"
-    NACE_86_1 = "86.1"
-    NACE_86_10 = "86.10"
-    NACE_86_2 = "86.2"
-    NACE_86_21 = "86.21"
-    NACE_86_22 = "86.22"
-    NACE_86_23 = "86.23"
-    NACE_86_9 = "86.9"
-    NACE_86_90 = "86.90"
-    NACE_87 = "87"
-    NACE_87_1 = "87.1"
-    NACE_87_10 = "87.10"
-    NACE_87_2 = "87.2"
-    NACE_87_20 = "87.20"
-    NACE_87_3 = "87.3"
-    NACE_87_30 = "87.30"
-    NACE_87_9 = "87.9"
-    NACE_87_90 = "87.90"
-    NACE_88 = "88"
-    NACE_88_1 = "88.1"
-    NACE_88_10 = "88.10"
-    NACE_88_9 = "88.9"
-    NACE_88_91 = "88.91"
-    NACE_88_99 = "88.99"
-    NACE_90 = "90"
-    NACE_90_0 = "90.0"
-    NACE_90_01 = "90.01"
-    NACE_90_02 = "90.02"
-    NACE_90_03 = "90.03"
-    NACE_90_04 = "90.04"
-    NACE_91 = "91"
-    NACE_91_0 = "91.0"
-    NACE_91_01 = "91.01"
-    NACE_91_02 = "91.02"
-    NACE_91_03 = "91.03"
-    NACE_91_04 = "91.04"
-    NACE_92 = "92"
-    NACE_92_0 = "92.0"
-    NACE_92_00 = "92.00"
-    NACE_93 = "93"
-    NACE_93_1 = "93.1"
-    NACE_93_11 = "93.11"
-    NACE_93_12 = "93.12"
-    NACE_93_13 = "93.13"
-    NACE_93_19 = "93.19"
-    NACE_93_2 = "93.2"
-    NACE_93_21 = "93.21"
-    NACE_93_29 = "93.29"
-    NACE_94 = "94"
-    NACE_94_1 = "94.1"
-    NACE_94_11 = "94.11"
-    NACE_94_12 = "94.12"
-    NACE_94_2 = "94.2"
-    NACE_94_20 = "94.20"
-    NACE_94_9 = "94.9"
-    NACE_94_91 = "94.91"
-    NACE_94_92 = "94.92"
-    NACE_94_99 = "94.99"
-    NACE_95 = "95"
-    NACE_95_1 = "95.1"
-    NACE_95_11 = "95.11"
-    NACE_95_12 = "95.12"
-    NACE_95_2 = "95.2"
-    NACE_95_21 = "95.21"
-    NACE_95_22 = "95.22"
-    NACE_95_23 = "95.23"
-    NACE_95_24 = "95.24"
-    NACE_95_25 = "95.25"
-    NACE_95_29 = "95.29"
-    NACE_96 = "96"
-    NACE_96_0 = "96.0"
-    NACE_96_01 = "96.01"
-    NACE_96_02 = "96.02"
-    NACE_96_03 = "96.03"
-    NACE_96_04 = "96.04"
-    NACE_96_09 = "96.09"
-    NACE_97 = "97"
-    NACE_97_0 = "97.0"
-    NACE_97_00 = "97.00"
-    NACE_98 = "98"
-    NACE_98_1 = "98.1"
-    NACE_98_10 = "98.10"
-    NACE_98_2 = "98.2"
-    NACE_98_20 = "98.20"
-    NACE_99 = "99"
-    NACE_99_0 = "99.0"
-    NACE_99_00 = "99.00"
-
-
-class ISO_3166_1_Alpha_2(str, Enum):
-    AD = "AD"
-    AE = "AE"
-    AF = "AF"
-    AG = "AG"
-    AI = "AI"
-    AL = "AL"
-    AM = "AM"
-    AO = "AO"
-    AQ = "AQ"
-    AR = "AR"
-    AS = "AS"
-    AT = "AT"
-    AU = "AU"
-    AW = "AW"
-    AX = "AX"
-    AZ = "AZ"
-    BA = "BA"
-    BB = "BB"
-    BD = "BD"
-    BE = "BE"
-    BF = "BF"
-    BG = "BG"
-    BH = "BH"
-    BI = "BI"
-    BJ = "BJ"
-    BL = "BL"
-    BM = "BM"
-    BN = "BN"
-    BO = "BO"
-    BQ = "BQ"
-    BR = "BR"
-    BS = "BS"
-    BT = "BT"
-    BV = "BV"
-    BW = "BW"
-    BY = "BY"
-    BZ = "BZ"
-    CA = "CA"
-    CC = "CC"
-    CD = "CD"
-    CF = "CF"
-    CG = "CG"
-    CH = "CH"
-    CI = "CI"
-    CK = "CK"
-    CL = "CL"
-    CM = "CM"
-    CN = "CN"
-    CO = "CO"
-    CR = "CR"
-    CU = "CU"
-    CV = "CV"
-    CW = "CW"
-    CX = "CX"
-    CY = "CY"
-    CZ = "CZ"
-    DE = "DE"
-    DJ = "DJ"
-    DK = "DK"
-    DM = "DM"
-    DO = "DO"
-    DZ = "DZ"
-    EC = "EC"
-    EE = "EE"
-    EG = "EG"
-    EH = "EH"
-    ER = "ER"
-    ES = "ES"
-    ET = "ET"
-    FI = "FI"
-    FJ = "FJ"
-    FK = "FK"
-    FM = "FM"
-    FO = "FO"
-    FR = "FR"
-    GA = "GA"
-    GB = "GB"
-    GD = "GD"
-    GE = "GE"
-    GF = "GF"
-    GG = "GG"
-    GH = "GH"
-    GI = "GI"
-    GL = "GL"
-    GM = "GM"
-    GN = "GN"
-    GP = "GP"
-    GQ = "GQ"
-    GR = "GR"
-    GS = "GS"
-    GT = "GT"
-    GU = "GU"
-    GW = "GW"
-    GY = "GY"
-    HK = "HK"
-    HM = "HM"
-    HN = "HN"
-    HR = "HR"
-    HT = "HT"
-    HU = "HU"
-    ID = "ID"
-    IE = "IE"
-    IL = "IL"
-    IM = "IM"
-    IN = "IN"
-    IO = "IO"
-    IQ = "IQ"
-    IR = "IR"
-    IS = "IS"
-    IT = "IT"
-    JE = "JE"
-    JM = "JM"
-    JO = "JO"
-    JP = "JP"
-    KE = "KE"
-    KG = "KG"
-    KH = "KH"
-    KI = "KI"
-    KM = "KM"
-    KN = "KN"
-    KP = "KP"
-    KR = "KR"
-    KW = "KW"
-    KY = "KY"
-    KZ = "KZ"
-    LA = "LA"
-    LB = "LB"
-    LC = "LC"
-    LI = "LI"
-    LK = "LK"
-    LR = "LR"
-    LS = "LS"
-    LT = "LT"
-    LU = "LU"
-    LV = "LV"
-    LY = "LY"
-    MA = "MA"
-    MC = "MC"
-    MD = "MD"
-    ME = "ME"
-    MF = "MF"
-    MG = "MG"
-    MH = "MH"
-    MK = "MK"
-    ML = "ML"
-    MM = "MM"
-    MN = "MN"
-    MO = "MO"
-    MP = "MP"
-    MQ = "MQ"
-    MR = "MR"
-    MS = "MS"
-    MT = "MT"
-    MU = "MU"
-    MV = "MV"
-    MW = "MW"
-    MX = "MX"
-    MY = "MY"
-    MZ = "MZ"
-    NA = "NA"
-    NC = "NC"
-    NE = "NE"
-    NF = "NF"
-    NG = "NG"
-    NI = "NI"
-    NL = "NL"
-    NO = "NO"
-    NP = "NP"
-    NR = "NR"
-    NU = "NU"
-    NZ = "NZ"
-    OM = "OM"
-    PA = "PA"
-    PE = "PE"
-    PF = "PF"
-    PG = "PG"
-    PH = "PH"
-    PK = "PK"
-    PL = "PL"
-    PM = "PM"
-    PN = "PN"
-    PR = "PR"
-    PS = "PS"
-    PT = "PT"
-    PW = "PW"
-    PY = "PY"
-    QA = "QA"
-    RE = "RE"
-    RO = "RO"
-    RS = "RS"
-    RU = "RU"
-    RW = "RW"
-    SA = "SA"
-    SB = "SB"
-    SC = "SC"
-    SD = "SD"
-    SE = "SE"
-    SG = "SG"
-    SH = "SH"
-    SI = "SI"
-    SJ = "SJ"
-    SK = "SK"
-    SL = "SL"
-    SM = "SM"
-    SN = "SN"
-    SO = "SO"
-    SR = "SR"
-    SS = "SS"
-    ST = "ST"
-    SV = "SV"
-    SX = "SX"
-    SY = "SY"
-    SZ = "SZ"
-    TC = "TC"
-    TD = "TD"
-    TF = "TF"
-    TG = "TG"
-    TH = "TH"
-    TJ = "TJ"
-    TK = "TK"
-    TL = "TL"
-    TM = "TM"
-    TN = "TN"
-    TO = "TO"
-    TR = "TR"
-    TT = "TT"
-    TV = "TV"
-    TW = "TW"
-    TZ = "TZ"
-    UA = "UA"
-    UG = "UG"
-    UM = "UM"
-    US = "US"
-    UY = "UY"
-    UZ = "UZ"
-    VA = "VA"
-    VC = "VC"
-    VE = "VE"
-    VG = "VG"
-    VI = "VI"
-    VN = "VN"
-    VU = "VU"
-    WF = "WF"
-    WS = "WS"
-    YE = "YE"
-    YT = "YT"
-    ZA = "ZA"
-    ZM = "ZM"
-    ZW = "ZW"
-
-
 class LegalStatus(str, Enum):
     NORMAL = "NORMAL"
     LIQUIDATION = "LIQUIDATION"
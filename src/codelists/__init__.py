@@ -0,0 +1,50 @@
+"""
+Code lists shared by the data product definitions.
+
+The big code lists, like the ESCO occupations or the NACE activities, are used by many
+definitions. Instead of every definition having its own copy, they are defined here
+once and imported by the definitions, e.g.::
+
+    from codelists.esco import EscoCode
+
+The converter still inlines the enums into every generated OpenAPI spec, so the specs
+stay self-contained. A process importing many definitions builds each list only once.
+
+The types are only built when they're first accessed. The small lists, like
+``WorkingTime``, are ordinary ``str`` enums, the biggest ones, like ``EscoCode`` or
+``NaceCode``, are frozenset-backed code types, and the other big lists code enums
+whose members, e.g. ``EntityLegalForm.ISO_20275_DKUW``, don't need an ``Enum`` to be
+built, see ``codelists.base``. They can also be imported directly from this package,
+which only imports the module of the requested type.
+
+Indexes for data sources working with the codes, in ``codelists.hierarchy``,
+``codelists.lookups``, ``codelists.crosswalks`` and ``codelists.regions``, are built
+from the codes on demand as well.
+"""
+import importlib
+
+# Modules of the enums, by the names of the enums
+ENUM_MODULES = {
+    "EscoCode": "esco",
+    "EducationField": "isced",
+    "EducationLevel": "isced",
+    "ISO_3166_1_Alpha_2": "iso3166",
+    "ISO_3166_1_Alpha_3": "iso3166",
+    "ISO_3166_2_FI": "iso3166",
+    "ISO_639_1": "iso639",
+    "EntityLegalForm": "legal_forms",
+    "NordicLegalForm": "legal_forms",
+    "FinnishMunicipality": "municipalities",
+    "Activity": "nace",
+    "IndustrySector": "nace",
+    "NaceCode": "nace",
+    "Permit": "permits",
+    "WorkingTime": "working_time",
+}
+
+
+def __getattr__(name: str) -> type:
+    if name not in ENUM_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{ENUM_MODULES[name]}")
+    return getattr(module, name)
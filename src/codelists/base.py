@@ -0,0 +1,300 @@
+"""
+Compact storage of the code lists, with the types built from them on demand.
+
+A code list module keeps only the codes, as a tuple of strings, and exposes the types
+of the codes through a module level ``__getattr__``. A type is built the first time
+it's accessed, e.g. by ``from codelists.esco import EscoCode``, so importing a code
+list module, or using only its codes, doesn't pay for building thousands of enum
+members.
+
+The lists used as enums are ``str`` enums when they have at most ``ENUM_THRESHOLD``
+codes. The bigger ones are code enums instead, and the lists used as code types are
+code types: strings validated against a frozenset of the codes. The members of a code
+enum have the ``name`` and ``value`` of enum members and are canonical, but they are
+not ``Enum`` members, the ``Enum`` itself is only built when it's asked for. All of
+them are rendered the same way as enums in the JSON schema, as a string with an
+``enum`` of the codes.
+"""
+import re
+import sys
+import threading
+from enum import Enum
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+
+class CodeList:
+    """
+    The codes of a code list, in the order they are published in the specs.
+
+    The names of the enum members are derived from the codes by prefixing them and
+    replacing the characters not allowed in python names, e.g. "2654.1.7" becomes
+    "ESCO_2654_1_7", unless the names are given explicitly.
+    """
+
+    def __init__(
+        self,
+        codes: Sequence[str] = (),
+        prefix: str = "",
+        names: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        :param codes: The codes, when the names are derived from them
+        :param prefix: Prefix of the derived names
+        :param names: Mapping of names to codes, when they can't be derived
+        """
+        if names is not None:
+            codes = tuple(names.values())
+        self.codes: Tuple[str, ...] = tuple(codes)
+        self.prefix = prefix
+        self.names = names
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def members(self) -> List[Tuple[str, str]]:
+        """
+        Get the names and codes of the enum members
+        """
+        if self.names is not None:
+            return list(self.names.items())
+        return [(member_name(self.prefix, code), code) for code in self.codes]
+
+
+def member_name(prefix: str, code: str) -> str:
+    return prefix + re.sub(r"\W", "_", code).upper()
+
+
+class CodeTypeMeta(type):
+    """
+    Lets the code types be used like enums, e.g. ``"091" in FinnishMunicipality`` or
+    ``FinnishMunicipality.HELSINKI``
+    """
+
+    code_list: CodeList
+    codes: FrozenSet[str]
+
+    def __contains__(cls, code: object) -> bool:
+        return code in cls.codes
+
+    def __iter__(cls) -> Iterator[str]:
+        return iter(cls.code_list)
+
+    def __len__(cls) -> int:
+        return len(cls.code_list)
+
+    def __getattr__(cls, name: str) -> str:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # The mapping of the names is only needed for this, so it's built on demand
+        if "_by_name" not in cls.__dict__:
+            cls._by_name = dict(cls.code_list.members())
+        try:
+            return cls._by_name[name]
+        except KeyError:
+            raise AttributeError(f"{cls.__name__!r} has no code {name!r}") from None
+
+
+class CodeType(str, metaclass=CodeTypeMeta):
+    """
+    A code of a code list. Values are validated with a frozenset lookup and are
+    instances of the code type, without the members an enum would have.
+    """
+
+    def __new__(cls, value: str) -> "CodeType":
+        return cls.validate(value)
+
+    @classmethod
+    def validate(cls, value: str) -> "CodeType":
+        if value not in cls.codes:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        if type(value) is cls:
+            return value
+        return str.__new__(cls, value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            cls.validate,
+            core_schema.str_schema(),
+            # The reference makes it a component of its own in the schema, like enums
+            ref=f"{cls.__module__}.{cls.__qualname__}:{id(cls)}",
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "string", "enum": list(cls.code_list), "title": cls.__name__}
+
+
+def code_type(
+    name: str, code_list: CodeList, module_name: str, base: type = CodeType
+) -> CodeTypeMeta:
+    """
+    Create the code type, or with ``base=CodeEnum`` the code enum, of a code list
+    """
+    return type(base)(
+        name,
+        (base,),
+        {
+            "__module__": module_name,
+            "__qualname__": name,
+            "code_list": code_list,
+            "codes": frozenset(code_list.codes),
+        },
+    )
+
+
+_lock = threading.Lock()
+
+
+class CodeEnumMeta(CodeTypeMeta):
+    """
+    Lets the code enums be used like the enums they stand for. The members, e.g.
+    ``EntityLegalForm.ISO_20275_DKUW``, ``EntityLegalForm["ISO_20275_DKUW"]`` or the
+    ones iterated over, are values of the code enum, so using them doesn't build the
+    ``Enum``. It's built from the code list on the first access to ``enum``.
+    """
+
+    def _members(cls) -> Dict[str, "CodeEnum"]:
+        if "_members_by_name" not in cls.__dict__:
+            members = {
+                name: str.__new__(cls, code) for name, code in cls.code_list.members()
+            }
+            cls._names_by_code = {code: name for name, code in members.items()}
+            cls._members_by_code = {str(member): member for member in members.values()}
+            # Set last, so the rest is there when another thread finds the members
+            cls._members_by_name = members
+        return cls._members_by_name
+
+    @property
+    def __members__(cls) -> Mapping[str, "CodeEnum"]:
+        return MappingProxyType(cls._members())
+
+    def __getattr__(cls, name: str) -> "CodeEnum":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return cls._members()[name]
+        except KeyError:
+            raise AttributeError(f"{cls.__name__!r} has no member {name!r}") from None
+
+    def __getitem__(cls, name: str) -> "CodeEnum":
+        return cls._members()[name]
+
+    def __iter__(cls) -> Iterator["CodeEnum"]:
+        return iter(cls._members().values())
+
+    @property
+    def enum(cls) -> Type[Enum]:
+        """
+        The enum of the code list, with the same members, built on the first use
+        """
+        with _lock:
+            if "_enum" not in cls.__dict__:
+                cls._enum = Enum(
+                    cls.__name__,
+                    cls.code_list.members(),
+                    module=cls.__module__,
+                    type=str,
+                )
+        return cls._enum
+
+
+class CodeEnum(CodeType, metaclass=CodeEnumMeta):
+    """
+    A member of a code list used as an enum. Like a code type it's validated with a
+    frozenset lookup, and it has the ``name`` and ``value`` of an enum member. The
+    validated values are the members, e.g. ``WorkingTime("01")`` is
+    ``WorkingTime.DAY_SHIFT``, but unlike enum members they aren't ``Enum``
+    instances.
+    """
+
+    @classmethod
+    def validate(cls, value: str) -> "CodeEnum":
+        if isinstance(value, Enum):
+            # A member of the enum built with ``enum``
+            value = value.value
+        if value not in cls.codes:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        cls._members()
+        return cls._members_by_code[value]
+
+    @property
+    def name(self) -> str:
+        type(self)._members()
+        return type(self)._names_by_code[self]
+
+    @property
+    def value(self) -> str:
+        return str(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}.{self.name}: {str(self)!r}>"
+
+
+# The largest code list used as an enum that is built as an actual ``Enum``
+ENUM_THRESHOLD = 100
+
+
+def lazy_code_lists(
+    module_name: str,
+    enums: Optional[Dict[str, CodeList]] = None,
+    code_types: Optional[Dict[str, CodeList]] = None,
+) -> Callable[[str], type]:
+    """
+    Create the module level ``__getattr__`` building the types of the code lists
+
+    :param module_name: Name of the module the types belong to
+    :param enums: The code lists to build enums of, by the names of the enums. The
+    lists with more than ``ENUM_THRESHOLD`` codes become code enums.
+    :param code_types: The code lists to build code types of, by the names of the
+    types
+    :return: Function to assign to ``__getattr__`` of the module
+    """
+    enums = enums or {}
+    code_types = code_types or {}
+
+    def __getattr__(name: str) -> type:
+        if name not in enums and name not in code_types:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = sys.modules[module_name]
+        with _lock:
+            # Another thread may have built it while we were waiting
+            built = module.__dict__.get(name)
+            if built is None:
+                if name in enums and len(enums[name]) <= ENUM_THRESHOLD:
+                    built = Enum(
+                        name, enums[name].members(), module=module_name, type=str
+                    )
+                elif name in enums:
+                    built = code_type(name, enums[name], module_name, CodeEnum)
+                else:
+                    built = code_type(name, code_types[name], module_name)
+                # Cache the type in the module, so it's found without this function
+                setattr(module, name, built)
+        return built
+
+    return __getattr__
@@ -0,0 +1,169 @@
+"""
+Crosswalks between the codes of code lists used for the same thing in different
+definitions, e.g. the alpha-2 and alpha-3 country codes.
+
+A crosswalk stores, for each code of either list, the position of the matching code
+of the other list in an array, so converting a code either way is two lookups and a
+column of codes is converted with a single pass over it.
+
+The NACE activities are used as three different types, ``IndustrySector``,
+``Activity`` and ``NaceCode``, built from the same code list. Converting between them
+maps every code to itself, so it only needs a table of the values of each type.
+"""
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from codelists import nace
+from codelists.iso3166 import (
+    ALPHA_3_TO_ALPHA_2,
+    COUNTRY_CODES_ALPHA_2,
+    COUNTRY_CODES_ALPHA_3,
+)
+
+# Position of a code without a match in the other code list
+_NO_MATCH = -1
+
+
+class CodeCrosswalk:
+    """
+    One-to-one mapping between the codes of a source and a target code list. Codes
+    may be missing a match, e.g. the alpha-3 code of the former Netherlands Antilles
+    has no alpha-2 code in the code lists.
+    """
+
+    def __init__(
+        self,
+        source: Sequence[str],
+        target: Sequence[str],
+        pairs: Iterable[Tuple[str, str]],
+    ):
+        """
+        :param source: The codes of the source code list
+        :param target: The codes of the target code list
+        :param pairs: The matching source and target codes
+        """
+        self.source: Tuple[str, ...] = tuple(source)
+        self.target: Tuple[str, ...] = tuple(target)
+        self._source_index: Dict[str, int] = {c: i for i, c in enumerate(self.source)}
+        self._target_index: Dict[str, int] = {c: i for i, c in enumerate(self.target)}
+        self._forward = array("i", [_NO_MATCH] * len(self.source))
+        self._backward = array("i", [_NO_MATCH] * len(self.target))
+        for source_code, target_code in pairs:
+            i = self._source_index[source_code]
+            j = self._target_index[target_code]
+            if self._forward[i] != _NO_MATCH or self._backward[j] != _NO_MATCH:
+                raise ValueError(f"{source_code} or {target_code} is matched twice")
+            self._forward[i] = j
+            self._backward[j] = i
+
+    def __len__(self) -> int:
+        """
+        The number of matched pairs of codes
+        """
+        return sum(1 for j in self._forward if j != _NO_MATCH)
+
+    def _tables(self, reverse: bool) -> Tuple[Dict[str, int], array, Tuple[str, ...]]:
+        if reverse:
+            return self._target_index, self._backward, self.source
+        return self._source_index, self._forward, self.target
+
+    def convert(self, code: str, reverse: bool = False) -> Optional[str]:
+        """
+        Convert a code of the source list to the target list, or the other way around
+
+        :param code: The code to convert
+        :param reverse: Convert from the target list to the source list
+        :return: The matching code, or None if the code is unknown or has no match
+        """
+        index, matches, codes = self._tables(reverse)
+        i = index.get(code)
+        if i is None or matches[i] == _NO_MATCH:
+            return None
+        return codes[matches[i]]
+
+    def convert_many(
+        self, codes: Iterable[str], reverse: bool = False
+    ) -> List[Optional[str]]:
+        """
+        Convert a column of codes, with None for the codes that can't be converted
+        """
+        index, matches, converted = self._tables(reverse)
+        # The position of no match, -1, picks the None added last
+        lookup = converted + (None,)
+        return [lookup[matches[index[c]] if c in index else _NO_MATCH] for c in codes]
+
+
+@lru_cache(maxsize=None)
+def country_codes() -> CodeCrosswalk:
+    """
+    Get the crosswalk from the ISO 3166-1 alpha-2 codes to the alpha-3 codes, built
+    on the first call
+    """
+    return CodeCrosswalk(
+        COUNTRY_CODES_ALPHA_2,
+        COUNTRY_CODES_ALPHA_3,
+        ((alpha_2, alpha_3) for alpha_3, alpha_2 in ALPHA_3_TO_ALPHA_2.items()),
+    )
+
+
+def alpha_2_to_alpha_3(code: str) -> Optional[str]:
+    return country_codes().convert(code)
+
+
+def alpha_3_to_alpha_2(code: str) -> Optional[str]:
+    return country_codes().convert(code, reverse=True)
+
+
+# The types of the NACE activities in the definitions
+NACE_TYPES = ("IndustrySector", "Activity", "NaceCode")
+
+
+class NaceCrosswalk:
+    """
+    Converts between the types of the NACE activities. A value of any of them, or a
+    plain code, is found in the tables as it is, since the enums are string enums
+    and the code type is a string.
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, Dict[str, str]] = {}
+
+    def table(self, target: str) -> Dict[str, str]:
+        """
+        Get the values of the target type by code, built on the first use
+        """
+        if target not in self._tables:
+            if target not in NACE_TYPES:
+                raise ValueError(f"{target!r} is not one of {', '.join(NACE_TYPES)}")
+            target_type = getattr(nace, target)
+            self._tables[target] = {
+                code: target_type(code) for code in nace.NACE_ACTIVITIES
+            }
+        return self._tables[target]
+
+    def convert(self, value: str, target: str) -> Optional[str]:
+        """
+        Convert a value to the target type, e.g. an ``IndustrySector`` of a company
+        to the ``NaceCode`` of a job applicant's preferences
+
+        :param value: The value of any of the types, or a code
+        :param target: Name of the type to convert to
+        :return: The value of the target type, or None if the code is unknown
+        """
+        return self.table(target).get(value)
+
+    def convert_many(self, values: Iterable[str], target: str) -> List[Optional[str]]:
+        """
+        Convert a column of values to the target type, with None for unknown codes
+        """
+        get = self.table(target).get
+        return [get(value) for value in values]
+
+
+@lru_cache(maxsize=None)
+def nace_crosswalk() -> NaceCrosswalk:
+    """
+    Get the crosswalk between the types of the NACE activities
+    """
+    return NaceCrosswalk()
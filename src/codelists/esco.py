@@ -0,0 +1,3021 @@
+"""
+ESCO occupations, https://esco.ec.europa.eu/en/classification/occupation_main
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+ESCO_OCCUPATIONS = CodeList(
+    prefix="ESCO_",
+    codes=(
+        "2654.1.7",
+        "8121.4",
+        "7543.10.3",
+        "3155.1",
+        "2431.9",
+        "3212.2",
+        "3116.1.1",
+        "5312.2",
+        "2264.2",
+        "2310.1.30",
+        "8160.39",
+        "8160.46",
+        "1420.4.42",
+        "5249.2.1",
+        "2165.4.2",
+        "2263.2",
+        "7233.8",
+        "8331.1",
+        "1324.3.2.22",
+        "2422.12.8",
+        "3434.1.1",
+        "8131.15",
+        "1345.1.5",
+        "3123.1.13",
+        "2149.8",
+        "3315.3",
+        "1223.2.1.1",
+        "8131.14",
+        "2149.5.1",
+        "3412.2",
+        "7318.6",
+        "7122.4",
+        "1420.4.38",
+        "1439.7",
+        "6123.1",
+        "3342.2",
+        "3134.4",
+        "8153.1.5",
+        "8122.3",
+        "6221.3",
+        "7223.8",
+        "1411.3",
+        "7316.1.1",
+        "2153.1",
+        "2352.1.1",
+        "1321.2.2.1",
+        "7126.12",
+        "1324.3.1.6.11",
+        "2352.1.6",
+        "1431.1.2",
+        "1321.2.1.8",
+        "8211.1.1",
+        "2146.11",
+        "1420.4.4",
+        "5223.7.21",
+        "2341.1",
+        "8331.2",
+        "3122.3.2",
+        "4321.1.5",
+        "3343.1",
+        "8160.22",
+        "3344.1",
+        "2529.6",
+        "3123.1.1",
+        "2269.3",
+        "8114.6",
+        "3115.1.7",
+        "1221.1",
+        "2512.2",
+        "1211.1.1",
+        "1219.5.2",
+        "2422.14",
+        "7422.7",
+        "5242.1",
+        "2320.1.17",
+        "3311.3.2",
+        "3115.1.1",
+        "8172.5.3",
+        "3123.1.2",
+        "7112.1",
+        "7511.4",
+        "2632.4",
+        "3521.1.4",
+        "5223.7.16",
+        "1322.1.2",
+        "3117.3",
+        "8151.3",
+        "7122.3",
+        "3119.16.6",
+        "7516.1",
+        "8122.8",
+        "2423.6",
+        "2120.1",
+        "2166.11",
+        "2653.1.2",
+        "7412.1",
+        "2163.1.3.2",
+        "1120.5",
+        "7532.3",
+        "1112.6",
+        "3312.2.1",
+        "3123.1.17",
+        "2413.1.4",
+        "2653.2",
+        "7536.2.1",
+        "2612.1",
+        "2163.1.7",
+        "7322.2",
+        "2149.7",
+        "2511.17",
+        "2112.1.3",
+        "2659.3",
+        "1431.2.5",
+        "3421.1",
+        "2250.8",
+        "3435.4",
+        "3119.4",
+        "1213.5.1",
+        "2513.2",
+        "7126.14",
+        "2635.3.27.1",
+        "3323.2.1",
+        "2310.1.14",
+        "5223.2",
+        "5141.1",
+        "2651.2",
+        "2656.3",
+        "3422.4.2",
+        "3112.1.5.1",
+        "4110.1.1",
+        "7536.2.6",
+        "5311.1.4",
+        "3324.4.27",
+        "7214.3.1",
+        "7312.6",
+        "8159.8",
+        "2519.6",
+        "7221.3",
+        "8143.7",
+        "2250.4.2",
+        "7232.2",
+        "3422.4.1",
+        "5164.1",
+        "5223.6",
+        "0110.9",
+        "2250.4",
+        "3258.2",
+        "7115.2",
+        "7233.4",
+        "2424.2",
+        "2144.1.21",
+        "2310.1.25",
+        "4223.1",
+        "3256.1",
+        "7413.1.1",
+        "3423.3",
+        "8322.2",
+        "2529.2",
+        "2152.1.5",
+        "1420.4.40",
+        "1324.3.2.1",
+        "2149.14",
+        "4323.19",
+        "2633.1",
+        "2529.7",
+        "1321.2.1.1",
+        "2635.3.2",
+        "1324.2",
+        "2330.1.9",
+        "8131.10",
+        "6221.11",
+        "3111.8",
+        "2113.1",
+        "5223.7.1",
+        "3521.1.10",
+        "8157.1",
+        "3141.1",
+        "8131.9",
+        "2656.1",
+        "3123.1",
+        "1221.3",
+        "3341.6",
+        "7223.1",
+        "2652.3.1",
+        "3122.4.7",
+        "2149.9.7",
+        "3114.1.6",
+        "8343.5",
+        "7231.4",
+        "2412.6.3",
+        "5244.1",
+        "6129.1",
+        "1111.6",
+        "3435.15.1",
+        "2636.3",
+        "3115.1.18",
+        "3334.5",
+        "3112.1",
+        "3411.5",
+        "2163.1.8",
+        "2262.1.1",
+        "7126.13",
+        "7223.2",
+        "8141.1.6",
+        "8160.11",
+        "3434.1",
+        "2131.7",
+        "2519.4",
+        "7313.1.1",
+        "2352.2",
+        "2511.5",
+        "2519.7",
+        "8151.2.2",
+        "1322.1",
+        "3254.1.1",
+        "2310.1.42",
+        "1219.7",
+        "5223.7.33",
+        "2352.1.3",
+        "2433.3",
+        "3422.4",
+        "2310.1.38",
+        "2166.8",
+        "3115.1.16",
+        "5113.1.1",
+        "2269.2",
+        "2113.1.4",
+        "2133.7",
+        "2632.6",
+        "5120.1.4",
+        "7311.1",
+        "3119.6",
+        "1324.3.2.20",
+        "8160.6",
+        "8141.1.8",
+        "7211.1.1",
+        "3512.2",
+        "5223.7.6",
+        "3131.3.5",
+        "5419.4",
+        "7222.2",
+        "8312.2",
+        "2631.2.1",
+        "1219.2",
+        "3112.1.13",
+        "2432.6.1",
+        "2432.5",
+        "5322.1",
+        "3122.5",
+        "1324.3.1.6.27",
+        "4225.1",
+        "2652.2",
+        "5223.7.8",
+        "1345.1.9",
+        "3322.1",
+        "8212.3.6",
+        "4321.1.1",
+        "1431.2.3",
+        "1223.2.1",
+        "7314.1",
+        "3252.1",
+        "6121.3",
+        "7536.2.7",
+        "8159.1",
+        "7131.1",
+        "2521.5",
+        "7231.5",
+        "7421.7",
+        "9121.1",
+        "3240.2.1",
+        "7311.2",
+        "5164.1.2",
+        "3314.1",
+        "2619.4",
+        "8131.2.4",
+        "2434.3",
+        "1221.3.2.1.3",
+        "7223.16",
+        "8156.2.1",
+        "3131.3.3",
+        "3119.16.5",
+        "3122.4.14",
+        "2144.1.23",
+        "8156.2.4",
+        "3259.1",
+        "8160.49",
+        "2131.4.4",
+        "3324.4.18",
+        "1324.3.2.16",
+        "8341.3",
+        "2114.1.6",
+        "8183.2",
+        "7212.2",
+        "8212.1",
+        "2320.1.15",
+        "5153.1",
+        "7532.7",
+        "8219.1",
+        "7223.4.1",
+        "3111.12",
+        "2120.3",
+        "2635.3.7",
+        "4322.1",
+        "2653.1",
+        "7223.20",
+        "8152.1.2",
+        "3123.1.25",
+        "2413.1.3",
+        "8350.4",
+        "2221.3",
+        "7119.1",
+        "3123.1.15",
+        "1112.3.1",
+        "7532.4",
+        "5142.7",
+        "8131.6",
+        "1420.4.17",
+        "7312.3.1",
+        "7215.2.3",
+        "2632.1.2",
+        "2635.3.10",
+        "2643.6",
+        "3119.11",
+        "7213.2",
+        "2422.16",
+        "8211.3",
+        "2654.1.8",
+        "3312.2",
+        "9112.5",
+        "7311.6",
+        "9214.2",
+        "3435.22",
+        "7512.1",
+        "3132.7",
+        "2330.1.18",
+        "2411.1.7",
+        "4229.2",
+        "2113.1.2",
+        "3332.2",
+        "1420.4.30",
+        "3257.6",
+        "3132.2",
+        "8156.2",
+        "6114.1",
+        "8154.1",
+        "8341.2",
+        "2166.10",
+        "8332.5",
+        "3435.23",
+        "2310.1.28",
+        "8342.9",
+        "2142.1.4",
+        "6130.2",
+        "7543.7.3",
+        "2144.1.6",
+        "2511.2",
+        "2529.3",
+        "8122.12",
+        "1213.6",
+        "2112.1",
+        "1431.2.6",
+        "3118.3.1",
+        "5411.1.1",
+        "7535.2",
+        "7536.1.2",
+        "7421.4",
+        "2659.2.2",
+        "3343.1.3",
+        "7319.2",
+        "2263.3.1",
+        "7223.4.2",
+        "2163.1.1",
+        "3339.5",
+        "1221.3.2.1.4",
+        "0210.3",
+        "8343.4",
+        "3118.3.7",
+        "2413.1.1",
+        "7223.4.8",
+        "8160.7",
+        "3123.1.18",
+        "8332.1",
+        "2355.3",
+        "5164.2",
+        "1324.3.2.13",
+        "5312.4",
+        "3412.6",
+        "9629.6",
+        "8343.3",
+        "3311.3.1",
+        "9129.2",
+        "3412.4.6",
+        "4312.1",
+        "3142.1",
+        "1321.2.2.2",
+        "2149.2.2",
+        "2144.1.8",
+        "1112.3",
+        "6112.5",
+        "3152.3",
+        "2149.9.2",
+        "2151.1.2",
+        "3122.3.7",
+        "2632.2",
+        "3339.6",
+        "7541.2",
+        "2359.4",
+        "9216.3",
+        "2421.3",
+        "8156.1",
+        "2423.4",
+        "3123.1.4",
+        "1349.22",
+        "6112.2.1",
+        "7125.2",
+        "3114.1.7",
+        "5152.1",
+        "3134.3",
+        "8172.5.4",
+        "2421.1.1",
+        "8312.5",
+        "8155.1.1",
+        "8131.8",
+        "3339.4",
+        "2431.16",
+        "7544.1",
+        "2412.4",
+        "2359.13",
+        "9312.1.6",
+        "8154.2",
+        "8219.7",
+        "3435.13",
+        "2659.2.1",
+        "7543.7.4",
+        "2511.7",
+        "4131.1",
+        "7223.13",
+        "3315.1",
+        "3423.1",
+        "3133.1.1",
+        "8131.2.2",
+        "3521.1.9",
+        "3121.1.1",
+        "3112.6",
+        "1324.3.1.6.13",
+        "9112.3",
+        "7321.1.1",
+        "2643.2",
+        "7233.6",
+        "7233.14",
+        "2359.8",
+        "2512.4.1",
+        "2152.1.14",
+        "8141.1.7",
+        "1324.3.1.6.8",
+        "6223.1",
+        "2412.6.1",
+        "9329.1",
+        "2144.1.20",
+        "2619.5",
+        "7115.5",
+        "8332.8",
+        "8219.6",
+        "1324.3.1.6.25",
+        "7231.3",
+        "1349.16",
+        "7536.1",
+        "3240.2.4",
+        "3119.12",
+        "3118.3.6",
+        "8121.1",
+        "7543.6",
+        "2165.1",
+        "2131.4.11",
+        "2511.4",
+        "5165.1.3",
+        "8142.4",
+        "9629.4",
+        "4323.16",
+        "5113.1.2",
+        "2655.1",
+        "1321.2.1.6.2",
+        "0110.11",
+        "7231.9",
+        "4212.2",
+        "5164.2.1.1",
+        "7512.4",
+        "5223.7.11",
+        "7233.7",
+        "7215.2.1",
+        "2642.1.10",
+        "2642.1.13",
+        "3114.1.8",
+        "6222.1",
+        "2413.2",
+        "2529.1",
+        "3114.1",
+        "4323.12",
+        "3153.4",
+        "3359.5.1",
+        "2330.1.8",
+        "2146.5.1",
+        "8143.6",
+        "2659.2.3",
+        "2422.12.14",
+        "2133.13",
+        "3240.1",
+        "7533.4",
+        "8160.14",
+        "8159.2",
+        "4221.8",
+        "7543.2",
+        "2112.1.1",
+        "7532.5",
+        "8131.19.1",
+        "1324.3.1.6.19",
+        "3422.4.3",
+        "3323.2",
+        "3343.3",
+        "6121.6",
+        "3123.1.19",
+        "7115.1",
+        "8160.15",
+        "3435.7",
+        "8113.4",
+        "7222.1",
+        "2142.1.2",
+        "7233.15",
+        "7542.1",
+        "3118.3.10",
+        "1324.3.1.6.12",
+        "7311.3",
+        "1112.5",
+        "3412.4.3",
+        "3324.1",
+        "1420.4.5",
+        "8152.2",
+        "5164.6",
+        "3123.1.22",
+        "3257.7",
+        "7543.9.1",
+        "2330.1.5",
+        "1345.1.2",
+        "5230.1",
+        "3114.1.4",
+        "9623.1",
+        "8183.5",
+        "5249.2.2",
+        "2511.6",
+        "2141.1",
+        "5165.2",
+        "1345.1.4",
+        "3141.2.4",
+        "3353.1",
+        "1349.8",
+        "9332.1",
+        "8159.4",
+        "2619.1",
+        "8182.1",
+        "3435.3",
+        "1420.4.43",
+        "3122.4.8",
+        "1213.8",
+        "4214.2",
+        "1221.4",
+        "5142.10",
+        "2433.6.1",
+        "7213.3",
+        "5131.2.2.3",
+        "7115.7",
+        "2230.2.1",
+        "3324.4.11",
+        "2359.2",
+        "5419.9",
+        "8350.1",
+        "9216.1",
+        "3123.1.14",
+        "2131.8",
+        "5223.7.4",
+        "3123.1.6",
+        "1420.3",
+        "8181.3.2",
+        "2514.2.2",
+        "9121.2",
+        "3324.4.12",
+        "7422.1",
+        "7323.3",
+        "2141.4.2.2",
+        "2654.1.4",
+        "1324.3.4",
+        "5132.1",
+        "4212.1",
+        "1349.4",
+        "8114.1",
+        "7223.19",
+        "7212.3.3",
+        "4211.1",
+        "2310.1.7",
+        "3222.1",
+        "5419.7",
+        "7543.8.1",
+        "7514.3",
+        "9112.2",
+        "3115.1.15",
+        "3114.1.5",
+        "2310.1.13",
+        "3435.7.1",
+        "4321.1.4",
+        "3118.3.4",
+        "2654.1.1",
+        "2149.2.7",
+        "3341.1",
+        "8131.12",
+        "1211.1",
+        "8131.5",
+        "8212.5",
+        "1321.2.1.6",
+        "5414.1",
+        "2619.7",
+        "3240.2.2",
+        "3141.2.3",
+        "5161.3",
+        "4321.1.2",
+        "3331.2.1.35",
+        "6221.1",
+        "3331.2.1.2",
+        "2143.1.1",
+        "8160.52",
+        "3112.1.4",
+        "3119.19",
+        "3252.3",
+        "3240.2.3",
+        "3312.3",
+        "7322.7",
+        "5413.2",
+        "7234.1",
+        "7411.1.1",
+        "3413.1",
+        "3331.2.1.22",
+        "2269.4",
+        "1431.2.1",
+        "2519.7.1",
+        "3111.3",
+        "3151.1",
+        "5311.1",
+        "8152.3.1",
+        "3118.3.3",
+        "4226.1.1",
+        "1345.1.10",
+        "2512.1",
+        "8160.21",
+        "8131.19.2",
+        "2163.1.5",
+        "3432.4",
+        "7511.6",
+        "2133.10",
+        "8151.2.1",
+        "1324.5",
+        "7115.6",
+        "2612.1.1",
+        "2511.11",
+        "2431.10.4",
+        "7318.4",
+        "7543.8.3",
+        "3116.1",
+        "3332.3",
+        "2149.11.2",
+        "2152.1.11",
+        "3324.4.8",
+        "2330.1.17",
+        "0310.4",
+        "3432.6",
+        "7422.4",
+        "7512.2",
+        "4312.2.1",
+        "3521.1.8",
+        "2221.1",
+        "3118.3.2",
+        "2166.14",
+        "8111.2",
+        "8160.23",
+        "7543.9.2",
+        "8171.6",
+        "9211.1",
+        "5414.1.9",
+        "2651.1",
+        "7313.1.3",
+        "8160.50",
+        "2622.1",
+        "1324.8.2",
+        "3359.6",
+        "4411.1",
+        "2320.1.13",
+        "7511.1",
+        "3122.3.4",
+        "1324.3.1.6.5",
+        "7543.10.2",
+        "3118.3.11",
+        "2422.12.2",
+        "5223.1",
+        "3115.1.9",
+        "3355.2",
+        "3422.5",
+        "3114.1.2",
+        "2412.6",
+        "5153.1.1",
+        "5249.2",
+        "2631.1",
+        "3423.2.4",
+        "3331.2",
+        "5223.7.28",
+        "9629.3",
+        "3331.2.1.14",
+        "3354.2",
+        "2320.1.19",
+        "8131.19",
+        "2422.2",
+        "8331.1.1",
+        "5223.7.3",
+        "8350.6",
+        "1420.6",
+        "7316.2",
+        "2310.2",
+        "8131.18",
+        "7543.1",
+        "7223.4.5",
+        "1420.4.9",
+        "9331.1",
+        "3324.4",
+        "3339.8",
+        "3331.2.1.16",
+        "2632.6.1",
+        "1321.2.1.2",
+        "2132.4",
+        "2164.2",
+        "2519.3",
+        "2635.3.14",
+        "3422.3.1",
+        "8160.40",
+        "7231.8",
+        "2654.3.2",
+        "3311.3.5",
+        "2341.1.1",
+        "7523.5",
+        "8122.1",
+        "3119.17",
+        "1420.4.20",
+        "1219.1",
+        "7312.5",
+        "3154.1",
+        "2310.1.43",
+        "8160.13",
+        "2163.1.6",
+        "9621.2",
+        "5249.3",
+        "1330.9",
+        "3115.1.5",
+        "3355.1",
+        "2359.11",
+        "2521.4",
+        "3331.2.1.3",
+        "2269.9.4",
+        "2310.1.12",
+        "7515.1",
+        "8157.1.1",
+        "9333.1",
+        "1212.3",
+        "8155.1",
+        "2149.2.8",
+        "2320.1.6",
+        "2112.1.2",
+        "7126.1",
+        "8156.3",
+        "1211.1.4",
+        "2432.6",
+        "8212.2",
+        "3132.1",
+        "3423.2.3",
+        "3512.4",
+        "3422.3",
+        "8112.4",
+        "3324.4.17",
+        "3311.2.2",
+        "3331.2.1.13",
+        "5230.2",
+        "2142.1.8",
+        "3112.3",
+        "1349.10",
+        "3118.3.13",
+        "5311.1.3",
+        "2131.4.13",
+        "2146.2",
+        "2422.7",
+        "7536.2.3",
+        "5223.7.10",
+        "3112.1.12",
+        "2619.9",
+        "1111.2",
+        "3122.4",
+        "2146.3",
+        "7536.2.2",
+        "3435.5",
+        "8171.1",
+        "2431.13",
+        "3119.10",
+        "7316.1",
+        "7123.1",
+        "5245.1",
+        "8113.1",
+        "3112.4",
+        "3119.15",
+        "7534.3.2",
+        "1221.3.1",
+        "8111.4",
+        "8342.4",
+        "3333.1",
+        "1324.3.2.27",
+        "3343.5",
+        "2149.9.8",
+        "3115.1.21",
+        "2651.6",
+        "7133.4",
+        "1324.3.2.7",
+        "8172.5.2",
+        "3122.4.11",
+        "8342.7",
+        "7513.1",
+        "2165.4.1",
+        "8181.1",
+        "3257.5.1",
+        "7543.3",
+        "9621.1",
+        "2632.3",
+        "3115.1.4",
+        "2164.1",
+        "8181.9",
+        "1324.3.1.6.2",
+        "7521.1",
+        "1439.5",
+        "1211.1.3",
+        "1349.1",
+        "8332.2",
+        "2652.1.1",
+        "8111.1",
+        "2523.1",
+        "1321.2.1.7",
+        "6130.1",
+        "2320.1.2",
+        "3122.4.13",
+        "2514.1",
+        "2356.1.1",
+        "1346.3",
+        "3119.16.3",
+        "7126.2",
+        "2320.1.10",
+        "3230.1",
+        "1420.4.3",
+        "5165.1.1",
+        "8113.9",
+        "4229.1",
+        "2355.5",
+        "2320.1.16",
+        "9312.1",
+        "3153.2.4",
+        "9129.3",
+        "2431.10",
+        "2431.2",
+        "2310.1.21",
+        "3134.1",
+        "3131.1",
+        "1420.4.27",
+        "8342.2",
+        "2146.4",
+        "3521.1.3",
+        "2431.10.3",
+        "3431.2",
+        "8189.1",
+        "3324.4.28",
+        "2152.1.4",
+        "1411.2",
+        "5142.8",
+        "7511.1.1",
+        "2166.3",
+        "8151.2.3",
+        "2310.1.10",
+        "7421.1",
+        "7411.1",
+        "2120.4",
+        "1324.3.1.6.32",
+        "5142.5",
+        "3321.3.1",
+        "2145.1.7",
+        "5131.2.2",
+        "7323.1",
+        "2643.3",
+        "1431.2.4",
+        "4323.6",
+        "2269.1",
+        "8181.4",
+        "5246.2",
+        "2433.6.3",
+        "8122.11",
+        "8111.3",
+        "8156.2.6",
+        "1342.2",
+        "8142.8",
+        "2149.11",
+        "3352.1",
+        "0210.1",
+        "2131.8.1",
+        "8142.10",
+        "5164.2.1.2",
+        "7231.10",
+        "5223.7.30",
+        "2431.12",
+        "2635.3",
+        "5223.7.20",
+        "1349.13",
+        "2511.8",
+        "3122.4.15",
+        "8171.5",
+        "8122.4",
+        "2145.1.4",
+        "3324.3",
+        "2114.1.8",
+        "3111.6",
+        "3311.3.4",
+        "2635.3.26",
+        "3154.1.1",
+        "2149.10.1",
+        "1120.3.1",
+        "2641.1",
+        "1324.3.2.25",
+        "2635.3.1",
+        "3322.1.1",
+        "2412.6.4",
+        "8151.4",
+        "3412.4.5",
+        "3112.1.7",
+        "2422.8",
+        "5419.8",
+        "2642.1.11",
+        "8111.5",
+        "2250.7",
+        "3118.1",
+        "3521.1.1",
+        "5312.1",
+        "2152.1",
+        "2654.1.5",
+        "2144.1.2",
+        "2320.1.5",
+        "3353.2",
+        "3412.4.10",
+        "2149.4",
+        "5223.7.9",
+        "3423.1.2.1",
+        "5141.1.1",
+        "2144.1.16",
+        "3433.2",
+        "2411.1.4",
+        "5249.2.1.7",
+        "2359.5",
+        "2310.1.3",
+        "1324.3.1.4",
+        "2320.1.24",
+        "1222.1.1",
+        "2412.10",
+        "3432.4.1",
+        "9612.1",
+        "3412.4.7",
+        "2659.1",
+        "2146.5.2",
+        "2269.7",
+        "7122.2",
+        "2654.1.2",
+        "1213.2.2",
+        "2152.1.15",
+        "2634.2.2",
+        "8122.9",
+        "7322.6",
+        "2633.3",
+        "3412.5",
+        "1312.1",
+        "3141.2",
+        "3139.2",
+        "3214.3.1",
+        "7522.3",
+        "8142.7",
+        "9613.1",
+        "3359.5",
+        "3412.4.12",
+        "2412.1",
+        "7544.1.1",
+        "4214.1",
+        "2519.7.2",
+        "3435.25.4",
+        "2422.12.6",
+        "3112.9",
+        "4412.1",
+        "7532.6",
+        "7533.5",
+        "1321.3",
+        "3113.1.2",
+        "5223.7.19",
+        "2421.5",
+        "2642.1.17",
+        "3214.1",
+        "2162.1",
+        "3153.2.2.1",
+        "3153.2.2",
+        "1341.1",
+        "3135.1",
+        "5223.7.35",
+        "3423.1.2.2.1",
+        "2654.3",
+        "8212.4",
+        "1324.3.1.6.22",
+        "2519.7.4",
+        "2634.2",
+        "2166.3.1",
+        "2433.6.5",
+        "7211.1.3",
+        "8159.3",
+        "7126.6",
+        "3119.14",
+        "8156.4",
+        "7233.13",
+        "2262.1.2.2",
+        "1411.1",
+        "2141.4",
+        "8153.1.4",
+        "1345.1.8",
+        "1324.3.1.6.28",
+        "5131.2.1",
+        "2310.1.17",
+        "1213.5",
+        "1219.5.4",
+        "5223.7",
+        "4419.1",
+        "7321.1",
+        "2113.1.6",
+        "2114.1.5",
+        "2149.15",
+        "8160.10",
+        "0310.5",
+        "4323.8",
+        "2250.9",
+        "7531.2",
+        "2310.1.31",
+        "3423.1.2.2",
+        "3343.1.2",
+        "2643.4.1",
+        "2342.1",
+        "2131.4.6",
+        "5141.1.2",
+        "5249.2.1.5",
+        "4323.10",
+        "7113.1.1",
+        "8350.7",
+        "5223.7.15",
+        "2631.2.2",
+        "2654.2",
+        "3331.3",
+        "2330.1.16",
+        "2635.1",
+        "2641.2",
+        "7213.4",
+        "6121.2",
+        "2113.1.1",
+        "1420.4.26",
+        "1420.4.29",
+        "3342.1",
+        "3119.2",
+        "2144.1",
+        "5412.1",
+        "8332.3",
+        "2111.1",
+        "3211.1",
+        "2142.1.7",
+        "2514.2.1",
+        "2434.2",
+        "8121.3",
+        "3123.1.9",
+        "1213.7",
+        "3341.2",
+        "2431.10.2",
+        "5153.1.3",
+        "2149.2.5",
+        "3324.4.22",
+        "2151.1.1",
+        "3422.1",
+        "5111.2",
+        "7522.1",
+        "3513.1",
+        "2320.1.11",
+        "8219.3",
+        "1346.4",
+        "1312.3",
+        "2144.1.17",
+        "2133.6",
+        "7233.5",
+        "8219.9",
+        "2310.1.33",
+        "8151.2",
+        "2359.14",
+        "2411.1.12",
+        "2353.2",
+        "7111.1",
+        "3435.20",
+        "3119.7",
+        "8183.3",
+        "3435.25.3",
+        "8312.3",
+        "2351.2",
+        "3324.4.9",
+        "7522.6",
+        "2144.1.14",
+        "7541.1",
+        "3422.2",
+        "3339.3",
+        "2641.4.3",
+        "5164.1.1",
+        "3412.4.8",
+        "7231.2",
+        "4120.1",
+        "2310.1.41",
+        "6112.2",
+        "7233.12",
+        "8131.2",
+        "2330.1.13",
+        "1324.3.2.35",
+        "7322.10",
+        "4221.6",
+        "3122.4.3",
+        "1111.5",
+        "2250.3",
+        "8141.1.4",
+        "7223.4",
+        "3121.1",
+        "4311.2",
+        "8181.10",
+        "1112.7",
+        "1439.4",
+        "1324.3.2.23",
+        "3343.1.6",
+        "1344.1.1",
+        "7412.3",
+        "2423.1",
+        "8152.3.2",
+        "7223.15",
+        "8113.7",
+        "3344.3",
+        "2422.12.11",
+        "2635.1.2",
+        "8160.2",
+        "7411.1.1.1",
+        "5142.4",
+        "7411.1.1.2",
+        "3411.4",
+        "7317.4",
+        "3312.1",
+        "8172.3",
+        "2411.1.8",
+        "7233.9",
+        "7213.1",
+        "5329.2",
+        "2330.1",
+        "2269.8.2",
+        "3351.1",
+        "2633.1.1",
+        "2519.7.5",
+        "7314.3",
+        "8342.6",
+        "1420.4.34",
+        "7516.2",
+        "7125.1",
+        "2262.1.2.1",
+        "1330.4",
+        "2146.6",
+        "2310.1.6",
+        "2422.12.3",
+        "9510.1",
+        "2654.3.1",
+        "2421.1",
+        "5249.2.1.2",
+        "3433.1",
+        "1420.4.2",
+        "2310.1.15",
+        "1431.1",
+        "2152.1.2",
+        "7223.21",
+        "3311.3",
+        "3123.1.26",
+        "2622.2",
+        "2422.6",
+        "8112.3",
+        "5230.3",
+        "2131.4.8",
+        "2141.8",
+        "2230.2.2",
+        "7322.1",
+        "7412.12",
+        "7313.1",
+        "1324.3.1.6.29",
+        "3331.2.1",
+        "7543.10",
+        "2659.2.5",
+        "4323.17",
+        "1223.2.1.3",
+        "3252.1.1",
+        "3331.2.1.25",
+        "5164.10",
+        "8113.2",
+        "2352.1.4",
+        "3122.2",
+        "3112.10",
+        "1324.3.1.6.6",
+        "3112.1.1",
+        "3351.3",
+        "3422.4.6",
+        "3118.3.5",
+        "2146.9",
+        "8160.19",
+        "7223.4.4",
+        "4213.1",
+        "3114.1.10",
+        "1324.3.1",
+        "2114.1.4",
+        "4132.1",
+        "1324.3.2.34",
+        "5223.7.5",
+        "1321.2",
+        "2422.5",
+        "3331.2.1.18",
+        "3152.2",
+        "1321.2.1.4",
+        "7315.1",
+        "1349.20",
+        "8160.5",
+        "3513.2",
+        "1213.2",
+        "3258.1",
+        "3324.4.20",
+        "1321.2.2.3",
+        "2359.12",
+        "2145.3",
+        "8212.3",
+        "4323.4",
+        "3116.1.3",
+        "2652.3.2",
+        "2412.11",
+        "5164.2.1.1.1",
+        "8143.3",
+        "9212.4",
+        "1324.3.2.9",
+        "2422.3",
+        "9212.2",
+        "3324.4.15",
+        "1420.4.21",
+        "3413.2",
+        "2310.1.4",
+        "3431.1",
+        "7412.2",
+        "3332.2.2",
+        "3412.4.13",
+        "2619.11",
+        "3111.5",
+        "7223.11",
+        "3259.3",
+        "8112.2",
+        "3123.1.21",
+        "2431.11",
+        "3353.2.1",
+        "8160.9",
+        "7313.1.7",
+        "3257.5",
+        "1324.3.1.6.31",
+        "8219.5",
+        "3423.1.2",
+        "8160.38",
+        "1219.5",
+        "2141.4.1",
+        "2163.4",
+        "8181.3",
+        "4223.1.1",
+        "2310.1",
+        "7543.7.2",
+        "3259.5",
+        "2131.3",
+        "2320.1.20",
+        "2131.4.1",
+        "2131.5",
+        "1420.4.12",
+        "2621.6",
+        "7214.3",
+        "8341.1",
+        "2166.9",
+        "7534.3.4",
+        "9112.1",
+        "2133.1",
+        "7514.2",
+        "5223.7.25",
+        "2635.3.3",
+        "5111.2.2",
+        "2421.2",
+        "2133.11",
+        "3123.1.5",
+        "2635.3.15",
+        "4211.2",
+        "2635.3.21",
+        "3341.3",
+        "1439.2",
+        "2359.9",
+        "5161.1",
+        "2320.1.22",
+        "7233.3",
+        "2422.12.9",
+        "2654.1.3",
+        "3324.4.29",
+        "7511.3",
+        "1120.3",
+        "3359.4",
+        "4110.1",
+        "1222.1.2",
+        "8141.1.9.2",
+        "2632.1.1",
+        "1221.6",
+        "3151.4",
+        "1111.4",
+        "7215.1",
+        "2423.5",
+        "7316.1.2",
+        "3112.2",
+        "2636.4",
+        "5152.2",
+        "7212.1",
+        "2163.3",
+        "3131.3.8",
+        "8152.1",
+        "1349.9",
+        "8121.5",
+        "2131.4.2",
+        "3254.1",
+        "8156.2.3",
+        "8160.12",
+        "8142.14",
+        "2359.3",
+        "3423.1.1",
+        "5413.1",
+        "2434.4",
+        "2514.4",
+        "3341.7",
+        "3324.4.30",
+        "4224.2",
+        "4323.2",
+        "1324.3.2.31",
+        "1420.4.35",
+        "2511.12",
+        "9312.1.5",
+        "3133.1.2",
+        "3122.4.12",
+        "7126.10",
+        "8322.7",
+        "7522.7",
+        "8159.6",
+        "3324.4.7",
+        "2149.2.4",
+        "1221.3.2",
+        "7514.1",
+        "3521.1.2",
+        "4212.7",
+        "5329.3",
+        "2149.17",
+        "5164.5",
+        "7413.1.2",
+        "8160.4",
+        "2519.1",
+        "8160.31",
+        "2642.1.16",
+        "8172.6",
+        "4221.1",
+        "3359.1",
+        "2151.2",
+        "8132.2",
+        "3435.2",
+        "8212.3.1",
+        "8143.8",
+        "5223.7.7",
+        "3411.8.1",
+        "3123.1.10",
+        "2211.1",
+        "5223.7.31",
+        "1111.1",
+        "8160.35",
+        "3131.3",
+        "5142.3",
+        "2431.6",
+        "7126.4",
+        "2120.5",
+        "2412.8",
+        "8171.3",
+        "2263.1",
+        "2642.1.14",
+        "2355.6",
+        "7318.5",
+        "1324.3.1.6",
+        "3331.2.1.29",
+        "7312.2",
+        "8160.43",
+        "9112.4",
+        "2519.7.3",
+        "7533.2",
+        "8143.4",
+        "5223.5",
+        "7223.10",
+        "2320.1.18",
+        "8182.2",
+        "2635.3.16",
+        "1223.1.1",
+        "1120.6",
+        "7313.2",
+        "1324.3.1.6.14",
+        "1111.7",
+        "1223.2",
+        "8219.10",
+        "1324.3.1.1",
+        "7126.11",
+        "3432.1",
+        "3131.3.1",
+        "7132.1",
+        "3119.18",
+        "5152.2.1",
+        "4323.5",
+        "7543.7",
+        "2230.1",
+        "1346.1",
+        "2621.3",
+        "3112.1.10",
+        "2146.10",
+        "2643.1",
+        "2635.3.9",
+        "7411.1.4",
+        "7421.6",
+        "7126.7",
+        "1420.4.25",
+        "7532.1",
+        "2269.8",
+        "5142.12",
+        "3521.1",
+        "8121.7",
+        "2619.3",
+        "8211.4",
+        "0110.6",
+        "2519.2",
+        "2342.3",
+        "2149.6",
+        "3214.2",
+        "2659.2.6",
+        "2529.4",
+        "7313.1.4",
+        "2267.2",
+        "1431.2",
+        "3411.8",
+        "5112.3.1",
+        "8142.5",
+        "5223.7.12",
+        "9215.1",
+        "3432.1.1",
+        "3111.10",
+        "2529.8",
+        "3422.4.5",
+        "2149.12.1",
+        "2619.12",
+        "7523.3",
+        "7223.24",
+        "2151.1.3",
+        "2163.1.3",
+        "7322.8",
+        "2422.9",
+        "2166.4",
+        "8131.1",
+        "3119.2.1",
+        "4227.1",
+        "1324.3.4.1",
+        "8211.5.3",
+        "1324.6",
+        "2263.3",
+        "3324.4.33",
+        "2269.9.3",
+        "2411.1.11",
+        "8160.29",
+        "5311.2",
+        "2310.1.29",
+        "3412.4.11",
+        "2511.14.1",
+        "9312.1.4",
+        "3521.1.7",
+        "1420.4.23",
+        "5312.3",
+        "7127.1",
+        "4221.7",
+        "2144.1.22",
+        "1221.3.2.1.2",
+        "8113.8",
+        "3435.17",
+        "1213.1",
+        "2143.1.3",
+        "2412.5",
+        "7212.3",
+        "2133.15.1",
+        "3134.5",
+        "1330.3",
+        "2152.1.6",
+        "2422.17",
+        "3213.2",
+        "2619.8",
+        "3259.7",
+        "2146.8",
+        "2145.1.5",
+        "3321.2",
+        "2651.11",
+        "3119.16.4",
+        "2262.1",
+        "3123.1.20",
+        "2144.1.19",
+        "5411.1.4",
+        "5113.1.3",
+        "8131.11",
+        "7533.3",
+        "9122.1",
+        "8160.26",
+        "3131.3.2",
+        "5164.3",
+        "2269.8.1",
+        "3435.10",
+        "8153.1",
+        "7232.3",
+        "1349.15",
+        "3257.3",
+        "7223.4.4.1",
+        "8155.1.2",
+        "1324.3.2.8",
+        "2634.1",
+        "2131.1",
+        "3122.4.10",
+        "8160.3",
+        "2652.1",
+        "2310.1.35",
+        "1420.1",
+        "7523.2",
+        "5414.1.4",
+        "7511.5",
+        "3334.3.2",
+        "8219.11",
+        "4412.2",
+        "3113.2",
+        "1420.4.32",
+        "3435.6",
+        "2152.1.10",
+        "2111.3",
+        "9629.7",
+        "7323.2",
+        "2152.1.12",
+        "5419.1",
+        "3132.6",
+        "7322.3",
+        "3324.4.26",
+        "1324.3.1.6.17",
+        "2266.2",
+        "3324.4.34",
+        "2651.8",
+        "6221.9",
+        "8160.28",
+        "6122.2",
+        "3153.2.1",
+        "2146.1",
+        "9333.3",
+        "3331.2.1.19",
+        "2230.2.3",
+        "3115.1.20",
+        "2330.1.3",
+        "2133.9",
+        "1324.8.2.1",
+        "2330.1.1",
+        "5223.7.22",
+        "1330.1.1",
+        "2144.1.7",
+        "3422.4.4",
+        "2529.9",
+        "3412.4.9",
+        "1420.4.28",
+        "2522.1.1",
+        "7513.2",
+        "3153.1",
+        "1219.5.1",
+        "8311.1",
+        "2320.1",
+        "8131.2.1",
+        "4224.1",
+        "2422.10",
+        "3119.1",
+        "3115.1.17",
+        "1324.3",
+        "3123.1.24",
+        "1431.3",
+        "2152.1.9",
+        "5223.7.37",
+        "2320.1.4",
+        "2269.5",
+        "7543.5",
+        "5141.1.3",
+        "2114.1.9",
+        "7312.6.1",
+        "1330.2",
+        "2432.2",
+        "3122.4.5",
+        "5165.1.2",
+        "1349.23",
+        "7224.2",
+        "2149.2.3",
+        "8350.3",
+        "8211.6",
+        "3331.2.1.8",
+        "2635.1.3",
+        "8160.32",
+        "2656.2",
+        "3115.1.19",
+        "5414.1.5",
+        "2250.5",
+        "2411.1.5",
+        "3332.1",
+        "3118.2",
+        "3111.14",
+        "5164.9",
+        "8142.9",
+        "8160.47",
+        "1324.3.2.24",
+        "3435.24",
+        "4312.7",
+        "2433.4",
+        "2320.1.3",
+        "2635.3.4",
+        "5163.4",
+        "2141.11",
+        "7543.10.4",
+        "2113.2",
+        "8122.5",
+        "8172.5",
+        "2512.5",
+        "3139.1",
+        "2114.3",
+        "8113.6",
+        "0210.4",
+        "2151.1",
+        "8114.3",
+        "3423.4",
+        "5223.7.14",
+        "1324.3.1.6.4",
+        "3432.5",
+        "3123.1.3",
+        "3111.1",
+        "9321.1",
+        "8160.25",
+        "5321.1.1",
+        "1431.2.2",
+        "3435.25.2",
+        "1420.4.1",
+        "2619.6",
+        "8322.4",
+        "8154.3",
+        "7233.10",
+        "3123.1.11",
+        "8171.9",
+        "5411.1",
+        "3432.3",
+        "2310.1.27",
+        "8211.7",
+        "8142.6",
+        "3423.2.1",
+        "8181.3.1",
+        "4323.20",
+        "1324.3.2.11",
+        "7533.1",
+        "3331.2.1.34",
+        "2411.1.10",
+        "2145.1.6",
+        "7223.7",
+        "3435.11",
+        "2330.1.7",
+        "7126.9",
+        "2434.1",
+        "2133.5",
+        "7313.1.2",
+        "3119.16.2",
+        "3311.2.4.1",
+        "3153.2.5",
+        "2654.1.6",
+        "2265.1",
+        "3111.1.1",
+        "2141.2",
+        "3112.1.9",
+        "7214.2",
+        "2310.1.39",
+        "1219.3",
+        "8131.2.3",
+        "7316.3",
+        "6112.6",
+        "3115.1.12",
+        "1330.7",
+        "3119.13",
+        "7412.10",
+        "7318.1",
+        "8142.1",
+        "8142.11",
+        "1420.4.33",
+        "2144.1.9",
+        "3331.2.2",
+        "2642.1.5",
+        "2342.2",
+        "2422.13",
+        "3324.4.2",
+        "1324.3.2.26",
+        "2152.1.7",
+        "2161.1",
+        "2521.1",
+        "7215.4",
+        "3344.2",
+        "1349.5",
+        "2641.4.4",
+        "2659.4",
+        "3343.4",
+        "7412.5",
+        "8141.1.1",
+        "2330.1.2",
+        "7223.25",
+        "2221.2",
+        "8114.5",
+        "2144.1.3",
+        "8322.1",
+        "2413.1",
+        "3412.4",
+        "8113.5",
+        "2521.2",
+        "2262.1.2",
+        "5249.2.1.4",
+        "2141.9",
+        "3312.5",
+        "6113.3",
+        "3311.2.5",
+        "3334.3",
+        "8141.1.9",
+        "2152.1.13",
+        "3434.1.2",
+        "2621.7",
+        "7536.1.1",
+        "8171.4",
+        "8131.3",
+        "5223.7.27",
+        "1324.4",
+        "8343.1",
+        "5419.5",
+        "8114.4",
+        "2432.4",
+        "2635.3.25",
+        "2320.1.23",
+        "5120.1",
+        "7232.5",
+        "8160.51",
+        "3331.2.1.1",
+        "2320.1.1",
+        "2141.5",
+        "3118.4",
+        "1213.3",
+        "2310.1.37",
+        "9333.5",
+        "7532.2",
+        "3214.3",
+        "3411.7",
+        "4224.1.1",
+        "7412.4",
+        "2152.1.1",
+        "3252.4",
+        "9123.1",
+        "7534.2",
+        "3412.1",
+        "2114.1.1",
+        "3324.4.5",
+        "3351.2",
+        "2412.6.2",
+        "1439.8",
+        "8183.1",
+        "8152.3",
+        "7221.2",
+        "7536.2.5",
+        "2144.1.4",
+        "1120.1",
+        "2164.3",
+        "2320.1.14",
+        "1346.5",
+        "7412.8",
+        "3255.1",
+        "1212.2.1",
+        "7317.5",
+        "2149.11.1",
+        "3435.16",
+        "3324.1.1",
+        "2651.9",
+        "1219.4",
+        "2166.2",
+        "8332.6",
+        "3122.1",
+        "3141.2.2",
+        "7233.11",
+        "3112.8",
+        "8189.2",
+        "7534.3",
+        "2145.1.2",
+        "2222.1",
+        "2635.3.13",
+        "3122.3.3",
+        "1324.3.2.5",
+        "7119.3",
+        "5111.1",
+        "7316.1.4",
+        "4212.3",
+        "5153.1.2",
+        "8142.2",
+        "5112.2",
+        "2651.5",
+        "9411.2",
+        "2621.2",
+        "1324.3.1.6.20",
+        "3122.3.1",
+        "2513.3",
+        "1212.1",
+        "1420.4.39",
+        "2353.1",
+        "3511.1",
+        "1324.3.2.30",
+        "2143.3",
+        "5223.7.23",
+        "1420.4.8",
+        "2611.1",
+        "8160.27",
+        "2310.1.1",
+        "8172.1",
+        "2634.2.3",
+        "2352.1",
+        "8322.5",
+        "7314.2",
+        "7531.5",
+        "7126.3",
+        "2141.6",
+        "7212.3.4",
+        "7312.3.3",
+        "1420.4.10",
+        "7223.17",
+        "2432.1",
+        "3252.2",
+        "2632.7",
+        "5131.2.2.1",
+        "3331.2.1.28",
+        "1324.3.1.3",
+        "6113.4",
+        "2635.3.19",
+        "2522.1.2",
+        "7231.7",
+        "2433.1",
+        "2422.12.1",
+        "1420.4.36",
+        "3324.4.21",
+        "2310.1.18",
+        "8114.2",
+        "7133.1",
+        "2631.2",
+        "2144.1.18",
+        "3154.1.3",
+        "8181.7",
+        "3119.16",
+        "3435.21",
+        "3331.2.1.15",
+        "3240.2",
+        "1321.2.5",
+        "2643.5",
+        "2351.4",
+        "4312.4",
+        "3153.2",
+        "2320.1.7",
+        "2310.1.40",
+        "7543.7.5",
+        "4221.3.1",
+        "2635.3.8",
+        "3113.1",
+        "9623.2",
+        "4415.1",
+        "5120.1.1",
+        "3435.15",
+        "8160.30",
+        "8160.24",
+        "5241.2",
+        "2165.3",
+        "4221.4",
+        "3323.3",
+        "2351.3",
+        "2212.1",
+        "5223.4",
+        "1420.4.41",
+        "0110.3",
+        "5411.1.2",
+        "3412.4.4",
+        "7317.3",
+        "5414.1.7",
+        "2431.8",
+        "2635.1.4",
+        "3117.5",
+        "5112.1",
+        "3341.4",
+        "1223.2.2.1",
+        "3151.3",
+        "1321.2.4",
+        "3123.1.8",
+        "2320.1.9",
+        "2631.2.3",
+        "2432.8",
+        "2522.1",
+        "1112.1",
+        "2144.1.1.1",
+        "2356.1",
+        "1420.4",
+        "2513.1",
+        "7317.1",
+        "1324.8.3",
+        "1223.1",
+        "7516.3",
+        "1324.3.2.3",
+        "1324.3.1.6.30",
+        "8114.8",
+        "1349.12",
+        "9411.1",
+        "2411.1.9",
+        "1349.7",
+        "3324.4.10",
+        "3257.1",
+        "3435.19",
+        "8121.2",
+        "5223.7.2",
+        "2330.1.15",
+        "9214.1",
+        "2149.10",
+        "2163.1.3.3",
+        "2424.3",
+        "3321.1",
+        "9212.1",
+        "3423.1.2.3",
+        "7316.4",
+        "5131.1",
+        "2422.12.10",
+        "7223.4.6",
+        "3324.4.31",
+        "4227.2",
+        "5161.2",
+        "5249.2.1.6",
+        "5142.1",
+        "5131.2.2.2",
+        "3133.1",
+        "1112.3.2",
+        "3434.1.3",
+        "8152.3.3",
+        "2519.5",
+        "7515.5",
+        "7131.3",
+        "3315.4",
+        "1321.2.1.5",
+        "7133.3",
+        "8312.4",
+        "1324.3.3",
+        "5329.1",
+        "2264.1",
+        "3131.2",
+        "2132.3",
+        "2310.1.20",
+        "2142.1.3",
+        "3331.1",
+        "3257.4",
+        "2162.1.1",
+        "7232.1",
+        "3512.3",
+        "7543.7.7",
+        "2642.1",
+        "3118.3",
+        "3324.4.25",
+        "6113.1",
+        "5419.10",
+        "1324.3.1.6.18",
+        "8142.7.1",
+        "7215.3",
+        "2636.1",
+        "9329.2",
+        "8332.7",
+        "7114.2",
+        "7223.9",
+        "7223.12",
+        "5249.2.2.1",
+        "2261.2",
+        "1312.2",
+        "3521.1.11",
+        "3324.4.16",
+        "2144.1.2.1",
+        "4221.2",
+        "3123.1.23",
+        "7133.2",
+        "2621.8",
+        "3119.9",
+        "2359.6",
+        "2659.2",
+        "3122.4.6",
+        "7223.22",
+        "2511.13",
+        "6112.3",
+        "1324.3.2.15",
+        "2269.11",
+        "2143.2",
+        "2513.4",
+        "1221.3.2.1",
+        "2149.9.1",
+        "2635.3.17",
+        "7523.4",
+        "7132.3",
+        "3433.3",
+        "1330.6",
+        "1420.2",
+        "1344.1.3",
+        "2131.4.10",
+        "8212.3.4",
+        "2511.15",
+        "1321.2.1.3",
+        "3411.3",
+        "6221.5",
+        "2113.1.3",
+        "1112.2",
+        "7114.1",
+        "2114.2",
+        "3411.2",
+        "8172.5.1",
+        "2149.2.7.1",
+        "7322.9",
+        "2529.5",
+        "2635.3.18",
+        "3115.1.6",
+        "3111.11",
+        "2359.10",
+        "2643.4",
+        "9216.4",
+        "7223.6",
+        "3521.1.6",
+        "3331.2.1.6",
+        "5223.7.24",
+        "7222.3",
+        "1349.19",
+        "5163.1",
+        "3131.3.9",
+        "1324.8",
+        "2142.1.9",
+        "3324.4.24",
+        "3512.1",
+        "3354.3",
+        "8152.1.1",
+        "2144.1.11",
+        "2149.12",
+        "7321.1.2",
+        "2143.1.4",
+        "3312.6",
+        "2433.2",
+        "2163.1",
+        "8160.37",
+        "2359.1",
+        "3259.8",
+        "7515.2",
+        "3142.1.2",
+        "7523.6",
+        "2143.1",
+        "2151.1.5",
+        "8181.6",
+        "3343.1.1",
+        "2654.5",
+        "7119.4",
+        "2642.1.1",
+        "2120.6",
+        "3435.25.5",
+        "2131.4.12",
+        "1420.4.16",
+        "2611.1.2",
+        "2632.1",
+        "2114.1.2",
+        "1324.3.1.6.23",
+        "7322.4",
+        "7543.8.2",
+        "8211.1",
+        "2165.2",
+        "1223.2.1.4",
+        "4313.1",
+        "3112.1.8",
+        "2310.1.32",
+        "8142.13",
+        "2651.10",
+        "5243.1",
+        "2144.1.15",
+        "3122.4.4",
+        "1324.8.1",
+        "3123.1.16",
+        "8219.8",
+        "3341.5",
+        "8322.3",
+        "2634.2.4",
+        "2149.9.9",
+        "3315.7",
+        "1324.3.2.29",
+        "7223.3",
+        "3119.5",
+        "2635.3.12",
+        "5414.1.1",
+        "3255.3",
+        "3154.2",
+        "7233.1",
+        "9520.1",
+        "7215.2",
+        "2149.1",
+        "2641.4",
+        "7317.2",
+        "2412.3",
+        "7321.1.6",
+        "7543.9",
+        "8141.1",
+        "7521.2",
+        "2120.6.1",
+        "8183.7",
+        "7543.7.1",
+        "3434.1.2.1",
+        "2521.3",
+        "3122.3",
+        "1324.3.2.18",
+        "1322.2",
+        "3111.13",
+        "2431.1",
+        "2166.13",
+        "2511.10",
+        "3123.1.7",
+        "3133.1.3",
+        "1420.4.31",
+        "0110.10",
+        "6121.5",
+        "7232.4",
+        "1324.3.2.12",
+        "7543.4",
+        "2149.9",
+        "7124.1",
+        "4312.2",
+        "3131.3.6",
+        "2651.7",
+        "3422.4.7",
+        "3115.1",
+        "8122.10",
+        "3115.1.3",
+        "7422.3",
+        "2144.1.13",
+        "3257.4.1",
+        "1324.7",
+        "3153.2.3",
+        "7531.1",
+        "7318.2",
+        "3312.4",
+        "2631.2.4",
+        "2310.1.19",
+        "1219.1.1",
+        "3334.2.1",
+        "7515.3",
+        "3411.6",
+        "5113.1",
+        "7421.5",
+        "1324.3.2.19",
+        "5246.1",
+        "7121.1",
+        "2145.2",
+        "8132.1",
+        "8342.5",
+        "6121.1",
+        "3115.1.13",
+        "3331.2.1.20",
+        "2431.10.1",
+        "7312.4",
+        "3253.1.1",
+        "9333.6",
+        "8342.10",
+        "2131.6",
+        "2422.12.5",
+        "4221.5",
+        "3114.1.1",
+        "2141.10",
+        "8321.1",
+        "1219.5.5",
+        "2310.1.22",
+        "2642.1.2",
+        "1420.4.15",
+        "5223.7.36",
+        "1211.1.2",
+        "8160.44",
+        "8181.2",
+        "2352.1.2",
+        "2355.2",
+        "2433.6.4",
+        "2131.4.7",
+        "2635.3.23",
+        "1324.3.1.6.24",
+        "2635.3.27",
+        "2431.5",
+        "1420.5",
+        "3331.2.1.12",
+        "2114.1.10",
+        "7422.2",
+        "2131.4.3",
+        "4222.1",
+        "2413.1.2",
+        "4312.3",
+        "2320.1.12",
+        "0110.8",
+        "6112.1",
+        "2642.1.4",
+        "1324.3.2",
+        "2432.9.1",
+        "4212.4.1",
+        "5419.2",
+        "7231.1",
+        "8160.1",
+        "3334.2",
+        "3115.1.10",
+        "3324.4.23",
+        "2412.7",
+        "1323.1.2",
+        "5249.2.1.1",
+        "4323.14",
+        "8160.54",
+        "2621.5",
+        "7543.11",
+        "7317.6",
+        "2635.1.5",
+        "5120.1.2",
+        "3142.1.3",
+        "3331.2.1.24",
+        "1323.1.1",
+        "2149.9.6",
+        "1324.3.1.2",
+        "2166.1",
+        "3411.1",
+        "2632.5",
+        "4311.1",
+        "8171.8",
+        "8122.7",
+        "3313.3",
+        "2141.4.2.1",
+        "2514.3",
+        "3323.2.2",
+        "5120.1.3",
+        "1324.3.2.21",
+        "0110.7",
+        "3315.8",
+        "5164.8",
+        "2142.1.1",
+        "2163.1.4",
+        "7115.4",
+        "7221.4",
+        "2111.2",
+        "7223.4.3",
+        "7311.5",
+        "5165.1",
+        "8112.1",
+        "3343.2",
+        "7541.3",
+        "3119.8",
+        "1349.21",
+        "6223.2",
+        "5142.6",
+        "2146.5",
+        "7221.1.1",
+        "5419.3",
+        "7531.6",
+        "8350.5",
+        "2514.2",
+        "2659.2.4",
+        "8172.2",
+        "7312.6.2",
+        "0310.3",
+        "1324.3.1.6.15",
+        "3435.18",
+        "2511.16",
+        "8153.1.2",
+        "3251.1",
+        "4221.3",
+        "5222.1",
+        "3122.4.16",
+        "8211.2",
+        "2269.10",
+        "2250.1",
+        "5142.11",
+        "2310.1.26",
+        "3332.2.1",
+        "2635.3.20",
+        "2149.9.3",
+        "9333.8",
+        "1219.6",
+        "8160.55",
+        "3114.1.3",
+        "9212.3",
+        "2433.6.2",
+        "8183.6",
+        "5132.1.1",
+        "2263.5",
+        "5221.1",
+        "3435.14",
+        "2633.2",
+        "8131.13",
+        "3313.1",
+        "2133.2",
+        "2310.1.2",
+        "2267.1",
+        "2330.1.10",
+        "3311.2",
+        "1223.2.2",
+        "7511.2",
+        "3311.2.4",
+        "2432.9",
+        "3435.12",
+        "7231.6",
+        "5223.7.18",
+        "7412.9",
+        "6221.7",
+        "7543.9.3",
+        "7422.5",
+        "8172.4",
+        "7133.5",
+        "7323.4",
+        "3331.2.1.26",
+        "1344.1",
+        "3213.1",
+        "1324.3.1.6.9",
+        "8142.12",
+        "3312.7",
+        "2132.1",
+        "2310.1.5",
+        "1341.3",
+        "9629.1",
+        "5165.1.4",
+        "2230.2",
+        "8121.6",
+        "2432.3",
+        "2355.1",
+        "3112.1.6",
+        "8171.2",
+        "3113.1.1",
+        "2144.1.10",
+        "4323.15",
+        "2265.1.1",
+        "3131.3.4",
+        "3313.2",
+        "4323.7",
+        "2310.1.11",
+        "2634.2.1",
+        "8211.5.2",
+        "3323.5",
+        "3359.3",
+        "3122.4.9",
+        "2149.2.6",
+        "2513.5",
+        "2132.2",
+        "2422.18",
+        "1324.3.2.32",
+        "8212.2.1",
+        "2145.1.8",
+        "2149.9.5",
+        "7223.14",
+        "8114.7",
+        "7115.3",
+        "5311.1.2",
+        "2266.1",
+        "3118.3.12",
+        "1221.2",
+        "2131.4.5",
+        "2310.1.23",
+        "6112.4",
+        "3259.4",
+        "7211.1.2",
+        "2310.1.34",
+        "7543.7.6",
+        "4312.6",
+        "2153.1.1",
+        "8332.4",
+        "2635.3.11",
+        "2114.1",
+        "3412.4.1",
+        "7312.3",
+        "1120.4",
+        "5414.1.8",
+        "0110.2",
+        "1321.2.3",
+        "2619.2",
+        "0110.4",
+        "8143.1",
+        "1324.3.2.33",
+        "2653.1.1",
+        "8131.2.6",
+        "3352.2",
+        "5222.1.1",
+        "3423.2",
+        "3253.1",
+        "7312.3.2",
+        "8131.20",
+        "3122.4.1",
+        "3112.1.5",
+        "3324.4.4",
+        "7212.3.2",
+        "5211.1",
+        "9333.4",
+        "4419.2",
+        "3339.7",
+        "3324.4.32",
+        "3257.2",
+        "7413.1",
+        "3343.1.7",
+        "2114.1.3",
+        "6224.1",
+        "3119.3",
+        "2149.16",
+        "2310.1.36",
+        "1330.10",
+        "9213.1",
+        "8312.1",
+        "7534.1",
+        "8131.17",
+        "0310.1",
+        "1213.4",
+        "3116.1.4",
+        "2433.6",
+        "3311.2.3",
+        "2421.4",
+        "7534.3.3",
+        "2166.12",
+        "3112.1.11",
+        "3343.1.5",
+        "1345.1.6",
+        "7315.2",
+        "8160.53",
+        "1321.1",
+        "2411.1.1",
+        "7215.2.2",
+        "8342.1",
+        "2422.12",
+        "7223.18",
+        "0210.2",
+        "8342.8",
+        "1219.5.3",
+        "2422.15",
+        "3359.2",
+        "8212.2.3",
+        "9112.6",
+        "2654.1",
+        "9111.1",
+        "2642.1.8",
+        "3133.1.4",
+        "3112.5",
+        "2355.4",
+        "3323.1",
+        "7543.8",
+        "1349.18",
+        "2131.4.6.1",
+        "1324.3.2.6",
+        "5223.7.29",
+        "3151.2",
+        "7534.3.1",
+        "2411.1.2",
+        "1222.1",
+        "3115.1.8",
+        "9333.8.1",
+        "2511.18",
+        "7212.4",
+        "3355.3",
+        "2635.3.6",
+        "7536.2.4",
+        "8122.6",
+        "1431.1.1",
+        "2654.4",
+        "2652.5",
+        "7321.1.4",
+        "3324.4.6",
+        "7523.1",
+        "3123.1.12",
+        "1346.6",
+        "3255.4",
+        "3334.4",
+        "2523.3",
+        "7321.1.3",
+        "8159.5",
+        "2652.3.1.1",
+        "2269.6",
+        "1349.2",
+        "1213.2.1",
+        "5241.1",
+        "7233.2",
+        "7224.1",
+        "7422.6",
+        "3323.4",
+        "2512.3",
+        "7312.6.3",
+        "3139.3",
+        "1346.2",
+        "2131.8.2",
+        "2320.1.8",
+        "4212.6",
+        "3251.2",
+        "7222.4",
+        "2433.6.7",
+        "2163.1.3.1",
+        "2163.1.2",
+        "3259.2",
+        "5169.1",
+        "7531.3",
+        "6122.1",
+        "2619.10",
+        "1345.1.3",
+        "2652.4",
+        "3334.3.1",
+        "3134.2",
+        "3115.1.14",
+        "2412.2",
+        "2431.7",
+        "2145.1.3",
+        "3314.2",
+        "1349.21.1",
+        "8131.7",
+        "2642.1.9",
+        "9334.1",
+        "6113.2",
+        "2642.1.6",
+        "3324.4.35",
+        "1345.1.7",
+        "5321.1",
+        "3331.2.1.33",
+        "8113.3",
+        "7543.10.1",
+        "2423.3",
+        "2511.3",
+        "5142.2",
+        "8160.16",
+        "3132.4",
+        "8212.3.2",
+        "1324.3.1.6.16",
+        "6221.8",
+        "7511.6.2",
+        "3153.2.6",
+        "7511.1.2",
+        "5411.1.3",
+        "2422.12.12",
+        "1420.4.14",
+        "3153.3",
+        "8181.5",
+        "2163.2",
+        "7215.1.1",
+        "5162.1",
+        "2166.7",
+        "8131.16",
+        "2166.5",
+        "5142.9",
+        "5131.2",
+        "1412.1",
+        "1111.3",
+        "8172.5.5",
+        "2166.6",
+        "3331.2.1.11",
+        "3435.9",
+        "5249.2.2.2",
+        "2635.3.24",
+        "2146.7",
+        "2422.12.15",
+        "3435.25.1",
+        "2141.4.2",
+        "5163.3",
+        "7223.23",
+        "1324.3.2.17",
+        "4321.1",
+        "2142.1",
+        "2144.1.1",
+        "8219.4",
+        "4323.3",
+        "3118.3.8",
+        "3522.1",
+        "6221.2",
+        "1420.4.18",
+        "8151.1",
+        "2351.1",
+        "2165.4",
+        "1420.4.11",
+        "4416.1",
+        "2114.1.7",
+        "2422.11",
+        "3331.2.1.32",
+        "1221.3.3",
+        "2424.1",
+        "1324.3.2.28",
+        "2412.4.1",
+        "2411.1.3",
+        "9312.1.2",
+        "3132.5",
+        "7421.2",
+        "8183.4",
+        "3359.8",
+        "5223.7.17",
+        "8212.3.5",
+        "2643.6.1",
+        "3115.1.22",
+        "8131.21",
+        "1221.3.2.1.1",
+        "2310.1.24",
+        "3116.1.2",
+        "5169.3",
+        "8160.45",
+        "7316.1.3",
+        "2642.1.3",
+        "1349.14",
+        "1349.3",
+        "8153.1.1",
+        "2144.1.5",
+        "3323.2.3",
+        "7211.1",
+        "1324.3.2.14",
+        "1324.3.2.2",
+        "5163.2",
+        "7515.4",
+        "7313.1.6",
+        "3122.3.6",
+        "2635.3.22",
+        "3331.2.1.5",
+        "3514.1",
+        "8343.2",
+        "1221.5",
+        "7536.2.8",
+        "2141.4.3",
+        "3521.1.5",
+        "3114.1.9",
+        "1439.1",
+        "7119.2",
+        "3334.1",
+        "3331.2.1.27",
+        "8350.2",
+        "9333.7",
+        "1324.3.1.6.10",
+        "3257.4.2",
+        "5249.1",
+        "3324.4.19",
+        "3112.7",
+        "2431.4",
+        "2412.9",
+        "7311.4",
+        "3118.3.9",
+        "8160.36",
+        "8141.1.5",
+        "1322.1.1",
+        "2411.1.6",
+        "8157.2",
+        "7512.3",
+        "2133.4",
+        "2431.3",
+        "2113.1.5",
+        "5223.7.26",
+        "1324.3.1.6.3",
+        "2149.13",
+        "1324.3.1.6.1",
+        "6221.6",
+        "3324.4.3",
+        "8160.20",
+        "2523.2",
+        "8160.42",
+        "3435.1",
+        "5223.7.13",
+        "2142.1.5",
+        "3211.2",
+        "7522.2",
+        "2164.4",
+        "7319.1",
+        "1345.1",
+        "2431.14",
+        "9629.5",
+        "8181.8",
+        "3354.1",
+        "2511.14",
+        "1420.4.13",
+        "9412.1",
+        "2132.6",
+        "3331.2.1.31",
+        "5132.1.2",
+        "3311.1",
+        "1213.2.3",
+        "1330.1",
+        "2145.1.9",
+        "1349.6",
+        "3122.3.5",
+        "8219.2",
+        "9629.2",
+        "2511.1",
+        "3122.3.8",
+        "8160.17",
+        "2621.1",
+        "2133.3",
+        "8160.34",
+        "3152.1",
+        "3324.1.2",
+        "2423.2",
+        "7122.1",
+        "0110.12",
+        "7313.1.5",
+        "1345.1.1",
+        "0110.5",
+        "3324.2",
+        "9333.2",
+        "3435.8",
+        "1321.2.1.6.1",
+        "2261.1",
+        "3154.3",
+        "9611.1",
+        "2641.4.1",
+        "3123.2",
+        "3115.1.23",
+        "2431.15",
+        "9211.2",
+        "2269.9.1",
+        "8156.2.2",
+        "5151.1",
+        "7536.1.3",
+        "2152.1.3",
+        "2151.1.4",
+        "3111.9",
+        "2433.6.6",
+        "2152.1.8",
+        "7535.1",
+        "3331.2.1.23",
+        "2621.9",
+        "2310.1.8",
+        "8322.6",
+        "3331.2.1.10",
+        "2320.1.21",
+        "6113.5",
+        "8141.1.3",
+        "1420.4.22",
+        "8141.1.9.1",
+        "2250.2",
+        "1324.3.1.6.26",
+        "2133.15",
+        "7411.1.3",
+        "2655.1.1",
+        "2330.1.14",
+        "1330.8",
+        "2149.3",
+        "3315.5",
+        "3321.3",
+        "3315.6",
+        "6221.4",
+        "1219.1.2",
+        "3331.2.1.4",
+        "4323.18",
+        "3117.2",
+        "4212.8",
+        "2131.2",
+        "5212.1",
+        "1324.3.2.10",
+        "7212.3.1",
+        "1114.1",
+        "8122.2",
+        "2310.1.16",
+        "5112.3",
+        "6121.4",
+        "7322.5",
+        "5419.6",
+        "7214.1",
+        "6221.10",
+        "3111.7",
+        "4212.4",
+        "2269.9.2",
+        "8143.2",
+        "7313.1.8",
+        "3324.4.1",
+        "2250.6",
+        "2642.1.15",
+        "1321.2.1",
+        "5414.1.6",
+        "7223.5",
+        "2641.4.2",
+        "7318.3",
+        "2651.4",
+        "2145.1",
+        "8142.3",
+        "2643.6.2",
+        "2141.3",
+        "2359.7",
+        "7222.5",
+        "2651.3",
+        "7421.8",
+        "8160.18",
+        "8153.1.3",
+        "2636.2",
+        "7126.8",
+        "8160.48",
+        "3119.16.1",
+        "2411.1",
+        "1420.4.7",
+        "3115.1.11",
+        "8131.2.5",
+        "1324.3.1.6.21",
+        "3152.5",
+        "1343.1",
+        "8344.1",
+        "8342.3",
+        "2131.4",
+        "7126.5",
+        "1349.11",
+        "1223.2.1.2",
+        "1342.1",
+        "3331.2.1.21",
+        "3115.1.2",
+        "2161.1.1",
+        "2142.1.6",
+        "9311.1",
+        "4226.1.2",
+        "2131.4.9",
+        "1311.1",
+        "7131.2",
+        "1420.4.24",
+        "3112.1.3",
+        "3435.25",
+        "1330.5",
+        "2330.1.11",
+        "3112.1.2",
+        "7422.3.1",
+        "2149.9.4",
+        "7511.6.1",
+        "2151.1.6",
+        "3133.1.5",
+        "3339.2",
+        "3432.2",
+        "5111.2.1",
+        "5311.1.1",
+        "2354.1",
+        "1112.4",
+        "9312.1.3",
+        "3152.4",
+        "2512.4",
+        "0110.1",
+        "7413.1.3",
+        "1420.4.6",
+        "8156.3.1",
+        "1330.5.1",
+        "3131.3.7",
+        "3331.2.1.30",
+        "3141.2.1",
+        "3331.2.1.7",
+        "2641.3",
+        "3324.4.13",
+        "2145.1.1",
+        "4323.1",
+        "7113.1",
+        "3139.1.1",
+        "3412.4.2",
+        "3154.1.2",
+        "6210.1",
+        "7233.8.2",
+        "7123.2",
+        "9622.1",
+        "5223.7.34",
+        "8159.7",
+        "1349.17",
+        "8160.41",
+        "1439.6",
+        "7412.6",
+        "2250.4.1",
+        "1439.3",
+        "3339.1",
+        "8160.33",
+        "1344.1.2",
+        "7321.1.5",
+        "7312.1",
+        "1324.3.1.5",
+        "4323.9",
+        "3122.4.2",
+        "8212.2.2",
+        "9321.2",
+        "6111.1",
+        "1212.2",
+        "5141.1.4",
+        "3411.9",
+        "4323.13",
+        "2652.3",
+        "2432.7",
+        "2330.1.6",
+        "8160.8",
+        "5164.1.3",
+        "1420.4.37",
+        "7233.8.1",
+        "3423.2.2",
+        "3331.2.1.9",
+        "8154.4",
+        "2422.12.7",
+        "9412.2",
+        "4226.1",
+        "3115.1.24",
+        "2635.1.1",
+        "2422.12.4",
+        "5223.7.32",
+        "3117.4",
+        "9129.1",
+        "5169.2",
+        "4321.1.3",
+        "5249.2.1.3",
+        "3315.2",
+        "3255.2",
+        "8212.3.3",
+        "1420.4.19",
+        "2352.1.5",
+        "7421.3",
+        "2642.1.12",
+        "7412.7",
+        "1324.3.1.6.7",
+        "5223.3",
+        "5414.1.3",
+        "7536.2",
+        "4413.1",
+        "8156.2.5",
+        "2269.9",
+        "2149.5",
+        "7312.7",
+        "3331.2.1.17",
+        "3142.1.1",
+        "5111.2.3",
+        "6113.6",
+        "2132.5",
+        "8211.5.1",
+        "4323.11",
+        "2635.2",
+        "2112.2",
+        "1341.2",
+        "2133.8",
+        "3117.1",
+        "3311.2.1",
+        "5151.2",
+        "1323.1",
+        "2511.19",
+        "2621.4",
+        "2330.1.12",
+        "9312.1.1",
+        "4212.5",
+        "3111.4",
+        "7132.2",
+        "7522.5",
+        "9313.1",
+        "2310.1.9",
+        "2149.2.1",
+        "9216.2",
+        "3143.1",
+        "5164.2.1",
+        "1324.1",
+        "3311.3.3",
+        "3412.3",
+        "8143.5",
+        "3343.1.4",
+        "8141.1.2",
+        "2144.1.12",
+        "7221.1",
+        "2142.1.11",
+        "1324.3.2.4",
+        "4312.5",
+        "7531.4",
+        "3323.2.4",
+        "2152.1.7.1",
+        "7223.4.7",
+        "2433.5",
+        "3132.3",
+        "7412.11",
+        "3324.4.14",
+        "5161.4",
+        "1321.2.2",
+        "0310.2",
+        "2642.1.7",
+        "7411.1.2",
+        "2149.2",
+        "4222.1.1",
+        "2422.12.13",
+        "2611.1.1",
+        "2511.9",
+        "3521.2",
+        "2133.14",
+        "2330.1.4",
+        "2635.3.5",
+        "3322.1.2",
+        "7512.5",
+        "3141.2.5",
+        "8131.4",
+        "6223.2.1",
+        "2120.2",
+        "9612.2",
+        "5414.1.2",
+        "2422.1",
+        "8211.5",
+    ),
+)
+
+__getattr__ = lazy_code_lists(__name__, code_types={"EscoCode": ESCO_OCCUPATIONS})
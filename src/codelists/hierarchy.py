@@ -0,0 +1,226 @@
+"""
+Hierarchies of the hierarchical code lists, for matching codes without linear scans.
+
+The codes are arranged in a tree, including the intermediate levels that are not in
+the code list themselves, e.g. the ISCO groups "2654", "265", "26" and "2" above the
+ESCO occupation "2654.1.7", or the NACE section "J" above the division "62". The tree
+is numbered in depth-first order, so the codes under any node form a contiguous range:
+listing a subtree is a slice, and checking whether a code is under another one is a
+comparison of two numbers.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from codelists.esco import ESCO_OCCUPATIONS
+from codelists.nace import NACE_ACTIVITIES
+
+
+def natural_key(code: str) -> list:
+    """
+    Sort key ordering the numbers in the codes by value, e.g. "2654.2" before
+    "2654.10"
+    """
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", code)]
+
+
+class CodeHierarchy:
+    """
+    Tree of the codes of a code list, with the intermediate levels of the hierarchy
+    """
+
+    def __init__(self, codes: Iterable[str], parent: Callable[[str], Optional[str]]):
+        """
+        :param codes: The codes of the code list
+        :param parent: Function giving the parent of a code or an intermediate level,
+        or None at the top of the hierarchy
+        """
+        self.codes = frozenset(codes)
+        self._parents: Dict[str, Optional[str]] = {}
+        children: Dict[Optional[str], List[str]] = {}
+        for code in self.codes:
+            node: Optional[str] = code
+            while node is not None and node not in self._parents:
+                parent_node = parent(node)
+                self._parents[node] = parent_node
+                children.setdefault(parent_node, []).append(node)
+                node = parent_node
+        self._children: Dict[Optional[str], Tuple[str, ...]] = {
+            node: tuple(sorted(nodes, key=natural_key))
+            for node, nodes in children.items()
+        }
+
+        # Depth-first numbering of the nodes, and the range of the listed codes in
+        # each subtree
+        self._listed: List[str] = []
+        self._enter: Dict[str, int] = {}
+        self._exit: Dict[str, int] = {}
+        self._first: Dict[str, int] = {}
+        self._last: Dict[str, int] = {}
+        stack = [(node, False) for node in reversed(self.roots)]
+        counter = 0
+        while stack:
+            node, done = stack.pop()
+            if done:
+                self._exit[node] = counter
+                self._last[node] = len(self._listed)
+                continue
+            self._enter[node] = counter
+            counter += 1
+            self._first[node] = len(self._listed)
+            if node in self.codes:
+                self._listed.append(node)
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(self.children(node)))
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    @property
+    def roots(self) -> Tuple[str, ...]:
+        return self._children.get(None, ())
+
+    def parent(self, node: str) -> Optional[str]:
+        return self._parents[node]
+
+    def children(self, node: str) -> Tuple[str, ...]:
+        if node not in self._parents:
+            raise KeyError(node)
+        return self._children.get(node, ())
+
+    def ancestors(self, node: str) -> List[str]:
+        """
+        Get the levels above the node, nearest first
+        """
+        result = []
+        parent = self._parents[node]
+        while parent is not None:
+            result.append(parent)
+            parent = self._parents[parent]
+        return result
+
+    def depth(self, node: str) -> int:
+        return len(self.ancestors(node))
+
+    def subtree(self, node: str) -> List[str]:
+        """
+        Get the codes of the code list at or under the node, in depth-first order
+        """
+        return self._listed[self._first[node] : self._last[node]]
+
+    def descendants(self, node: str) -> List[str]:
+        """
+        Get the codes of the code list under the node, excluding the node itself
+        """
+        start = self._first[node] + (node in self.codes)
+        return self._listed[start : self._last[node]]
+
+    def is_within(self, node: str, ancestor: str) -> bool:
+        """
+        Check if the node is the ancestor itself or under it, in constant time
+        """
+        return self._enter[ancestor] <= self._enter[node] < self._exit[ancestor]
+
+    def matches(self, node: str, ancestors: Iterable[str]) -> bool:
+        """
+        Check if the node is within any of the given nodes, e.g. if an occupation is
+        within the preferred occupations or groups of a job applicant
+        """
+        return any(self.is_within(node, ancestor) for ancestor in ancestors)
+
+    def rollup(self, nodes: Iterable[str], depth: int) -> List[Optional[str]]:
+        """
+        Roll the nodes up to the level at the given depth, e.g. the NACE activities
+        to their sections with depth 0 or to their divisions with depth 1. Each
+        distinct node is only looked up once.
+
+        :return: The node at the given depth above or at each node, or None for the
+        nodes above that depth
+        """
+        rolled: Dict[str, Optional[str]] = {}
+        result = []
+        for node in nodes:
+            if node not in rolled:
+                path = [node, *self.ancestors(node)]
+                rolled[node] = path[-depth - 1] if depth < len(path) else None
+            result.append(rolled[node])
+        return result
+
+
+def esco_parent(code: str) -> Optional[str]:
+    """
+    The ESCO occupations extend the ISCO groups with dotted numbers, e.g.
+    "2654.1.7" is under "2654.1", and the ISCO groups are nested by their digits,
+    e.g. "2654" is under "265"
+    """
+    if "." in code:
+        return code.rsplit(".", 1)[0]
+    return code[:-1] or None
+
+
+@lru_cache(maxsize=None)
+def esco_hierarchy() -> CodeHierarchy:
+    """
+    Get the hierarchy of the ESCO occupations, built on the first call
+    """
+    return CodeHierarchy(ESCO_OCCUPATIONS, esco_parent)
+
+
+# The NACE sections by the ranges of their divisions, the sections are not in the
+# code list itself
+NACE_SECTIONS = {
+    "A": (1, 3),
+    "B": (5, 9),
+    "C": (10, 33),
+    "D": (35, 35),
+    "E": (36, 39),
+    "F": (41, 43),
+    "G": (45, 47),
+    "H": (49, 53),
+    "I": (55, 56),
+    "J": (58, 63),
+    "K": (64, 66),
+    "L": (68, 68),
+    "M": (69, 75),
+    "N": (77, 82),
+    "O": (84, 84),
+    "P": (85, 85),
+    "Q": (86, 88),
+    "R": (90, 93),
+    "S": (94, 96),
+    "T": (97, 98),
+    "U": (99, 99),
+}
+
+# The section of each division, e.g. "62" is in section "J"
+_NACE_DIVISION_SECTIONS = {
+    f"{division:02}": section
+    for section, (first, last) in NACE_SECTIONS.items()
+    for division in range(first, last + 1)
+}
+
+
+def nace_parent(code: str) -> Optional[str]:
+    """
+    The NACE classes are under their groups, e.g. "62.01" is under "62.0", the groups
+    under their divisions, e.g. "62.0" is under "62", and the divisions under their
+    sections, e.g. "62" is under "J"
+    """
+    if code in NACE_SECTIONS:
+        return None
+    if "." not in code:
+        return _NACE_DIVISION_SECTIONS[code]
+    division, group = code.split(".")
+    return f"{division}.{group[:-1]}" if len(group) > 1 else division
+
+
+@lru_cache(maxsize=None)
+def nace_hierarchy() -> CodeHierarchy:
+    """
+    Get the hierarchy of the NACE activities, with the sections on top, built on the
+    first call
+    """
+    return CodeHierarchy(NACE_ACTIVITIES, nace_parent)
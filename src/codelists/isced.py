@@ -0,0 +1,181 @@
+"""
+ISCED education levels and fields of education
+
+https://koodistot.suomi.fi/codescheme;registryCode=dataecon;schemeCode=educationlevel
+https://koodistot.suomi.fi/codescheme;registryCode=jhs;schemeCode=isced_ala_1_20110101
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+EDUCATION_LEVELS = CodeList(
+    prefix="ISCED_LEVEL_",
+    codes=(
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+    ),
+)
+
+EDUCATION_FIELDS = CodeList(
+    prefix="ISCED_FIELD_",
+    codes=(
+        "00",
+        "001",
+        "0011",
+        "01",
+        "011",
+        "0110",
+        "0111",
+        "0112",
+        "0113",
+        "0114",
+        "0118",
+        "02",
+        "020",
+        "0200",
+        "021",
+        "0210",
+        "0211",
+        "0212",
+        "0213",
+        "0214",
+        "0215",
+        "0218",
+        "022",
+        "0220",
+        "0221",
+        "0222",
+        "0223",
+        "023",
+        "0231",
+        "0232",
+        "03",
+        "031",
+        "0310",
+        "0311",
+        "0312",
+        "0313",
+        "0314",
+        "0318",
+        "032",
+        "0321",
+        "0322",
+        "04",
+        "041",
+        "0410",
+        "0411",
+        "0412",
+        "0413",
+        "0414",
+        "0415",
+        "0416",
+        "0418",
+        "042",
+        "0421",
+        "05",
+        "050",
+        "0500",
+        "051",
+        "0511",
+        "0512",
+        "052",
+        "0521",
+        "0522",
+        "0528",
+        "053",
+        "0531",
+        "0532",
+        "0533",
+        "054",
+        "0541",
+        "0542",
+        "06",
+        "061",
+        "0618",
+        "07",
+        "071",
+        "0710",
+        "0711",
+        "0712",
+        "0713",
+        "0714",
+        "0715",
+        "0716",
+        "0718",
+        "072",
+        "0721",
+        "0722",
+        "0723",
+        "0724",
+        "0728",
+        "073",
+        "0731",
+        "0732",
+        "08",
+        "080",
+        "0800",
+        "081",
+        "0811",
+        "0812",
+        "0818",
+        "082",
+        "0820",
+        "0821",
+        "0828",
+        "083",
+        "0831",
+        "084",
+        "0841",
+        "09",
+        "090",
+        "0900",
+        "091",
+        "0911",
+        "0912",
+        "0913",
+        "0914",
+        "0915",
+        "0916",
+        "0918",
+        "092",
+        "0920",
+        "0921",
+        "0922",
+        "0923",
+        "0928",
+        "10",
+        "100",
+        "1000",
+        "101",
+        "1010",
+        "1011",
+        "1012",
+        "1013",
+        "1014",
+        "1015",
+        "1018",
+        "103",
+        "1030",
+        "1031",
+        "1032",
+        "104",
+        "1041",
+        "1048",
+        "99",
+        "999",
+        "9999",
+    ),
+)
+
+__getattr__ = lazy_code_lists(
+    __name__,
+    enums={"EducationLevel": EDUCATION_LEVELS, "EducationField": EDUCATION_FIELDS},
+)
@@ -0,0 +1,788 @@
+"""
+ISO 3166 country and subdivision codes
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+COUNTRY_CODES_ALPHA_2 = CodeList(
+    codes=(
+        "AD",
+        "AE",
+        "AF",
+        "AG",
+        "AI",
+        "AL",
+        "AM",
+        "AO",
+        "AQ",
+        "AR",
+        "AS",
+        "AT",
+        "AU",
+        "AW",
+        "AX",
+        "AZ",
+        "BA",
+        "BB",
+        "BD",
+        "BE",
+        "BF",
+        "BG",
+        "BH",
+        "BI",
+        "BJ",
+        "BL",
+        "BM",
+        "BN",
+        "BO",
+        "BQ",
+        "BR",
+        "BS",
+        "BT",
+        "BV",
+        "BW",
+        "BY",
+        "BZ",
+        "CA",
+        "CC",
+        "CD",
+        "CF",
+        "CG",
+        "CH",
+        "CI",
+        "CK",
+        "CL",
+        "CM",
+        "CN",
+        "CO",
+        "CR",
+        "CU",
+        "CV",
+        "CW",
+        "CX",
+        "CY",
+        "CZ",
+        "DE",
+        "DJ",
+        "DK",
+        "DM",
+        "DO",
+        "DZ",
+        "EC",
+        "EE",
+        "EG",
+        "EH",
+        "ER",
+        "ES",
+        "ET",
+        "FI",
+        "FJ",
+        "FK",
+        "FM",
+        "FO",
+        "FR",
+        "GA",
+        "GB",
+        "GD",
+        "GE",
+        "GF",
+        "GG",
+        "GH",
+        "GI",
+        "GL",
+        "GM",
+        "GN",
+        "GP",
+        "GQ",
+        "GR",
+        "GS",
+        "GT",
+        "GU",
+        "GW",
+        "GY",
+        "HK",
+        "HM",
+        "HN",
+        "HR",
+        "HT",
+        "HU",
+        "ID",
+        "IE",
+        "IL",
+        "IM",
+        "IN",
+        "IO",
+        "IQ",
+        "IR",
+        "IS",
+        "IT",
+        "JE",
+        "JM",
+        "JO",
+        "JP",
+        "KE",
+        "KG",
+        "KH",
+        "KI",
+        "KM",
+        "KN",
+        "KP",
+        "KR",
+        "KW",
+        "KY",
+        "KZ",
+        "LA",
+        "LB",
+        "LC",
+        "LI",
+        "LK",
+        "LR",
+        "LS",
+        "LT",
+        "LU",
+        "LV",
+        "LY",
+        "MA",
+        "MC",
+        "MD",
+        "ME",
+        "MF",
+        "MG",
+        "MH",
+        "MK",
+        "ML",
+        "MM",
+        "MN",
+        "MO",
+        "MP",
+        "MQ",
+        "MR",
+        "MS",
+        "MT",
+        "MU",
+        "MV",
+        "MW",
+        "MX",
+        "MY",
+        "MZ",
+        "NA",
+        "NC",
+        "NE",
+        "NF",
+        "NG",
+        "NI",
+        "NL",
+        "NO",
+        "NP",
+        "NR",
+        "NU",
+        "NZ",
+        "OM",
+        "PA",
+        "PE",
+        "PF",
+        "PG",
+        "PH",
+        "PK",
+        "PL",
+        "PM",
+        "PN",
+        "PR",
+        "PS",
+        "PT",
+        "PW",
+        "PY",
+        "QA",
+        "RE",
+        "RO",
+        "RS",
+        "RU",
+        "RW",
+        "SA",
+        "SB",
+        "SC",
+        "SD",
+        "SE",
+        "SG",
+        "SH",
+        "SI",
+        "SJ",
+        "SK",
+        "SL",
+        "SM",
+        "SN",
+        "SO",
+        "SR",
+        "SS",
+        "ST",
+        "SV",
+        "SX",
+        "SY",
+        "SZ",
+        "TC",
+        "TD",
+        "TF",
+        "TG",
+        "TH",
+        "TJ",
+        "TK",
+        "TL",
+        "TM",
+        "TN",
+        "TO",
+        "TR",
+        "TT",
+        "TV",
+        "TW",
+        "TZ",
+        "UA",
+        "UG",
+        "UM",
+        "US",
+        "UY",
+        "UZ",
+        "VA",
+        "VC",
+        "VE",
+        "VG",
+        "VI",
+        "VN",
+        "VU",
+        "WF",
+        "WS",
+        "YE",
+        "YT",
+        "ZA",
+        "ZM",
+        "ZW",
+    ),
+)
+
+COUNTRY_CODES_ALPHA_3 = CodeList(
+    codes=(
+        "AFG",
+        "ALB",
+        "DZA",
+        "ASM",
+        "AND",
+        "AGO",
+        "AIA",
+        "ATA",
+        "ATG",
+        "ARG",
+        "ARM",
+        "ABW",
+        "AUS",
+        "AUT",
+        "AZE",
+        "BHS",
+        "BHR",
+        "BGD",
+        "BRB",
+        "BLR",
+        "BEL",
+        "BLZ",
+        "BEN",
+        "BMU",
+        "BTN",
+        "BOL",
+        "BIH",
+        "BWA",
+        "BVT",
+        "BRA",
+        "IOT",
+        "BRN",
+        "BGR",
+        "BFA",
+        "BDI",
+        "KHM",
+        "CMR",
+        "CAN",
+        "CPV",
+        "CYM",
+        "CAF",
+        "TCD",
+        "CHL",
+        "CHN",
+        "CXR",
+        "CCK",
+        "COL",
+        "COM",
+        "COG",
+        "COD",
+        "COK",
+        "CRI",
+        "CIV",
+        "HRV",
+        "CUB",
+        "CYP",
+        "CZE",
+        "DNK",
+        "DJI",
+        "DMA",
+        "DOM",
+        "ECU",
+        "EGY",
+        "SLV",
+        "GNQ",
+        "ERI",
+        "EST",
+        "ETH",
+        "FLK",
+        "FRO",
+        "FJI",
+        "FIN",
+        "FRA",
+        "GUF",
+        "PYF",
+        "ATF",
+        "GAB",
+        "GMB",
+        "GEO",
+        "DEU",
+        "GHA",
+        "GIB",
+        "GRC",
+        "GRL",
+        "GRD",
+        "GLP",
+        "GUM",
+        "GTM",
+        "GGY",
+        "GIN",
+        "GNB",
+        "GUY",
+        "HTI",
+        "HMD",
+        "VAT",
+        "HND",
+        "HKG",
+        "HUN",
+        "ISL",
+        "IND",
+        "IDN",
+        "IRN",
+        "IRQ",
+        "IRL",
+        "IMN",
+        "ISR",
+        "ITA",
+        "JAM",
+        "JPN",
+        "JEY",
+        "JOR",
+        "KAZ",
+        "KEN",
+        "KIR",
+        "PRK",
+        "KOR",
+        "KWT",
+        "KGZ",
+        "LAO",
+        "LVA",
+        "LBN",
+        "LSO",
+        "LBR",
+        "LBY",
+        "LIE",
+        "LTU",
+        "LUX",
+        "MAC",
+        "MKD",
+        "MDG",
+        "MWI",
+        "MYS",
+        "MDV",
+        "MLI",
+        "MLT",
+        "MHL",
+        "MTQ",
+        "MRT",
+        "MUS",
+        "MYT",
+        "MEX",
+        "FSM",
+        "MDA",
+        "MCO",
+        "MNG",
+        "MNE",
+        "MSR",
+        "MAR",
+        "MOZ",
+        "MMR",
+        "NAM",
+        "NRU",
+        "NPL",
+        "NLD",
+        "ANT",
+        "NCL",
+        "NZL",
+        "NIC",
+        "NER",
+        "NGA",
+        "NIU",
+        "NFK",
+        "MNP",
+        "NOR",
+        "OMN",
+        "PAK",
+        "PLW",
+        "PSE",
+        "PAN",
+        "PNG",
+        "PRY",
+        "PER",
+        "PHL",
+        "PCN",
+        "POL",
+        "PRT",
+        "PRI",
+        "QAT",
+        "REU",
+        "ROU",
+        "RUS",
+        "RWA",
+        "SHN",
+        "KNA",
+        "LCA",
+        "SPM",
+        "VCT",
+        "WSM",
+        "SMR",
+        "STP",
+        "SAU",
+        "SEN",
+        "SRB",
+        "SYC",
+        "SLE",
+        "SGP",
+        "SVK",
+        "SVN",
+        "SLB",
+        "SOM",
+        "ZAF",
+        "SGS",
+        "SSD",
+        "ESP",
+        "LKA",
+        "SDN",
+        "SUR",
+        "SJM",
+        "SWZ",
+        "SWE",
+        "CHE",
+        "SYR",
+        "TWN",
+        "TJK",
+        "TZA",
+        "THA",
+        "TLS",
+        "TGO",
+        "TKL",
+        "TON",
+        "TTO",
+        "TUN",
+        "TUR",
+        "TKM",
+        "TCA",
+        "TUV",
+        "UGA",
+        "UKR",
+        "ARE",
+        "GBR",
+        "USA",
+        "UMI",
+        "URY",
+        "UZB",
+        "VUT",
+        "VEN",
+        "VNM",
+        "VGB",
+        "VIR",
+        "WLF",
+        "ESH",
+        "YEM",
+        "ZMB",
+        "ZWE",
+    ),
+)
+
+ALPHA_3_TO_ALPHA_2 = {
+    "AFG": "AF",
+    "ALB": "AL",
+    "DZA": "DZ",
+    "ASM": "AS",
+    "AND": "AD",
+    "AGO": "AO",
+    "AIA": "AI",
+    "ATA": "AQ",
+    "ATG": "AG",
+    "ARG": "AR",
+    "ARM": "AM",
+    "ABW": "AW",
+    "AUS": "AU",
+    "AUT": "AT",
+    "AZE": "AZ",
+    "BHS": "BS",
+    "BHR": "BH",
+    "BGD": "BD",
+    "BRB": "BB",
+    "BLR": "BY",
+    "BEL": "BE",
+    "BLZ": "BZ",
+    "BEN": "BJ",
+    "BMU": "BM",
+    "BTN": "BT",
+    "BOL": "BO",
+    "BIH": "BA",
+    "BWA": "BW",
+    "BVT": "BV",
+    "BRA": "BR",
+    "IOT": "IO",
+    "BRN": "BN",
+    "BGR": "BG",
+    "BFA": "BF",
+    "BDI": "BI",
+    "KHM": "KH",
+    "CMR": "CM",
+    "CAN": "CA",
+    "CPV": "CV",
+    "CYM": "KY",
+    "CAF": "CF",
+    "TCD": "TD",
+    "CHL": "CL",
+    "CHN": "CN",
+    "CXR": "CX",
+    "CCK": "CC",
+    "COL": "CO",
+    "COM": "KM",
+    "COG": "CG",
+    "COD": "CD",
+    "COK": "CK",
+    "CRI": "CR",
+    "CIV": "CI",
+    "HRV": "HR",
+    "CUB": "CU",
+    "CYP": "CY",
+    "CZE": "CZ",
+    "DNK": "DK",
+    "DJI": "DJ",
+    "DMA": "DM",
+    "DOM": "DO",
+    "ECU": "EC",
+    "EGY": "EG",
+    "SLV": "SV",
+    "GNQ": "GQ",
+    "ERI": "ER",
+    "EST": "EE",
+    "ETH": "ET",
+    "FLK": "FK",
+    "FRO": "FO",
+    "FJI": "FJ",
+    "FIN": "FI",
+    "FRA": "FR",
+    "GUF": "GF",
+    "PYF": "PF",
+    "ATF": "TF",
+    "GAB": "GA",
+    "GMB": "GM",
+    "GEO": "GE",
+    "DEU": "DE",
+    "GHA": "GH",
+    "GIB": "GI",
+    "GRC": "GR",
+    "GRL": "GL",
+    "GRD": "GD",
+    "GLP": "GP",
+    "GUM": "GU",
+    "GTM": "GT",
+    "GGY": "GG",
+    "GIN": "GN",
+    "GNB": "GW",
+    "GUY": "GY",
+    "HTI": "HT",
+    "HMD": "HM",
+    "VAT": "VA",
+    "HND": "HN",
+    "HKG": "HK",
+    "HUN": "HU",
+    "ISL": "IS",
+    "IND": "IN",
+    "IDN": "ID",
+    "IRN": "IR",
+    "IRQ": "IQ",
+    "IRL": "IE",
+    "IMN": "IM",
+    "ISR": "IL",
+    "ITA": "IT",
+    "JAM": "JM",
+    "JPN": "JP",
+    "JEY": "JE",
+    "JOR": "JO",
+    "KAZ": "KZ",
+    "KEN": "KE",
+    "KIR": "KI",
+    "PRK": "KP",
+    "KOR": "KR",
+    "KWT": "KW",
+    "KGZ": "KG",
+    "LAO": "LA",
+    "LVA": "LV",
+    "LBN": "LB",
+    "LSO": "LS",
+    "LBR": "LR",
+    "LBY": "LY",
+    "LIE": "LI",
+    "LTU": "LT",
+    "LUX": "LU",
+    "MAC": "MO",
+    "MKD": "MK",
+    "MDG": "MG",
+    "MWI": "MW",
+    "MYS": "MY",
+    "MDV": "MV",
+    "MLI": "ML",
+    "MLT": "MT",
+    "MHL": "MH",
+    "MTQ": "MQ",
+    "MRT": "MR",
+    "MUS": "MU",
+    "MYT": "YT",
+    "MEX": "MX",
+    "FSM": "FM",
+    "MDA": "MD",
+    "MCO": "MC",
+    "MNG": "MN",
+    "MNE": "ME",
+    "MSR": "MS",
+    "MAR": "MA",
+    "MOZ": "MZ",
+    "MMR": "MM",
+    "NAM": "NA",
+    "NRU": "NR",
+    "NPL": "NP",
+    "NLD": "NL",
+    "NCL": "NC",
+    "NZL": "NZ",
+    "NIC": "NI",
+    "NER": "NE",
+    "NGA": "NG",
+    "NIU": "NU",
+    "NFK": "NF",
+    "MNP": "MP",
+    "NOR": "NO",
+    "OMN": "OM",
+    "PAK": "PK",
+    "PLW": "PW",
+    "PSE": "PS",
+    "PAN": "PA",
+    "PNG": "PG",
+    "PRY": "PY",
+    "PER": "PE",
+    "PHL": "PH",
+    "PCN": "PN",
+    "POL": "PL",
+    "PRT": "PT",
+    "PRI": "PR",
+    "QAT": "QA",
+    "REU": "RE",
+    "ROU": "RO",
+    "RUS": "RU",
+    "RWA": "RW",
+    "SHN": "SH",
+    "KNA": "KN",
+    "LCA": "LC",
+    "SPM": "PM",
+    "VCT": "VC",
+    "WSM": "WS",
+    "SMR": "SM",
+    "STP": "ST",
+    "SAU": "SA",
+    "SEN": "SN",
+    "SRB": "RS",
+    "SYC": "SC",
+    "SLE": "SL",
+    "SGP": "SG",
+    "SVK": "SK",
+    "SVN": "SI",
+    "SLB": "SB",
+    "SOM": "SO",
+    "ZAF": "ZA",
+    "SGS": "GS",
+    "SSD": "SS",
+    "ESP": "ES",
+    "LKA": "LK",
+    "SDN": "SD",
+    "SUR": "SR",
+    "SJM": "SJ",
+    "SWZ": "SZ",
+    "SWE": "SE",
+    "CHE": "CH",
+    "SYR": "SY",
+    "TWN": "TW",
+    "TJK": "TJ",
+    "TZA": "TZ",
+    "THA": "TH",
+    "TLS": "TL",
+    "TGO": "TG",
+    "TKL": "TK",
+    "TON": "TO",
+    "TTO": "TT",
+    "TUN": "TN",
+    "TUR": "TR",
+    "TKM": "TM",
+    "TCA": "TC",
+    "TUV": "TV",
+    "UGA": "UG",
+    "UKR": "UA",
+    "ARE": "AE",
+    "GBR": "GB",
+    "USA": "US",
+    "UMI": "UM",
+    "URY": "UY",
+    "UZB": "UZ",
+    "VUT": "VU",
+    "VEN": "VE",
+    "VNM": "VN",
+    "VGB": "VG",
+    "VIR": "VI",
+    "WLF": "WF",
+    "ESH": "EH",
+    "YEM": "YE",
+    "ZMB": "ZM",
+    "ZWE": "ZW",
+}
+
+FINNISH_REGIONS = CodeList(
+    codes=(
+        "FI-01",
+        "FI-02",
+        "FI-03",
+        "FI-04",
+        "FI-05",
+        "FI-06",
+        "FI-07",
+        "FI-08",
+        "FI-09",
+        "FI-10",
+        "FI-11",
+        "FI-12",
+        "FI-13",
+        "FI-14",
+        "FI-15",
+        "FI-16",
+        "FI-17",
+        "FI-18",
+        "FI-19",
+    ),
+)
+
+__getattr__ = lazy_code_lists(
+    __name__,
+    enums={
+        "ISO_3166_1_Alpha_2": COUNTRY_CODES_ALPHA_2,
+        "ISO_3166_1_Alpha_3": COUNTRY_CODES_ALPHA_3,
+        "ISO_3166_2_FI": FINNISH_REGIONS,
+    },
+)
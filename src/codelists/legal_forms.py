@@ -0,0 +1,3435 @@
+"""
+Legal forms of entities
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+ENTITY_LEGAL_FORMS = CodeList(
+    prefix="ISO_20275_",
+    codes=(
+        "8888",
+        "9999",
+        "CDOV",
+        "F0A6",
+        "HZ6C",
+        "WUAZ",
+        "CRL9",
+        "CYW2",
+        "GAJN",
+        "M27U",
+        "OLAI",
+        "P65N",
+        "PCRJ",
+        "PT6C",
+        "REUP",
+        "T5RL",
+        "UV8T",
+        "V905",
+        "YCV2",
+        "6W6X",
+        "7TPC",
+        "ADXG",
+        "BC38",
+        "J4JC",
+        "LZFR",
+        "PQHL",
+        "Q82Q",
+        "R4KK",
+        "TXVC",
+        "XHCV",
+        "1NOX",
+        "5WWO",
+        "69H1",
+        "8XDW",
+        "AAL7",
+        "AXSB",
+        "CAQ1",
+        "DM88",
+        "DX6Z",
+        "E9OX",
+        "ECWU",
+        "EQOV",
+        "G3R6",
+        "GVPD",
+        "JJYT",
+        "JQOI",
+        "JTAV",
+        "JUHG",
+        "NIJH",
+        "NNLI",
+        "O65B",
+        "ONF1",
+        "UI81",
+        "52TH",
+        "6JHZ",
+        "DWEA",
+        "HKL3",
+        "K81Q",
+        "M4LU",
+        "MEJT",
+        "PITR",
+        "SLXJ",
+        "TD56",
+        "U0SP",
+        "ZD74",
+        "1W6I",
+        "78QF",
+        "98A8",
+        "A9N4",
+        "DAEG",
+        "HNSU",
+        "HP0B",
+        "PB7W",
+        "PICJ",
+        "SQ8U",
+        "VVOW",
+        "XDKS",
+        "2T7B",
+        "5IL6",
+        "7FCS",
+        "EKJG",
+        "HTBY",
+        "KYFD",
+        "Q9Y1",
+        "T4KB",
+        "TEPY",
+        "X2X1",
+        "106J",
+        "9X63",
+        "AABD",
+        "JLR3",
+        "MR85",
+        "1TX8",
+        "28FE",
+        "2QSA",
+        "36KV",
+        "3LMA",
+        "3N94",
+        "3W7E",
+        "4E5P",
+        "7SJP",
+        "8E2A",
+        "8YLB",
+        "B910",
+        "C609",
+        "CFH5",
+        "EDMK",
+        "EXY8",
+        "J5OU",
+        "JAM3",
+        "JNAD",
+        "KLBO",
+        "KM6O",
+        "L05H",
+        "LWHF",
+        "LWV6",
+        "MQH3",
+        "N5NT",
+        "O59C",
+        "O5HQ",
+        "PVT3",
+        "QZIS",
+        "R85P",
+        "T922",
+        "TPTU",
+        "U2PN",
+        "U5KF",
+        "UCT9",
+        "UW1Y",
+        "V03J",
+        "V7FT",
+        "V8L7",
+        "W3WH",
+        "WTLP",
+        "X8ZK",
+        "XLEO",
+        "XQZX",
+        "Y1Q4",
+        "YBHM",
+        "ZOK2",
+        "ZSFX",
+        "ZUHK",
+        "84DD",
+        "AO0O",
+        "D1SL",
+        "EAD0",
+        "GJKF",
+        "ZHT0",
+        "7AS7",
+        "7HCE",
+        "7MGJ",
+        "9TCY",
+        "ASR5",
+        "CW38",
+        "EURM",
+        "LC2L",
+        "MBVS",
+        "NAQG",
+        "UZWE",
+        "VFXJ",
+        "WF3Q",
+        "ZLTD",
+        "38JQ",
+        "5T3W",
+        "70BS",
+        "DSML",
+        "JYAN",
+        "LJYQ",
+        "LN9O",
+        "MGOU",
+        "PJ29",
+        "PM48",
+        "RXJN",
+        "TNHO",
+        "XTCQ",
+        "1A0A",
+        "3Y5C",
+        "4S4Z",
+        "4ZBE",
+        "51WZ",
+        "56MU",
+        "92JZ",
+        "AS4W",
+        "B2UK",
+        "DQMJ",
+        "FCPM",
+        "IPTQ",
+        "JFQ5",
+        "KSHL",
+        "NPFB",
+        "SNRI",
+        "VHIY",
+        "X088",
+        "XL51",
+        "4IXL",
+        "771I",
+        "QK1F",
+        "Y2L3",
+        "4LKN",
+        "529B",
+        "8GEA",
+        "9BIS",
+        "ANHM",
+        "I4T1",
+        "J7G9",
+        "OB5J",
+        "PC5A",
+        "QHW1",
+        "WBEC",
+        "X0SD",
+        "X2ZT",
+        "XQRI",
+        "2DGO",
+        "EULU",
+        "3FUP",
+        "3HLJ",
+        "3SHX",
+        "45D7",
+        "946C",
+        "9F78",
+        "CTCH",
+        "EJ06",
+        "FPP2",
+        "HN63",
+        "LECS",
+        "O15N",
+        "PW3Y",
+        "QZAU",
+        "RYDY",
+        "S94S",
+        "SZW0",
+        "TCGV",
+        "U8LM",
+        "UFG8",
+        "VJ3G",
+        "WTK4",
+        "WVIN",
+        "15BP",
+        "BQ0P",
+        "D3UY",
+        "KD84",
+        "Z4YC",
+        "ZCFU",
+        "1EQC",
+        "60MF",
+        "8ZH8",
+        "94UQ",
+        "B69V",
+        "BASA",
+        "BH5D",
+        "C9KZ",
+        "DK7L",
+        "G65S",
+        "J3C5",
+        "K1QX",
+        "KVC1",
+        "PXPK",
+        "R0KX",
+        "RHVP",
+        "RN4K",
+        "TRO6",
+        "TS9O",
+        "U938",
+        "VHXN",
+        "1CML",
+        "23V9",
+        "AW80",
+        "F9J3",
+        "HLBQ",
+        "LNBY",
+        "LRRN",
+        "O13B",
+        "OTU7",
+        "QODJ",
+        "S3K4",
+        "TGLV",
+        "WFPH",
+        "XOYI",
+        "YG5M",
+        "59T2",
+        "6TRA",
+        "D90J",
+        "M4IF",
+        "MGE0",
+        "UDLA",
+        "5ONY",
+        "9D1K",
+        "FN6X",
+        "G9PJ",
+        "GM04",
+        "HBCT",
+        "LV28",
+        "MXLT",
+        "OPRT",
+        "RBBY",
+        "SS1V",
+        "Y485",
+        "3Q15",
+        "40JO",
+        "44LR",
+        "4M62",
+        "56KZ",
+        "64XG",
+        "6U2Q",
+        "7P8Y",
+        "8MEC",
+        "AXW3",
+        "B3RX",
+        "D8UQ",
+        "DHGI",
+        "EKRT",
+        "EPFN",
+        "FGSL",
+        "GF6X",
+        "GLX2",
+        "GPG0",
+        "IDBS",
+        "IKMB",
+        "IKSU",
+        "ILON",
+        "JBBW",
+        "M53U",
+        "MY4W",
+        "NONB",
+        "QJ3A",
+        "QNSC",
+        "TSQ7",
+        "WI0P",
+        "ZACY",
+        "ZY4E",
+        "1E9M",
+        "3Y5V",
+        "ASWX",
+        "EBYQ",
+        "ER0H",
+        "GTBR",
+        "IKGM",
+        "SYPT",
+        "1ADH",
+        "85EC",
+        "CS15",
+        "KAM9",
+        "PIDT",
+        "QN8Y",
+        "QR4F",
+        "TA98",
+        "TPZ2",
+        "VAPN",
+        "W126",
+        "2FHC",
+        "3M14",
+        "42GN",
+        "876U",
+        "8M03",
+        "8OZ0",
+        "9XHE",
+        "FQJ9",
+        "GG0S",
+        "T0CV",
+        "TY0S",
+        "ULJ1",
+        "W8XG",
+        "Y80K",
+        "1JGX",
+        "456Q",
+        "7VKC",
+        "BOYK",
+        "CMB6",
+        "EIDL",
+        "ESVK",
+        "FBQL",
+        "HQKE",
+        "O90R",
+        "PCO0",
+        "487P",
+        "5SGE",
+        "790T",
+        "CUQF",
+        "E281",
+        "HK03",
+        "I5NO",
+        "JOGO",
+        "LT1Y",
+        "N745",
+        "PFPW",
+        "QZMH",
+        "W4DB",
+        "X6N9",
+        "Y33B",
+        "10UR",
+        "16GH",
+        "16RL",
+        "1VTA",
+        "27WJ",
+        "2ODA",
+        "2U3G",
+        "30IT",
+        "3C5P",
+        "3FP6",
+        "4B4B",
+        "50Z9",
+        "52CK",
+        "6ZCO",
+        "702U",
+        "814Y",
+        "87OW",
+        "95EN",
+        "9CB2",
+        "9CEN",
+        "9IF2",
+        "A7KA",
+        "AS7L",
+        "CG81",
+        "CT3J",
+        "D2T8",
+        "F9CT",
+        "GAMO",
+        "HVWR",
+        "I3UX",
+        "J5SC",
+        "JBU2",
+        "JI4V",
+        "JLE0",
+        "JLZW",
+        "JQNA",
+        "JVMD",
+        "JXO5",
+        "K08P",
+        "L26C",
+        "L3XH",
+        "LN3N",
+        "MCY8",
+        "MK1I",
+        "MQT7",
+        "MR95",
+        "NVXN",
+        "OMUP",
+        "Q8NY",
+        "QB2W",
+        "RC3D",
+        "RPGT",
+        "RQIC",
+        "S72N",
+        "T1LR",
+        "TA7J",
+        "TKAB",
+        "TWLR",
+        "UG3Z",
+        "UVCG",
+        "V5IH",
+        "V9GU",
+        "VGP6",
+        "VRVJ",
+        "WGEA",
+        "XS49",
+        "XW5K",
+        "YBMJ",
+        "YIIS",
+        "YRUJ",
+        "Z6MF",
+        "ZGEX",
+        "ZQQU",
+        "ZX1F",
+        "3OVJ",
+        "5D9I",
+        "5EEA",
+        "7IKZ",
+        "7XZL",
+        "8KL5",
+        "FYYY",
+        "I8VP",
+        "JNCJ",
+        "KZDW",
+        "L2NN",
+        "LMSY",
+        "UWMY",
+        "4XP8",
+        "6XB7",
+        "8HR7",
+        "JDX6",
+        "K575",
+        "MP7S",
+        "MPUG",
+        "OSBR",
+        "SNUK",
+        "T5UM",
+        "XAQA",
+        "2UZP",
+        "78VN",
+        "7T6S",
+        "7ZMX",
+        "B8OI",
+        "C6AH",
+        "CVDP",
+        "CZCE",
+        "EE3W",
+        "KUUZ",
+        "OA6N",
+        "Q1J0",
+        "QFYC",
+        "RNQ0",
+        "VZ3G",
+        "Y8F1",
+        "YDNQ",
+        "ZHHH",
+        "1IWK",
+        "2M6Y",
+        "5A9K",
+        "5GXA",
+        "6KC0",
+        "6NSC",
+        "8XAW",
+        "B5UZ",
+        "BDTI",
+        "C38B",
+        "CYV6",
+        "DLEK",
+        "E4FG",
+        "E4YV",
+        "E88S",
+        "ECAK",
+        "ESZ8",
+        "GGZ5",
+        "GPHT",
+        "I39S",
+        "IBEM",
+        "LURL",
+        "NWJX",
+        "OH9O",
+        "OMUD",
+        "R3O0",
+        "RV48",
+        "S9UH",
+        "SH05",
+        "T0KK",
+        "TBG2",
+        "UMCR",
+        "V251",
+        "V816",
+        "WEUX",
+        "YXJ5",
+        "1PAD",
+        "3RHN",
+        "4OYE",
+        "6Z8B",
+        "D2T3",
+        "DEJ0",
+        "IUIY",
+        "KC51",
+        "KYVO",
+        "N1TE",
+        "SJB8",
+        "WX45",
+        "70NZ",
+        "A7G6",
+        "KNIC",
+        "N00R",
+        "YCQM",
+        "Z3Y2",
+        "4SFS",
+        "4Y4D",
+        "72BT",
+        "DUXT",
+        "E26K",
+        "EFE3",
+        "G5RR",
+        "H2BW",
+        "HSX9",
+        "KZMF",
+        "LQVG",
+        "M0X8",
+        "O4X3",
+        "P864",
+        "Q4J1",
+        "SBQF",
+        "SMWM",
+        "YFZL",
+        "YOIW",
+        "YP63",
+        "YW6W",
+        "YYZO",
+        "24EG",
+        "274G",
+        "28RA",
+        "2FED",
+        "3OW3",
+        "6Q6D",
+        "6RD2",
+        "8VRU",
+        "9D9U",
+        "9PZC",
+        "E9CM",
+        "EYKU",
+        "G5RH",
+        "IVVD",
+        "KP34",
+        "LUMA",
+        "MF7P",
+        "NRTG",
+        "OQWO",
+        "SPJ7",
+        "TSA0",
+        "XQLW",
+        "YA9S",
+        "ZFQS",
+        "ZMY8",
+        "1SVL",
+        "1T06",
+        "2J66",
+        "36AO",
+        "5OZV",
+        "9E0Q",
+        "ADF8",
+        "IHD0",
+        "KM1T",
+        "MZB1",
+        "SS3A",
+        "WV3I",
+        "ZKTC",
+        "1MBR",
+        "233U",
+        "8BL9",
+        "8VZ0",
+        "BCF5",
+        "FV0K",
+        "GLCH",
+        "HIL6",
+        "I8RE",
+        "INTY",
+        "K9L6",
+        "MYKG",
+        "P12B",
+        "P5JT",
+        "RCPI",
+        "T1JS",
+        "U24X",
+        "W86L",
+        "1JK6",
+        "2DK3",
+        "2N9X",
+        "3BX3",
+        "3G3D",
+        "3RMA",
+        "4A26",
+        "4OTK",
+        "4UB2",
+        "4YAK",
+        "5AP3",
+        "5KU5",
+        "6CQN",
+        "6D9L",
+        "6FAI",
+        "6OMW",
+        "747U",
+        "74W6",
+        "7OZQ",
+        "84J8",
+        "8K5T",
+        "917C",
+        "95G8",
+        "971Y",
+        "9HLU",
+        "9RVC",
+        "9XDB",
+        "AM3T",
+        "APEN",
+        "BL4B",
+        "C4Q2",
+        "C5FE",
+        "C7GZ",
+        "CATU",
+        "CD28",
+        "CHJR",
+        "CIO8",
+        "CUKQ",
+        "CZUA",
+        "D1VK",
+        "D35X",
+        "ET6Z",
+        "FIPS",
+        "FY1B",
+        "G2I3",
+        "H4XQ",
+        "H6WW",
+        "HQPK",
+        "HS5W",
+        "HSNC",
+        "HY6K",
+        "I32F",
+        "I68R",
+        "IQ9O",
+        "J8PB",
+        "JCAD",
+        "JJYB",
+        "KM6Z",
+        "LEDI",
+        "LJ92",
+        "LJL0",
+        "LPCQ",
+        "MAVU",
+        "MBUU",
+        "NI3I",
+        "NJ87",
+        "NPH3",
+        "NQHQ",
+        "O9PW",
+        "OVKW",
+        "P3YF",
+        "PFE5",
+        "PQJE",
+        "Q25I",
+        "QIEL",
+        "QJ0F",
+        "QJWK",
+        "QQ49",
+        "QS6A",
+        "R2XE",
+        "RBGQ",
+        "RHFQ",
+        "RP0E",
+        "SNWJ",
+        "T1FT",
+        "T3Q1",
+        "TNBA",
+        "U95A",
+        "UFDA",
+        "V6YH",
+        "VIE3",
+        "VQU7",
+        "WJ30",
+        "WL83",
+        "WO0T",
+        "WUFK",
+        "WVZF",
+        "XG70",
+        "XRK7",
+        "Y18E",
+        "Z3BF",
+        "ZQO8",
+        "ZU32",
+        "1MWR",
+        "37UT",
+        "40R4",
+        "599X",
+        "5QS7",
+        "7WRN",
+        "9KSX",
+        "D4PU",
+        "F7JY",
+        "FUKI",
+        "FW7S",
+        "GFXN",
+        "GULL",
+        "H8VP",
+        "LWOD",
+        "NUL8",
+        "PIOI",
+        "PMJW",
+        "PZ6Y",
+        "TB2C",
+        "UA1O",
+        "WU7R",
+        "ZRPO",
+        "3ZBR",
+        "8WQ9",
+        "B35X",
+        "DQAU",
+        "K4CD",
+        "LSWY",
+        "SWO8",
+        "T4LC",
+        "6TPE",
+        "FKVG",
+        "J3T2",
+        "N9QH",
+        "XOAD",
+        "1NKP",
+        "3UPJ",
+        "6I0P",
+        "752Q",
+        "8ZQE",
+        "9LJA",
+        "CKOS",
+        "GA3A",
+        "I1UP",
+        "J34T",
+        "JC0Y",
+        "LA47",
+        "LVEQ",
+        "PMOF",
+        "PRTB",
+        "RXTT",
+        "VSEV",
+        "1AFG",
+        "1YIR",
+        "2RK5",
+        "37GR",
+        "4H61",
+        "5WI2",
+        "6PEQ",
+        "760X",
+        "883O",
+        "8HGS",
+        "8WJ7",
+        "97PB",
+        "9AUC",
+        "AUPV",
+        "BKQO",
+        "BKVI",
+        "BQ19",
+        "C51L",
+        "DAFV",
+        "DKUW",
+        "DL9Z",
+        "DMT8",
+        "EDN7",
+        "EDZP",
+        "EE90",
+        "EMC8",
+        "HBR3",
+        "HEOB",
+        "HNWB",
+        "HTT9",
+        "IX7U",
+        "IYF9",
+        "JI3A",
+        "K09E",
+        "K2G8",
+        "K6VE",
+        "KHI5",
+        "L7XJ",
+        "LBQS",
+        "MBPY",
+        "MRW9",
+        "N3LC",
+        "NV7C",
+        "OXLO",
+        "PPMX",
+        "R39F",
+        "R5ZC",
+        "R6UB",
+        "SDPE",
+        "SJL9",
+        "SKGX",
+        "SQS1",
+        "SUHV",
+        "T31U",
+        "T3K4",
+        "TZ1U",
+        "UAV1",
+        "UMF0",
+        "UXEW",
+        "V0TJ",
+        "V42B",
+        "VKKN",
+        "VOTI",
+        "XGKW",
+        "XJH3",
+        "YK5G",
+        "Z38E",
+        "ZMTL",
+        "157O",
+        "1B88",
+        "1GNM",
+        "1L24",
+        "1NF1",
+        "1Q16",
+        "1Y0C",
+        "211B",
+        "29FA",
+        "2N4L",
+        "2NL6",
+        "2ONM",
+        "2WMP",
+        "2XIK",
+        "34QS",
+        "3AZY",
+        "3FCU",
+        "3NJL",
+        "3OK3",
+        "3S6E",
+        "3XTE",
+        "487E",
+        "491H",
+        "4DZU",
+        "4H0F",
+        "4JS0",
+        "4RT7",
+        "4TNX",
+        "4VD7",
+        "59F9",
+        "5AJO",
+        "5H68",
+        "5K0Q",
+        "5VCF",
+        "61WE",
+        "66JQ",
+        "6CHY",
+        "6CJJ",
+        "6DYI",
+        "6IIE",
+        "6KWU",
+        "6RUE",
+        "6SYJ",
+        "6YHU",
+        "74HH",
+        "7O94",
+        "7SZH",
+        "7UHA",
+        "82QO",
+        "87VO",
+        "8FZW",
+        "8G07",
+        "8GTU",
+        "8II5",
+        "8IWA",
+        "8LX5",
+        "8OKM",
+        "8R2G",
+        "8TYA",
+        "8VDW",
+        "8VWR",
+        "8WH8",
+        "8XDK",
+        "94WO",
+        "97PZ",
+        "9HC8",
+        "9KU7",
+        "9N1F",
+        "9O0S",
+        "9T5S",
+        "A0VZ",
+        "AHBR",
+        "AMFI",
+        "B645",
+        "B7I7",
+        "BAK2",
+        "BAUQ",
+        "BDDP",
+        "BEWI",
+        "BRGA",
+        "BYZF",
+        "C42J",
+        "C4D7",
+        "CAX5",
+        "CBO2",
+        "CF56",
+        "CNSS",
+        "CNXL",
+        "CQJI",
+        "CVH6",
+        "D2I2",
+        "DEG4",
+        "DRQM",
+        "DTAX",
+        "DWYD",
+        "DXQH",
+        "E0YF",
+        "E6YB",
+        "EABD",
+        "EAC8",
+        "ECUL",
+        "EVYY",
+        "EYRI",
+        "F0B6",
+        "F6SZ",
+        "F72Z",
+        "F8UD",
+        "F93F",
+        "FBYB",
+        "FEEA",
+        "FFQL",
+        "FKG2",
+        "FOUY",
+        "FY0F",
+        "FYBN",
+        "G7Z2",
+        "G8LP",
+        "G98S",
+        "GFN6",
+        "GJJJ",
+        "GLN8",
+        "GQV4",
+        "GXL6",
+        "GZCQ",
+        "H1U2",
+        "H3Z4",
+        "H3ZD",
+        "H4VR",
+        "HA3N",
+        "HATI",
+        "HC8N",
+        "HF2L",
+        "HMEI",
+        "HSYZ",
+        "I0MH",
+        "I8TE",
+        "IAP3",
+        "IC8G",
+        "IC98",
+        "IF7H",
+        "IGSV",
+        "IQR2",
+        "J9OZ",
+        "JBIQ",
+        "JFET",
+        "JIYK",
+        "JM1W",
+        "JMO0",
+        "JN2P",
+        "JR7T",
+        "JU82",
+        "K39X",
+        "K5KA",
+        "K65D",
+        "K69X",
+        "K7XQ",
+        "K99N",
+        "KBEQ",
+        "KCN5",
+        "KFR1",
+        "KMPN",
+        "KQH7",
+        "KS9B",
+        "KWI4",
+        "L25Z",
+        "L6QO",
+        "LARO",
+        "LGME",
+        "LU8S",
+        "LUIN",
+        "M1BJ",
+        "M673",
+        "MG2O",
+        "MMA4",
+        "MOUL",
+        "MQPZ",
+        "MQU9",
+        "MX8J",
+        "NBA8",
+        "NFCV",
+        "NM07",
+        "NOI8",
+        "NQCT",
+        "NUMY",
+        "OAGA",
+        "OIQA",
+        "OLJ1",
+        "OSLZ",
+        "OWUN",
+        "P3J5",
+        "P714",
+        "PESN",
+        "PL6V",
+        "PWKL",
+        "PZLG",
+        "Q2A1",
+        "Q634",
+        "Q8E2",
+        "QCWO",
+        "QU3G",
+        "QUB4",
+        "QV2O",
+        "QVPB",
+        "R0B6",
+        "R1JO",
+        "R59A",
+        "R6WQ",
+        "RD0Z",
+        "RFWH",
+        "RNJZ",
+        "RNSB",
+        "RT39",
+        "RT6Y",
+        "RWMC",
+        "S0X8",
+        "S82R",
+        "SMZ6",
+        "SOXQ",
+        "SSHN",
+        "SWPX",
+        "SZ63",
+        "T25Y",
+        "TGRE",
+        "TNPO",
+        "TOL2",
+        "TPNT",
+        "TUE5",
+        "UFM7",
+        "UHKH",
+        "UQRY",
+        "UUT8",
+        "UV02",
+        "UZY3",
+        "V1Z5",
+        "V5SV",
+        "V6G1",
+        "V9QP",
+        "VBC7",
+        "VBQP",
+        "VD7Z",
+        "VJV5",
+        "VO18",
+        "VTFS",
+        "W3LD",
+        "W4G1",
+        "WGCY",
+        "WXNU",
+        "X78I",
+        "XH8C",
+        "XK4T",
+        "XPX6",
+        "XQBA",
+        "Y1W1",
+        "Y4VA",
+        "Y7G8",
+        "Y8WC",
+        "YADL",
+        "YHI5",
+        "YJM5",
+        "YUCL",
+        "YX4E",
+        "Z0JP",
+        "Z2FQ",
+        "Z5WG",
+        "Z9K8",
+        "ZECH",
+        "ZM5P",
+        "ZPEZ",
+        "ZQ9B",
+        "ZQIT",
+        "ZXHJ",
+        "ZY9X",
+        "ZZ0X",
+        "13AV",
+        "2HBR",
+        "2YZO",
+        "40DB",
+        "63KS",
+        "6QQB",
+        "79H0",
+        "7J3S",
+        "8CM0",
+        "8Z6G",
+        "9JGX",
+        "AMKW",
+        "AZFE",
+        "D40E",
+        "FR3V",
+        "JMVF",
+        "JNDX",
+        "OL20",
+        "QZ3L",
+        "SCE1",
+        "SGST",
+        "SQKS",
+        "SUA1",
+        "T0YJ",
+        "US8E",
+        "V2YH",
+        "XLWA",
+        "YA01",
+        "YJ4C",
+        "4HD1",
+        "56NA",
+        "I0X7",
+        "J5RC",
+        "PH5T",
+        "T69Z",
+        "VBJW",
+        "W9ZD",
+        "WP5I",
+        "XWPT",
+        "7U4R",
+        "CB98",
+        "GCCT",
+        "M4TI",
+        "QFLH",
+        "TKPE",
+        "UUYB",
+        "VJRL",
+        "WBKH",
+        "Y8CL",
+        "3RHO",
+        "54AL",
+        "CQ5X",
+        "H6OR",
+        "HKVP",
+        "J3VJ",
+        "JYKN",
+        "L6IY",
+        "L8D6",
+        "MCWR",
+        "QCA0",
+        "QNWW",
+        "QSYQ",
+        "TIZ2",
+        "UCU5",
+        "VKSR",
+        "W2NK",
+        "5I7B",
+        "GNYB",
+        "KJ1Y",
+        "TMK1",
+        "U5RF",
+        "YB1Q",
+        "YNEH",
+        "F0IC",
+        "GY0L",
+        "RK88",
+        "W9T7",
+        "XH5R",
+        "BVOE",
+        "UO3D",
+        "1Q2B",
+        "NDC3",
+        "UY66",
+        "2AUN",
+        "4C0J",
+        "75XK",
+        "9XFK",
+        "E6J3",
+        "MCQP",
+        "NGR5",
+        "OT3Y",
+        "Q49K",
+        "QJBA",
+        "YVZD",
+        "12F9",
+        "6ETM",
+        "E7JZ",
+        "JUDZ",
+        "O2M6",
+        "RF41",
+        "XE7O",
+        "254M",
+        "2QMJ",
+        "85VD",
+        "E1SE",
+        "EPG7",
+        "KSUS",
+        "N3VO",
+        "S2E3",
+        "UDG6",
+        "XPE5",
+        "2A44",
+        "2LB5",
+        "4C5L",
+        "4QRE",
+        "4WV7",
+        "876R",
+        "8UEG",
+        "8UMK",
+        "8VH3",
+        "995K",
+        "BJ8Q",
+        "BKUX",
+        "BMYJ",
+        "BSK1",
+        "DN6F",
+        "DPY1",
+        "EO9F",
+        "ESTU",
+        "HTJD",
+        "J6MO",
+        "LNY0",
+        "M1DW",
+        "NZAI",
+        "OII5",
+        "P9F2",
+        "QYV5",
+        "S3DA",
+        "TQ3O",
+        "TSVO",
+        "UD8K",
+        "V3LT",
+        "X0SX",
+        "XW5U",
+        "Y64R",
+        "ZQAQ",
+        "2OJP",
+        "8T79",
+        "CMHQ",
+        "E4KB",
+        "M8SS",
+        "180P",
+        "2DVA",
+        "2Y95",
+        "36YD",
+        "3VSP",
+        "4QIE",
+        "70GJ",
+        "8ZLF",
+        "9ME5",
+        "A0PS",
+        "DDKQ",
+        "DW2W",
+        "EX8U",
+        "FC7L",
+        "FPZK",
+        "HBQK",
+        "I47Z",
+        "JKJX",
+        "K361",
+        "K4OX",
+        "KJ0B",
+        "NBCI",
+        "NFPC",
+        "OYDA",
+        "QCSO",
+        "U5S6",
+        "U8NM",
+        "VX5J",
+        "W0G7",
+        "W9FI",
+        "X4IT",
+        "XTZG",
+        "YSP9",
+        "72I6",
+        "B8VT",
+        "BJT3",
+        "HELT",
+        "JAJS",
+        "UD1V",
+        "V05A",
+        "XFHP",
+        "2GV9",
+        "363J",
+        "54SK",
+        "5AX8",
+        "9BPE",
+        "C58S",
+        "DWS3",
+        "FF1D",
+        "HNJK",
+        "JXDX",
+        "KMFX",
+        "LGWG",
+        "LMIM",
+        "LZIC",
+        "MNQ7",
+        "URQH",
+        "VYAX",
+        "ZJS8",
+        "1G26",
+        "5ABK",
+        "CDXK",
+        "EMLA",
+        "FI4M",
+        "FMPL",
+        "G4V6",
+        "JHC4",
+        "M44Y",
+        "OESH",
+        "QZTT",
+        "SAI8",
+        "SP9F",
+        "TE79",
+        "TQ3Z",
+        "TV5P",
+        "VC3E",
+        "ZGPY",
+        "135L",
+        "1RI9",
+        "1TON",
+        "2J7Z",
+        "2SZI",
+        "2XXH",
+        "5ODO",
+        "634M",
+        "70X0",
+        "75WC",
+        "8AXV",
+        "8GU1",
+        "9KGS",
+        "ADAZ",
+        "ARJF",
+        "B5TO",
+        "BL52",
+        "C1IC",
+        "CGSO",
+        "CTNS",
+        "DCRK",
+        "DLS4",
+        "DSSD",
+        "H7D4",
+        "HN75",
+        "IMHA",
+        "K021",
+        "K26L",
+        "KCHO",
+        "KCSG",
+        "KXZT",
+        "L1ZJ",
+        "LHBB",
+        "LZZD",
+        "NDEW",
+        "OQ8C",
+        "OV32",
+        "P418",
+        "PHMS",
+        "QRZJ",
+        "RWZD",
+        "SBQN",
+        "SSP9",
+        "T2X1",
+        "VA1V",
+        "VDRB",
+        "VUPE",
+        "W2PE",
+        "W9SC",
+        "WPED",
+        "WRU2",
+        "X32V",
+        "X62Z",
+        "ZG6S",
+        "ZU9S",
+        "ZZOG",
+        "7ZU4",
+        "EBRQ",
+        "HCBE",
+        "N97C",
+        "PFY0",
+        "TLCB",
+        "WVQN",
+        "2NRQ",
+        "5MVV",
+        "7QQ0",
+        "DYQK",
+        "IUVI",
+        "MXMH",
+        "N3JU",
+        "R4LR",
+        "T417",
+        "VQLD",
+        "21F4",
+        "33IP",
+        "40A7",
+        "7RZH",
+        "JOX1",
+        "LO9A",
+        "SQXV",
+        "UBWU",
+        "2R82",
+        "6B39",
+        "6KSC",
+        "9NBN",
+        "BL60",
+        "FZAC",
+        "IXQK",
+        "SAST",
+        "12KO",
+        "5RCH",
+        "AHJG",
+        "AKF5",
+        "AXEQ",
+        "BW92",
+        "EO0G",
+        "GF7G",
+        "J3U5",
+        "QU16",
+        "UDJG",
+        "UGVB",
+        "VTH4",
+        "WUJC",
+        "3YUD",
+        "B56A",
+        "CRX3",
+        "D37H",
+        "OZDY",
+        "Q22D",
+        "QZEN",
+        "T2X0",
+        "W5H8",
+        "W7KV",
+        "1IPK",
+        "3LCY",
+        "5ULL",
+        "AZTM",
+        "BS22",
+        "ES2D",
+        "VJBO",
+        "CD8F",
+        "K6G7",
+        "S02Y",
+        "S779",
+        "1DGT",
+        "1SOY",
+        "32HC",
+        "53QF",
+        "7RRP",
+        "ANSR",
+        "BSZ8",
+        "IF49",
+        "K98U",
+        "NDID",
+        "TMU1",
+        "TV8Y",
+        "WAK8",
+        "Y8LH",
+        "13T9",
+        "4ZF3",
+        "5BY2",
+        "5CIE",
+        "5TA8",
+        "6JDN",
+        "81KA",
+        "A2GC",
+        "A338",
+        "BGPJ",
+        "BPLS",
+        "DLCX",
+        "E4HU",
+        "F2TQ",
+        "F2ZF",
+        "HGMH",
+        "HJ1Y",
+        "K4GR",
+        "KWBA",
+        "LUGM",
+        "LUOA",
+        "NVPY",
+        "Q4A3",
+        "Q8UI",
+        "QG9Y",
+        "QRXD",
+        "SFK9",
+        "SFYA",
+        "UHNL",
+        "WQRG",
+        "X8J8",
+        "YRXK",
+        "2IGL",
+        "2JEI",
+        "2S2U",
+        "5DWL",
+        "5GGB",
+        "63P9",
+        "68J6",
+        "7SIZ",
+        "81G5",
+        "9C91",
+        "AIR5",
+        "ATQY",
+        "BEAN",
+        "BKAB",
+        "DVXS",
+        "EUT4",
+        "FG84",
+        "HHR4",
+        "JIWD",
+        "LCR0",
+        "SQ1A",
+        "STBC",
+        "U8KA",
+        "UDY2",
+        "V19Y",
+        "V5OS",
+        "V7QY",
+        "WCEP",
+        "ZFFA",
+        "7OYN",
+        "SP51",
+        "SV3F",
+        "XEOV",
+        "2SPI",
+        "6HT0",
+        "95AW",
+        "JH78",
+        "LA66",
+        "MEHL",
+        "NO8C",
+        "NY3P",
+        "OO14",
+        "P0LR",
+        "P0TZ",
+        "PBQH",
+        "PWX8",
+        "QOO6",
+        "S7R4",
+        "SP0A",
+        "T5HS",
+        "T635",
+        "TGWE",
+        "TXCW",
+        "ZWYK",
+        "3U3Y",
+        "9QHJ",
+        "BVJ0",
+        "C061",
+        "CR7N",
+        "DJ2D",
+        "F5X7",
+        "J4S1",
+        "JOZN",
+        "V89C",
+        "YB0U",
+        "DSII",
+        "EZL8",
+        "S69C",
+        "UW1C",
+        "4AJY",
+        "6M6Z",
+        "AOS4",
+        "B0LD",
+        "BVPF",
+        "G7H0",
+        "J76S",
+        "JWWT",
+        "O786",
+        "RJYT",
+        "RTVE",
+        "S2J1",
+        "XXCZ",
+        "ZTUI",
+        "23XJ",
+        "2LNV",
+        "2NAI",
+        "2RVP",
+        "31N9",
+        "3WVI",
+        "449I",
+        "4HBI",
+        "5AWU",
+        "5K70",
+        "6EYT",
+        "761Z",
+        "776G",
+        "784B",
+        "7G15",
+        "7H63",
+        "7L83",
+        "7PKK",
+        "8AGD",
+        "8M3D",
+        "8MY7",
+        "8QZA",
+        "8RRB",
+        "8ZUV",
+        "96OC",
+        "A2A8",
+        "ANXC",
+        "AOKU",
+        "B3WQ",
+        "B8CE",
+        "BFIV",
+        "BOF1",
+        "C4Z4",
+        "CAF9",
+        "COVJ",
+        "CU5R",
+        "CU68",
+        "DBU3",
+        "DHY2",
+        "DNF1",
+        "DU8H",
+        "E0YZ",
+        "EHWD",
+        "F3L5",
+        "FVTS",
+        "G3JV",
+        "G522",
+        "G73Q",
+        "GNNT",
+        "GW1T",
+        "GXBE",
+        "H725",
+        "HKWO",
+        "ICXT",
+        "IWNQ",
+        "JGV1",
+        "JN6Y",
+        "JRAQ",
+        "JSTL",
+        "JZ1I",
+        "L2MQ",
+        "L9JC",
+        "LBPW",
+        "LJTR",
+        "LOB9",
+        "LVRX",
+        "M0SL",
+        "M44Q",
+        "MAM6",
+        "MB35",
+        "N0JF",
+        "N124",
+        "NA09",
+        "NHBK",
+        "NSZI",
+        "O15R",
+        "OZ3O",
+        "P28E",
+        "P7VS",
+        "P8D7",
+        "PG49",
+        "Q7WY",
+        "QAUY",
+        "QM7Z",
+        "QZB4",
+        "R8PY",
+        "RCE0",
+        "RCJS",
+        "RKLI",
+        "RQDD",
+        "RR3L",
+        "S6M8",
+        "S8DM",
+        "SKO4",
+        "TPJZ",
+        "TTIF",
+        "TYW0",
+        "U77P",
+        "U901",
+        "UBV0",
+        "VATV",
+        "VIOQ",
+        "VN3F",
+        "W9WS",
+        "X9J8",
+        "XDGC",
+        "XEN5",
+        "XLVZ",
+        "XSZY",
+        "YRI0",
+        "ZAIS",
+        "ZXVG",
+        "528Z",
+        "CWTQ",
+        "DA06",
+        "GWZF",
+        "TU6A",
+        "X7W6",
+        "33MN",
+        "4QXM",
+        "54M6",
+        "5WU6",
+        "62Y3",
+        "9AAK",
+        "A0W7",
+        "B5PM",
+        "BBEB",
+        "CODH",
+        "DEO1",
+        "EZQW",
+        "GNXT",
+        "JHK5",
+        "L7HX",
+        "M1IZ",
+        "NFFH",
+        "UNJ2",
+        "V44D",
+        "Y3ZB",
+        "4LEA",
+        "F7KI",
+        "P2R9",
+        "Z6ZU",
+        "149O",
+        "DTIU",
+        "HEXO",
+        "JCK1",
+        "KHAB",
+        "KXDY",
+        "VPFY",
+        "XH7Z",
+        "326Y",
+        "3C7U",
+        "3L58",
+        "4ZRR",
+        "50TD",
+        "5ZTZ",
+        "8S9H",
+        "9DI1",
+        "AEV1",
+        "BJ65",
+        "CF5L",
+        "DRPL",
+        "EXD7",
+        "FSBD",
+        "GYY6",
+        "IQGE",
+        "K5P8",
+        "LJJW",
+        "M9IQ",
+        "O0EU",
+        "O7LB",
+        "PB3V",
+        "Q0Q1",
+        "R71C",
+        "V06W",
+        "YI42",
+        "YTMC",
+        "ZQ0Q",
+        "4XMS",
+        "7IYW",
+        "88OX",
+        "LH0Q",
+        "MOI8",
+        "QR25",
+        "RKYF",
+        "VQV6",
+        "XBK3",
+        "6TPA",
+        "BSN7",
+        "GDT9",
+        "JS13",
+        "PY5Y",
+        "UNCO",
+        "V5VG",
+        "VIMA",
+        "6UED",
+        "WHCV",
+        "ZE1G",
+        "48X2",
+        "4QBB",
+        "78SG",
+        "IJAO",
+        "K08V",
+        "LNG8",
+        "1MQ6",
+        "37G2",
+        "3LHF",
+        "4LCX",
+        "649C",
+        "73C0",
+        "AABQ",
+        "CHX6",
+        "H8G2",
+        "I695",
+        "P53M",
+        "PKRY",
+        "QQWG",
+        "RFJT",
+        "YMBC",
+        "76ME",
+        "IODM",
+        "KJOW",
+        "SPX9",
+        "WHGH",
+        "ZJEX",
+        "13ZV",
+        "3BJG",
+        "5F76",
+        "60BG",
+        "629I",
+        "6LUM",
+        "6OYI",
+        "85PM",
+        "8TOF",
+        "96XK",
+        "AL9T",
+        "B21W",
+        "BSJT",
+        "CY1M",
+        "EU0T",
+        "F21U",
+        "FANM",
+        "FJ0E",
+        "FQ5Y",
+        "GZE5",
+        "H7OD",
+        "HOT8",
+        "J3A3",
+        "JCKO",
+        "KM66",
+        "LT9U",
+        "O7XB",
+        "OMX0",
+        "P1L1",
+        "QUX1",
+        "QYL4",
+        "RBHP",
+        "RUCO",
+        "SMIS",
+        "SP4S",
+        "SVA3",
+        "T7PB",
+        "WNX1",
+        "WOK7",
+        "WUJ2",
+        "YLZL",
+        "ZVVM",
+        "ZZKE",
+        "1HGD",
+        "5KVH",
+        "68PD",
+        "6IK8",
+        "6L6P",
+        "99JD",
+        "A8CT",
+        "ALPT",
+        "D7OA",
+        "DFE5",
+        "IX01",
+        "KUUV",
+        "MFHR",
+        "N66B",
+        "NIQY",
+        "OXUC",
+        "P5S3",
+        "PIDC",
+        "QFXD",
+        "USOG",
+        "V6YL",
+        "VF4C",
+        "W9W3",
+        "XD16",
+        "XMXM",
+        "YMLD",
+        "Z0NE",
+        "ZILA",
+        "ZSWE",
+        "IKBN",
+        "Z7ZX",
+        "194I",
+        "1TG4",
+        "35RF",
+        "3QX8",
+        "4XY9",
+        "6DE6",
+        "7JAI",
+        "81YI",
+        "87N3",
+        "9EGO",
+        "A4MM",
+        "BQ6L",
+        "C907",
+        "D5L6",
+        "D8XQ",
+        "DE7H",
+        "E85L",
+        "EQQP",
+        "ERUM",
+        "GCP3",
+        "GL33",
+        "GRH5",
+        "I1WG",
+        "I6FV",
+        "INDH",
+        "JJ1V",
+        "ME4Y",
+        "O2JM",
+        "O4QG",
+        "O8XV",
+        "RA5B",
+        "SOQ1",
+        "SQXC",
+        "T2JS",
+        "TEGV",
+        "TPFL",
+        "UL6C",
+        "VKSV",
+        "W6NI",
+        "XK6L",
+        "XUYT",
+        "Y21X",
+        "Y3T2",
+        "Y7LW",
+        "YS16",
+        "ADV0",
+        "B4L0",
+        "KHBL",
+        "OR18",
+        "QZ84",
+        "RN1W",
+        "W50Q",
+        "1CDX",
+        "37II",
+        "4V0A",
+        "5NCK",
+        "7B9H",
+        "7W9B",
+        "85K5",
+        "8FD2",
+        "AI01",
+        "ANDT",
+        "CTBD",
+        "CUGP",
+        "DUGD",
+        "EFBR",
+        "F0BK",
+        "F68H",
+        "FJQ8",
+        "GT4V",
+        "I15K",
+        "I9BB",
+        "NFRJ",
+        "SWMK",
+        "TH8A",
+        "UWEE",
+        "V0FL",
+        "XHN1",
+        "15A2",
+        "17R7",
+        "1MJ0",
+        "1RJ2",
+        "1U7Y",
+        "24TU",
+        "2H36",
+        "2OTW",
+        "2R46",
+        "37YG",
+        "3AMJ",
+        "3EAX",
+        "3F98",
+        "3TOV",
+        "3U8X",
+        "4PZX",
+        "4TYO",
+        "4VTZ",
+        "5VMR",
+        "6H83",
+        "8B9A",
+        "8JWV",
+        "8MQM",
+        "8NF7",
+        "8NZE",
+        "8RIH",
+        "8XDD",
+        "9M15",
+        "9RQZ",
+        "AS78",
+        "B5GH",
+        "BLVV",
+        "BQ3A",
+        "BZQL",
+        "C3RQ",
+        "C7TI",
+        "CKTA",
+        "CN7I",
+        "D094",
+        "D84J",
+        "DO25",
+        "DZSY",
+        "E0VI",
+        "EH3M",
+        "EWQF",
+        "FWGK",
+        "FZKX",
+        "G2CW",
+        "GHC5",
+        "GQRJ",
+        "GWHK",
+        "GZF9",
+        "H2AF",
+        "H2P4",
+        "H4NY",
+        "HKKL",
+        "HUET",
+        "HUR1",
+        "I9O1",
+        "I9V2",
+        "IBSS",
+        "IC46",
+        "ILY0",
+        "J18N",
+        "J7NW",
+        "JPMQ",
+        "JZBN",
+        "KLA2",
+        "KOYR",
+        "KVSH",
+        "KZC6",
+        "LLL8",
+        "LYTH",
+        "MG22",
+        "MT3A",
+        "MV1C",
+        "MVSF",
+        "NRK9",
+        "NZ85",
+        "O1KO",
+        "OCIS",
+        "OPLQ",
+        "OVLN",
+        "P9CF",
+        "PA5X",
+        "PDYW",
+        "PJRZ",
+        "Q9FA",
+        "QCRH",
+        "QFGM",
+        "QKFU",
+        "QMEH",
+        "QQS1",
+        "QSXT",
+        "QUMQ",
+        "R71T",
+        "RJUK",
+        "SDVV",
+        "SIPP",
+        "TLDB",
+        "TMIG",
+        "UTBN",
+        "UY49",
+        "VA0A",
+        "VAB6",
+        "VE1P",
+        "VEOU",
+        "VEX5",
+        "VIGZ",
+        "VOUU",
+        "WJXS",
+        "WYNO",
+        "XBRI",
+        "XIGI",
+        "XINV",
+        "XJJR",
+        "XNKN",
+        "YA7H",
+        "YGHZ",
+        "YJ6A",
+        "Z2AQ",
+        "Z3SH",
+        "Z3Y0",
+        "ZGYA",
+        "ZH3O",
+        "ZKAF",
+        "ZNHF",
+        "29OB",
+        "AHRM",
+        "I93O",
+        "KYOI",
+        "WFYL",
+        "ZJZB",
+        "2F0A",
+        "4EP1",
+        "7Z3M",
+        "BXZH",
+        "EF4Y",
+        "H64R",
+        "HW77",
+        "I03S",
+        "I8G4",
+        "OTE3",
+        "10ST",
+        "1PWF",
+        "3QSG",
+        "5EKE",
+        "ABII",
+        "FG2L",
+        "I9K6",
+        "LCVA",
+        "QYZD",
+        "REVF",
+        "RY5B",
+        "S1OK",
+        "U5AR",
+        "XY6R",
+        "YN9Y",
+        "1RPE",
+        "7WL9",
+        "BCM3",
+        "M6YY",
+        "QWFD",
+        "SXY3",
+        "TOMA",
+        "78VH",
+        "B3JS",
+        "DW9N",
+        "N10C",
+        "PT6M",
+        "T2NA",
+        "TTE8",
+        "WHCI",
+        "YVGA",
+        "Z9IE",
+        "6UPM",
+        "73PZ",
+        "88TX",
+        "9O67",
+        "DEF6",
+        "E7W8",
+        "KIU5",
+        "YVPW",
+        "ZPOY",
+        "3YUS",
+        "6MS4",
+        "7QEH",
+        "7XUS",
+        "BB5Y",
+        "CDYY",
+        "E3YL",
+        "G6M8",
+        "H35I",
+        "H987",
+        "KGUS",
+        "KOFC",
+        "P3YJ",
+        "Q9VK",
+        "VA1X",
+        "WKFR",
+        "17FJ",
+        "2PHU",
+        "5SGV",
+        "KEMH",
+        "LWXI",
+        "1CSZ",
+        "2CC3",
+        "2UBX",
+        "52AV",
+        "66T3",
+        "8W32",
+        "B4OI",
+        "FBX9",
+        "FI9R",
+        "NWT1",
+        "SXX9",
+        "YXX0",
+        "14NU",
+        "189Q",
+        "1CSW",
+        "1GLU",
+        "1HEP",
+        "1K73",
+        "1W8B",
+        "2EEG",
+        "2KMA",
+        "2XNE",
+        "3P3W",
+        "43MZ",
+        "46CD",
+        "4CKX",
+        "4GX1",
+        "5AM3",
+        "5J5Y",
+        "5YBL",
+        "5Z8W",
+        "6R72",
+        "72R7",
+        "73MQ",
+        "7EG2",
+        "7O89",
+        "7QSE",
+        "8KHD",
+        "8RE3",
+        "8UE6",
+        "90YN",
+        "93WZ",
+        "95MS",
+        "9L9V",
+        "9NSV",
+        "AGSR",
+        "BKEB",
+        "BUMI",
+        "C4PZ",
+        "CS8B",
+        "D18J",
+        "DAQC",
+        "E1VK",
+        "E4CI",
+        "E9SH",
+        "ED84",
+        "ER02",
+        "F560",
+        "FDVU",
+        "FMUC",
+        "FQRE",
+        "GL07",
+        "GY5R",
+        "HZG7",
+        "HZI2",
+        "I7AS",
+        "ISCZ",
+        "IW8Z",
+        "J8DW",
+        "JKC5",
+        "KB52",
+        "KVQU",
+        "KWFE",
+        "KZ3R",
+        "L1M7",
+        "L9WT",
+        "MSGT",
+        "MY1S",
+        "N5MX",
+        "N7I1",
+        "N9QW",
+        "NC88",
+        "NL31",
+        "NLI7",
+        "NO20",
+        "O0Y2",
+        "O7TC",
+        "OKAZ",
+        "P6XJ",
+        "PX29",
+        "QACV",
+        "QCJ9",
+        "R9GT",
+        "RF3D",
+        "S5E1",
+        "SIRY",
+        "SMUS",
+        "SPIE",
+        "SQ4I",
+        "SQFW",
+        "STUP",
+        "SUH3",
+        "T0KQ",
+        "TAV3",
+        "TG3X",
+        "U3QQ",
+        "U5IM",
+        "U7QK",
+        "UCTO",
+        "VATN",
+        "VRJP",
+        "VSC1",
+        "VSZS",
+        "WQCR",
+        "XLXU",
+        "Y1X5",
+        "Y45Q",
+        "YB59",
+        "YF99",
+        "YGN4",
+        "YRIU",
+        "YVE8",
+        "YVWB",
+        "ZG2I",
+        "14AT",
+        "1OR3",
+        "2CTG",
+        "34PA",
+        "4A8T",
+        "5LXY",
+        "6MPY",
+        "8ER6",
+        "D64E",
+        "E01X",
+        "HJCS",
+        "I7MN",
+        "ICQT",
+        "JQA2",
+        "KBKD",
+        "KH4O",
+        "LNYR",
+        "M84A",
+        "OPDJ",
+        "Q2EV",
+        "QUEA",
+        "QW8S",
+        "QYQ5",
+        "RAX7",
+        "RG9Z",
+        "S1UI",
+        "SD81",
+        "TMVE",
+        "UDQJ",
+        "UESF",
+        "UG0E",
+        "WZ78",
+        "X94Z",
+        "8PIA",
+        "A7VA",
+        "YSBJ",
+        "Z4ZP",
+        "4YUU",
+        "CXWJ",
+        "GQVQ",
+        "J7L0",
+        "MZT6",
+        "R155",
+        "R59V",
+        "U89P",
+        "XE4Z",
+        "ZE81",
+        "1G29",
+        "1QU8",
+        "1SL4",
+        "1ZHJ",
+        "4S57",
+        "4SJR",
+        "5RDO",
+        "7U8O",
+        "8EHB",
+        "956I",
+        "9FPZ",
+        "A0J6",
+        "A97B",
+        "AJ9U",
+        "ARDP",
+        "AXS5",
+        "B0V5",
+        "BI3B",
+        "CUIH",
+        "DDES",
+        "DP3Q",
+        "FCJF",
+        "FH4R",
+        "GJL1",
+        "GJTL",
+        "HRQA",
+        "I2WU",
+        "IAS6",
+        "IT6N",
+        "JB2M",
+        "JTV5",
+        "K0RI",
+        "K6L9",
+        "MDOL",
+        "QMUM",
+        "R2L8",
+        "R6UT",
+        "S0Z5",
+        "S6MS",
+        "S6X7",
+        "SS0L",
+        "TDD5",
+        "TUHS",
+        "UJ35",
+        "VFIU",
+        "XYGP",
+        "8MS6",
+        "K4ZA",
+        "KJZ3",
+        "OBTO",
+        "QPC9",
+        "QWWY",
+        "R6BI",
+        "TCVB",
+        "WBWC",
+        "1TN0",
+        "2UAX",
+        "381R",
+        "54P7",
+        "9YIP",
+        "AZTO",
+        "BEAY",
+        "BYQJ",
+        "C61P",
+        "CX05",
+        "G04R",
+        "M0Y0",
+        "O1QI",
+        "OJ9I",
+        "PDQ0",
+        "RLJO",
+        "RYFP",
+        "SSOM",
+        "WZDB",
+        "XJHM",
+        "1BL5",
+        "1RKS",
+        "2B81",
+        "2JZ4",
+        "2WFG",
+        "2XJA",
+        "3EKS",
+        "54WI",
+        "5BEZ",
+        "7MNN",
+        "AZA0",
+        "BF9N",
+        "CQMY",
+        "DP2E",
+        "E0NE",
+        "FFTN",
+        "FJG4",
+        "FLNB",
+        "GP8M",
+        "H781",
+        "HX77",
+        "JB25",
+        "KJ9Q",
+        "L5DU",
+        "M848",
+        "MRSY",
+        "MVII",
+        "OBFU",
+        "QSI2",
+        "R9TC",
+        "TL87",
+        "UNA9",
+        "VPRH",
+        "W6A7",
+        "XJOT",
+        "YRGM",
+        "UZUP",
+        "ZQEN",
+        "AF67",
+        "F502",
+        "WSE1",
+        "YVSL",
+        "5T3H",
+        "JMQU",
+        "ONVA",
+        "R5UT",
+        "W2SQ",
+        "F8VX",
+        "JGNU",
+        "LOL8",
+        "MV4S",
+        "RWVW",
+        "WR09",
+        "4VPM",
+        "6H9F",
+        "9I58",
+        "9U6F",
+        "B13W",
+        "FE4G",
+        "GU5E",
+        "H8MU",
+        "HECG",
+        "KAEM",
+        "LZ3H",
+        "OSE2",
+        "PNX6",
+        "R2YL",
+        "VKZD",
+        "375P",
+        "3P03",
+        "46QC",
+        "70EO",
+        "AIR0",
+        "F3UE",
+        "RWX4",
+        "V2PA",
+        "VTIP",
+        "35BX",
+        "FHRL",
+        "GQ8F",
+        "HNPH",
+        "QJVN",
+        "UAES",
+        "Z3P8",
+        "17R0",
+        "1W62",
+        "468Q",
+        "4A3J",
+        "4GJI",
+        "55MA",
+        "57V7",
+        "5FRT",
+        "60IF",
+        "7T8N",
+        "7VVZ",
+        "8CF0",
+        "9B78",
+        "A2X8",
+        "AVYY",
+        "B6ES",
+        "BX6Y",
+        "C605",
+        "CDOT",
+        "E12O",
+        "FVGZ",
+        "G12F",
+        "H0PO",
+        "HHYT",
+        "HX6D",
+        "ID30",
+        "IYXU",
+        "JTCO",
+        "NAUO",
+        "NBTW",
+        "Q0M5",
+        "STX7",
+        "T61R",
+        "TT2H",
+        "TYJK",
+        "U6R9",
+        "UTY8",
+        "VV0W",
+        "VYF8",
+        "WBQU",
+        "WJ0A",
+        "XLZV",
+        "Z0EY",
+        "ZQ6S",
+        "ZZGG",
+        "380O",
+        "3MM4",
+        "62VJ",
+        "Z7ER",
+        "CR3H",
+        "CWRI",
+        "FIP8",
+        "HFGV",
+        "HN8W",
+        "JPZW",
+        "QUNR",
+        "V65U",
+        "WDT2",
+        "7GTR",
+        "7QKB",
+        "9A4Q",
+        "BRO8",
+        "C0VE",
+        "D4YS",
+        "EQAQ",
+        "K2BJ",
+        "M886",
+        "OVBT",
+        "TRS2",
+        "VXDE",
+        "WNKG",
+        "1T9S",
+        "5MNR",
+        "78H5",
+        "A9AW",
+        "D8PB",
+        "FGVH",
+        "IMDT",
+        "IVQQ",
+        "N69M",
+        "O85W",
+        "P24O",
+        "QEEJ",
+        "QUJ5",
+        "RSWJ",
+        "S68T",
+        "ST2Q",
+        "UGE3",
+        "VKPN",
+        "1K9U",
+        "EJX1",
+        "GD6J",
+        "JR6U",
+        "KGZ8",
+        "L2DM",
+        "M4FO",
+        "MJJZ",
+        "4JCS",
+        "5HQ4",
+        "5Y1L",
+        "7CDL",
+        "BADE",
+        "CVXK",
+        "EI4J",
+        "G1P6",
+        "H1UM",
+        "K7YU",
+        "KQXA",
+        "LYRX",
+        "N295",
+        "PZR6",
+        "SQ7B",
+        "1JXS",
+        "81WV",
+        "BC32",
+        "HLCG",
+        "I3Z9",
+        "L10T",
+        "LDHG",
+        "M64D",
+        "OWR6",
+        "PDLV",
+        "TOBE",
+        "WE9D",
+        "ZCHO",
+        "7W53",
+        "JKOT",
+        "L7HH",
+        "LIEA",
+        "LKQ2",
+        "SHCN",
+        "T5X4",
+        "T80N",
+        "WT0G",
+        "Y182",
+        "12N6",
+        "1HXP",
+        "4FSX",
+        "9ASJ",
+        "HZEH",
+        "JU79",
+        "MIPY",
+        "QF4W",
+        "T91T",
+        "TGMR",
+        "XTIQ",
+        "74LJ",
+        "9AQ8",
+        "CNQ3",
+        "IPGV",
+        "O35K",
+        "SQOE",
+        "TJ6V",
+        "VNIU",
+        "ZJPG",
+        "3LXM",
+        "3N55",
+        "5DS0",
+        "72CA",
+        "8N21",
+        "D155",
+        "E4LW",
+        "TRI2",
+        "6IIM",
+        "AD0H",
+        "ALW3",
+        "ASC7",
+        "EY94",
+        "GR2X",
+        "H5G0",
+        "MFYJ",
+        "S7VR",
+        "6MB6",
+        "982Z",
+        "9G8O",
+        "AQBO",
+        "B38Q",
+        "DX2N",
+        "FTNW",
+        "IWRC",
+        "L2QV",
+        "L5BO",
+        "M2KR",
+        "QJ1G",
+        "S0BB",
+        "SBF3",
+        "TTTV",
+        "VPBH",
+        "WMTY",
+        "YOUG",
+        "ZLIW",
+        "530K",
+        "EVE6",
+        "H1J5",
+        "JXUC",
+        "QLWR",
+        "RU6X",
+        "U9HL",
+        "UK9P",
+        "1WZP",
+        "22SC",
+        "8RLE",
+        "AZUK",
+        "COKS",
+        "F5VL",
+        "HSPI",
+        "QY7A",
+        "VUXH",
+        "YTY3",
+        "78PB",
+        "8Z76",
+        "95W7",
+        "9FD9",
+        "C639",
+        "D92T",
+        "DQBZ",
+        "EW9A",
+        "EZ08",
+        "G4YY",
+        "M1FY",
+        "N0YQ",
+        "P91Q",
+        "QR5I",
+        "R0BI",
+        "V5G5",
+        "V89I",
+        "VCQZ",
+        "X4EB",
+        "32AX",
+        "7XPF",
+        "8VLM",
+        "DU35",
+        "GDH0",
+        "HPKC",
+        "HUSW",
+        "L22N",
+        "T7D4",
+        "VVPD",
+        "VWY9",
+        "35QN",
+        "7U8S",
+        "AREY",
+        "CANT",
+        "F9I4",
+        "FBN0",
+        "FEC4",
+        "FGT5",
+        "GCU5",
+        "JIF7",
+        "VBVM",
+        "WC8Q",
+        "X4TB",
+        "XQEC",
+        "3MMY",
+        "5RRE",
+        "6GEC",
+        "85YQ",
+        "A9VQ",
+        "DAVB",
+        "EBP8",
+        "F2QV",
+        "HH12",
+        "LU9O",
+        "MBKN",
+        "MY61",
+        "NJ57",
+        "O5PH",
+        "OFGO",
+        "QWPR",
+        "T362",
+        "VE28",
+        "1V0I",
+        "6DVA",
+        "6EDK",
+        "6R7O",
+        "8PUO",
+        "9L6B",
+        "C1F4",
+        "CD9O",
+        "EO9A",
+        "HQYG",
+        "LTKC",
+        "MQU4",
+        "N71W",
+        "NI44",
+        "NV9X",
+        "O6QP",
+        "ONJ1",
+        "Q8RV",
+        "SJKV",
+        "TDBW",
+        "TZDZ",
+        "WP6R",
+        "XFUO",
+        "Z016",
+        "ZQZW",
+        "2XXG",
+        "53DC",
+        "5KRB",
+        "AT9F",
+        "IIZ4",
+        "JR3Z",
+        "M9A1",
+        "P1VP",
+        "TTB3",
+        "BSLM",
+        "EW8U",
+        "GMFE",
+        "HLR4",
+        "J5NM",
+        "JJ9M",
+        "LKD5",
+        "OCVJ",
+        "R2PI",
+        "XHT1",
+        "ZVS9",
+        "1XME",
+        "672E",
+        "6I75",
+        "7G8G",
+        "BE3O",
+        "BYFU",
+        "CAGH",
+        "G76T",
+        "GOGQ",
+        "KU3O",
+        "NETO",
+        "QX9N",
+        "R7QO",
+        "YP04",
+        "Z73Z",
+        "ZJTK",
+        "47LQ",
+        "58N0",
+        "6E4G",
+        "6RZK",
+        "88XU",
+        "HQJV",
+        "IN4H",
+        "LJH5",
+        "MI0H",
+        "NK3V",
+        "NR96",
+        "TPO4",
+        "U7HC",
+        "UJZB",
+        "XTOF",
+        "1ASH",
+        "1ONH",
+        "37F5",
+        "43LY",
+        "6VCW",
+        "6ZAR",
+        "8OK2",
+        "9HKD",
+        "9I4Y",
+        "BQRL",
+        "DEMP",
+        "IYZI",
+        "LDBS",
+        "OXAZ",
+        "S2K8",
+        "S968",
+        "SGT8",
+        "T4OL",
+        "TBN1",
+        "TS1K",
+        "UJ49",
+        "VSDJ",
+        "7WQO",
+        "8YBQ",
+        "BG8P",
+        "HDOD",
+        "NDBR",
+        "O4NK",
+        "U7GR",
+        "WPCN",
+        "XST3",
+        "1ADA",
+        "21OE",
+        "7F5B",
+        "9BH2",
+        "EMLK",
+        "J1JO",
+        "KC7Z",
+        "QSHG",
+        "R8SH",
+        "SU5T",
+        "U7OR",
+        "1S9L",
+        "1XOG",
+        "30PQ",
+        "30TX",
+        "40SO",
+        "5AE9",
+        "5MRP",
+        "7OS8",
+        "93CA",
+        "9OSW",
+        "9STD",
+        "A770",
+        "AEK0",
+        "B2F4",
+        "HEMZ",
+        "JGPP",
+        "KPH8",
+        "L1PM",
+        "LPLY",
+        "LXI4",
+        "MY93",
+        "OOX5",
+        "PNF3",
+        "Q6K2",
+        "QB0A",
+        "SCX8",
+        "SW88",
+        "T91C",
+        "WRF9",
+        "XVC6",
+        "3GTV",
+        "4TMV",
+        "4WTP",
+        "5OET",
+        "639V",
+        "6ICB",
+        "7BQ5",
+        "8APW",
+        "8HNT",
+        "B843",
+        "BJ2V",
+        "CXIO",
+        "D2MO",
+        "DFPP",
+        "ECLT",
+        "GEXT",
+        "HV3B",
+        "IOWN",
+        "KFPS",
+        "LQZC",
+        "MPFG",
+        "NGZJ",
+        "O256",
+        "Q17J",
+        "R22H",
+        "R3J6",
+        "R7JP",
+        "RH6N",
+        "T172",
+        "V4RX",
+        "VYEO",
+        "XBKP",
+        "XUVE",
+        "Y7BG",
+        "YQDQ",
+        "YWK0",
+        "ZEZ2",
+        "62L3",
+        "7K6U",
+        "8WM4",
+        "HCTP",
+        "IY8C",
+        "K3J6",
+        "MM8M",
+        "SUEQ",
+        "Y9F2",
+        "2JB4",
+        "3LNE",
+        "520I",
+        "6M6O",
+        "9M2Q",
+        "G66U",
+        "OJ9K",
+        "P3LZ",
+        "RCNI",
+        "S97G",
+        "W1DV",
+        "7HY7",
+        "FFBM",
+        "G42I",
+        "N508",
+        "P7RH",
+        "T4M6",
+        "VWC5",
+        "XSNP",
+        "4YOA",
+        "7GMS",
+        "F69V",
+        "POG3",
+        "VG3S",
+        "W0U4",
+        "Y1ZD",
+        "4VH5",
+        "51RC",
+        "BO6L",
+        "EPCY",
+        "M0ER",
+        "PJ10",
+        "SDX0",
+        "XIZI",
+        "YVSB",
+        "1QMT",
+        "358I",
+        "3DXJ",
+        "4LKE",
+        "5AAO",
+        "5JAL",
+        "6NI8",
+        "8N0C",
+        "8QMN",
+        "ARON",
+        "CJ58",
+        "F99D",
+        "IHLF",
+        "JF6D",
+        "Q4F9",
+        "Q6EM",
+        "SIST",
+        "U94O",
+        "UFIY",
+        "UKX4",
+        "UVH6",
+        "WY1B",
+        "X0MP",
+        "X1EL",
+        "Y5L0",
+        "YJZ3",
+        "2WJZ",
+        "4U9V",
+        "64HG",
+        "6JCE",
+        "AZYL",
+        "CPK1",
+        "DLEW",
+        "EO24",
+        "ER7C",
+        "FK53",
+        "GHB2",
+        "J1V0",
+        "LF4E",
+        "MTDW",
+        "NHGN",
+        "NJA5",
+        "OGHV",
+        "OVCL",
+        "S745",
+        "U87X",
+        "WIU6",
+        "YOB3",
+        "ZULC",
+        "2EPF",
+        "2R1N",
+        "52U0",
+        "7VK5",
+        "95OK",
+        "AEJF",
+        "BTQ1",
+        "EZNQ",
+        "FZMT",
+        "JBQI",
+        "N566",
+        "ZD39",
+        "30D6",
+        "B8XC",
+        "BGH4",
+        "EDOR",
+        "GIPE",
+        "OJDX",
+        "PQXK",
+        "VJXH",
+        "4BEM",
+        "GEE0",
+        "LGVF",
+        "QK2J",
+        "R18M",
+        "T2DF",
+        "T5ZE",
+        "U1EG",
+        "UQWQ",
+        "UZ83",
+        "V10Q",
+        "WQLU",
+        "Z9C5",
+        "23Q4",
+        "3JTE",
+        "3L7Q",
+        "51AN",
+        "9C19",
+        "9EJ6",
+        "B8KO",
+        "HSEV",
+        "R9OY",
+        "4NMI",
+        "5E0K",
+        "7RLC",
+        "AVLE",
+        "C2O4",
+        "DRSE",
+        "FW66",
+        "HA7M",
+        "MG8V",
+        "N263",
+        "QMI2",
+        "RZ5R",
+        "Z54A",
+        "ZHZP",
+        "11GD",
+        "5DBJ",
+        "7QV2",
+        "D2EI",
+        "DBGD",
+        "G0HE",
+        "G6VI",
+        "N10D",
+        "PNSZ",
+        "WTWK",
+        "YS05",
+        "15JS",
+        "4LZW",
+        "6TGS",
+        "C276",
+        "JZWN",
+        "PXNI",
+        "UX5E",
+        "Z9CH",
+        "7TJ1",
+        "8MBD",
+        "C8HJ",
+        "DE0G",
+        "DQUB",
+        "I2XB",
+        "ND93",
+        "QJ9F",
+        "RD1T",
+        "9AAS",
+        "C5K7",
+        "FE1L",
+        "HTV5",
+        "MXWB",
+        "N5OS",
+        "OGSS",
+        "TCLA",
+        "WYG5",
+        "YY5A",
+        "1CZS",
+        "2I4P",
+        "3ZXC",
+        "65B6",
+        "6OGF",
+        "7AJT",
+        "7H0X",
+        "B12O",
+        "GIN3",
+        "IDFN",
+        "NOBH",
+        "Q1N4",
+        "RC44",
+        "T0XH",
+        "UEKV",
+        "YQLO",
+        "8XN0",
+        "AMV2",
+        "FXHR",
+        "GZMZ",
+        "JWTD",
+        "K4MF",
+        "LPEE",
+        "NYUD",
+        "OE6T",
+        "PNZI",
+        "R8O9",
+        "TCC0",
+        "UF6Y",
+        "456O",
+        "4WN7",
+        "8KA4",
+        "BOEX",
+        "DQMV",
+        "HOV4",
+        "OF3Q",
+        "PLMC",
+        "Q28E",
+        "S4U2",
+        "VVJ3",
+        "F8DD",
+        "FQLY",
+        "LBJ1",
+        "NHYA",
+        "PM3Y",
+        "RR8G",
+        "RRXD",
+        "VUUU",
+        "724Q",
+        "DURX",
+        "IJHI",
+        "O1EZ",
+        "O9MN",
+        "OJBU",
+        "PXGA",
+        "QDZK",
+        "R27J",
+        "RC5L",
+        "SSN4",
+        "SUMS",
+        "6S32",
+        "B5YE",
+        "C0CR",
+        "EVBW",
+        "JNYX",
+        "M5RM",
+        "QSJ1",
+        "WNV6",
+        "Y7PW",
+        "Z92A",
+        "ZXZ7",
+        "1YA4",
+        "71ZI",
+        "9GXA",
+        "HXKE",
+        "NB58",
+        "PUJR",
+        "QR4Y",
+        "RDQZ",
+        "S6TP",
+        "A35I",
+        "JTJE",
+        "WMJ9",
+        "6EH6",
+        "BST2",
+        "GLCI",
+        "JS65",
+        "N28C",
+        "Q62B",
+        "YOP9",
+        "ZHED",
+        "6QCE",
+        "A30N",
+        "AN8Z",
+        "CHWX",
+        "DMNZ",
+        "MGUM",
+        "MH3L",
+        "NNLM",
+        "PKZ2",
+        "Q367",
+        "SOX5",
+        "TA9Z",
+        "UZ9W",
+    ),
+)
+
+NORDIC_LEGAL_FORMS = CodeList(
+    codes=(
+        "NO_AAFY",
+        "NO_ADOS",
+        "NO_ANNA",
+        "NO_ANS",
+        "NO_AS",
+        "NO_ASA",
+        "NO_BA",
+        "NO_BBL",
+        "NO_BEDR",
+        "NO_BO",
+        "NO_BRL",
+        "NO_DA",
+        "NO_ENK",
+        "NO_ESEK",
+        "NO_EOEFG",
+        "NO_FKF",
+        "NO_FLI",
+        "NO_FYLK",
+        "NO_GFS",
+        "NO_IKJP",
+        "NO_IKS",
+        "NO_KBO",
+        "NO_KF",
+        "NO_KIRK",
+        "NO_KOMM",
+        "NO_KS",
+        "NO_KTRF",
+        "NO_NUF",
+        "NO_OPMV",
+        "NO_ORGL",
+        "NO_PERS",
+        "NO_PK",
+        "NO_PRE",
+        "NO_SA",
+        "NO_SAM",
+        "NO_SE",
+        "NO_SF",
+        "NO_SPA",
+        "NO_STAT",
+        "NO_STI",
+        "NO_SAER",
+        "NO_TVAM",
+        "NO_VPFO",
+        "SE_I",
+        "SE_TSF",
+        "SE_MB",
+        "SE_SE",
+        "SE_SCE",
+        "SE_SF",
+        "SE_HB",
+        "SE_BAB",
+        "SE_EK",
+        "SE_KB",
+        "SE_SB",
+        "SE_FOF",
+        "SE_OFB",
+        "SE_FAB",
+        "SE_KHF",
+        "SE_EEIG",
+        "SE_EGTS",
+        "SE_BRF",
+        "SE_BF",
+        "SE_AB",
+        "SE_BFL",
+        "SE_E",
+        "SE_EB",
+        "SE_FL",
+        "SE_S",
+        "FI_AYH",
+        "FI_AHVELL",
+        "FI_AHVE",
+        "FI_ASH",
+        "FI_ASY",
+        "FI_AOY",
+        "FI_AY",
+        "FI_EYHT",
+        "FI_ESAA",
+        "FI_EVL",
+        "FI_ELSYH",
+        "FI_ETS",
+        "FI_ETY",
+        "FI_EUOKKT",
+        "FI_SCE",
+        "FI_SCP",
+        "FI_SE",
+        "FI_EVLUT",
+        "FI_HYYH",
+        "FI_KVJ",
+        "FI_OYJ",
+        "FI_VOJ",
+        "FI_KK",
+        "FI_KOY",
+        "FI_KVAKYH",
+        "FI_KVY",
+        "FI_KY",
+        "FI_KONK",
+        "FI_KUNTLL",
+        "FI_KUNT",
+        "FI_KUNTLLL",
+        "FI_KUNTYHT",
+        "FI_KP",
+        "FI_LIY",
+        "FI_MHY",
+        "FI_MJUO",
+        "FI_MUUKOY",
+        "FI_MSAA",
+        "FI_MTYH",
+        "FI_MUVE",
+        "FI_MYH",
+        "FI_MUYP",
+        "FI_MUU",
+        "FI_MOHLO",
+        "FI_ORTO",
+        "FI_OY",
+        "FI_OK",
+        "FI_OP",
+        "FI_PY",
+        "FI_PK",
+        "FI_SL",
+        "FI_SP",
+        "FI_SAA",
+        "FI_TYH",
+        "FI_TEKA",
+        "FI_TYKA",
+        "FI_ULKO",
+        "FI_VAKK",
+        "FI_VOY",
+        "FI_VY",
+        "FI_VALT",
+        "FI_VALTLL",
+        "FI_VEYHT",
+        "FI_YHTE",
+        "FI_YHME",
+        "FI_YEH",
+        "FI_YO",
+        "FI_UYK",
+    ),
+)
+
+__getattr__ = lazy_code_lists(
+    __name__,
+    enums={
+        "EntityLegalForm": ENTITY_LEGAL_FORMS,
+        "NordicLegalForm": NORDIC_LEGAL_FORMS,
+    },
+)
@@ -0,0 +1,102 @@
+"""
+Lookup tables resolving the free-text values of data sources to codes.
+
+The tables are built once, on the first call, with every accepted spelling of a code
+as a key, so resolving a value is a dictionary lookup. The values seen by data sources
+are mostly the codes or names as such, so only the values not found as they are need
+to be normalized.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from codelists.municipalities import FINNISH_MUNICIPALITIES, FINNISH_MUNICIPALITY_NAMES
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for lookups, ignoring the case, the diacritics and the
+    separators, e.g. "Mänttä-Vilppula" and "MANTTA_VILPPULA" become "mantta vilppula"
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _SEPARATORS.sub(" ", stripped).strip()
+
+
+class MunicipalityLookup:
+    """
+    Resolves the codes of the Finnish municipalities from their codes, the names of
+    the members of ``FinnishMunicipality``, and their Finnish and Swedish names
+    """
+
+    def __init__(self):
+        # Member by value, and value by member
+        self.members: Dict[str, str] = {
+            code: name for name, code in FINNISH_MUNICIPALITIES.members()
+        }
+        self.codes: Dict[str, str] = {name: code for code, name in self.members.items()}
+        self.names_fi: Dict[str, str] = {}
+        self.names_sv: Dict[str, str] = {}
+        for code, (name_fi, name_sv) in FINNISH_MUNICIPALITY_NAMES.items():
+            self.names_fi[code] = name_fi
+            self.names_sv[code] = name_sv
+
+        # Codes by the spellings as they are, and by the normalized spellings
+        self._exact: Dict[str, str] = {}
+        self._normalized: Dict[str, str] = {}
+        for code, member in self.members.items():
+            aliases = [code, member, self.names_fi[code], self.names_sv[code]]
+            for alias in aliases:
+                self._add(self._exact, alias, code)
+                self._add(self._normalized, normalize_name(alias), code)
+
+    @staticmethod
+    def _add(table: Dict[str, str], alias: str, code: str) -> None:
+        if table.setdefault(alias, code) != code:
+            raise ValueError(f"{alias!r} is ambiguous, both {table[alias]} and {code}")
+
+    def resolve(self, value: str) -> Optional[str]:
+        """
+        Get the code of a municipality by its code, member name or name in Finnish
+        or Swedish, in any case and with or without the diacritics
+
+        :return: The code, or None if the value matches no municipality
+        """
+        code = self._exact.get(value)
+        if code is not None:
+            return code
+        normalized = normalize_name(value)
+        if normalized.isdigit():
+            # Codes are often stored as numbers, without the leading zeros
+            normalized = normalized.zfill(3)
+        return self._normalized.get(normalized)
+
+    def resolve_many(self, values: Iterable[str]) -> List[Optional[str]]:
+        """
+        Resolve a column of values, normalizing each distinct value only once
+        """
+        resolved: Dict[str, Optional[str]] = {}
+        result = []
+        for value in values:
+            if value not in resolved:
+                resolved[value] = self.resolve(value)
+            result.append(resolved[value])
+        return result
+
+    def name(self, code: str, language: str = "fi") -> str:
+        """
+        Get the name of a municipality in Finnish ("fi") or Swedish ("sv")
+        """
+        names = {"fi": self.names_fi, "sv": self.names_sv}[language]
+        return names[code]
+
+
+@lru_cache(maxsize=None)
+def municipality_lookup() -> MunicipalityLookup:
+    """
+    Get the lookup of the Finnish municipalities, built on the first call
+    """
+    return MunicipalityLookup()
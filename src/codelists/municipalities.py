@@ -0,0 +1,948 @@
+"""
+Finnish municipalities, with their names in Finnish and Swedish and their regions
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+FINNISH_MUNICIPALITIES = CodeList(
+    names={
+        "AKAA": "020",
+        "ALAJARVI": "005",
+        "ALAVIESKA": "009",
+        "ALAVUS": "010",
+        "ASIKKALA": "016",
+        "ASKOLA": "018",
+        "AURA": "019",
+        "BRANDO": "035",
+        "ECKERO": "043",
+        "ENONKOSKI": "046",
+        "ENONTEKIO": "047",
+        "ESPOO": "049",
+        "EURA": "050",
+        "EURAJOKI": "051",
+        "EVIJARVI": "052",
+        "FINSTROM": "060",
+        "FORSSA": "061",
+        "FOGLO": "062",
+        "GETA": "065",
+        "HAAPAJARVI": "069",
+        "HAAPAVESI": "071",
+        "HAILUOTO": "072",
+        "HALSUA": "074",
+        "HAMINA": "075",
+        "HAMMARLAND": "076",
+        "HANKASALMI": "077",
+        "HANKO": "078",
+        "HARJAVALTA": "079",
+        "HARTOLA": "081",
+        "HATTULA": "082",
+        "HAUSJARVI": "086",
+        "HEINOLA": "111",
+        "HEINAVESI": "090",
+        "HELSINKI": "091",
+        "HIRVENSALMI": "097",
+        "HOLLOLA": "098",
+        "HUITTINEN": "102",
+        "HUMPPILA": "103",
+        "HYRYNSALMI": "105",
+        "HYVINKAA": "106",
+        "HAMEENKYRO": "108",
+        "HAMEENLINNA": "109",
+        "II": "139",
+        "IISALMI": "140",
+        "IITTI": "142",
+        "IKAALINEN": "143",
+        "ILMAJOKI": "145",
+        "ILOMANTSI": "146",
+        "IMATRA": "153",
+        "INARI": "148",
+        "INKOO": "149",
+        "ISOJOKI": "151",
+        "ISOKYRO": "152",
+        "JANAKKALA": "165",
+        "JOENSUU": "167",
+        "JOKIOINEN": "169",
+        "JOMALA": "170",
+        "JOROINEN": "171",
+        "JOUTSA": "172",
+        "JUUKA": "176",
+        "JUUPAJOKI": "177",
+        "JUVA": "178",
+        "JYVASKYLA": "179",
+        "JAMIJARVI": "181",
+        "JAMSA": "182",
+        "JARVENPAA": "186",
+        "KAARINA": "202",
+        "KAAVI": "204",
+        "KAJAANI": "205",
+        "KALAJOKI": "208",
+        "KANGASALA": "211",
+        "KANGASNIEMI": "213",
+        "KANKAANPAA": "214",
+        "KANNONKOSKI": "216",
+        "KANNUS": "217",
+        "KARIJOKI": "218",
+        "KARKKILA": "224",
+        "KARSTULA": "226",
+        "KARVIA": "230",
+        "KASKINEN": "231",
+        "KAUHAJOKI": "232",
+        "KAUHAVA": "233",
+        "KAUNIAINEN": "235",
+        "KAUSTINEN": "236",
+        "KEITELE": "239",
+        "KEMI": "240",
+        "KEMIJARVI": "320",
+        "KEMINMAA": "241",
+        "KEMIONSAARI": "322",
+        "KEMPELE": "244",
+        "KERAVA": "245",
+        "KEURUU": "249",
+        "KIHNIO": "250",
+        "KINNULA": "256",
+        "KIRKKONUMMI": "257",
+        "KITEE": "260",
+        "KITTILA": "261",
+        "KIURUVESI": "263",
+        "KIVIJARVI": "265",
+        "KOKEMAKI": "271",
+        "KOKKOLA": "272",
+        "KOLARI": "273",
+        "KONNEVESI": "275",
+        "KONTIOLAHTI": "276",
+        "KORSNAS": "280",
+        "KOSKI_TL": "284",
+        "KOTKA": "285",
+        "KOUVOLA": "286",
+        "KRISTIINANKAUPUNKI": "287",
+        "KRUUNUPYY": "288",
+        "KUHMO": "290",
+        "KUHMOINEN": "291",
+        "KUMLINGE": "295",
+        "KUOPIO": "297",
+        "KUORTANE": "300",
+        "KURIKKA": "301",
+        "KUSTAVI": "304",
+        "KUUSAMO": "305",
+        "KYYJARVI": "312",
+        "KARKOLA": "316",
+        "KARSAMAKI": "317",
+        "KOKAR": "318",
+        "LAHTI": "398",
+        "LAIHIA": "399",
+        "LAITILA": "400",
+        "LAPINJARVI": "407",
+        "LAPINLAHTI": "402",
+        "LAPPAJARVI": "403",
+        "LAPPEENRANTA": "405",
+        "LAPUA": "408",
+        "LAUKAA": "410",
+        "LEMI": "416",
+        "LEMLAND": "417",
+        "LEMPAALA": "418",
+        "LEPPAVIRTA": "420",
+        "LESTIJARVI": "421",
+        "LIEKSA": "422",
+        "LIETO": "423",
+        "LIMINKA": "425",
+        "LIPERI": "426",
+        "LOHJA": "444",
+        "LOIMAA": "430",
+        "LOPPI": "433",
+        "LOVIISA": "434",
+        "LUHANKA": "435",
+        "LUMIJOKI": "436",
+        "LUMPARLAND": "438",
+        "LUOTO": "440",
+        "LUUMAKI": "441",
+        "MAALAHTI": "475",
+        "MAARIANHAMINA": "478",
+        "MARTTILA": "480",
+        "MASKU": "481",
+        "MERIJARVI": "483",
+        "MERIKARVIA": "484",
+        "MIEHIKKALA": "489",
+        "MIKKELI": "491",
+        "MUHOS": "494",
+        "MULTIA": "495",
+        "MUONIO": "498",
+        "MUSTASAARI": "499",
+        "MUURAME": "500",
+        "MYNAMAKI": "503",
+        "MYRSKYLA": "504",
+        "MANTSALA": "505",
+        "MANTTA_VILPPULA": "508",
+        "MANTYHARJU": "507",
+        "NAANTALI": "529",
+        "NAKKILA": "531",
+        "NIVALA": "535",
+        "NOKIA": "536",
+        "NOUSIAINEN": "538",
+        "NURMES": "541",
+        "NURMIJARVI": "543",
+        "NARPIO": "545",
+        "ORIMATTILA": "560",
+        "ORIPAA": "561",
+        "ORIVESI": "562",
+        "OULAINEN": "563",
+        "OULU": "564",
+        "OUTOKUMPU": "309",
+        "PADASJOKI": "576",
+        "PAIMIO": "577",
+        "PALTAMO": "578",
+        "PARAINEN": "445",
+        "PARIKKALA": "580",
+        "PARKANO": "581",
+        "PEDERSOREN_KUNTA": "599",
+        "PELKOSENNIEMI": "583",
+        "PELLO": "854",
+        "PERHO": "584",
+        "PERTUNMAA": "588",
+        "PETAJAVESI": "592",
+        "PIEKSAMAKI": "593",
+        "PIELAVESI": "595",
+        "PIETARSAARI": "598",
+        "PIHTIPUDAS": "601",
+        "PIRKKALA": "604",
+        "POLVIJARVI": "607",
+        "POMARKKU": "608",
+        "PORI": "609",
+        "PORNAINEN": "611",
+        "PORVOO": "638",
+        "POSIO": "614",
+        "PUDASJARVI": "615",
+        "PUKKILA": "616",
+        "PUNKALAIDUN": "619",
+        "PUOLANKA": "620",
+        "PUUMALA": "623",
+        "PYHTAA": "624",
+        "PYHAJOKI": "625",
+        "PYHAJARVI": "626",
+        "PYHANTA": "630",
+        "PYHARANTA": "631",
+        "PALKANE": "635",
+        "POYTYA": "636",
+        "RAAHE": "678",
+        "RAASEPORI": "710",
+        "RAISIO": "680",
+        "RANTASALMI": "681",
+        "RANUA": "683",
+        "RAUMA": "684",
+        "RAUTALAMPI": "686",
+        "RAUTAVAARA": "687",
+        "RAUTJARVI": "689",
+        "REISJARVI": "691",
+        "RIIHIMAKI": "694",
+        "RISTIJARVI": "697",
+        "ROVANIEMI": "698",
+        "RUOKOLAHTI": "700",
+        "RUOVESI": "702",
+        "RUSKO": "704",
+        "RAAKKYLA": "707",
+        "SAARIJARVI": "729",
+        "SALLA": "732",
+        "SALO": "734",
+        "SALTVIK": "736",
+        "SASTAMALA": "790",
+        "SAUVO": "738",
+        "SAVITAIPALE": "739",
+        "SAVONLINNA": "740",
+        "SAVUKOSKI": "742",
+        "SEINAJOKI": "743",
+        "SIEVI": "746",
+        "SIIKAINEN": "747",
+        "SIIKAJOKI": "748",
+        "SIIKALATVA": "791",
+        "SIILINJARVI": "749",
+        "SIMO": "751",
+        "SIPOO": "753",
+        "SIUNTIO": "755",
+        "SODANKYLA": "758",
+        "SOINI": "759",
+        "SOMERO": "761",
+        "SONKAJARVI": "762",
+        "SOTKAMO": "765",
+        "SOTTUNGA": "766",
+        "SULKAVA": "768",
+        "SUND": "771",
+        "SUOMUSSALMI": "777",
+        "SUONENJOKI": "778",
+        "SYSMA": "781",
+        "SAKYLA": "783",
+        "TAIPALSAARI": "831",
+        "TAIVALKOSKI": "832",
+        "TAIVASSALO": "833",
+        "TAMMELA": "834",
+        "TAMPERE": "837",
+        "TERVO": "844",
+        "TERVOLA": "845",
+        "TEUVA": "846",
+        "TOHMAJARVI": "848",
+        "TOHOLAMPI": "849",
+        "TOIVAKKA": "850",
+        "TORNIO": "851",
+        "TURKU": "853",
+        "TUUSNIEMI": "857",
+        "TUUSULA": "858",
+        "TYRNAVA": "859",
+        "ULVILA": "886",
+        "URJALA": "887",
+        "UTAJARVI": "889",
+        "UTSJOKI": "890",
+        "UURAINEN": "892",
+        "UUSIKAARLEPYY": "893",
+        "UUSIKAUPUNKI": "895",
+        "VAALA": "785",
+        "VAASA": "905",
+        "VALKEAKOSKI": "908",
+        "VANTAA": "092",
+        "VARKAUS": "915",
+        "VEHMAA": "918",
+        "VESANTO": "921",
+        "VESILAHTI": "922",
+        "VETELI": "924",
+        "VIEREMA": "925",
+        "VIHTI": "927",
+        "VIITASAARI": "931",
+        "VIMPELI": "934",
+        "VIROLAHTI": "935",
+        "VIRRAT": "936",
+        "VARDO": "941",
+        "VOYRI": "946",
+        "YLITORNIO": "976",
+        "YLIVIESKA": "977",
+        "YLOJARVI": "980",
+        "YPAJA": "981",
+        "AHTARI": "989",
+        "AANEKOSKI": "992",
+    },
+)
+
+FINNISH_MUNICIPALITY_NAMES = {
+    "020": ("Akaa", "Akaa"),
+    "005": ("Alajärvi", "Alajärvi"),
+    "009": ("Alavieska", "Alavieska"),
+    "010": ("Alavus", "Alavo"),
+    "016": ("Asikkala", "Asikkala"),
+    "018": ("Askola", "Askola"),
+    "019": ("Aura", "Aura"),
+    "035": ("Brändö", "Brändö"),
+    "043": ("Eckerö", "Eckerö"),
+    "046": ("Enonkoski", "Enonkoski"),
+    "047": ("Enontekiö", "Enontekis"),
+    "049": ("Espoo", "Esbo"),
+    "050": ("Eura", "Eura"),
+    "051": ("Eurajoki", "Euraåminne"),
+    "052": ("Evijärvi", "Evijärvi"),
+    "060": ("Finström", "Finström"),
+    "061": ("Forssa", "Forssa"),
+    "062": ("Föglö", "Föglö"),
+    "065": ("Geta", "Geta"),
+    "069": ("Haapajärvi", "Haapajärvi"),
+    "071": ("Haapavesi", "Haapavesi"),
+    "072": ("Hailuoto", "Karlö"),
+    "074": ("Halsua", "Halsua"),
+    "075": ("Hamina", "Fredrikshamn"),
+    "076": ("Hammarland", "Hammarland"),
+    "077": ("Hankasalmi", "Hankasalmi"),
+    "078": ("Hanko", "Hangö"),
+    "079": ("Harjavalta", "Harjavalta"),
+    "081": ("Hartola", "Gustav Adolfs"),
+    "082": ("Hattula", "Hattula"),
+    "086": ("Hausjärvi", "Hausjärvi"),
+    "111": ("Heinola", "Heinola"),
+    "090": ("Heinävesi", "Heinävesi"),
+    "091": ("Helsinki", "Helsingfors"),
+    "097": ("Hirvensalmi", "Hirvensalmi"),
+    "098": ("Hollola", "Hollola"),
+    "102": ("Huittinen", "Vittis"),
+    "103": ("Humppila", "Humppila"),
+    "105": ("Hyrynsalmi", "Hyrynsalmi"),
+    "106": ("Hyvinkää", "Hyvinge"),
+    "108": ("Hämeenkyrö", "Tavastkyro"),
+    "109": ("Hämeenlinna", "Tavastehus"),
+    "139": ("Ii", "Ijo"),
+    "140": ("Iisalmi", "Idensalmi"),
+    "142": ("Iitti", "Iitti"),
+    "143": ("Ikaalinen", "Ikalis"),
+    "145": ("Ilmajoki", "Ilmajoki"),
+    "146": ("Ilomantsi", "Ilomants"),
+    "153": ("Imatra", "Imatra"),
+    "148": ("Inari", "Enare"),
+    "149": ("Inkoo", "Ingå"),
+    "151": ("Isojoki", "Storå"),
+    "152": ("Isokyrö", "Storkyro"),
+    "165": ("Janakkala", "Janakkala"),
+    "167": ("Joensuu", "Joensuu"),
+    "169": ("Jokioinen", "Jockis"),
+    "170": ("Jomala", "Jomala"),
+    "171": ("Joroinen", "Jorois"),
+    "172": ("Joutsa", "Joutsa"),
+    "176": ("Juuka", "Juuka"),
+    "177": ("Juupajoki", "Juupajoki"),
+    "178": ("Juva", "Juva"),
+    "179": ("Jyväskylä", "Jyväskylä"),
+    "181": ("Jämijärvi", "Jämijärvi"),
+    "182": ("Jämsä", "Jämsä"),
+    "186": ("Järvenpää", "Träskända"),
+    "202": ("Kaarina", "S:t Karins"),
+    "204": ("Kaavi", "Kaavi"),
+    "205": ("Kajaani", "Kajana"),
+    "208": ("Kalajoki", "Kalajoki"),
+    "211": ("Kangasala", "Kangasala"),
+    "213": ("Kangasniemi", "Kangasniemi"),
+    "214": ("Kankaanpää", "Kankaanpää"),
+    "216": ("Kannonkoski", "Kannonkoski"),
+    "217": ("Kannus", "Kannus"),
+    "218": ("Karijoki", "Bötom"),
+    "224": ("Karkkila", "Högfors"),
+    "226": ("Karstula", "Karstula"),
+    "230": ("Karvia", "Karvia"),
+    "231": ("Kaskinen", "Kaskö"),
+    "232": ("Kauhajoki", "Kauhajoki"),
+    "233": ("Kauhava", "Kauhava"),
+    "235": ("Kauniainen", "Grankulla"),
+    "236": ("Kaustinen", "Kaustby"),
+    "239": ("Keitele", "Keitele"),
+    "240": ("Kemi", "Kemi"),
+    "320": ("Kemijärvi", "Kemijärvi"),
+    "241": ("Keminmaa", "Keminmaa"),
+    "322": ("Kemiönsaari", "Kimitoön"),
+    "244": ("Kempele", "Kempele"),
+    "245": ("Kerava", "Kervo"),
+    "249": ("Keuruu", "Keuru"),
+    "250": ("Kihniö", "Kihniö"),
+    "256": ("Kinnula", "Kinnula"),
+    "257": ("Kirkkonummi", "Kyrkslätt"),
+    "260": ("Kitee", "Kitee"),
+    "261": ("Kittilä", "Kittilä"),
+    "263": ("Kiuruvesi", "Kiuruvesi"),
+    "265": ("Kivijärvi", "Kivijärvi"),
+    "271": ("Kokemäki", "Kumo"),
+    "272": ("Kokkola", "Karleby"),
+    "273": ("Kolari", "Kolari"),
+    "275": ("Konnevesi", "Konnevesi"),
+    "276": ("Kontiolahti", "Kontiolahti"),
+    "280": ("Korsnäs", "Korsnäs"),
+    "284": ("Koski Tl", "Koskis"),
+    "285": ("Kotka", "Kotka"),
+    "286": ("Kouvola", "Kouvola"),
+    "287": ("Kristiinankaupunki", "Kristinestad"),
+    "288": ("Kruunupyy", "Kronoby"),
+    "290": ("Kuhmo", "Kuhmo"),
+    "291": ("Kuhmoinen", "Kuhmoinen"),
+    "295": ("Kumlinge", "Kumlinge"),
+    "297": ("Kuopio", "Kuopio"),
+    "300": ("Kuortane", "Kuortane"),
+    "301": ("Kurikka", "Kurikka"),
+    "304": ("Kustavi", "Gustavs"),
+    "305": ("Kuusamo", "Kuusamo"),
+    "312": ("Kyyjärvi", "Kyyjärvi"),
+    "316": ("Kärkölä", "Kärkölä"),
+    "317": ("Kärsämäki", "Kärsämäki"),
+    "318": ("Kökar", "Kökar"),
+    "398": ("Lahti", "Lahtis"),
+    "399": ("Laihia", "Laihela"),
+    "400": ("Laitila", "Letala"),
+    "407": ("Lapinjärvi", "Lappträsk"),
+    "402": ("Lapinlahti", "Lapinlahti"),
+    "403": ("Lappajärvi", "Lappajärvi"),
+    "405": ("Lappeenranta", "Villmanstrand"),
+    "408": ("Lapua", "Lappo"),
+    "410": ("Laukaa", "Laukaa"),
+    "416": ("Lemi", "Lemi"),
+    "417": ("Lemland", "Lemland"),
+    "418": ("Lempäälä", "Lempäälä"),
+    "420": ("Leppävirta", "Leppävirta"),
+    "421": ("Lestijärvi", "Lestijärvi"),
+    "422": ("Lieksa", "Lieksa"),
+    "423": ("Lieto", "Lundo"),
+    "425": ("Liminka", "Limingo"),
+    "426": ("Liperi", "Liperi"),
+    "444": ("Lohja", "Lojo"),
+    "430": ("Loimaa", "Loimaa"),
+    "433": ("Loppi", "Loppi"),
+    "434": ("Loviisa", "Lovisa"),
+    "435": ("Luhanka", "Luhanka"),
+    "436": ("Lumijoki", "Lumijoki"),
+    "438": ("Lumparland", "Lumparland"),
+    "440": ("Luoto", "Larsmo"),
+    "441": ("Luumäki", "Luumäki"),
+    "475": ("Maalahti", "Malax"),
+    "478": ("Maarianhamina", "Mariehamn"),
+    "480": ("Marttila", "S:t Mårtens"),
+    "481": ("Masku", "Masku"),
+    "483": ("Merijärvi", "Merijärvi"),
+    "484": ("Merikarvia", "Sastmola"),
+    "489": ("Miehikkälä", "Miehikkälä"),
+    "491": ("Mikkeli", "S:t Michel"),
+    "494": ("Muhos", "Muhos"),
+    "495": ("Multia", "Multia"),
+    "498": ("Muonio", "Muonio"),
+    "499": ("Mustasaari", "Korsholm"),
+    "500": ("Muurame", "Muurame"),
+    "503": ("Mynämäki", "Virmo"),
+    "504": ("Myrskylä", "Mörskom"),
+    "505": ("Mäntsälä", "Mäntsälä"),
+    "508": ("Mänttä-Vilppula", "Mänttä-Vilppula"),
+    "507": ("Mäntyharju", "Mäntyharju"),
+    "529": ("Naantali", "Nådendal"),
+    "531": ("Nakkila", "Nakkila"),
+    "535": ("Nivala", "Nivala"),
+    "536": ("Nokia", "Nokia"),
+    "538": ("Nousiainen", "Nousis"),
+    "541": ("Nurmes", "Nurmes"),
+    "543": ("Nurmijärvi", "Nurmijärvi"),
+    "545": ("Närpiö", "Närpes"),
+    "560": ("Orimattila", "Orimattila"),
+    "561": ("Oripää", "Oripää"),
+    "562": ("Orivesi", "Orivesi"),
+    "563": ("Oulainen", "Oulainen"),
+    "564": ("Oulu", "Uleåborg"),
+    "309": ("Outokumpu", "Outokumpu"),
+    "576": ("Padasjoki", "Padasjoki"),
+    "577": ("Paimio", "Pemar"),
+    "578": ("Paltamo", "Paltamo"),
+    "445": ("Parainen", "Pargas"),
+    "580": ("Parikkala", "Parikkala"),
+    "581": ("Parkano", "Parkano"),
+    "599": ("Pedersören kunta", "Pedersöre"),
+    "583": ("Pelkosenniemi", "Pelkosenniemi"),
+    "854": ("Pello", "Pello"),
+    "584": ("Perho", "Perho"),
+    "588": ("Pertunmaa", "Pertunmaa"),
+    "592": ("Petäjävesi", "Petäjävesi"),
+    "593": ("Pieksämäki", "Pieksämäki"),
+    "595": ("Pielavesi", "Pielavesi"),
+    "598": ("Pietarsaari", "Jakobstad"),
+    "601": ("Pihtipudas", "Pihtipudas"),
+    "604": ("Pirkkala", "Birkala"),
+    "607": ("Polvijärvi", "Polvijärvi"),
+    "608": ("Pomarkku", "Påmark"),
+    "609": ("Pori", "Björneborg"),
+    "611": ("Pornainen", "Borgnäs"),
+    "638": ("Porvoo", "Borgå"),
+    "614": ("Posio", "Posio"),
+    "615": ("Pudasjärvi", "Pudasjärvi"),
+    "616": ("Pukkila", "Pukkila"),
+    "619": ("Punkalaidun", "Punkalaidun"),
+    "620": ("Puolanka", "Puolanka"),
+    "623": ("Puumala", "Puumala"),
+    "624": ("Pyhtää", "Pyttis"),
+    "625": ("Pyhäjoki", "Pyhäjoki"),
+    "626": ("Pyhäjärvi", "Pyhäjärvi"),
+    "630": ("Pyhäntä", "Pyhäntä"),
+    "631": ("Pyhäranta", "Pyhäranta"),
+    "635": ("Pälkäne", "Pälkäne"),
+    "636": ("Pöytyä", "Pöytyä"),
+    "678": ("Raahe", "Brahestad"),
+    "710": ("Raasepori", "Raseborg"),
+    "680": ("Raisio", "Reso"),
+    "681": ("Rantasalmi", "Rantasalmi"),
+    "683": ("Ranua", "Ranua"),
+    "684": ("Rauma", "Raumo"),
+    "686": ("Rautalampi", "Rautalampi"),
+    "687": ("Rautavaara", "Rautavaara"),
+    "689": ("Rautjärvi", "Rautjärvi"),
+    "691": ("Reisjärvi", "Reisjärvi"),
+    "694": ("Riihimäki", "Riihimäki"),
+    "697": ("Ristijärvi", "Ristijärvi"),
+    "698": ("Rovaniemi", "Rovaniemi"),
+    "700": ("Ruokolahti", "Ruokolahti"),
+    "702": ("Ruovesi", "Ruovesi"),
+    "704": ("Rusko", "Rusko"),
+    "707": ("Rääkkylä", "Rääkkylä"),
+    "729": ("Saarijärvi", "Saarijärvi"),
+    "732": ("Salla", "Salla"),
+    "734": ("Salo", "Salo"),
+    "736": ("Saltvik", "Saltvik"),
+    "790": ("Sastamala", "Sastamala"),
+    "738": ("Sauvo", "Sagu"),
+    "739": ("Savitaipale", "Savitaipale"),
+    "740": ("Savonlinna", "Nyslott"),
+    "742": ("Savukoski", "Savukoski"),
+    "743": ("Seinäjoki", "Seinäjoki"),
+    "746": ("Sievi", "Sievi"),
+    "747": ("Siikainen", "Siikainen"),
+    "748": ("Siikajoki", "Siikajoki"),
+    "791": ("Siikalatva", "Siikalatva"),
+    "749": ("Siilinjärvi", "Siilinjärvi"),
+    "751": ("Simo", "Simo"),
+    "753": ("Sipoo", "Sibbo"),
+    "755": ("Siuntio", "Sjundeå"),
+    "758": ("Sodankylä", "Sodankylä"),
+    "759": ("Soini", "Soini"),
+    "761": ("Somero", "Somero"),
+    "762": ("Sonkajärvi", "Sonkajärvi"),
+    "765": ("Sotkamo", "Sotkamo"),
+    "766": ("Sottunga", "Sottunga"),
+    "768": ("Sulkava", "Sulkava"),
+    "771": ("Sund", "Sund"),
+    "777": ("Suomussalmi", "Suomussalmi"),
+    "778": ("Suonenjoki", "Suonenjoki"),
+    "781": ("Sysmä", "Sysmä"),
+    "783": ("Säkylä", "Säkylä"),
+    "831": ("Taipalsaari", "Taipalsaari"),
+    "832": ("Taivalkoski", "Taivalkoski"),
+    "833": ("Taivassalo", "Tövsala"),
+    "834": ("Tammela", "Tammela"),
+    "837": ("Tampere", "Tammerfors"),
+    "844": ("Tervo", "Tervo"),
+    "845": ("Tervola", "Tervola"),
+    "846": ("Teuva", "Östermark"),
+    "848": ("Tohmajärvi", "Tohmajärvi"),
+    "849": ("Toholampi", "Toholampi"),
+    "850": ("Toivakka", "Toivakka"),
+    "851": ("Tornio", "Torneå"),
+    "853": ("Turku", "Åbo"),
+    "857": ("Tuusniemi", "Tuusniemi"),
+    "858": ("Tuusula", "Tusby"),
+    "859": ("Tyrnävä", "Tyrnävä"),
+    "886": ("Ulvila", "Ulvsby"),
+    "887": ("Urjala", "Urjala"),
+    "889": ("Utajärvi", "Utajärvi"),
+    "890": ("Utsjoki", "Utsjoki"),
+    "892": ("Uurainen", "Uurainen"),
+    "893": ("Uusikaarlepyy", "Nykarleby"),
+    "895": ("Uusikaupunki", "Nystad"),
+    "785": ("Vaala", "Vaala"),
+    "905": ("Vaasa", "Vasa"),
+    "908": ("Valkeakoski", "Valkeakoski"),
+    "092": ("Vantaa", "Vanda"),
+    "915": ("Varkaus", "Varkaus"),
+    "918": ("Vehmaa", "Vehmaa"),
+    "921": ("Vesanto", "Vesanto"),
+    "922": ("Vesilahti", "Vesilahti"),
+    "924": ("Veteli", "Vetil"),
+    "925": ("Vieremä", "Vieremä"),
+    "927": ("Vihti", "Vichtis"),
+    "931": ("Viitasaari", "Viitasaari"),
+    "934": ("Vimpeli", "Vindala"),
+    "935": ("Virolahti", "Virolahti"),
+    "936": ("Virrat", "Virrat"),
+    "941": ("Vårdö", "Vårdö"),
+    "946": ("Vöyri", "Vörå"),
+    "976": ("Ylitornio", "Övertorneå"),
+    "977": ("Ylivieska", "Ylivieska"),
+    "980": ("Ylöjärvi", "Ylöjärvi"),
+    "981": ("Ypäjä", "Ypäjä"),
+    "989": ("Ähtäri", "Etseri"),
+    "992": ("Äänekoski", "Äänekoski"),
+}
+
+FINNISH_MUNICIPALITY_REGIONS = {
+    "020": "FI-11",
+    "005": "FI-03",
+    "009": "FI-14",
+    "010": "FI-03",
+    "016": "FI-16",
+    "018": "FI-18",
+    "019": "FI-19",
+    "035": "FI-01",
+    "043": "FI-01",
+    "046": "FI-04",
+    "047": "FI-10",
+    "049": "FI-18",
+    "050": "FI-17",
+    "051": "FI-17",
+    "052": "FI-03",
+    "060": "FI-01",
+    "061": "FI-06",
+    "062": "FI-01",
+    "065": "FI-01",
+    "069": "FI-14",
+    "071": "FI-14",
+    "072": "FI-14",
+    "074": "FI-07",
+    "075": "FI-09",
+    "076": "FI-01",
+    "077": "FI-08",
+    "078": "FI-18",
+    "079": "FI-17",
+    "081": "FI-16",
+    "082": "FI-06",
+    "086": "FI-06",
+    "111": "FI-16",
+    "090": "FI-13",
+    "091": "FI-18",
+    "097": "FI-04",
+    "098": "FI-16",
+    "102": "FI-17",
+    "103": "FI-06",
+    "105": "FI-05",
+    "106": "FI-18",
+    "108": "FI-11",
+    "109": "FI-06",
+    "139": "FI-14",
+    "140": "FI-15",
+    "142": "FI-16",
+    "143": "FI-11",
+    "145": "FI-03",
+    "146": "FI-13",
+    "153": "FI-02",
+    "148": "FI-10",
+    "149": "FI-18",
+    "151": "FI-03",
+    "152": "FI-03",
+    "165": "FI-06",
+    "167": "FI-13",
+    "169": "FI-06",
+    "170": "FI-01",
+    "171": "FI-15",
+    "172": "FI-08",
+    "176": "FI-13",
+    "177": "FI-11",
+    "178": "FI-04",
+    "179": "FI-08",
+    "181": "FI-17",
+    "182": "FI-08",
+    "186": "FI-18",
+    "202": "FI-19",
+    "204": "FI-15",
+    "205": "FI-05",
+    "208": "FI-14",
+    "211": "FI-11",
+    "213": "FI-04",
+    "214": "FI-17",
+    "216": "FI-08",
+    "217": "FI-07",
+    "218": "FI-03",
+    "224": "FI-18",
+    "226": "FI-08",
+    "230": "FI-17",
+    "231": "FI-12",
+    "232": "FI-03",
+    "233": "FI-03",
+    "235": "FI-18",
+    "236": "FI-07",
+    "239": "FI-15",
+    "240": "FI-10",
+    "320": "FI-10",
+    "241": "FI-10",
+    "322": "FI-19",
+    "244": "FI-14",
+    "245": "FI-18",
+    "249": "FI-08",
+    "250": "FI-11",
+    "256": "FI-08",
+    "257": "FI-18",
+    "260": "FI-13",
+    "261": "FI-10",
+    "263": "FI-15",
+    "265": "FI-08",
+    "271": "FI-17",
+    "272": "FI-07",
+    "273": "FI-10",
+    "275": "FI-08",
+    "276": "FI-13",
+    "280": "FI-12",
+    "284": "FI-19",
+    "285": "FI-09",
+    "286": "FI-09",
+    "287": "FI-12",
+    "288": "FI-12",
+    "290": "FI-05",
+    "291": "FI-11",
+    "295": "FI-01",
+    "297": "FI-15",
+    "300": "FI-03",
+    "301": "FI-03",
+    "304": "FI-19",
+    "305": "FI-14",
+    "312": "FI-08",
+    "316": "FI-16",
+    "317": "FI-14",
+    "318": "FI-01",
+    "398": "FI-16",
+    "399": "FI-12",
+    "400": "FI-19",
+    "407": "FI-18",
+    "402": "FI-15",
+    "403": "FI-03",
+    "405": "FI-02",
+    "408": "FI-03",
+    "410": "FI-08",
+    "416": "FI-02",
+    "417": "FI-01",
+    "418": "FI-11",
+    "420": "FI-15",
+    "421": "FI-07",
+    "422": "FI-13",
+    "423": "FI-19",
+    "425": "FI-14",
+    "426": "FI-13",
+    "444": "FI-18",
+    "430": "FI-19",
+    "433": "FI-06",
+    "434": "FI-18",
+    "435": "FI-08",
+    "436": "FI-14",
+    "438": "FI-01",
+    "440": "FI-12",
+    "441": "FI-02",
+    "475": "FI-12",
+    "478": "FI-01",
+    "480": "FI-19",
+    "481": "FI-19",
+    "483": "FI-14",
+    "484": "FI-17",
+    "489": "FI-09",
+    "491": "FI-04",
+    "494": "FI-14",
+    "495": "FI-08",
+    "498": "FI-10",
+    "499": "FI-12",
+    "500": "FI-08",
+    "503": "FI-19",
+    "504": "FI-18",
+    "505": "FI-18",
+    "508": "FI-11",
+    "507": "FI-04",
+    "529": "FI-19",
+    "531": "FI-17",
+    "535": "FI-14",
+    "536": "FI-11",
+    "538": "FI-19",
+    "541": "FI-13",
+    "543": "FI-18",
+    "545": "FI-12",
+    "560": "FI-16",
+    "561": "FI-19",
+    "562": "FI-11",
+    "563": "FI-14",
+    "564": "FI-14",
+    "309": "FI-13",
+    "576": "FI-16",
+    "577": "FI-19",
+    "578": "FI-05",
+    "445": "FI-19",
+    "580": "FI-02",
+    "581": "FI-11",
+    "599": "FI-12",
+    "583": "FI-10",
+    "854": "FI-10",
+    "584": "FI-07",
+    "588": "FI-04",
+    "592": "FI-08",
+    "593": "FI-04",
+    "595": "FI-15",
+    "598": "FI-12",
+    "601": "FI-08",
+    "604": "FI-11",
+    "607": "FI-13",
+    "608": "FI-17",
+    "609": "FI-17",
+    "611": "FI-18",
+    "638": "FI-18",
+    "614": "FI-10",
+    "615": "FI-14",
+    "616": "FI-18",
+    "619": "FI-11",
+    "620": "FI-05",
+    "623": "FI-04",
+    "624": "FI-09",
+    "625": "FI-14",
+    "626": "FI-14",
+    "630": "FI-14",
+    "631": "FI-19",
+    "635": "FI-11",
+    "636": "FI-19",
+    "678": "FI-14",
+    "710": "FI-18",
+    "680": "FI-19",
+    "681": "FI-04",
+    "683": "FI-10",
+    "684": "FI-17",
+    "686": "FI-15",
+    "687": "FI-15",
+    "689": "FI-02",
+    "691": "FI-14",
+    "694": "FI-06",
+    "697": "FI-05",
+    "698": "FI-10",
+    "700": "FI-02",
+    "702": "FI-11",
+    "704": "FI-19",
+    "707": "FI-13",
+    "729": "FI-08",
+    "732": "FI-10",
+    "734": "FI-19",
+    "736": "FI-01",
+    "790": "FI-11",
+    "738": "FI-19",
+    "739": "FI-02",
+    "740": "FI-04",
+    "742": "FI-10",
+    "743": "FI-03",
+    "746": "FI-14",
+    "747": "FI-17",
+    "748": "FI-14",
+    "791": "FI-14",
+    "749": "FI-15",
+    "751": "FI-10",
+    "753": "FI-18",
+    "755": "FI-18",
+    "758": "FI-10",
+    "759": "FI-03",
+    "761": "FI-19",
+    "762": "FI-15",
+    "765": "FI-05",
+    "766": "FI-01",
+    "768": "FI-04",
+    "771": "FI-01",
+    "777": "FI-05",
+    "778": "FI-15",
+    "781": "FI-16",
+    "783": "FI-17",
+    "831": "FI-02",
+    "832": "FI-14",
+    "833": "FI-19",
+    "834": "FI-06",
+    "837": "FI-11",
+    "844": "FI-15",
+    "845": "FI-10",
+    "846": "FI-03",
+    "848": "FI-13",
+    "849": "FI-07",
+    "850": "FI-08",
+    "851": "FI-10",
+    "853": "FI-19",
+    "857": "FI-15",
+    "858": "FI-18",
+    "859": "FI-14",
+    "886": "FI-17",
+    "887": "FI-11",
+    "889": "FI-14",
+    "890": "FI-10",
+    "892": "FI-08",
+    "893": "FI-12",
+    "895": "FI-19",
+    "785": "FI-14",
+    "905": "FI-12",
+    "908": "FI-11",
+    "092": "FI-18",
+    "915": "FI-15",
+    "918": "FI-19",
+    "921": "FI-15",
+    "922": "FI-11",
+    "924": "FI-07",
+    "925": "FI-15",
+    "927": "FI-18",
+    "931": "FI-08",
+    "934": "FI-03",
+    "935": "FI-09",
+    "936": "FI-11",
+    "941": "FI-01",
+    "946": "FI-12",
+    "976": "FI-10",
+    "977": "FI-14",
+    "980": "FI-11",
+    "981": "FI-06",
+    "989": "FI-03",
+    "992": "FI-08",
+}
+
+__getattr__ = lazy_code_lists(
+    __name__, code_types={"FinnishMunicipality": FINNISH_MUNICIPALITIES}
+)
@@ -0,0 +1,99 @@
+"""
+Index between the Finnish municipalities and the regions, ``ISO_3166_2_FI``, they are
+in.
+
+Sets of municipalities are represented as bitsets, python integers with a bit for
+each municipality in the order of the code list. A region is the bitset of its
+municipalities, so a job applicant's preferred regions and municipalities are turned
+into a single bitset once, and matching it against a job or another applicant is a
+bitwise and.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from codelists.iso3166 import FINNISH_REGIONS
+from codelists.municipalities import (
+    FINNISH_MUNICIPALITIES,
+    FINNISH_MUNICIPALITY_REGIONS,
+)
+
+
+class RegionIndex:
+    """
+    Bitsets of the municipalities of each region, and the region of each
+    municipality
+    """
+
+    def __init__(self):
+        self.municipalities = FINNISH_MUNICIPALITIES.codes
+        self.regions = FINNISH_REGIONS.codes
+        self._bits: Dict[str, int] = {
+            code: 1 << i for i, code in enumerate(self.municipalities)
+        }
+        self._regions: Dict[str, str] = dict(FINNISH_MUNICIPALITY_REGIONS)
+        self._region_masks: Dict[str, int] = dict.fromkeys(self.regions, 0)
+        for code, region in self._regions.items():
+            self._region_masks[region] |= self._bits[code]
+
+    def region(self, municipality: str) -> str:
+        """
+        Get the region of a municipality
+        """
+        return self._regions[municipality]
+
+    def municipality_mask(self, municipalities: Iterable[str]) -> int:
+        """
+        Get the bitset of the municipalities
+        """
+        mask = 0
+        for code in municipalities:
+            mask |= self._bits[code]
+        return mask
+
+    def region_mask(self, regions: Iterable[str]) -> int:
+        """
+        Get the bitset of all the municipalities in the regions
+        """
+        mask = 0
+        for region in regions:
+            mask |= self._region_masks[region]
+        return mask
+
+    def area_mask(self, regions: Iterable[str], municipalities: Iterable[str]) -> int:
+        """
+        Get the bitset of the municipalities in the regions or listed, e.g. of the
+        preferred regions and municipalities of a job applicant
+        """
+        return self.region_mask(regions) | self.municipality_mask(municipalities)
+
+    def decode(self, mask: int) -> List[str]:
+        """
+        Get the codes of the municipalities in a bitset, in the order of the code list
+        """
+        codes = []
+        while mask:
+            lowest = mask & -mask
+            codes.append(self.municipalities[lowest.bit_length() - 1])
+            mask ^= lowest
+        return codes
+
+    def regions_of(self, mask: int, whole: bool = False) -> List[str]:
+        """
+        Get the regions with municipalities in a bitset
+
+        :param mask: Bitset of municipalities
+        :param whole: Only get the regions with all of their municipalities in the
+        bitset
+        :return: The codes of the regions
+        """
+        if whole:
+            return [r for r, m in self._region_masks.items() if m and m & mask == m]
+        return [r for r, m in self._region_masks.items() if m & mask]
+
+
+@lru_cache(maxsize=None)
+def region_index() -> RegionIndex:
+    """
+    Get the index of the municipalities and regions, built on the first call
+    """
+    return RegionIndex()
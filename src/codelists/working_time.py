@@ -0,0 +1,21 @@
+"""
+Working times
+"""
+# Generated by `python -m tools.codelists` from the snapshots in
+# src/codelists/snapshots, edit the snapshots instead of this file.
+from codelists.base import CodeList, lazy_code_lists
+
+WORKING_TIMES = CodeList(
+    names={
+        "DAY_SHIFT": "01",
+        "EVENING_SHIFT": "02",
+        "NIGHT_SHIFT": "03",
+        "WORK_IN_EPISODES": "04",
+        "FLEXIBLE_HOURS": "05",
+        "NORMAL_DAYS": "06",
+        "WEEKEND_HOURS": "07",
+        "WORK_IN_SHIFTS": "08",
+    },
+)
+
+__getattr__ = lazy_code_lists(__name__, enums={"WorkingTime": WORKING_TIMES})
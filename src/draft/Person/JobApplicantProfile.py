@@ -5,4160 +5,20 @@ from typing import List, Optional
 from definition_tooling.converter import CamelCaseModel, DataProductDefinition
 from pydantic import Field, HttpUrl
 
+from codelists.esco import EscoCode
+from codelists.isced import EducationField, EducationLevel
+from codelists.iso639 import ISO_639_1
+from codelists.iso3166 import ISO_3166_2_FI
+from codelists.municipalities import FinnishMunicipality
+from codelists.nace import NaceCode
+from codelists.permits import Permit
+from codelists.working_time import WorkingTime
+
 
 class JobApplicantProfileRequest(CamelCaseModel):
     pass
 
 
-class EscoCode(str, Enum):
-    ESCO_2654_1_7 = "2654.1.7"
-    ESCO_8121_4 = "8121.4"
-    ESCO_7543_10_3 = "7543.10.3"
-    ESCO_3155_1 = "3155.1"
-    ESCO_2431_9 = "2431.9"
-    ESCO_3212_2 = "3212.2"
-    ESCO_3116_1_1 = "3116.1.1"
-    ESCO_5312_2 = "5312.2"
-    ESCO_2264_2 = "2264.2"
-    ESCO_2310_1_30 = "2310.1.30"
-    ESCO_8160_39 = "8160.39"
-    ESCO_8160_46 = "8160.46"
-    ESCO_1420_4_42 = "1420.4.42"
-    ESCO_5249_2_1 = "5249.2.1"
-    ESCO_2165_4_2 = "2165.4.2"
-    ESCO_2263_2 = "2263.2"
-    ESCO_7233_8 = "7233.8"
-    ESCO_8331_1 = "8331.1"
-    ESCO_1324_3_2_22 = "1324.3.2.22"
-    ESCO_2422_12_8 = "2422.12.8"
-    ESCO_3434_1_1 = "3434.1.1"
-    ESCO_8131_15 = "8131.15"
-    ESCO_1345_1_5 = "1345.1.5"
-    ESCO_3123_1_13 = "3123.1.13"
-    ESCO_2149_8 = "2149.8"
-    ESCO_3315_3 = "3315.3"
-    ESCO_1223_2_1_1 = "1223.2.1.1"
-    ESCO_8131_14 = "8131.14"
-    ESCO_2149_5_1 = "2149.5.1"
-    ESCO_3412_2 = "3412.2"
-    ESCO_7318_6 = "7318.6"
-    ESCO_7122_4 = "7122.4"
-    ESCO_1420_4_38 = "1420.4.38"
-    ESCO_1439_7 = "1439.7"
-    ESCO_6123_1 = "6123.1"
-    ESCO_3342_2 = "3342.2"
-    ESCO_3134_4 = "3134.4"
-    ESCO_8153_1_5 = "8153.1.5"
-    ESCO_8122_3 = "8122.3"
-    ESCO_6221_3 = "6221.3"
-    ESCO_7223_8 = "7223.8"
-    ESCO_1411_3 = "1411.3"
-    ESCO_7316_1_1 = "7316.1.1"
-    ESCO_2153_1 = "2153.1"
-    ESCO_2352_1_1 = "2352.1.1"
-    ESCO_1321_2_2_1 = "1321.2.2.1"
-    ESCO_7126_12 = "7126.12"
-    ESCO_1324_3_1_6_11 = "1324.3.1.6.11"
-    ESCO_2352_1_6 = "2352.1.6"
-    ESCO_1431_1_2 = "1431.1.2"
-    ESCO_1321_2_1_8 = "1321.2.1.8"
-    ESCO_8211_1_1 = "8211.1.1"
-    ESCO_2146_11 = "2146.11"
-    ESCO_1420_4_4 = "1420.4.4"
-    ESCO_5223_7_21 = "5223.7.21"
-    ESCO_2341_1 = "2341.1"
-    ESCO_8331_2 = "8331.2"
-    ESCO_3122_3_2 = "3122.3.2"
-    ESCO_4321_1_5 = "4321.1.5"
-    ESCO_3343_1 = "3343.1"
-    ESCO_8160_22 = "8160.22"
-    ESCO_3344_1 = "3344.1"
-    ESCO_2529_6 = "2529.6"
-    ESCO_3123_1_1 = "3123.1.1"
-    ESCO_2269_3 = "2269.3"
-    ESCO_8114_6 = "8114.6"
-    ESCO_3115_1_7 = "3115.1.7"
-    ESCO_1221_1 = "1221.1"
-    ESCO_2512_2 = "2512.2"
-    ESCO_1211_1_1 = "1211.1.1"
-    ESCO_1219_5_2 = "1219.5.2"
-    ESCO_2422_14 = "2422.14"
-    ESCO_7422_7 = "7422.7"
-    ESCO_5242_1 = "5242.1"
-    ESCO_2320_1_17 = "2320.1.17"
-    ESCO_3311_3_2 = "3311.3.2"
-    ESCO_3115_1_1 = "3115.1.1"
-    ESCO_8172_5_3 = "8172.5.3"
-    ESCO_3123_1_2 = "3123.1.2"
-    ESCO_7112_1 = "7112.1"
-    ESCO_7511_4 = "7511.4"
-    ESCO_2632_4 = "2632.4"
-    ESCO_3521_1_4 = "3521.1.4"
-    ESCO_5223_7_16 = "5223.7.16"
-    ESCO_1322_1_2 = "1322.1.2"
-    ESCO_3117_3 = "3117.3"
-    ESCO_8151_3 = "8151.3"
-    ESCO_7122_3 = "7122.3"
-    ESCO_3119_16_6 = "3119.16.6"
-    ESCO_7516_1 = "7516.1"
-    ESCO_8122_8 = "8122.8"
-    ESCO_2423_6 = "2423.6"
-    ESCO_2120_1 = "2120.1"
-    ESCO_2166_11 = "2166.11"
-    ESCO_2653_1_2 = "2653.1.2"
-    ESCO_7412_1 = "7412.1"
-    ESCO_2163_1_3_2 = "2163.1.3.2"
-    ESCO_1120_5 = "1120.5"
-    ESCO_7532_3 = "7532.3"
-    ESCO_1112_6 = "1112.6"
-    ESCO_3312_2_1 = "3312.2.1"
-    ESCO_3123_1_17 = "3123.1.17"
-    ESCO_2413_1_4 = "2413.1.4"
-    ESCO_2653_2 = "2653.2"
-    ESCO_7536_2_1 = "7536.2.1"
-    ESCO_2612_1 = "2612.1"
-    ESCO_2163_1_7 = "2163.1.7"
-    ESCO_7322_2 = "7322.2"
-    ESCO_2149_7 = "2149.7"
-    ESCO_2511_17 = "2511.17"
-    ESCO_2112_1_3 = "2112.1.3"
-    ESCO_2659_3 = "2659.3"
-    ESCO_1431_2_5 = "1431.2.5"
-    ESCO_3421_1 = "3421.1"
-    ESCO_2250_8 = "2250.8"
-    ESCO_3435_4 = "3435.4"
-    ESCO_3119_4 = "3119.4"
-    ESCO_1213_5_1 = "1213.5.1"
-    ESCO_2513_2 = "2513.2"
-    ESCO_7126_14 = "7126.14"
-    ESCO_2635_3_27_1 = "2635.3.27.1"
-    ESCO_3323_2_1 = "3323.2.1"
-    ESCO_2310_1_14 = "2310.1.14"
-    ESCO_5223_2 = "5223.2"
-    ESCO_5141_1 = "5141.1"
-    ESCO_2651_2 = "2651.2"
-    ESCO_2656_3 = "2656.3"
-    ESCO_3422_4_2 = "3422.4.2"
-    ESCO_3112_1_5_1 = "3112.1.5.1"
-    ESCO_4110_1_1 = "4110.1.1"
-    ESCO_7536_2_6 = "7536.2.6"
-    ESCO_5311_1_4 = "5311.1.4"
-    ESCO_3324_4_27 = "3324.4.27"
-    ESCO_7214_3_1 = "7214.3.1"
-    ESCO_7312_6 = "7312.6"
-    ESCO_8159_8 = "8159.8"
-    ESCO_2519_6 = "2519.6"
-    ESCO_7221_3 = "7221.3"
-    ESCO_8143_7 = "8143.7"
-    ESCO_2250_4_2 = "2250.4.2"
-    ESCO_7232_2 = "7232.2"
-    ESCO_3422_4_1 = "3422.4.1"
-    ESCO_5164_1 = "5164.1"
-    ESCO_5223_6 = "5223.6"
-    ESCO_0110_9 = "0110.9"
-    ESCO_2250_4 = "2250.4"
-    ESCO_3258_2 = "3258.2"
-    ESCO_7115_2 = "7115.2"
-    ESCO_7233_4 = "7233.4"
-    ESCO_2424_2 = "2424.2"
-    ESCO_2144_1_21 = "2144.1.21"
-    ESCO_2310_1_25 = "2310.1.25"
-    ESCO_4223_1 = "4223.1"
-    ESCO_3256_1 = "3256.1"
-    ESCO_7413_1_1 = "7413.1.1"
-    ESCO_3423_3 = "3423.3"
-    ESCO_8322_2 = "8322.2"
-    ESCO_2529_2 = "2529.2"
-    ESCO_2152_1_5 = "2152.1.5"
-    ESCO_1420_4_40 = "1420.4.40"
-    ESCO_1324_3_2_1 = "1324.3.2.1"
-    ESCO_2149_14 = "2149.14"
-    ESCO_4323_19 = "4323.19"
-    ESCO_2633_1 = "2633.1"
-    ESCO_2529_7 = "2529.7"
-    ESCO_1321_2_1_1 = "1321.2.1.1"
-    ESCO_2635_3_2 = "2635.3.2"
-    ESCO_1324_2 = "1324.2"
-    ESCO_2330_1_9 = "2330.1.9"
-    ESCO_8131_10 = "8131.10"
-    ESCO_6221_11 = "6221.11"
-    ESCO_3111_8 = "3111.8"
-    ESCO_2113_1 = "2113.1"
-    ESCO_5223_7_1 = "5223.7.1"
-    ESCO_3521_1_10 = "3521.1.10"
-    ESCO_8157_1 = "8157.1"
-    ESCO_3141_1 = "3141.1"
-    ESCO_8131_9 = "8131.9"
-    ESCO_2656_1 = "2656.1"
-    ESCO_3123_1 = "3123.1"
-    ESCO_1221_3 = "1221.3"
-    ESCO_3341_6 = "3341.6"
-    ESCO_7223_1 = "7223.1"
-    ESCO_2652_3_1 = "2652.3.1"
-    ESCO_3122_4_7 = "3122.4.7"
-    ESCO_2149_9_7 = "2149.9.7"
-    ESCO_3114_1_6 = "3114.1.6"
-    ESCO_8343_5 = "8343.5"
-    ESCO_7231_4 = "7231.4"
-    ESCO_2412_6_3 = "2412.6.3"
-    ESCO_5244_1 = "5244.1"
-    ESCO_6129_1 = "6129.1"
-    ESCO_1111_6 = "1111.6"
-    ESCO_3435_15_1 = "3435.15.1"
-    ESCO_2636_3 = "2636.3"
-    ESCO_3115_1_18 = "3115.1.18"
-    ESCO_3334_5 = "3334.5"
-    ESCO_3112_1 = "3112.1"
-    ESCO_3411_5 = "3411.5"
-    ESCO_2163_1_8 = "2163.1.8"
-    ESCO_2262_1_1 = "2262.1.1"
-    ESCO_7126_13 = "7126.13"
-    ESCO_7223_2 = "7223.2"
-    ESCO_8141_1_6 = "8141.1.6"
-    ESCO_8160_11 = "8160.11"
-    ESCO_3434_1 = "3434.1"
-    ESCO_2131_7 = "2131.7"
-    ESCO_2519_4 = "2519.4"
-    ESCO_7313_1_1 = "7313.1.1"
-    ESCO_2352_2 = "2352.2"
-    ESCO_2511_5 = "2511.5"
-    ESCO_2519_7 = "2519.7"
-    ESCO_8151_2_2 = "8151.2.2"
-    ESCO_1322_1 = "1322.1"
-    ESCO_3254_1_1 = "3254.1.1"
-    ESCO_2310_1_42 = "2310.1.42"
-    ESCO_1219_7 = "1219.7"
-    ESCO_5223_7_33 = "5223.7.33"
-    ESCO_2352_1_3 = "2352.1.3"
-    ESCO_2433_3 = "2433.3"
-    ESCO_3422_4 = "3422.4"
-    ESCO_2310_1_38 = "2310.1.38"
-    ESCO_2166_8 = "2166.8"
-    ESCO_3115_1_16 = "3115.1.16"
-    ESCO_5113_1_1 = "5113.1.1"
-    ESCO_2269_2 = "2269.2"
-    ESCO_2113_1_4 = "2113.1.4"
-    ESCO_2133_7 = "2133.7"
-    ESCO_2632_6 = "2632.6"
-    ESCO_5120_1_4 = "5120.1.4"
-    ESCO_7311_1 = "7311.1"
-    ESCO_3119_6 = "3119.6"
-    ESCO_1324_3_2_20 = "1324.3.2.20"
-    ESCO_8160_6 = "8160.6"
-    ESCO_8141_1_8 = "8141.1.8"
-    ESCO_7211_1_1 = "7211.1.1"
-    ESCO_3512_2 = "3512.2"
-    ESCO_5223_7_6 = "5223.7.6"
-    ESCO_3131_3_5 = "3131.3.5"
-    ESCO_5419_4 = "5419.4"
-    ESCO_7222_2 = "7222.2"
-    ESCO_8312_2 = "8312.2"
-    ESCO_2631_2_1 = "2631.2.1"
-    ESCO_1219_2 = "1219.2"
-    ESCO_3112_1_13 = "3112.1.13"
-    ESCO_2432_6_1 = "2432.6.1"
-    ESCO_2432_5 = "2432.5"
-    ESCO_5322_1 = "5322.1"
-    ESCO_3122_5 = "3122.5"
-    ESCO_1324_3_1_6_27 = "1324.3.1.6.27"
-    ESCO_4225_1 = "4225.1"
-    ESCO_2652_2 = "2652.2"
-    ESCO_5223_7_8 = "5223.7.8"
-    ESCO_1345_1_9 = "1345.1.9"
-    ESCO_3322_1 = "3322.1"
-    ESCO_8212_3_6 = "8212.3.6"
-    ESCO_4321_1_1 = "4321.1.1"
-    ESCO_1431_2_3 = "1431.2.3"
-    ESCO_1223_2_1 = "1223.2.1"
-    ESCO_7314_1 = "7314.1"
-    ESCO_3252_1 = "3252.1"
-    ESCO_6121_3 = "6121.3"
-    ESCO_7536_2_7 = "7536.2.7"
-    ESCO_8159_1 = "8159.1"
-    ESCO_7131_1 = "7131.1"
-    ESCO_2521_5 = "2521.5"
-    ESCO_7231_5 = "7231.5"
-    ESCO_7421_7 = "7421.7"
-    ESCO_9121_1 = "9121.1"
-    ESCO_3240_2_1 = "3240.2.1"
-    ESCO_7311_2 = "7311.2"
-    ESCO_5164_1_2 = "5164.1.2"
-    ESCO_3314_1 = "3314.1"
-    ESCO_2619_4 = "2619.4"
-    ESCO_8131_2_4 = "8131.2.4"
-    ESCO_2434_3 = "2434.3"
-    ESCO_1221_3_2_1_3 = "1221.3.2.1.3"
-    ESCO_7223_16 = "7223.16"
-    ESCO_8156_2_1 = "8156.2.1"
-    ESCO_3131_3_3 = "3131.3.3"
-    ESCO_3119_16_5 = "3119.16.5"
-    ESCO_3122_4_14 = "3122.4.14"
-    ESCO_2144_1_23 = "2144.1.23"
-    ESCO_8156_2_4 = "8156.2.4"
-    ESCO_3259_1 = "3259.1"
-    ESCO_8160_49 = "8160.49"
-    ESCO_2131_4_4 = "2131.4.4"
-    ESCO_3324_4_18 = "3324.4.18"
-    ESCO_1324_3_2_16 = "1324.3.2.16"
-    ESCO_8341_3 = "8341.3"
-    ESCO_2114_1_6 = "2114.1.6"
-    ESCO_8183_2 = "8183.2"
-    ESCO_7212_2 = "7212.2"
-    ESCO_8212_1 = "8212.1"
-    ESCO_2320_1_15 = "2320.1.15"
-    ESCO_5153_1 = "5153.1"
-    ESCO_7532_7 = "7532.7"
-    ESCO_8219_1 = "8219.1"
-    ESCO_7223_4_1 = "7223.4.1"
-    ESCO_3111_12 = "3111.12"
-    ESCO_2120_3 = "2120.3"
-    ESCO_2635_3_7 = "2635.3.7"
-    ESCO_4322_1 = "4322.1"
-    ESCO_2653_1 = "2653.1"
-    ESCO_7223_20 = "7223.20"
-    ESCO_8152_1_2 = "8152.1.2"
-    ESCO_3123_1_25 = "3123.1.25"
-    ESCO_2413_1_3 = "2413.1.3"
-    ESCO_8350_4 = "8350.4"
-    ESCO_2221_3 = "2221.3"
-    ESCO_7119_1 = "7119.1"
-    ESCO_3123_1_15 = "3123.1.15"
-    ESCO_1112_3_1 = "1112.3.1"
-    ESCO_7532_4 = "7532.4"
-    ESCO_5142_7 = "5142.7"
-    ESCO_8131_6 = "8131.6"
-    ESCO_1420_4_17 = "1420.4.17"
-    ESCO_7312_3_1 = "7312.3.1"
-    ESCO_7215_2_3 = "7215.2.3"
-    ESCO_2632_1_2 = "2632.1.2"
-    ESCO_2635_3_10 = "2635.3.10"
-    ESCO_2643_6 = "2643.6"
-    ESCO_3119_11 = "3119.11"
-    ESCO_7213_2 = "7213.2"
-    ESCO_2422_16 = "2422.16"
-    ESCO_8211_3 = "8211.3"
-    ESCO_2654_1_8 = "2654.1.8"
-    ESCO_3312_2 = "3312.2"
-    ESCO_9112_5 = "9112.5"
-    ESCO_7311_6 = "7311.6"
-    ESCO_9214_2 = "9214.2"
-    ESCO_3435_22 = "3435.22"
-    ESCO_7512_1 = "7512.1"
-    ESCO_3132_7 = "3132.7"
-    ESCO_2330_1_18 = "2330.1.18"
-    ESCO_2411_1_7 = "2411.1.7"
-    ESCO_4229_2 = "4229.2"
-    ESCO_2113_1_2 = "2113.1.2"
-    ESCO_3332_2 = "3332.2"
-    ESCO_1420_4_30 = "1420.4.30"
-    ESCO_3257_6 = "3257.6"
-    ESCO_3132_2 = "3132.2"
-    ESCO_8156_2 = "8156.2"
-    ESCO_6114_1 = "6114.1"
-    ESCO_8154_1 = "8154.1"
-    ESCO_8341_2 = "8341.2"
-    ESCO_2166_10 = "2166.10"
-    ESCO_8332_5 = "8332.5"
-    ESCO_3435_23 = "3435.23"
-    ESCO_2310_1_28 = "2310.1.28"
-    ESCO_8342_9 = "8342.9"
-    ESCO_2142_1_4 = "2142.1.4"
-    ESCO_6130_2 = "6130.2"
-    ESCO_7543_7_3 = "7543.7.3"
-    ESCO_2144_1_6 = "2144.1.6"
-    ESCO_2511_2 = "2511.2"
-    ESCO_2529_3 = "2529.3"
-    ESCO_8122_12 = "8122.12"
-    ESCO_1213_6 = "1213.6"
-    ESCO_2112_1 = "2112.1"
-    ESCO_1431_2_6 = "1431.2.6"
-    ESCO_3118_3_1 = "3118.3.1"
-    ESCO_5411_1_1 = "5411.1.1"
-    ESCO_7535_2 = "7535.2"
-    ESCO_7536_1_2 = "7536.1.2"
-    ESCO_7421_4 = "7421.4"
-    ESCO_2659_2_2 = "2659.2.2"
-    ESCO_3343_1_3 = "3343.1.3"
-    ESCO_7319_2 = "7319.2"
-    ESCO_2263_3_1 = "2263.3.1"
-    ESCO_7223_4_2 = "7223.4.2"
-    ESCO_2163_1_1 = "2163.1.1"
-    ESCO_3339_5 = "3339.5"
-    ESCO_1221_3_2_1_4 = "1221.3.2.1.4"
-    ESCO_0210_3 = "0210.3"
-    ESCO_8343_4 = "8343.4"
-    ESCO_3118_3_7 = "3118.3.7"
-    ESCO_2413_1_1 = "2413.1.1"
-    ESCO_7223_4_8 = "7223.4.8"
-    ESCO_8160_7 = "8160.7"
-    ESCO_3123_1_18 = "3123.1.18"
-    ESCO_8332_1 = "8332.1"
-    ESCO_2355_3 = "2355.3"
-    ESCO_5164_2 = "5164.2"
-    ESCO_1324_3_2_13 = "1324.3.2.13"
-    ESCO_5312_4 = "5312.4"
-    ESCO_3412_6 = "3412.6"
-    ESCO_9629_6 = "9629.6"
-    ESCO_8343_3 = "8343.3"
-    ESCO_3311_3_1 = "3311.3.1"
-    ESCO_9129_2 = "9129.2"
-    ESCO_3412_4_6 = "3412.4.6"
-    ESCO_4312_1 = "4312.1"
-    ESCO_3142_1 = "3142.1"
-    ESCO_1321_2_2_2 = "1321.2.2.2"
-    ESCO_2149_2_2 = "2149.2.2"
-    ESCO_2144_1_8 = "2144.1.8"
-    ESCO_1112_3 = "1112.3"
-    ESCO_6112_5 = "6112.5"
-    ESCO_3152_3 = "3152.3"
-    ESCO_2149_9_2 = "2149.9.2"
-    ESCO_2151_1_2 = "2151.1.2"
-    ESCO_3122_3_7 = "3122.3.7"
-    ESCO_2632_2 = "2632.2"
-    ESCO_3339_6 = "3339.6"
-    ESCO_7541_2 = "7541.2"
-    ESCO_2359_4 = "2359.4"
-    ESCO_9216_3 = "9216.3"
-    ESCO_2421_3 = "2421.3"
-    ESCO_8156_1 = "8156.1"
-    ESCO_2423_4 = "2423.4"
-    ESCO_3123_1_4 = "3123.1.4"
-    ESCO_1349_22 = "1349.22"
-    ESCO_6112_2_1 = "6112.2.1"
-    ESCO_7125_2 = "7125.2"
-    ESCO_3114_1_7 = "3114.1.7"
-    ESCO_5152_1 = "5152.1"
-    ESCO_3134_3 = "3134.3"
-    ESCO_8172_5_4 = "8172.5.4"
-    ESCO_2421_1_1 = "2421.1.1"
-    ESCO_8312_5 = "8312.5"
-    ESCO_8155_1_1 = "8155.1.1"
-    ESCO_8131_8 = "8131.8"
-    ESCO_3339_4 = "3339.4"
-    ESCO_2431_16 = "2431.16"
-    ESCO_7544_1 = "7544.1"
-    ESCO_2412_4 = "2412.4"
-    ESCO_2359_13 = "2359.13"
-    ESCO_9312_1_6 = "9312.1.6"
-    ESCO_8154_2 = "8154.2"
-    ESCO_8219_7 = "8219.7"
-    ESCO_3435_13 = "3435.13"
-    ESCO_2659_2_1 = "2659.2.1"
-    ESCO_7543_7_4 = "7543.7.4"
-    ESCO_2511_7 = "2511.7"
-    ESCO_4131_1 = "4131.1"
-    ESCO_7223_13 = "7223.13"
-    ESCO_3315_1 = "3315.1"
-    ESCO_3423_1 = "3423.1"
-    ESCO_3133_1_1 = "3133.1.1"
-    ESCO_8131_2_2 = "8131.2.2"
-    ESCO_3521_1_9 = "3521.1.9"
-    ESCO_3121_1_1 = "3121.1.1"
-    ESCO_3112_6 = "3112.6"
-    ESCO_1324_3_1_6_13 = "1324.3.1.6.13"
-    ESCO_9112_3 = "9112.3"
-    ESCO_7321_1_1 = "7321.1.1"
-    ESCO_2643_2 = "2643.2"
-    ESCO_7233_6 = "7233.6"
-    ESCO_7233_14 = "7233.14"
-    ESCO_2359_8 = "2359.8"
-    ESCO_2512_4_1 = "2512.4.1"
-    ESCO_2152_1_14 = "2152.1.14"
-    ESCO_8141_1_7 = "8141.1.7"
-    ESCO_1324_3_1_6_8 = "1324.3.1.6.8"
-    ESCO_6223_1 = "6223.1"
-    ESCO_2412_6_1 = "2412.6.1"
-    ESCO_9329_1 = "9329.1"
-    ESCO_2144_1_20 = "2144.1.20"
-    ESCO_2619_5 = "2619.5"
-    ESCO_7115_5 = "7115.5"
-    ESCO_8332_8 = "8332.8"
-    ESCO_8219_6 = "8219.6"
-    ESCO_1324_3_1_6_25 = "1324.3.1.6.25"
-    ESCO_7231_3 = "7231.3"
-    ESCO_1349_16 = "1349.16"
-    ESCO_7536_1 = "7536.1"
-    ESCO_3240_2_4 = "3240.2.4"
-    ESCO_3119_12 = "3119.12"
-    ESCO_3118_3_6 = "3118.3.6"
-    ESCO_8121_1 = "8121.1"
-    ESCO_7543_6 = "7543.6"
-    ESCO_2165_1 = "2165.1"
-    ESCO_2131_4_11 = "2131.4.11"
-    ESCO_2511_4 = "2511.4"
-    ESCO_5165_1_3 = "5165.1.3"
-    ESCO_8142_4 = "8142.4"
-    ESCO_9629_4 = "9629.4"
-    ESCO_4323_16 = "4323.16"
-    ESCO_5113_1_2 = "5113.1.2"
-    ESCO_2655_1 = "2655.1"
-    ESCO_1321_2_1_6_2 = "1321.2.1.6.2"
-    ESCO_0110_11 = "0110.11"
-    ESCO_7231_9 = "7231.9"
-    ESCO_4212_2 = "4212.2"
-    ESCO_5164_2_1_1 = "5164.2.1.1"
-    ESCO_7512_4 = "7512.4"
-    ESCO_5223_7_11 = "5223.7.11"
-    ESCO_7233_7 = "7233.7"
-    ESCO_7215_2_1 = "7215.2.1"
-    ESCO_2642_1_10 = "2642.1.10"
-    ESCO_2642_1_13 = "2642.1.13"
-    ESCO_3114_1_8 = "3114.1.8"
-    ESCO_6222_1 = "6222.1"
-    ESCO_2413_2 = "2413.2"
-    ESCO_2529_1 = "2529.1"
-    ESCO_3114_1 = "3114.1"
-    ESCO_4323_12 = "4323.12"
-    ESCO_3153_4 = "3153.4"
-    ESCO_3359_5_1 = "3359.5.1"
-    ESCO_2330_1_8 = "2330.1.8"
-    ESCO_2146_5_1 = "2146.5.1"
-    ESCO_8143_6 = "8143.6"
-    ESCO_2659_2_3 = "2659.2.3"
-    ESCO_2422_12_14 = "2422.12.14"
-    ESCO_2133_13 = "2133.13"
-    ESCO_3240_1 = "3240.1"
-    ESCO_7533_4 = "7533.4"
-    ESCO_8160_14 = "8160.14"
-    ESCO_8159_2 = "8159.2"
-    ESCO_4221_8 = "4221.8"
-    ESCO_7543_2 = "7543.2"
-    ESCO_2112_1_1 = "2112.1.1"
-    ESCO_7532_5 = "7532.5"
-    ESCO_8131_19_1 = "8131.19.1"
-    ESCO_1324_3_1_6_19 = "1324.3.1.6.19"
-    ESCO_3422_4_3 = "3422.4.3"
-    ESCO_3323_2 = "3323.2"
-    ESCO_3343_3 = "3343.3"
-    ESCO_6121_6 = "6121.6"
-    ESCO_3123_1_19 = "3123.1.19"
-    ESCO_7115_1 = "7115.1"
-    ESCO_8160_15 = "8160.15"
-    ESCO_3435_7 = "3435.7"
-    ESCO_8113_4 = "8113.4"
-    ESCO_7222_1 = "7222.1"
-    ESCO_2142_1_2 = "2142.1.2"
-    ESCO_7233_15 = "7233.15"
-    ESCO_7542_1 = "7542.1"
-    ESCO_3118_3_10 = "3118.3.10"
-    ESCO_1324_3_1_6_12 = "1324.3.1.6.12"
-    ESCO_7311_3 = "7311.3"
-    ESCO_1112_5 = "1112.5"
-    ESCO_3412_4_3 = "3412.4.3"
-    ESCO_3324_1 = "3324.1"
-    ESCO_1420_4_5 = "1420.4.5"
-    ESCO_8152_2 = "8152.2"
-    ESCO_5164_6 = "5164.6"
-    ESCO_3123_1_22 = "3123.1.22"
-    ESCO_3257_7 = "3257.7"
-    ESCO_7543_9_1 = "7543.9.1"
-    ESCO_2330_1_5 = "2330.1.5"
-    ESCO_1345_1_2 = "1345.1.2"
-    ESCO_5230_1 = "5230.1"
-    ESCO_3114_1_4 = "3114.1.4"
-    ESCO_9623_1 = "9623.1"
-    ESCO_8183_5 = "8183.5"
-    ESCO_5249_2_2 = "5249.2.2"
-    ESCO_2511_6 = "2511.6"
-    ESCO_2141_1 = "2141.1"
-    ESCO_5165_2 = "5165.2"
-    ESCO_1345_1_4 = "1345.1.4"
-    ESCO_3141_2_4 = "3141.2.4"
-    ESCO_3353_1 = "3353.1"
-    ESCO_1349_8 = "1349.8"
-    ESCO_9332_1 = "9332.1"
-    ESCO_8159_4 = "8159.4"
-    ESCO_2619_1 = "2619.1"
-    ESCO_8182_1 = "8182.1"
-    ESCO_3435_3 = "3435.3"
-    ESCO_1420_4_43 = "1420.4.43"
-    ESCO_3122_4_8 = "3122.4.8"
-    ESCO_1213_8 = "1213.8"
-    ESCO_4214_2 = "4214.2"
-    ESCO_1221_4 = "1221.4"
-    ESCO_5142_10 = "5142.10"
-    ESCO_2433_6_1 = "2433.6.1"
-    ESCO_7213_3 = "7213.3"
-    ESCO_5131_2_2_3 = "5131.2.2.3"
-    ESCO_7115_7 = "7115.7"
-    ESCO_2230_2_1 = "2230.2.1"
-    ESCO_3324_4_11 = "3324.4.11"
-    ESCO_2359_2 = "2359.2"
-    ESCO_5419_9 = "5419.9"
-    ESCO_8350_1 = "8350.1"
-    ESCO_9216_1 = "9216.1"
-    ESCO_3123_1_14 = "3123.1.14"
-    ESCO_2131_8 = "2131.8"
-    ESCO_5223_7_4 = "5223.7.4"
-    ESCO_3123_1_6 = "3123.1.6"
-    ESCO_1420_3 = "1420.3"
-    ESCO_8181_3_2 = "8181.3.2"
-    ESCO_2514_2_2 = "2514.2.2"
-    ESCO_9121_2 = "9121.2"
-    ESCO_3324_4_12 = "3324.4.12"
-    ESCO_7422_1 = "7422.1"
-    ESCO_7323_3 = "7323.3"
-    ESCO_2141_4_2_2 = "2141.4.2.2"
-    ESCO_2654_1_4 = "2654.1.4"
-    ESCO_1324_3_4 = "1324.3.4"
-    ESCO_5132_1 = "5132.1"
-    ESCO_4212_1 = "4212.1"
-    ESCO_1349_4 = "1349.4"
-    ESCO_8114_1 = "8114.1"
-    ESCO_7223_19 = "7223.19"
-    ESCO_7212_3_3 = "7212.3.3"
-    ESCO_4211_1 = "4211.1"
-    ESCO_2310_1_7 = "2310.1.7"
-    ESCO_3222_1 = "3222.1"
-    ESCO_5419_7 = "5419.7"
-    ESCO_7543_8_1 = "7543.8.1"
-    ESCO_7514_3 = "7514.3"
-    ESCO_9112_2 = "9112.2"
-    ESCO_3115_1_15 = "3115.1.15"
-    ESCO_3114_1_5 = "3114.1.5"
-    ESCO_2310_1_13 = "2310.1.13"
-    ESCO_3435_7_1 = "3435.7.1"
-    ESCO_4321_1_4 = "4321.1.4"
-    ESCO_3118_3_4 = "3118.3.4"
-    ESCO_2654_1_1 = "2654.1.1"
-    ESCO_2149_2_7 = "2149.2.7"
-    ESCO_3341_1 = "3341.1"
-    ESCO_8131_12 = "8131.12"
-    ESCO_1211_1 = "1211.1"
-    ESCO_8131_5 = "8131.5"
-    ESCO_8212_5 = "8212.5"
-    ESCO_1321_2_1_6 = "1321.2.1.6"
-    ESCO_5414_1 = "5414.1"
-    ESCO_2619_7 = "2619.7"
-    ESCO_3240_2_2 = "3240.2.2"
-    ESCO_3141_2_3 = "3141.2.3"
-    ESCO_5161_3 = "5161.3"
-    ESCO_4321_1_2 = "4321.1.2"
-    ESCO_3331_2_1_35 = "3331.2.1.35"
-    ESCO_6221_1 = "6221.1"
-    ESCO_3331_2_1_2 = "3331.2.1.2"
-    ESCO_2143_1_1 = "2143.1.1"
-    ESCO_8160_52 = "8160.52"
-    ESCO_3112_1_4 = "3112.1.4"
-    ESCO_3119_19 = "3119.19"
-    ESCO_3252_3 = "3252.3"
-    ESCO_3240_2_3 = "3240.2.3"
-    ESCO_3312_3 = "3312.3"
-    ESCO_7322_7 = "7322.7"
-    ESCO_5413_2 = "5413.2"
-    ESCO_7234_1 = "7234.1"
-    ESCO_7411_1_1 = "7411.1.1"
-    ESCO_3413_1 = "3413.1"
-    ESCO_3331_2_1_22 = "3331.2.1.22"
-    ESCO_2269_4 = "2269.4"
-    ESCO_1431_2_1 = "1431.2.1"
-    ESCO_2519_7_1 = "2519.7.1"
-    ESCO_3111_3 = "3111.3"
-    ESCO_3151_1 = "3151.1"
-    ESCO_5311_1 = "5311.1"
-    ESCO_8152_3_1 = "8152.3.1"
-    ESCO_3118_3_3 = "3118.3.3"
-    ESCO_4226_1_1 = "4226.1.1"
-    ESCO_1345_1_10 = "1345.1.10"
-    ESCO_2512_1 = "2512.1"
-    ESCO_8160_21 = "8160.21"
-    ESCO_8131_19_2 = "8131.19.2"
-    ESCO_2163_1_5 = "2163.1.5"
-    ESCO_3432_4 = "3432.4"
-    ESCO_7511_6 = "7511.6"
-    ESCO_2133_10 = "2133.10"
-    ESCO_8151_2_1 = "8151.2.1"
-    ESCO_1324_5 = "1324.5"
-    ESCO_7115_6 = "7115.6"
-    ESCO_2612_1_1 = "2612.1.1"
-    ESCO_2511_11 = "2511.11"
-    ESCO_2431_10_4 = "2431.10.4"
-    ESCO_7318_4 = "7318.4"
-    ESCO_7543_8_3 = "7543.8.3"
-    ESCO_3116_1 = "3116.1"
-    ESCO_3332_3 = "3332.3"
-    ESCO_2149_11_2 = "2149.11.2"
-    ESCO_2152_1_11 = "2152.1.11"
-    ESCO_3324_4_8 = "3324.4.8"
-    ESCO_2330_1_17 = "2330.1.17"
-    ESCO_0310_4 = "0310.4"
-    ESCO_3432_6 = "3432.6"
-    ESCO_7422_4 = "7422.4"
-    ESCO_7512_2 = "7512.2"
-    ESCO_4312_2_1 = "4312.2.1"
-    ESCO_3521_1_8 = "3521.1.8"
-    ESCO_2221_1 = "2221.1"
-    ESCO_3118_3_2 = "3118.3.2"
-    ESCO_2166_14 = "2166.14"
-    ESCO_8111_2 = "8111.2"
-    ESCO_8160_23 = "8160.23"
-    ESCO_7543_9_2 = "7543.9.2"
-    ESCO_8171_6 = "8171.6"
-    ESCO_9211_1 = "9211.1"
-    ESCO_5414_1_9 = "5414.1.9"
-    ESCO_2651_1 = "2651.1"
-    ESCO_7313_1_3 = "7313.1.3"
-    ESCO_8160_50 = "8160.50"
-    ESCO_2622_1 = "2622.1"
-    ESCO_1324_8_2 = "1324.8.2"
-    ESCO_3359_6 = "3359.6"
-    ESCO_4411_1 = "4411.1"
-    ESCO_2320_1_13 = "2320.1.13"
-    ESCO_7511_1 = "7511.1"
-    ESCO_3122_3_4 = "3122.3.4"
-    ESCO_1324_3_1_6_5 = "1324.3.1.6.5"
-    ESCO_7543_10_2 = "7543.10.2"
-    ESCO_3118_3_11 = "3118.3.11"
-    ESCO_2422_12_2 = "2422.12.2"
-    ESCO_5223_1 = "5223.1"
-    ESCO_3115_1_9 = "3115.1.9"
-    ESCO_3355_2 = "3355.2"
-    ESCO_3422_5 = "3422.5"
-    ESCO_3114_1_2 = "3114.1.2"
-    ESCO_2412_6 = "2412.6"
-    ESCO_5153_1_1 = "5153.1.1"
-    ESCO_5249_2 = "5249.2"
-    ESCO_2631_1 = "2631.1"
-    ESCO_3423_2_4 = "3423.2.4"
-    ESCO_3331_2 = "3331.2"
-    ESCO_5223_7_28 = "5223.7.28"
-    ESCO_9629_3 = "9629.3"
-    ESCO_3331_2_1_14 = "3331.2.1.14"
-    ESCO_3354_2 = "3354.2"
-    ESCO_2320_1_19 = "2320.1.19"
-    ESCO_8131_19 = "8131.19"
-    ESCO_2422_2 = "2422.2"
-    ESCO_8331_1_1 = "8331.1.1"
-    ESCO_5223_7_3 = "5223.7.3"
-    ESCO_8350_6 = "8350.6"
-    ESCO_1420_6 = "1420.6"
-    ESCO_7316_2 = "7316.2"
-    ESCO_2310_2 = "2310.2"
-    ESCO_8131_18 = "8131.18"
-    ESCO_7543_1 = "7543.1"
-    ESCO_7223_4_5 = "7223.4.5"
-    ESCO_1420_4_9 = "1420.4.9"
-    ESCO_9331_1 = "9331.1"
-    ESCO_3324_4 = "3324.4"
-    ESCO_3339_8 = "3339.8"
-    ESCO_3331_2_1_16 = "3331.2.1.16"
-    ESCO_2632_6_1 = "2632.6.1"
-    ESCO_1321_2_1_2 = "1321.2.1.2"
-    ESCO_2132_4 = "2132.4"
-    ESCO_2164_2 = "2164.2"
-    ESCO_2519_3 = "2519.3"
-    ESCO_2635_3_14 = "2635.3.14"
-    ESCO_3422_3_1 = "3422.3.1"
-    ESCO_8160_40 = "8160.40"
-    ESCO_7231_8 = "7231.8"
-    ESCO_2654_3_2 = "2654.3.2"
-    ESCO_3311_3_5 = "3311.3.5"
-    ESCO_2341_1_1 = "2341.1.1"
-    ESCO_7523_5 = "7523.5"
-    ESCO_8122_1 = "8122.1"
-    ESCO_3119_17 = "3119.17"
-    ESCO_1420_4_20 = "1420.4.20"
-    ESCO_1219_1 = "1219.1"
-    ESCO_7312_5 = "7312.5"
-    ESCO_3154_1 = "3154.1"
-    ESCO_2310_1_43 = "2310.1.43"
-    ESCO_8160_13 = "8160.13"
-    ESCO_2163_1_6 = "2163.1.6"
-    ESCO_9621_2 = "9621.2"
-    ESCO_5249_3 = "5249.3"
-    ESCO_1330_9 = "1330.9"
-    ESCO_3115_1_5 = "3115.1.5"
-    ESCO_3355_1 = "3355.1"
-    ESCO_2359_11 = "2359.11"
-    ESCO_2521_4 = "2521.4"
-    ESCO_3331_2_1_3 = "3331.2.1.3"
-    ESCO_2269_9_4 = "2269.9.4"
-    ESCO_2310_1_12 = "2310.1.12"
-    ESCO_7515_1 = "7515.1"
-    ESCO_8157_1_1 = "8157.1.1"
-    ESCO_9333_1 = "9333.1"
-    ESCO_1212_3 = "1212.3"
-    ESCO_8155_1 = "8155.1"
-    ESCO_2149_2_8 = "2149.2.8"
-    ESCO_2320_1_6 = "2320.1.6"
-    ESCO_2112_1_2 = "2112.1.2"
-    ESCO_7126_1 = "7126.1"
-    ESCO_8156_3 = "8156.3"
-    ESCO_1211_1_4 = "1211.1.4"
-    ESCO_2432_6 = "2432.6"
-    ESCO_8212_2 = "8212.2"
-    ESCO_3132_1 = "3132.1"
-    ESCO_3423_2_3 = "3423.2.3"
-    ESCO_3512_4 = "3512.4"
-    ESCO_3422_3 = "3422.3"
-    ESCO_8112_4 = "8112.4"
-    ESCO_3324_4_17 = "3324.4.17"
-    ESCO_3311_2_2 = "3311.2.2"
-    ESCO_3331_2_1_13 = "3331.2.1.13"
-    ESCO_5230_2 = "5230.2"
-    ESCO_2142_1_8 = "2142.1.8"
-    ESCO_3112_3 = "3112.3"
-    ESCO_1349_10 = "1349.10"
-    ESCO_3118_3_13 = "3118.3.13"
-    ESCO_5311_1_3 = "5311.1.3"
-    ESCO_2131_4_13 = "2131.4.13"
-    ESCO_2146_2 = "2146.2"
-    ESCO_2422_7 = "2422.7"
-    ESCO_7536_2_3 = "7536.2.3"
-    ESCO_5223_7_10 = "5223.7.10"
-    ESCO_3112_1_12 = "3112.1.12"
-    ESCO_2619_9 = "2619.9"
-    ESCO_1111_2 = "1111.2"
-    ESCO_3122_4 = "3122.4"
-    ESCO_2146_3 = "2146.3"
-    ESCO_7536_2_2 = "7536.2.2"
-    ESCO_3435_5 = "3435.5"
-    ESCO_8171_1 = "8171.1"
-    ESCO_2431_13 = "2431.13"
-    ESCO_3119_10 = "3119.10"
-    ESCO_7316_1 = "7316.1"
-    ESCO_7123_1 = "7123.1"
-    ESCO_5245_1 = "5245.1"
-    ESCO_8113_1 = "8113.1"
-    ESCO_3112_4 = "3112.4"
-    ESCO_3119_15 = "3119.15"
-    ESCO_7534_3_2 = "7534.3.2"
-    ESCO_1221_3_1 = "1221.3.1"
-    ESCO_8111_4 = "8111.4"
-    ESCO_8342_4 = "8342.4"
-    ESCO_3333_1 = "3333.1"
-    ESCO_1324_3_2_27 = "1324.3.2.27"
-    ESCO_3343_5 = "3343.5"
-    ESCO_2149_9_8 = "2149.9.8"
-    ESCO_3115_1_21 = "3115.1.21"
-    ESCO_2651_6 = "2651.6"
-    ESCO_7133_4 = "7133.4"
-    ESCO_1324_3_2_7 = "1324.3.2.7"
-    ESCO_8172_5_2 = "8172.5.2"
-    ESCO_3122_4_11 = "3122.4.11"
-    ESCO_8342_7 = "8342.7"
-    ESCO_7513_1 = "7513.1"
-    ESCO_2165_4_1 = "2165.4.1"
-    ESCO_8181_1 = "8181.1"
-    ESCO_3257_5_1 = "3257.5.1"
-    ESCO_7543_3 = "7543.3"
-    ESCO_9621_1 = "9621.1"
-    ESCO_2632_3 = "2632.3"
-    ESCO_3115_1_4 = "3115.1.4"
-    ESCO_2164_1 = "2164.1"
-    ESCO_8181_9 = "8181.9"
-    ESCO_1324_3_1_6_2 = "1324.3.1.6.2"
-    ESCO_7521_1 = "7521.1"
-    ESCO_1439_5 = "1439.5"
-    ESCO_1211_1_3 = "1211.1.3"
-    ESCO_1349_1 = "1349.1"
-    ESCO_8332_2 = "8332.2"
-    ESCO_2652_1_1 = "2652.1.1"
-    ESCO_8111_1 = "8111.1"
-    ESCO_2523_1 = "2523.1"
-    ESCO_1321_2_1_7 = "1321.2.1.7"
-    ESCO_6130_1 = "6130.1"
-    ESCO_2320_1_2 = "2320.1.2"
-    ESCO_3122_4_13 = "3122.4.13"
-    ESCO_2514_1 = "2514.1"
-    ESCO_2356_1_1 = "2356.1.1"
-    ESCO_1346_3 = "1346.3"
-    ESCO_3119_16_3 = "3119.16.3"
-    ESCO_7126_2 = "7126.2"
-    ESCO_2320_1_10 = "2320.1.10"
-    ESCO_3230_1 = "3230.1"
-    ESCO_1420_4_3 = "1420.4.3"
-    ESCO_5165_1_1 = "5165.1.1"
-    ESCO_8113_9 = "8113.9"
-    ESCO_4229_1 = "4229.1"
-    ESCO_2355_5 = "2355.5"
-    ESCO_2320_1_16 = "2320.1.16"
-    ESCO_9312_1 = "9312.1"
-    ESCO_3153_2_4 = "3153.2.4"
-    ESCO_9129_3 = "9129.3"
-    ESCO_2431_10 = "2431.10"
-    ESCO_2431_2 = "2431.2"
-    ESCO_2310_1_21 = "2310.1.21"
-    ESCO_3134_1 = "3134.1"
-    ESCO_3131_1 = "3131.1"
-    ESCO_1420_4_27 = "1420.4.27"
-    ESCO_8342_2 = "8342.2"
-    ESCO_2146_4 = "2146.4"
-    ESCO_3521_1_3 = "3521.1.3"
-    ESCO_2431_10_3 = "2431.10.3"
-    ESCO_3431_2 = "3431.2"
-    ESCO_8189_1 = "8189.1"
-    ESCO_3324_4_28 = "3324.4.28"
-    ESCO_2152_1_4 = "2152.1.4"
-    ESCO_1411_2 = "1411.2"
-    ESCO_5142_8 = "5142.8"
-    ESCO_7511_1_1 = "7511.1.1"
-    ESCO_2166_3 = "2166.3"
-    ESCO_8151_2_3 = "8151.2.3"
-    ESCO_2310_1_10 = "2310.1.10"
-    ESCO_7421_1 = "7421.1"
-    ESCO_7411_1 = "7411.1"
-    ESCO_2120_4 = "2120.4"
-    ESCO_1324_3_1_6_32 = "1324.3.1.6.32"
-    ESCO_5142_5 = "5142.5"
-    ESCO_3321_3_1 = "3321.3.1"
-    ESCO_2145_1_7 = "2145.1.7"
-    ESCO_5131_2_2 = "5131.2.2"
-    ESCO_7323_1 = "7323.1"
-    ESCO_2643_3 = "2643.3"
-    ESCO_1431_2_4 = "1431.2.4"
-    ESCO_4323_6 = "4323.6"
-    ESCO_2269_1 = "2269.1"
-    ESCO_8181_4 = "8181.4"
-    ESCO_5246_2 = "5246.2"
-    ESCO_2433_6_3 = "2433.6.3"
-    ESCO_8122_11 = "8122.11"
-    ESCO_8111_3 = "8111.3"
-    ESCO_8156_2_6 = "8156.2.6"
-    ESCO_1342_2 = "1342.2"
-    ESCO_8142_8 = "8142.8"
-    ESCO_2149_11 = "2149.11"
-    ESCO_3352_1 = "3352.1"
-    ESCO_0210_1 = "0210.1"
-    ESCO_2131_8_1 = "2131.8.1"
-    ESCO_8142_10 = "8142.10"
-    ESCO_5164_2_1_2 = "5164.2.1.2"
-    ESCO_7231_10 = "7231.10"
-    ESCO_5223_7_30 = "5223.7.30"
-    ESCO_2431_12 = "2431.12"
-    ESCO_2635_3 = "2635.3"
-    ESCO_5223_7_20 = "5223.7.20"
-    ESCO_1349_13 = "1349.13"
-    ESCO_2511_8 = "2511.8"
-    ESCO_3122_4_15 = "3122.4.15"
-    ESCO_8171_5 = "8171.5"
-    ESCO_8122_4 = "8122.4"
-    ESCO_2145_1_4 = "2145.1.4"
-    ESCO_3324_3 = "3324.3"
-    ESCO_2114_1_8 = "2114.1.8"
-    ESCO_3111_6 = "3111.6"
-    ESCO_3311_3_4 = "3311.3.4"
-    ESCO_2635_3_26 = "2635.3.26"
-    ESCO_3154_1_1 = "3154.1.1"
-    ESCO_2149_10_1 = "2149.10.1"
-    ESCO_1120_3_1 = "1120.3.1"
-    ESCO_2641_1 = "2641.1"
-    ESCO_1324_3_2_25 = "1324.3.2.25"
-    ESCO_2635_3_1 = "2635.3.1"
-    ESCO_3322_1_1 = "3322.1.1"
-    ESCO_2412_6_4 = "2412.6.4"
-    ESCO_8151_4 = "8151.4"
-    ESCO_3412_4_5 = "3412.4.5"
-    ESCO_3112_1_7 = "3112.1.7"
-    ESCO_2422_8 = "2422.8"
-    ESCO_5419_8 = "5419.8"
-    ESCO_2642_1_11 = "2642.1.11"
-    ESCO_8111_5 = "8111.5"
-    ESCO_2250_7 = "2250.7"
-    ESCO_3118_1 = "3118.1"
-    ESCO_3521_1_1 = "3521.1.1"
-    ESCO_5312_1 = "5312.1"
-    ESCO_2152_1 = "2152.1"
-    ESCO_2654_1_5 = "2654.1.5"
-    ESCO_2144_1_2 = "2144.1.2"
-    ESCO_2320_1_5 = "2320.1.5"
-    ESCO_3353_2 = "3353.2"
-    ESCO_3412_4_10 = "3412.4.10"
-    ESCO_2149_4 = "2149.4"
-    ESCO_5223_7_9 = "5223.7.9"
-    ESCO_3423_1_2_1 = "3423.1.2.1"
-    ESCO_5141_1_1 = "5141.1.1"
-    ESCO_2144_1_16 = "2144.1.16"
-    ESCO_3433_2 = "3433.2"
-    ESCO_2411_1_4 = "2411.1.4"
-    ESCO_5249_2_1_7 = "5249.2.1.7"
-    ESCO_2359_5 = "2359.5"
-    ESCO_2310_1_3 = "2310.1.3"
-    ESCO_1324_3_1_4 = "1324.3.1.4"
-    ESCO_2320_1_24 = "2320.1.24"
-    ESCO_1222_1_1 = "1222.1.1"
-    ESCO_2412_10 = "2412.10"
-    ESCO_3432_4_1 = "3432.4.1"
-    ESCO_9612_1 = "9612.1"
-    ESCO_3412_4_7 = "3412.4.7"
-    ESCO_2659_1 = "2659.1"
-    ESCO_2146_5_2 = "2146.5.2"
-    ESCO_2269_7 = "2269.7"
-    ESCO_7122_2 = "7122.2"
-    ESCO_2654_1_2 = "2654.1.2"
-    ESCO_1213_2_2 = "1213.2.2"
-    ESCO_2152_1_15 = "2152.1.15"
-    ESCO_2634_2_2 = "2634.2.2"
-    ESCO_8122_9 = "8122.9"
-    ESCO_7322_6 = "7322.6"
-    ESCO_2633_3 = "2633.3"
-    ESCO_3412_5 = "3412.5"
-    ESCO_1312_1 = "1312.1"
-    ESCO_3141_2 = "3141.2"
-    ESCO_3139_2 = "3139.2"
-    ESCO_3214_3_1 = "3214.3.1"
-    ESCO_7522_3 = "7522.3"
-    ESCO_8142_7 = "8142.7"
-    ESCO_9613_1 = "9613.1"
-    ESCO_3359_5 = "3359.5"
-    ESCO_3412_4_12 = "3412.4.12"
-    ESCO_2412_1 = "2412.1"
-    ESCO_7544_1_1 = "7544.1.1"
-    ESCO_4214_1 = "4214.1"
-    ESCO_2519_7_2 = "2519.7.2"
-    ESCO_3435_25_4 = "3435.25.4"
-    ESCO_2422_12_6 = "2422.12.6"
-    ESCO_3112_9 = "3112.9"
-    ESCO_4412_1 = "4412.1"
-    ESCO_7532_6 = "7532.6"
-    ESCO_7533_5 = "7533.5"
-    ESCO_1321_3 = "1321.3"
-    ESCO_3113_1_2 = "3113.1.2"
-    ESCO_5223_7_19 = "5223.7.19"
-    ESCO_2421_5 = "2421.5"
-    ESCO_2642_1_17 = "2642.1.17"
-    ESCO_3214_1 = "3214.1"
-    ESCO_2162_1 = "2162.1"
-    ESCO_3153_2_2_1 = "3153.2.2.1"
-    ESCO_3153_2_2 = "3153.2.2"
-    ESCO_1341_1 = "1341.1"
-    ESCO_3135_1 = "3135.1"
-    ESCO_5223_7_35 = "5223.7.35"
-    ESCO_3423_1_2_2_1 = "3423.1.2.2.1"
-    ESCO_2654_3 = "2654.3"
-    ESCO_8212_4 = "8212.4"
-    ESCO_1324_3_1_6_22 = "1324.3.1.6.22"
-    ESCO_2519_7_4 = "2519.7.4"
-    ESCO_2634_2 = "2634.2"
-    ESCO_2166_3_1 = "2166.3.1"
-    ESCO_2433_6_5 = "2433.6.5"
-    ESCO_7211_1_3 = "7211.1.3"
-    ESCO_8159_3 = "8159.3"
-    ESCO_7126_6 = "7126.6"
-    ESCO_3119_14 = "3119.14"
-    ESCO_8156_4 = "8156.4"
-    ESCO_7233_13 = "7233.13"
-    ESCO_2262_1_2_2 = "2262.1.2.2"
-    ESCO_1411_1 = "1411.1"
-    ESCO_2141_4 = "2141.4"
-    ESCO_8153_1_4 = "8153.1.4"
-    ESCO_1345_1_8 = "1345.1.8"
-    ESCO_1324_3_1_6_28 = "1324.3.1.6.28"
-    ESCO_5131_2_1 = "5131.2.1"
-    ESCO_2310_1_17 = "2310.1.17"
-    ESCO_1213_5 = "1213.5"
-    ESCO_1219_5_4 = "1219.5.4"
-    ESCO_5223_7 = "5223.7"
-    ESCO_4419_1 = "4419.1"
-    ESCO_7321_1 = "7321.1"
-    ESCO_2113_1_6 = "2113.1.6"
-    ESCO_2114_1_5 = "2114.1.5"
-    ESCO_2149_15 = "2149.15"
-    ESCO_8160_10 = "8160.10"
-    ESCO_0310_5 = "0310.5"
-    ESCO_4323_8 = "4323.8"
-    ESCO_2250_9 = "2250.9"
-    ESCO_7531_2 = "7531.2"
-    ESCO_2310_1_31 = "2310.1.31"
-    ESCO_3423_1_2_2 = "3423.1.2.2"
-    ESCO_3343_1_2 = "3343.1.2"
-    ESCO_2643_4_1 = "2643.4.1"
-    ESCO_2342_1 = "2342.1"
-    ESCO_2131_4_6 = "2131.4.6"
-    ESCO_5141_1_2 = "5141.1.2"
-    ESCO_5249_2_1_5 = "5249.2.1.5"
-    ESCO_4323_10 = "4323.10"
-    ESCO_7113_1_1 = "7113.1.1"
-    ESCO_8350_7 = "8350.7"
-    ESCO_5223_7_15 = "5223.7.15"
-    ESCO_2631_2_2 = "2631.2.2"
-    ESCO_2654_2 = "2654.2"
-    ESCO_3331_3 = "3331.3"
-    ESCO_2330_1_16 = "2330.1.16"
-    ESCO_2635_1 = "2635.1"
-    ESCO_2641_2 = "2641.2"
-    ESCO_7213_4 = "7213.4"
-    ESCO_6121_2 = "6121.2"
-    ESCO_2113_1_1 = "2113.1.1"
-    ESCO_1420_4_26 = "1420.4.26"
-    ESCO_1420_4_29 = "1420.4.29"
-    ESCO_3342_1 = "3342.1"
-    ESCO_3119_2 = "3119.2"
-    ESCO_2144_1 = "2144.1"
-    ESCO_5412_1 = "5412.1"
-    ESCO_8332_3 = "8332.3"
-    ESCO_2111_1 = "2111.1"
-    ESCO_3211_1 = "3211.1"
-    ESCO_2142_1_7 = "2142.1.7"
-    ESCO_2514_2_1 = "2514.2.1"
-    ESCO_2434_2 = "2434.2"
-    ESCO_8121_3 = "8121.3"
-    ESCO_3123_1_9 = "3123.1.9"
-    ESCO_1213_7 = "1213.7"
-    ESCO_3341_2 = "3341.2"
-    ESCO_2431_10_2 = "2431.10.2"
-    ESCO_5153_1_3 = "5153.1.3"
-    ESCO_2149_2_5 = "2149.2.5"
-    ESCO_3324_4_22 = "3324.4.22"
-    ESCO_2151_1_1 = "2151.1.1"
-    ESCO_3422_1 = "3422.1"
-    ESCO_5111_2 = "5111.2"
-    ESCO_7522_1 = "7522.1"
-    ESCO_3513_1 = "3513.1"
-    ESCO_2320_1_11 = "2320.1.11"
-    ESCO_8219_3 = "8219.3"
-    ESCO_1346_4 = "1346.4"
-    ESCO_1312_3 = "1312.3"
-    ESCO_2144_1_17 = "2144.1.17"
-    ESCO_2133_6 = "2133.6"
-    ESCO_7233_5 = "7233.5"
-    ESCO_8219_9 = "8219.9"
-    ESCO_2310_1_33 = "2310.1.33"
-    ESCO_8151_2 = "8151.2"
-    ESCO_2359_14 = "2359.14"
-    ESCO_2411_1_12 = "2411.1.12"
-    ESCO_2353_2 = "2353.2"
-    ESCO_7111_1 = "7111.1"
-    ESCO_3435_20 = "3435.20"
-    ESCO_3119_7 = "3119.7"
-    ESCO_8183_3 = "8183.3"
-    ESCO_3435_25_3 = "3435.25.3"
-    ESCO_8312_3 = "8312.3"
-    ESCO_2351_2 = "2351.2"
-    ESCO_3324_4_9 = "3324.4.9"
-    ESCO_7522_6 = "7522.6"
-    ESCO_2144_1_14 = "2144.1.14"
-    ESCO_7541_1 = "7541.1"
-    ESCO_3422_2 = "3422.2"
-    ESCO_3339_3 = "3339.3"
-    ESCO_2641_4_3 = "2641.4.3"
-    ESCO_5164_1_1 = "5164.1.1"
-    ESCO_3412_4_8 = "3412.4.8"
-    ESCO_7231_2 = "7231.2"
-    ESCO_4120_1 = "4120.1"
-    ESCO_2310_1_41 = "2310.1.41"
-    ESCO_6112_2 = "6112.2"
-    ESCO_7233_12 = "7233.12"
-    ESCO_8131_2 = "8131.2"
-    ESCO_2330_1_13 = "2330.1.13"
-    ESCO_1324_3_2_35 = "1324.3.2.35"
-    ESCO_7322_10 = "7322.10"
-    ESCO_4221_6 = "4221.6"
-    ESCO_3122_4_3 = "3122.4.3"
-    ESCO_1111_5 = "1111.5"
-    ESCO_2250_3 = "2250.3"
-    ESCO_8141_1_4 = "8141.1.4"
-    ESCO_7223_4 = "7223.4"
-    ESCO_3121_1 = "3121.1"
-    ESCO_4311_2 = "4311.2"
-    ESCO_8181_10 = "8181.10"
-    ESCO_1112_7 = "1112.7"
-    ESCO_1439_4 = "1439.4"
-    ESCO_1324_3_2_23 = "1324.3.2.23"
-    ESCO_3343_1_6 = "3343.1.6"
-    ESCO_1344_1_1 = "1344.1.1"
-    ESCO_7412_3 = "7412.3"
-    ESCO_2423_1 = "2423.1"
-    ESCO_8152_3_2 = "8152.3.2"
-    ESCO_7223_15 = "7223.15"
-    ESCO_8113_7 = "8113.7"
-    ESCO_3344_3 = "3344.3"
-    ESCO_2422_12_11 = "2422.12.11"
-    ESCO_2635_1_2 = "2635.1.2"
-    ESCO_8160_2 = "8160.2"
-    ESCO_7411_1_1_1 = "7411.1.1.1"
-    ESCO_5142_4 = "5142.4"
-    ESCO_7411_1_1_2 = "7411.1.1.2"
-    ESCO_3411_4 = "3411.4"
-    ESCO_7317_4 = "7317.4"
-    ESCO_3312_1 = "3312.1"
-    ESCO_8172_3 = "8172.3"
-    ESCO_2411_1_8 = "2411.1.8"
-    ESCO_7233_9 = "7233.9"
-    ESCO_7213_1 = "7213.1"
-    ESCO_5329_2 = "5329.2"
-    ESCO_2330_1 = "2330.1"
-    ESCO_2269_8_2 = "2269.8.2"
-    ESCO_3351_1 = "3351.1"
-    ESCO_2633_1_1 = "2633.1.1"
-    ESCO_2519_7_5 = "2519.7.5"
-    ESCO_7314_3 = "7314.3"
-    ESCO_8342_6 = "8342.6"
-    ESCO_1420_4_34 = "1420.4.34"
-    ESCO_7516_2 = "7516.2"
-    ESCO_7125_1 = "7125.1"
-    ESCO_2262_1_2_1 = "2262.1.2.1"
-    ESCO_1330_4 = "1330.4"
-    ESCO_2146_6 = "2146.6"
-    ESCO_2310_1_6 = "2310.1.6"
-    ESCO_2422_12_3 = "2422.12.3"
-    ESCO_9510_1 = "9510.1"
-    ESCO_2654_3_1 = "2654.3.1"
-    ESCO_2421_1 = "2421.1"
-    ESCO_5249_2_1_2 = "5249.2.1.2"
-    ESCO_3433_1 = "3433.1"
-    ESCO_1420_4_2 = "1420.4.2"
-    ESCO_2310_1_15 = "2310.1.15"
-    ESCO_1431_1 = "1431.1"
-    ESCO_2152_1_2 = "2152.1.2"
-    ESCO_7223_21 = "7223.21"
-    ESCO_3311_3 = "3311.3"
-    ESCO_3123_1_26 = "3123.1.26"
-    ESCO_2622_2 = "2622.2"
-    ESCO_2422_6 = "2422.6"
-    ESCO_8112_3 = "8112.3"
-    ESCO_5230_3 = "5230.3"
-    ESCO_2131_4_8 = "2131.4.8"
-    ESCO_2141_8 = "2141.8"
-    ESCO_2230_2_2 = "2230.2.2"
-    ESCO_7322_1 = "7322.1"
-    ESCO_7412_12 = "7412.12"
-    ESCO_7313_1 = "7313.1"
-    ESCO_1324_3_1_6_29 = "1324.3.1.6.29"
-    ESCO_3331_2_1 = "3331.2.1"
-    ESCO_7543_10 = "7543.10"
-    ESCO_2659_2_5 = "2659.2.5"
-    ESCO_4323_17 = "4323.17"
-    ESCO_1223_2_1_3 = "1223.2.1.3"
-    ESCO_3252_1_1 = "3252.1.1"
-    ESCO_3331_2_1_25 = "3331.2.1.25"
-    ESCO_5164_10 = "5164.10"
-    ESCO_8113_2 = "8113.2"
-    ESCO_2352_1_4 = "2352.1.4"
-    ESCO_3122_2 = "3122.2"
-    ESCO_3112_10 = "3112.10"
-    ESCO_1324_3_1_6_6 = "1324.3.1.6.6"
-    ESCO_3112_1_1 = "3112.1.1"
-    ESCO_3351_3 = "3351.3"
-    ESCO_3422_4_6 = "3422.4.6"
-    ESCO_3118_3_5 = "3118.3.5"
-    ESCO_2146_9 = "2146.9"
-    ESCO_8160_19 = "8160.19"
-    ESCO_7223_4_4 = "7223.4.4"
-    ESCO_4213_1 = "4213.1"
-    ESCO_3114_1_10 = "3114.1.10"
-    ESCO_1324_3_1 = "1324.3.1"
-    ESCO_2114_1_4 = "2114.1.4"
-    ESCO_4132_1 = "4132.1"
-    ESCO_1324_3_2_34 = "1324.3.2.34"
-    ESCO_5223_7_5 = "5223.7.5"
-    ESCO_1321_2 = "1321.2"
-    ESCO_2422_5 = "2422.5"
-    ESCO_3331_2_1_18 = "3331.2.1.18"
-    ESCO_3152_2 = "3152.2"
-    ESCO_1321_2_1_4 = "1321.2.1.4"
-    ESCO_7315_1 = "7315.1"
-    ESCO_1349_20 = "1349.20"
-    ESCO_8160_5 = "8160.5"
-    ESCO_3513_2 = "3513.2"
-    ESCO_1213_2 = "1213.2"
-    ESCO_3258_1 = "3258.1"
-    ESCO_3324_4_20 = "3324.4.20"
-    ESCO_1321_2_2_3 = "1321.2.2.3"
-    ESCO_2359_12 = "2359.12"
-    ESCO_2145_3 = "2145.3"
-    ESCO_8212_3 = "8212.3"
-    ESCO_4323_4 = "4323.4"
-    ESCO_3116_1_3 = "3116.1.3"
-    ESCO_2652_3_2 = "2652.3.2"
-    ESCO_2412_11 = "2412.11"
-    ESCO_5164_2_1_1_1 = "5164.2.1.1.1"
-    ESCO_8143_3 = "8143.3"
-    ESCO_9212_4 = "9212.4"
-    ESCO_1324_3_2_9 = "1324.3.2.9"
-    ESCO_2422_3 = "2422.3"
-    ESCO_9212_2 = "9212.2"
-    ESCO_3324_4_15 = "3324.4.15"
-    ESCO_1420_4_21 = "1420.4.21"
-    ESCO_3413_2 = "3413.2"
-    ESCO_2310_1_4 = "2310.1.4"
-    ESCO_3431_1 = "3431.1"
-    ESCO_7412_2 = "7412.2"
-    ESCO_3332_2_2 = "3332.2.2"
-    ESCO_3412_4_13 = "3412.4.13"
-    ESCO_2619_11 = "2619.11"
-    ESCO_3111_5 = "3111.5"
-    ESCO_7223_11 = "7223.11"
-    ESCO_3259_3 = "3259.3"
-    ESCO_8112_2 = "8112.2"
-    ESCO_3123_1_21 = "3123.1.21"
-    ESCO_2431_11 = "2431.11"
-    ESCO_3353_2_1 = "3353.2.1"
-    ESCO_8160_9 = "8160.9"
-    ESCO_7313_1_7 = "7313.1.7"
-    ESCO_3257_5 = "3257.5"
-    ESCO_1324_3_1_6_31 = "1324.3.1.6.31"
-    ESCO_8219_5 = "8219.5"
-    ESCO_3423_1_2 = "3423.1.2"
-    ESCO_8160_38 = "8160.38"
-    ESCO_1219_5 = "1219.5"
-    ESCO_2141_4_1 = "2141.4.1"
-    ESCO_2163_4 = "2163.4"
-    ESCO_8181_3 = "8181.3"
-    ESCO_4223_1_1 = "4223.1.1"
-    ESCO_2310_1 = "2310.1"
-    ESCO_7543_7_2 = "7543.7.2"
-    ESCO_3259_5 = "3259.5"
-    ESCO_2131_3 = "2131.3"
-    ESCO_2320_1_20 = "2320.1.20"
-    ESCO_2131_4_1 = "2131.4.1"
-    ESCO_2131_5 = "2131.5"
-    ESCO_1420_4_12 = "1420.4.12"
-    ESCO_2621_6 = "2621.6"
-    ESCO_7214_3 = "7214.3"
-    ESCO_8341_1 = "8341.1"
-    ESCO_2166_9 = "2166.9"
-    ESCO_7534_3_4 = "7534.3.4"
-    ESCO_9112_1 = "9112.1"
-    ESCO_2133_1 = "2133.1"
-    ESCO_7514_2 = "7514.2"
-    ESCO_5223_7_25 = "5223.7.25"
-    ESCO_2635_3_3 = "2635.3.3"
-    ESCO_5111_2_2 = "5111.2.2"
-    ESCO_2421_2 = "2421.2"
-    ESCO_2133_11 = "2133.11"
-    ESCO_3123_1_5 = "3123.1.5"
-    ESCO_2635_3_15 = "2635.3.15"
-    ESCO_4211_2 = "4211.2"
-    ESCO_2635_3_21 = "2635.3.21"
-    ESCO_3341_3 = "3341.3"
-    ESCO_1439_2 = "1439.2"
-    ESCO_2359_9 = "2359.9"
-    ESCO_5161_1 = "5161.1"
-    ESCO_2320_1_22 = "2320.1.22"
-    ESCO_7233_3 = "7233.3"
-    ESCO_2422_12_9 = "2422.12.9"
-    ESCO_2654_1_3 = "2654.1.3"
-    ESCO_3324_4_29 = "3324.4.29"
-    ESCO_7511_3 = "7511.3"
-    ESCO_1120_3 = "1120.3"
-    ESCO_3359_4 = "3359.4"
-    ESCO_4110_1 = "4110.1"
-    ESCO_1222_1_2 = "1222.1.2"
-    ESCO_8141_1_9_2 = "8141.1.9.2"
-    ESCO_2632_1_1 = "2632.1.1"
-    ESCO_1221_6 = "1221.6"
-    ESCO_3151_4 = "3151.4"
-    ESCO_1111_4 = "1111.4"
-    ESCO_7215_1 = "7215.1"
-    ESCO_2423_5 = "2423.5"
-    ESCO_7316_1_2 = "7316.1.2"
-    ESCO_3112_2 = "3112.2"
-    ESCO_2636_4 = "2636.4"
-    ESCO_5152_2 = "5152.2"
-    ESCO_7212_1 = "7212.1"
-    ESCO_2163_3 = "2163.3"
-    ESCO_3131_3_8 = "3131.3.8"
-    ESCO_8152_1 = "8152.1"
-    ESCO_1349_9 = "1349.9"
-    ESCO_8121_5 = "8121.5"
-    ESCO_2131_4_2 = "2131.4.2"
-    ESCO_3254_1 = "3254.1"
-    ESCO_8156_2_3 = "8156.2.3"
-    ESCO_8160_12 = "8160.12"
-    ESCO_8142_14 = "8142.14"
-    ESCO_2359_3 = "2359.3"
-    ESCO_3423_1_1 = "3423.1.1"
-    ESCO_5413_1 = "5413.1"
-    ESCO_2434_4 = "2434.4"
-    ESCO_2514_4 = "2514.4"
-    ESCO_3341_7 = "3341.7"
-    ESCO_3324_4_30 = "3324.4.30"
-    ESCO_4224_2 = "4224.2"
-    ESCO_4323_2 = "4323.2"
-    ESCO_1324_3_2_31 = "1324.3.2.31"
-    ESCO_1420_4_35 = "1420.4.35"
-    ESCO_2511_12 = "2511.12"
-    ESCO_9312_1_5 = "9312.1.5"
-    ESCO_3133_1_2 = "3133.1.2"
-    ESCO_3122_4_12 = "3122.4.12"
-    ESCO_7126_10 = "7126.10"
-    ESCO_8322_7 = "8322.7"
-    ESCO_7522_7 = "7522.7"
-    ESCO_8159_6 = "8159.6"
-    ESCO_3324_4_7 = "3324.4.7"
-    ESCO_2149_2_4 = "2149.2.4"
-    ESCO_1221_3_2 = "1221.3.2"
-    ESCO_7514_1 = "7514.1"
-    ESCO_3521_1_2 = "3521.1.2"
-    ESCO_4212_7 = "4212.7"
-    ESCO_5329_3 = "5329.3"
-    ESCO_2149_17 = "2149.17"
-    ESCO_5164_5 = "5164.5"
-    ESCO_7413_1_2 = "7413.1.2"
-    ESCO_8160_4 = "8160.4"
-    ESCO_2519_1 = "2519.1"
-    ESCO_8160_31 = "8160.31"
-    ESCO_2642_1_16 = "2642.1.16"
-    ESCO_8172_6 = "8172.6"
-    ESCO_4221_1 = "4221.1"
-    ESCO_3359_1 = "3359.1"
-    ESCO_2151_2 = "2151.2"
-    ESCO_8132_2 = "8132.2"
-    ESCO_3435_2 = "3435.2"
-    ESCO_8212_3_1 = "8212.3.1"
-    ESCO_8143_8 = "8143.8"
-    ESCO_5223_7_7 = "5223.7.7"
-    ESCO_3411_8_1 = "3411.8.1"
-    ESCO_3123_1_10 = "3123.1.10"
-    ESCO_2211_1 = "2211.1"
-    ESCO_5223_7_31 = "5223.7.31"
-    ESCO_1111_1 = "1111.1"
-    ESCO_8160_35 = "8160.35"
-    ESCO_3131_3 = "3131.3"
-    ESCO_5142_3 = "5142.3"
-    ESCO_2431_6 = "2431.6"
-    ESCO_7126_4 = "7126.4"
-    ESCO_2120_5 = "2120.5"
-    ESCO_2412_8 = "2412.8"
-    ESCO_8171_3 = "8171.3"
-    ESCO_2263_1 = "2263.1"
-    ESCO_2642_1_14 = "2642.1.14"
-    ESCO_2355_6 = "2355.6"
-    ESCO_7318_5 = "7318.5"
-    ESCO_1324_3_1_6 = "1324.3.1.6"
-    ESCO_3331_2_1_29 = "3331.2.1.29"
-    ESCO_7312_2 = "7312.2"
-    ESCO_8160_43 = "8160.43"
-    ESCO_9112_4 = "9112.4"
-    ESCO_2519_7_3 = "2519.7.3"
-    ESCO_7533_2 = "7533.2"
-    ESCO_8143_4 = "8143.4"
-    ESCO_5223_5 = "5223.5"
-    ESCO_7223_10 = "7223.10"
-    ESCO_2320_1_18 = "2320.1.18"
-    ESCO_8182_2 = "8182.2"
-    ESCO_2635_3_16 = "2635.3.16"
-    ESCO_1223_1_1 = "1223.1.1"
-    ESCO_1120_6 = "1120.6"
-    ESCO_7313_2 = "7313.2"
-    ESCO_1324_3_1_6_14 = "1324.3.1.6.14"
-    ESCO_1111_7 = "1111.7"
-    ESCO_1223_2 = "1223.2"
-    ESCO_8219_10 = "8219.10"
-    ESCO_1324_3_1_1 = "1324.3.1.1"
-    ESCO_7126_11 = "7126.11"
-    ESCO_3432_1 = "3432.1"
-    ESCO_3131_3_1 = "3131.3.1"
-    ESCO_7132_1 = "7132.1"
-    ESCO_3119_18 = "3119.18"
-    ESCO_5152_2_1 = "5152.2.1"
-    ESCO_4323_5 = "4323.5"
-    ESCO_7543_7 = "7543.7"
-    ESCO_2230_1 = "2230.1"
-    ESCO_1346_1 = "1346.1"
-    ESCO_2621_3 = "2621.3"
-    ESCO_3112_1_10 = "3112.1.10"
-    ESCO_2146_10 = "2146.10"
-    ESCO_2643_1 = "2643.1"
-    ESCO_2635_3_9 = "2635.3.9"
-    ESCO_7411_1_4 = "7411.1.4"
-    ESCO_7421_6 = "7421.6"
-    ESCO_7126_7 = "7126.7"
-    ESCO_1420_4_25 = "1420.4.25"
-    ESCO_7532_1 = "7532.1"
-    ESCO_2269_8 = "2269.8"
-    ESCO_5142_12 = "5142.12"
-    ESCO_3521_1 = "3521.1"
-    ESCO_8121_7 = "8121.7"
-    ESCO_2619_3 = "2619.3"
-    ESCO_8211_4 = "8211.4"
-    ESCO_0110_6 = "0110.6"
-    ESCO_2519_2 = "2519.2"
-    ESCO_2342_3 = "2342.3"
-    ESCO_2149_6 = "2149.6"
-    ESCO_3214_2 = "3214.2"
-    ESCO_2659_2_6 = "2659.2.6"
-    ESCO_2529_4 = "2529.4"
-    ESCO_7313_1_4 = "7313.1.4"
-    ESCO_2267_2 = "2267.2"
-    ESCO_1431_2 = "1431.2"
-    ESCO_3411_8 = "3411.8"
-    ESCO_5112_3_1 = "5112.3.1"
-    ESCO_8142_5 = "8142.5"
-    ESCO_5223_7_12 = "5223.7.12"
-    ESCO_9215_1 = "9215.1"
-    ESCO_3432_1_1 = "3432.1.1"
-    ESCO_3111_10 = "3111.10"
-    ESCO_2529_8 = "2529.8"
-    ESCO_3422_4_5 = "3422.4.5"
-    ESCO_2149_12_1 = "2149.12.1"
-    ESCO_2619_12 = "2619.12"
-    ESCO_7523_3 = "7523.3"
-    ESCO_7223_24 = "7223.24"
-    ESCO_2151_1_3 = "2151.1.3"
-    ESCO_2163_1_3 = "2163.1.3"
-    ESCO_7322_8 = "7322.8"
-    ESCO_2422_9 = "2422.9"
-    ESCO_2166_4 = "2166.4"
-    ESCO_8131_1 = "8131.1"
-    ESCO_3119_2_1 = "3119.2.1"
-    ESCO_4227_1 = "4227.1"
-    ESCO_1324_3_4_1 = "1324.3.4.1"
-    ESCO_8211_5_3 = "8211.5.3"
-    ESCO_1324_6 = "1324.6"
-    ESCO_2263_3 = "2263.3"
-    ESCO_3324_4_33 = "3324.4.33"
-    ESCO_2269_9_3 = "2269.9.3"
-    ESCO_2411_1_11 = "2411.1.11"
-    ESCO_8160_29 = "8160.29"
-    ESCO_5311_2 = "5311.2"
-    ESCO_2310_1_29 = "2310.1.29"
-    ESCO_3412_4_11 = "3412.4.11"
-    ESCO_2511_14_1 = "2511.14.1"
-    ESCO_9312_1_4 = "9312.1.4"
-    ESCO_3521_1_7 = "3521.1.7"
-    ESCO_1420_4_23 = "1420.4.23"
-    ESCO_5312_3 = "5312.3"
-    ESCO_7127_1 = "7127.1"
-    ESCO_4221_7 = "4221.7"
-    ESCO_2144_1_22 = "2144.1.22"
-    ESCO_1221_3_2_1_2 = "1221.3.2.1.2"
-    ESCO_8113_8 = "8113.8"
-    ESCO_3435_17 = "3435.17"
-    ESCO_1213_1 = "1213.1"
-    ESCO_2143_1_3 = "2143.1.3"
-    ESCO_2412_5 = "2412.5"
-    ESCO_7212_3 = "7212.3"
-    ESCO_2133_15_1 = "2133.15.1"
-    ESCO_3134_5 = "3134.5"
-    ESCO_1330_3 = "1330.3"
-    ESCO_2152_1_6 = "2152.1.6"
-    ESCO_2422_17 = "2422.17"
-    ESCO_3213_2 = "3213.2"
-    ESCO_2619_8 = "2619.8"
-    ESCO_3259_7 = "3259.7"
-    ESCO_2146_8 = "2146.8"
-    ESCO_2145_1_5 = "2145.1.5"
-    ESCO_3321_2 = "3321.2"
-    ESCO_2651_11 = "2651.11"
-    ESCO_3119_16_4 = "3119.16.4"
-    ESCO_2262_1 = "2262.1"
-    ESCO_3123_1_20 = "3123.1.20"
-    ESCO_2144_1_19 = "2144.1.19"
-    ESCO_5411_1_4 = "5411.1.4"
-    ESCO_5113_1_3 = "5113.1.3"
-    ESCO_8131_11 = "8131.11"
-    ESCO_7533_3 = "7533.3"
-    ESCO_9122_1 = "9122.1"
-    ESCO_8160_26 = "8160.26"
-    ESCO_3131_3_2 = "3131.3.2"
-    ESCO_5164_3 = "5164.3"
-    ESCO_2269_8_1 = "2269.8.1"
-    ESCO_3435_10 = "3435.10"
-    ESCO_8153_1 = "8153.1"
-    ESCO_7232_3 = "7232.3"
-    ESCO_1349_15 = "1349.15"
-    ESCO_3257_3 = "3257.3"
-    ESCO_7223_4_4_1 = "7223.4.4.1"
-    ESCO_8155_1_2 = "8155.1.2"
-    ESCO_1324_3_2_8 = "1324.3.2.8"
-    ESCO_2634_1 = "2634.1"
-    ESCO_2131_1 = "2131.1"
-    ESCO_3122_4_10 = "3122.4.10"
-    ESCO_8160_3 = "8160.3"
-    ESCO_2652_1 = "2652.1"
-    ESCO_2310_1_35 = "2310.1.35"
-    ESCO_1420_1 = "1420.1"
-    ESCO_7523_2 = "7523.2"
-    ESCO_5414_1_4 = "5414.1.4"
-    ESCO_7511_5 = "7511.5"
-    ESCO_3334_3_2 = "3334.3.2"
-    ESCO_8219_11 = "8219.11"
-    ESCO_4412_2 = "4412.2"
-    ESCO_3113_2 = "3113.2"
-    ESCO_1420_4_32 = "1420.4.32"
-    ESCO_3435_6 = "3435.6"
-    ESCO_2152_1_10 = "2152.1.10"
-    ESCO_2111_3 = "2111.3"
-    ESCO_9629_7 = "9629.7"
-    ESCO_7323_2 = "7323.2"
-    ESCO_2152_1_12 = "2152.1.12"
-    ESCO_5419_1 = "5419.1"
-    ESCO_3132_6 = "3132.6"
-    ESCO_7322_3 = "7322.3"
-    ESCO_3324_4_26 = "3324.4.26"
-    ESCO_1324_3_1_6_17 = "1324.3.1.6.17"
-    ESCO_2266_2 = "2266.2"
-    ESCO_3324_4_34 = "3324.4.34"
-    ESCO_2651_8 = "2651.8"
-    ESCO_6221_9 = "6221.9"
-    ESCO_8160_28 = "8160.28"
-    ESCO_6122_2 = "6122.2"
-    ESCO_3153_2_1 = "3153.2.1"
-    ESCO_2146_1 = "2146.1"
-    ESCO_9333_3 = "9333.3"
-    ESCO_3331_2_1_19 = "3331.2.1.19"
-    ESCO_2230_2_3 = "2230.2.3"
-    ESCO_3115_1_20 = "3115.1.20"
-    ESCO_2330_1_3 = "2330.1.3"
-    ESCO_2133_9 = "2133.9"
-    ESCO_1324_8_2_1 = "1324.8.2.1"
-    ESCO_2330_1_1 = "2330.1.1"
-    ESCO_5223_7_22 = "5223.7.22"
-    ESCO_1330_1_1 = "1330.1.1"
-    ESCO_2144_1_7 = "2144.1.7"
-    ESCO_3422_4_4 = "3422.4.4"
-    ESCO_2529_9 = "2529.9"
-    ESCO_3412_4_9 = "3412.4.9"
-    ESCO_1420_4_28 = "1420.4.28"
-    ESCO_2522_1_1 = "2522.1.1"
-    ESCO_7513_2 = "7513.2"
-    ESCO_3153_1 = "3153.1"
-    ESCO_1219_5_1 = "1219.5.1"
-    ESCO_8311_1 = "8311.1"
-    ESCO_2320_1 = "2320.1"
-    ESCO_8131_2_1 = "8131.2.1"
-    ESCO_4224_1 = "4224.1"
-    ESCO_2422_10 = "2422.10"
-    ESCO_3119_1 = "3119.1"
-    ESCO_3115_1_17 = "3115.1.17"
-    ESCO_1324_3 = "1324.3"
-    ESCO_3123_1_24 = "3123.1.24"
-    ESCO_1431_3 = "1431.3"
-    ESCO_2152_1_9 = "2152.1.9"
-    ESCO_5223_7_37 = "5223.7.37"
-    ESCO_2320_1_4 = "2320.1.4"
-    ESCO_2269_5 = "2269.5"
-    ESCO_7543_5 = "7543.5"
-    ESCO_5141_1_3 = "5141.1.3"
-    ESCO_2114_1_9 = "2114.1.9"
-    ESCO_7312_6_1 = "7312.6.1"
-    ESCO_1330_2 = "1330.2"
-    ESCO_2432_2 = "2432.2"
-    ESCO_3122_4_5 = "3122.4.5"
-    ESCO_5165_1_2 = "5165.1.2"
-    ESCO_1349_23 = "1349.23"
-    ESCO_7224_2 = "7224.2"
-    ESCO_2149_2_3 = "2149.2.3"
-    ESCO_8350_3 = "8350.3"
-    ESCO_8211_6 = "8211.6"
-    ESCO_3331_2_1_8 = "3331.2.1.8"
-    ESCO_2635_1_3 = "2635.1.3"
-    ESCO_8160_32 = "8160.32"
-    ESCO_2656_2 = "2656.2"
-    ESCO_3115_1_19 = "3115.1.19"
-    ESCO_5414_1_5 = "5414.1.5"
-    ESCO_2250_5 = "2250.5"
-    ESCO_2411_1_5 = "2411.1.5"
-    ESCO_3332_1 = "3332.1"
-    ESCO_3118_2 = "3118.2"
-    ESCO_3111_14 = "3111.14"
-    ESCO_5164_9 = "5164.9"
-    ESCO_8142_9 = "8142.9"
-    ESCO_8160_47 = "8160.47"
-    ESCO_1324_3_2_24 = "1324.3.2.24"
-    ESCO_3435_24 = "3435.24"
-    ESCO_4312_7 = "4312.7"
-    ESCO_2433_4 = "2433.4"
-    ESCO_2320_1_3 = "2320.1.3"
-    ESCO_2635_3_4 = "2635.3.4"
-    ESCO_5163_4 = "5163.4"
-    ESCO_2141_11 = "2141.11"
-    ESCO_7543_10_4 = "7543.10.4"
-    ESCO_2113_2 = "2113.2"
-    ESCO_8122_5 = "8122.5"
-    ESCO_8172_5 = "8172.5"
-    ESCO_2512_5 = "2512.5"
-    ESCO_3139_1 = "3139.1"
-    ESCO_2114_3 = "2114.3"
-    ESCO_8113_6 = "8113.6"
-    ESCO_0210_4 = "0210.4"
-    ESCO_2151_1 = "2151.1"
-    ESCO_8114_3 = "8114.3"
-    ESCO_3423_4 = "3423.4"
-    ESCO_5223_7_14 = "5223.7.14"
-    ESCO_1324_3_1_6_4 = "1324.3.1.6.4"
-    ESCO_3432_5 = "3432.5"
-    ESCO_3123_1_3 = "3123.1.3"
-    ESCO_3111_1 = "3111.1"
-    ESCO_9321_1 = "9321.1"
-    ESCO_8160_25 = "8160.25"
-    ESCO_5321_1_1 = "5321.1.1"
-    ESCO_1431_2_2 = "1431.2.2"
-    ESCO_3435_25_2 = "3435.25.2"
-    ESCO_1420_4_1 = "1420.4.1"
-    ESCO_2619_6 = "2619.6"
-    ESCO_8322_4 = "8322.4"
-    ESCO_8154_3 = "8154.3"
-    ESCO_7233_10 = "7233.10"
-    ESCO_3123_1_11 = "3123.1.11"
-    ESCO_8171_9 = "8171.9"
-    ESCO_5411_1 = "5411.1"
-    ESCO_3432_3 = "3432.3"
-    ESCO_2310_1_27 = "2310.1.27"
-    ESCO_8211_7 = "8211.7"
-    ESCO_8142_6 = "8142.6"
-    ESCO_3423_2_1 = "3423.2.1"
-    ESCO_8181_3_1 = "8181.3.1"
-    ESCO_4323_20 = "4323.20"
-    ESCO_1324_3_2_11 = "1324.3.2.11"
-    ESCO_7533_1 = "7533.1"
-    ESCO_3331_2_1_34 = "3331.2.1.34"
-    ESCO_2411_1_10 = "2411.1.10"
-    ESCO_2145_1_6 = "2145.1.6"
-    ESCO_7223_7 = "7223.7"
-    ESCO_3435_11 = "3435.11"
-    ESCO_2330_1_7 = "2330.1.7"
-    ESCO_7126_9 = "7126.9"
-    ESCO_2434_1 = "2434.1"
-    ESCO_2133_5 = "2133.5"
-    ESCO_7313_1_2 = "7313.1.2"
-    ESCO_3119_16_2 = "3119.16.2"
-    ESCO_3311_2_4_1 = "3311.2.4.1"
-    ESCO_3153_2_5 = "3153.2.5"
-    ESCO_2654_1_6 = "2654.1.6"
-    ESCO_2265_1 = "2265.1"
-    ESCO_3111_1_1 = "3111.1.1"
-    ESCO_2141_2 = "2141.2"
-    ESCO_3112_1_9 = "3112.1.9"
-    ESCO_7214_2 = "7214.2"
-    ESCO_2310_1_39 = "2310.1.39"
-    ESCO_1219_3 = "1219.3"
-    ESCO_8131_2_3 = "8131.2.3"
-    ESCO_7316_3 = "7316.3"
-    ESCO_6112_6 = "6112.6"
-    ESCO_3115_1_12 = "3115.1.12"
-    ESCO_1330_7 = "1330.7"
-    ESCO_3119_13 = "3119.13"
-    ESCO_7412_10 = "7412.10"
-    ESCO_7318_1 = "7318.1"
-    ESCO_8142_1 = "8142.1"
-    ESCO_8142_11 = "8142.11"
-    ESCO_1420_4_33 = "1420.4.33"
-    ESCO_2144_1_9 = "2144.1.9"
-    ESCO_3331_2_2 = "3331.2.2"
-    ESCO_2642_1_5 = "2642.1.5"
-    ESCO_2342_2 = "2342.2"
-    ESCO_2422_13 = "2422.13"
-    ESCO_3324_4_2 = "3324.4.2"
-    ESCO_1324_3_2_26 = "1324.3.2.26"
-    ESCO_2152_1_7 = "2152.1.7"
-    ESCO_2161_1 = "2161.1"
-    ESCO_2521_1 = "2521.1"
-    ESCO_7215_4 = "7215.4"
-    ESCO_3344_2 = "3344.2"
-    ESCO_1349_5 = "1349.5"
-    ESCO_2641_4_4 = "2641.4.4"
-    ESCO_2659_4 = "2659.4"
-    ESCO_3343_4 = "3343.4"
-    ESCO_7412_5 = "7412.5"
-    ESCO_8141_1_1 = "8141.1.1"
-    ESCO_2330_1_2 = "2330.1.2"
-    ESCO_7223_25 = "7223.25"
-    ESCO_2221_2 = "2221.2"
-    ESCO_8114_5 = "8114.5"
-    ESCO_2144_1_3 = "2144.1.3"
-    ESCO_8322_1 = "8322.1"
-    ESCO_2413_1 = "2413.1"
-    ESCO_3412_4 = "3412.4"
-    ESCO_8113_5 = "8113.5"
-    ESCO_2521_2 = "2521.2"
-    ESCO_2262_1_2 = "2262.1.2"
-    ESCO_5249_2_1_4 = "5249.2.1.4"
-    ESCO_2141_9 = "2141.9"
-    ESCO_3312_5 = "3312.5"
-    ESCO_6113_3 = "6113.3"
-    ESCO_3311_2_5 = "3311.2.5"
-    ESCO_3334_3 = "3334.3"
-    ESCO_8141_1_9 = "8141.1.9"
-    ESCO_2152_1_13 = "2152.1.13"
-    ESCO_3434_1_2 = "3434.1.2"
-    ESCO_2621_7 = "2621.7"
-    ESCO_7536_1_1 = "7536.1.1"
-    ESCO_8171_4 = "8171.4"
-    ESCO_8131_3 = "8131.3"
-    ESCO_5223_7_27 = "5223.7.27"
-    ESCO_1324_4 = "1324.4"
-    ESCO_8343_1 = "8343.1"
-    ESCO_5419_5 = "5419.5"
-    ESCO_8114_4 = "8114.4"
-    ESCO_2432_4 = "2432.4"
-    ESCO_2635_3_25 = "2635.3.25"
-    ESCO_2320_1_23 = "2320.1.23"
-    ESCO_5120_1 = "5120.1"
-    ESCO_7232_5 = "7232.5"
-    ESCO_8160_51 = "8160.51"
-    ESCO_3331_2_1_1 = "3331.2.1.1"
-    ESCO_2320_1_1 = "2320.1.1"
-    ESCO_2141_5 = "2141.5"
-    ESCO_3118_4 = "3118.4"
-    ESCO_1213_3 = "1213.3"
-    ESCO_2310_1_37 = "2310.1.37"
-    ESCO_9333_5 = "9333.5"
-    ESCO_7532_2 = "7532.2"
-    ESCO_3214_3 = "3214.3"
-    ESCO_3411_7 = "3411.7"
-    ESCO_4224_1_1 = "4224.1.1"
-    ESCO_7412_4 = "7412.4"
-    ESCO_2152_1_1 = "2152.1.1"
-    ESCO_3252_4 = "3252.4"
-    ESCO_9123_1 = "9123.1"
-    ESCO_7534_2 = "7534.2"
-    ESCO_3412_1 = "3412.1"
-    ESCO_2114_1_1 = "2114.1.1"
-    ESCO_3324_4_5 = "3324.4.5"
-    ESCO_3351_2 = "3351.2"
-    ESCO_2412_6_2 = "2412.6.2"
-    ESCO_1439_8 = "1439.8"
-    ESCO_8183_1 = "8183.1"
-    ESCO_8152_3 = "8152.3"
-    ESCO_7221_2 = "7221.2"
-    ESCO_7536_2_5 = "7536.2.5"
-    ESCO_2144_1_4 = "2144.1.4"
-    ESCO_1120_1 = "1120.1"
-    ESCO_2164_3 = "2164.3"
-    ESCO_2320_1_14 = "2320.1.14"
-    ESCO_1346_5 = "1346.5"
-    ESCO_7412_8 = "7412.8"
-    ESCO_3255_1 = "3255.1"
-    ESCO_1212_2_1 = "1212.2.1"
-    ESCO_7317_5 = "7317.5"
-    ESCO_2149_11_1 = "2149.11.1"
-    ESCO_3435_16 = "3435.16"
-    ESCO_3324_1_1 = "3324.1.1"
-    ESCO_2651_9 = "2651.9"
-    ESCO_1219_4 = "1219.4"
-    ESCO_2166_2 = "2166.2"
-    ESCO_8332_6 = "8332.6"
-    ESCO_3122_1 = "3122.1"
-    ESCO_3141_2_2 = "3141.2.2"
-    ESCO_7233_11 = "7233.11"
-    ESCO_3112_8 = "3112.8"
-    ESCO_8189_2 = "8189.2"
-    ESCO_7534_3 = "7534.3"
-    ESCO_2145_1_2 = "2145.1.2"
-    ESCO_2222_1 = "2222.1"
-    ESCO_2635_3_13 = "2635.3.13"
-    ESCO_3122_3_3 = "3122.3.3"
-    ESCO_1324_3_2_5 = "1324.3.2.5"
-    ESCO_7119_3 = "7119.3"
-    ESCO_5111_1 = "5111.1"
-    ESCO_7316_1_4 = "7316.1.4"
-    ESCO_4212_3 = "4212.3"
-    ESCO_5153_1_2 = "5153.1.2"
-    ESCO_8142_2 = "8142.2"
-    ESCO_5112_2 = "5112.2"
-    ESCO_2651_5 = "2651.5"
-    ESCO_9411_2 = "9411.2"
-    ESCO_2621_2 = "2621.2"
-    ESCO_1324_3_1_6_20 = "1324.3.1.6.20"
-    ESCO_3122_3_1 = "3122.3.1"
-    ESCO_2513_3 = "2513.3"
-    ESCO_1212_1 = "1212.1"
-    ESCO_1420_4_39 = "1420.4.39"
-    ESCO_2353_1 = "2353.1"
-    ESCO_3511_1 = "3511.1"
-    ESCO_1324_3_2_30 = "1324.3.2.30"
-    ESCO_2143_3 = "2143.3"
-    ESCO_5223_7_23 = "5223.7.23"
-    ESCO_1420_4_8 = "1420.4.8"
-    ESCO_2611_1 = "2611.1"
-    ESCO_8160_27 = "8160.27"
-    ESCO_2310_1_1 = "2310.1.1"
-    ESCO_8172_1 = "8172.1"
-    ESCO_2634_2_3 = "2634.2.3"
-    ESCO_2352_1 = "2352.1"
-    ESCO_8322_5 = "8322.5"
-    ESCO_7314_2 = "7314.2"
-    ESCO_7531_5 = "7531.5"
-    ESCO_7126_3 = "7126.3"
-    ESCO_2141_6 = "2141.6"
-    ESCO_7212_3_4 = "7212.3.4"
-    ESCO_7312_3_3 = "7312.3.3"
-    ESCO_1420_4_10 = "1420.4.10"
-    ESCO_7223_17 = "7223.17"
-    ESCO_2432_1 = "2432.1"
-    ESCO_3252_2 = "3252.2"
-    ESCO_2632_7 = "2632.7"
-    ESCO_5131_2_2_1 = "5131.2.2.1"
-    ESCO_3331_2_1_28 = "3331.2.1.28"
-    ESCO_1324_3_1_3 = "1324.3.1.3"
-    ESCO_6113_4 = "6113.4"
-    ESCO_2635_3_19 = "2635.3.19"
-    ESCO_2522_1_2 = "2522.1.2"
-    ESCO_7231_7 = "7231.7"
-    ESCO_2433_1 = "2433.1"
-    ESCO_2422_12_1 = "2422.12.1"
-    ESCO_1420_4_36 = "1420.4.36"
-    ESCO_3324_4_21 = "3324.4.21"
-    ESCO_2310_1_18 = "2310.1.18"
-    ESCO_8114_2 = "8114.2"
-    ESCO_7133_1 = "7133.1"
-    ESCO_2631_2 = "2631.2"
-    ESCO_2144_1_18 = "2144.1.18"
-    ESCO_3154_1_3 = "3154.1.3"
-    ESCO_8181_7 = "8181.7"
-    ESCO_3119_16 = "3119.16"
-    ESCO_3435_21 = "3435.21"
-    ESCO_3331_2_1_15 = "3331.2.1.15"
-    ESCO_3240_2 = "3240.2"
-    ESCO_1321_2_5 = "1321.2.5"
-    ESCO_2643_5 = "2643.5"
-    ESCO_2351_4 = "2351.4"
-    ESCO_4312_4 = "4312.4"
-    ESCO_3153_2 = "3153.2"
-    ESCO_2320_1_7 = "2320.1.7"
-    ESCO_2310_1_40 = "2310.1.40"
-    ESCO_7543_7_5 = "7543.7.5"
-    ESCO_4221_3_1 = "4221.3.1"
-    ESCO_2635_3_8 = "2635.3.8"
-    ESCO_3113_1 = "3113.1"
-    ESCO_9623_2 = "9623.2"
-    ESCO_4415_1 = "4415.1"
-    ESCO_5120_1_1 = "5120.1.1"
-    ESCO_3435_15 = "3435.15"
-    ESCO_8160_30 = "8160.30"
-    ESCO_8160_24 = "8160.24"
-    ESCO_5241_2 = "5241.2"
-    ESCO_2165_3 = "2165.3"
-    ESCO_4221_4 = "4221.4"
-    ESCO_3323_3 = "3323.3"
-    ESCO_2351_3 = "2351.3"
-    ESCO_2212_1 = "2212.1"
-    ESCO_5223_4 = "5223.4"
-    ESCO_1420_4_41 = "1420.4.41"
-    ESCO_0110_3 = "0110.3"
-    ESCO_5411_1_2 = "5411.1.2"
-    ESCO_3412_4_4 = "3412.4.4"
-    ESCO_7317_3 = "7317.3"
-    ESCO_5414_1_7 = "5414.1.7"
-    ESCO_2431_8 = "2431.8"
-    ESCO_2635_1_4 = "2635.1.4"
-    ESCO_3117_5 = "3117.5"
-    ESCO_5112_1 = "5112.1"
-    ESCO_3341_4 = "3341.4"
-    ESCO_1223_2_2_1 = "1223.2.2.1"
-    ESCO_3151_3 = "3151.3"
-    ESCO_1321_2_4 = "1321.2.4"
-    ESCO_3123_1_8 = "3123.1.8"
-    ESCO_2320_1_9 = "2320.1.9"
-    ESCO_2631_2_3 = "2631.2.3"
-    ESCO_2432_8 = "2432.8"
-    ESCO_2522_1 = "2522.1"
-    ESCO_1112_1 = "1112.1"
-    ESCO_2144_1_1_1 = "2144.1.1.1"
-    ESCO_2356_1 = "2356.1"
-    ESCO_1420_4 = "1420.4"
-    ESCO_2513_1 = "2513.1"
-    ESCO_7317_1 = "7317.1"
-    ESCO_1324_8_3 = "1324.8.3"
-    ESCO_1223_1 = "1223.1"
-    ESCO_7516_3 = "7516.3"
-    ESCO_1324_3_2_3 = "1324.3.2.3"
-    ESCO_1324_3_1_6_30 = "1324.3.1.6.30"
-    ESCO_8114_8 = "8114.8"
-    ESCO_1349_12 = "1349.12"
-    ESCO_9411_1 = "9411.1"
-    ESCO_2411_1_9 = "2411.1.9"
-    ESCO_1349_7 = "1349.7"
-    ESCO_3324_4_10 = "3324.4.10"
-    ESCO_3257_1 = "3257.1"
-    ESCO_3435_19 = "3435.19"
-    ESCO_8121_2 = "8121.2"
-    ESCO_5223_7_2 = "5223.7.2"
-    ESCO_2330_1_15 = "2330.1.15"
-    ESCO_9214_1 = "9214.1"
-    ESCO_2149_10 = "2149.10"
-    ESCO_2163_1_3_3 = "2163.1.3.3"
-    ESCO_2424_3 = "2424.3"
-    ESCO_3321_1 = "3321.1"
-    ESCO_9212_1 = "9212.1"
-    ESCO_3423_1_2_3 = "3423.1.2.3"
-    ESCO_7316_4 = "7316.4"
-    ESCO_5131_1 = "5131.1"
-    ESCO_2422_12_10 = "2422.12.10"
-    ESCO_7223_4_6 = "7223.4.6"
-    ESCO_3324_4_31 = "3324.4.31"
-    ESCO_4227_2 = "4227.2"
-    ESCO_5161_2 = "5161.2"
-    ESCO_5249_2_1_6 = "5249.2.1.6"
-    ESCO_5142_1 = "5142.1"
-    ESCO_5131_2_2_2 = "5131.2.2.2"
-    ESCO_3133_1 = "3133.1"
-    ESCO_1112_3_2 = "1112.3.2"
-    ESCO_3434_1_3 = "3434.1.3"
-    ESCO_8152_3_3 = "8152.3.3"
-    ESCO_2519_5 = "2519.5"
-    ESCO_7515_5 = "7515.5"
-    ESCO_7131_3 = "7131.3"
-    ESCO_3315_4 = "3315.4"
-    ESCO_1321_2_1_5 = "1321.2.1.5"
-    ESCO_7133_3 = "7133.3"
-    ESCO_8312_4 = "8312.4"
-    ESCO_1324_3_3 = "1324.3.3"
-    ESCO_5329_1 = "5329.1"
-    ESCO_2264_1 = "2264.1"
-    ESCO_3131_2 = "3131.2"
-    ESCO_2132_3 = "2132.3"
-    ESCO_2310_1_20 = "2310.1.20"
-    ESCO_2142_1_3 = "2142.1.3"
-    ESCO_3331_1 = "3331.1"
-    ESCO_3257_4 = "3257.4"
-    ESCO_2162_1_1 = "2162.1.1"
-    ESCO_7232_1 = "7232.1"
-    ESCO_3512_3 = "3512.3"
-    ESCO_7543_7_7 = "7543.7.7"
-    ESCO_2642_1 = "2642.1"
-    ESCO_3118_3 = "3118.3"
-    ESCO_3324_4_25 = "3324.4.25"
-    ESCO_6113_1 = "6113.1"
-    ESCO_5419_10 = "5419.10"
-    ESCO_1324_3_1_6_18 = "1324.3.1.6.18"
-    ESCO_8142_7_1 = "8142.7.1"
-    ESCO_7215_3 = "7215.3"
-    ESCO_2636_1 = "2636.1"
-    ESCO_9329_2 = "9329.2"
-    ESCO_8332_7 = "8332.7"
-    ESCO_7114_2 = "7114.2"
-    ESCO_7223_9 = "7223.9"
-    ESCO_7223_12 = "7223.12"
-    ESCO_5249_2_2_1 = "5249.2.2.1"
-    ESCO_2261_2 = "2261.2"
-    ESCO_1312_2 = "1312.2"
-    ESCO_3521_1_11 = "3521.1.11"
-    ESCO_3324_4_16 = "3324.4.16"
-    ESCO_2144_1_2_1 = "2144.1.2.1"
-    ESCO_4221_2 = "4221.2"
-    ESCO_3123_1_23 = "3123.1.23"
-    ESCO_7133_2 = "7133.2"
-    ESCO_2621_8 = "2621.8"
-    ESCO_3119_9 = "3119.9"
-    ESCO_2359_6 = "2359.6"
-    ESCO_2659_2 = "2659.2"
-    ESCO_3122_4_6 = "3122.4.6"
-    ESCO_7223_22 = "7223.22"
-    ESCO_2511_13 = "2511.13"
-    ESCO_6112_3 = "6112.3"
-    ESCO_1324_3_2_15 = "1324.3.2.15"
-    ESCO_2269_11 = "2269.11"
-    ESCO_2143_2 = "2143.2"
-    ESCO_2513_4 = "2513.4"
-    ESCO_1221_3_2_1 = "1221.3.2.1"
-    ESCO_2149_9_1 = "2149.9.1"
-    ESCO_2635_3_17 = "2635.3.17"
-    ESCO_7523_4 = "7523.4"
-    ESCO_7132_3 = "7132.3"
-    ESCO_3433_3 = "3433.3"
-    ESCO_1330_6 = "1330.6"
-    ESCO_1420_2 = "1420.2"
-    ESCO_1344_1_3 = "1344.1.3"
-    ESCO_2131_4_10 = "2131.4.10"
-    ESCO_8212_3_4 = "8212.3.4"
-    ESCO_2511_15 = "2511.15"
-    ESCO_1321_2_1_3 = "1321.2.1.3"
-    ESCO_3411_3 = "3411.3"
-    ESCO_6221_5 = "6221.5"
-    ESCO_2113_1_3 = "2113.1.3"
-    ESCO_1112_2 = "1112.2"
-    ESCO_7114_1 = "7114.1"
-    ESCO_2114_2 = "2114.2"
-    ESCO_3411_2 = "3411.2"
-    ESCO_8172_5_1 = "8172.5.1"
-    ESCO_2149_2_7_1 = "2149.2.7.1"
-    ESCO_7322_9 = "7322.9"
-    ESCO_2529_5 = "2529.5"
-    ESCO_2635_3_18 = "2635.3.18"
-    ESCO_3115_1_6 = "3115.1.6"
-    ESCO_3111_11 = "3111.11"
-    ESCO_2359_10 = "2359.10"
-    ESCO_2643_4 = "2643.4"
-    ESCO_9216_4 = "9216.4"
-    ESCO_7223_6 = "7223.6"
-    ESCO_3521_1_6 = "3521.1.6"
-    ESCO_3331_2_1_6 = "3331.2.1.6"
-    ESCO_5223_7_24 = "5223.7.24"
-    ESCO_7222_3 = "7222.3"
-    ESCO_1349_19 = "1349.19"
-    ESCO_5163_1 = "5163.1"
-    ESCO_3131_3_9 = "3131.3.9"
-    ESCO_1324_8 = "1324.8"
-    ESCO_2142_1_9 = "2142.1.9"
-    ESCO_3324_4_24 = "3324.4.24"
-    ESCO_3512_1 = "3512.1"
-    ESCO_3354_3 = "3354.3"
-    ESCO_8152_1_1 = "8152.1.1"
-    ESCO_2144_1_11 = "2144.1.11"
-    ESCO_2149_12 = "2149.12"
-    ESCO_7321_1_2 = "7321.1.2"
-    ESCO_2143_1_4 = "2143.1.4"
-    ESCO_3312_6 = "3312.6"
-    ESCO_2433_2 = "2433.2"
-    ESCO_2163_1 = "2163.1"
-    ESCO_8160_37 = "8160.37"
-    ESCO_2359_1 = "2359.1"
-    ESCO_3259_8 = "3259.8"
-    ESCO_7515_2 = "7515.2"
-    ESCO_3142_1_2 = "3142.1.2"
-    ESCO_7523_6 = "7523.6"
-    ESCO_2143_1 = "2143.1"
-    ESCO_2151_1_5 = "2151.1.5"
-    ESCO_8181_6 = "8181.6"
-    ESCO_3343_1_1 = "3343.1.1"
-    ESCO_2654_5 = "2654.5"
-    ESCO_7119_4 = "7119.4"
-    ESCO_2642_1_1 = "2642.1.1"
-    ESCO_2120_6 = "2120.6"
-    ESCO_3435_25_5 = "3435.25.5"
-    ESCO_2131_4_12 = "2131.4.12"
-    ESCO_1420_4_16 = "1420.4.16"
-    ESCO_2611_1_2 = "2611.1.2"
-    ESCO_2632_1 = "2632.1"
-    ESCO_2114_1_2 = "2114.1.2"
-    ESCO_1324_3_1_6_23 = "1324.3.1.6.23"
-    ESCO_7322_4 = "7322.4"
-    ESCO_7543_8_2 = "7543.8.2"
-    ESCO_8211_1 = "8211.1"
-    ESCO_2165_2 = "2165.2"
-    ESCO_1223_2_1_4 = "1223.2.1.4"
-    ESCO_4313_1 = "4313.1"
-    ESCO_3112_1_8 = "3112.1.8"
-    ESCO_2310_1_32 = "2310.1.32"
-    ESCO_8142_13 = "8142.13"
-    ESCO_2651_10 = "2651.10"
-    ESCO_5243_1 = "5243.1"
-    ESCO_2144_1_15 = "2144.1.15"
-    ESCO_3122_4_4 = "3122.4.4"
-    ESCO_1324_8_1 = "1324.8.1"
-    ESCO_3123_1_16 = "3123.1.16"
-    ESCO_8219_8 = "8219.8"
-    ESCO_3341_5 = "3341.5"
-    ESCO_8322_3 = "8322.3"
-    ESCO_2634_2_4 = "2634.2.4"
-    ESCO_2149_9_9 = "2149.9.9"
-    ESCO_3315_7 = "3315.7"
-    ESCO_1324_3_2_29 = "1324.3.2.29"
-    ESCO_7223_3 = "7223.3"
-    ESCO_3119_5 = "3119.5"
-    ESCO_2635_3_12 = "2635.3.12"
-    ESCO_5414_1_1 = "5414.1.1"
-    ESCO_3255_3 = "3255.3"
-    ESCO_3154_2 = "3154.2"
-    ESCO_7233_1 = "7233.1"
-    ESCO_9520_1 = "9520.1"
-    ESCO_7215_2 = "7215.2"
-    ESCO_2149_1 = "2149.1"
-    ESCO_2641_4 = "2641.4"
-    ESCO_7317_2 = "7317.2"
-    ESCO_2412_3 = "2412.3"
-    ESCO_7321_1_6 = "7321.1.6"
-    ESCO_7543_9 = "7543.9"
-    ESCO_8141_1 = "8141.1"
-    ESCO_7521_2 = "7521.2"
-    ESCO_2120_6_1 = "2120.6.1"
-    ESCO_8183_7 = "8183.7"
-    ESCO_7543_7_1 = "7543.7.1"
-    ESCO_3434_1_2_1 = "3434.1.2.1"
-    ESCO_2521_3 = "2521.3"
-    ESCO_3122_3 = "3122.3"
-    ESCO_1324_3_2_18 = "1324.3.2.18"
-    ESCO_1322_2 = "1322.2"
-    ESCO_3111_13 = "3111.13"
-    ESCO_2431_1 = "2431.1"
-    ESCO_2166_13 = "2166.13"
-    ESCO_2511_10 = "2511.10"
-    ESCO_3123_1_7 = "3123.1.7"
-    ESCO_3133_1_3 = "3133.1.3"
-    ESCO_1420_4_31 = "1420.4.31"
-    ESCO_0110_10 = "0110.10"
-    ESCO_6121_5 = "6121.5"
-    ESCO_7232_4 = "7232.4"
-    ESCO_1324_3_2_12 = "1324.3.2.12"
-    ESCO_7543_4 = "7543.4"
-    ESCO_2149_9 = "2149.9"
-    ESCO_7124_1 = "7124.1"
-    ESCO_4312_2 = "4312.2"
-    ESCO_3131_3_6 = "3131.3.6"
-    ESCO_2651_7 = "2651.7"
-    ESCO_3422_4_7 = "3422.4.7"
-    ESCO_3115_1 = "3115.1"
-    ESCO_8122_10 = "8122.10"
-    ESCO_3115_1_3 = "3115.1.3"
-    ESCO_7422_3 = "7422.3"
-    ESCO_2144_1_13 = "2144.1.13"
-    ESCO_3257_4_1 = "3257.4.1"
-    ESCO_1324_7 = "1324.7"
-    ESCO_3153_2_3 = "3153.2.3"
-    ESCO_7531_1 = "7531.1"
-    ESCO_7318_2 = "7318.2"
-    ESCO_3312_4 = "3312.4"
-    ESCO_2631_2_4 = "2631.2.4"
-    ESCO_2310_1_19 = "2310.1.19"
-    ESCO_1219_1_1 = "1219.1.1"
-    ESCO_3334_2_1 = "3334.2.1"
-    ESCO_7515_3 = "7515.3"
-    ESCO_3411_6 = "3411.6"
-    ESCO_5113_1 = "5113.1"
-    ESCO_7421_5 = "7421.5"
-    ESCO_1324_3_2_19 = "1324.3.2.19"
-    ESCO_5246_1 = "5246.1"
-    ESCO_7121_1 = "7121.1"
-    ESCO_2145_2 = "2145.2"
-    ESCO_8132_1 = "8132.1"
-    ESCO_8342_5 = "8342.5"
-    ESCO_6121_1 = "6121.1"
-    ESCO_3115_1_13 = "3115.1.13"
-    ESCO_3331_2_1_20 = "3331.2.1.20"
-    ESCO_2431_10_1 = "2431.10.1"
-    ESCO_7312_4 = "7312.4"
-    ESCO_3253_1_1 = "3253.1.1"
-    ESCO_9333_6 = "9333.6"
-    ESCO_8342_10 = "8342.10"
-    ESCO_2131_6 = "2131.6"
-    ESCO_2422_12_5 = "2422.12.5"
-    ESCO_4221_5 = "4221.5"
-    ESCO_3114_1_1 = "3114.1.1"
-    ESCO_2141_10 = "2141.10"
-    ESCO_8321_1 = "8321.1"
-    ESCO_1219_5_5 = "1219.5.5"
-    ESCO_2310_1_22 = "2310.1.22"
-    ESCO_2642_1_2 = "2642.1.2"
-    ESCO_1420_4_15 = "1420.4.15"
-    ESCO_5223_7_36 = "5223.7.36"
-    ESCO_1211_1_2 = "1211.1.2"
-    ESCO_8160_44 = "8160.44"
-    ESCO_8181_2 = "8181.2"
-    ESCO_2352_1_2 = "2352.1.2"
-    ESCO_2355_2 = "2355.2"
-    ESCO_2433_6_4 = "2433.6.4"
-    ESCO_2131_4_7 = "2131.4.7"
-    ESCO_2635_3_23 = "2635.3.23"
-    ESCO_1324_3_1_6_24 = "1324.3.1.6.24"
-    ESCO_2635_3_27 = "2635.3.27"
-    ESCO_2431_5 = "2431.5"
-    ESCO_1420_5 = "1420.5"
-    ESCO_3331_2_1_12 = "3331.2.1.12"
-    ESCO_2114_1_10 = "2114.1.10"
-    ESCO_7422_2 = "7422.2"
-    ESCO_2131_4_3 = "2131.4.3"
-    ESCO_4222_1 = "4222.1"
-    ESCO_2413_1_2 = "2413.1.2"
-    ESCO_4312_3 = "4312.3"
-    ESCO_2320_1_12 = "2320.1.12"
-    ESCO_0110_8 = "0110.8"
-    ESCO_6112_1 = "6112.1"
-    ESCO_2642_1_4 = "2642.1.4"
-    ESCO_1324_3_2 = "1324.3.2"
-    ESCO_2432_9_1 = "2432.9.1"
-    ESCO_4212_4_1 = "4212.4.1"
-    ESCO_5419_2 = "5419.2"
-    ESCO_7231_1 = "7231.1"
-    ESCO_8160_1 = "8160.1"
-    ESCO_3334_2 = "3334.2"
-    ESCO_3115_1_10 = "3115.1.10"
-    ESCO_3324_4_23 = "3324.4.23"
-    ESCO_2412_7 = "2412.7"
-    ESCO_1323_1_2 = "1323.1.2"
-    ESCO_5249_2_1_1 = "5249.2.1.1"
-    ESCO_4323_14 = "4323.14"
-    ESCO_8160_54 = "8160.54"
-    ESCO_2621_5 = "2621.5"
-    ESCO_7543_11 = "7543.11"
-    ESCO_7317_6 = "7317.6"
-    ESCO_2635_1_5 = "2635.1.5"
-    ESCO_5120_1_2 = "5120.1.2"
-    ESCO_3142_1_3 = "3142.1.3"
-    ESCO_3331_2_1_24 = "3331.2.1.24"
-    ESCO_1323_1_1 = "1323.1.1"
-    ESCO_2149_9_6 = "2149.9.6"
-    ESCO_1324_3_1_2 = "1324.3.1.2"
-    ESCO_2166_1 = "2166.1"
-    ESCO_3411_1 = "3411.1"
-    ESCO_2632_5 = "2632.5"
-    ESCO_4311_1 = "4311.1"
-    ESCO_8171_8 = "8171.8"
-    ESCO_8122_7 = "8122.7"
-    ESCO_3313_3 = "3313.3"
-    ESCO_2141_4_2_1 = "2141.4.2.1"
-    ESCO_2514_3 = "2514.3"
-    ESCO_3323_2_2 = "3323.2.2"
-    ESCO_5120_1_3 = "5120.1.3"
-    ESCO_1324_3_2_21 = "1324.3.2.21"
-    ESCO_0110_7 = "0110.7"
-    ESCO_3315_8 = "3315.8"
-    ESCO_5164_8 = "5164.8"
-    ESCO_2142_1_1 = "2142.1.1"
-    ESCO_2163_1_4 = "2163.1.4"
-    ESCO_7115_4 = "7115.4"
-    ESCO_7221_4 = "7221.4"
-    ESCO_2111_2 = "2111.2"
-    ESCO_7223_4_3 = "7223.4.3"
-    ESCO_7311_5 = "7311.5"
-    ESCO_5165_1 = "5165.1"
-    ESCO_8112_1 = "8112.1"
-    ESCO_3343_2 = "3343.2"
-    ESCO_7541_3 = "7541.3"
-    ESCO_3119_8 = "3119.8"
-    ESCO_1349_21 = "1349.21"
-    ESCO_6223_2 = "6223.2"
-    ESCO_5142_6 = "5142.6"
-    ESCO_2146_5 = "2146.5"
-    ESCO_7221_1_1 = "7221.1.1"
-    ESCO_5419_3 = "5419.3"
-    ESCO_7531_6 = "7531.6"
-    ESCO_8350_5 = "8350.5"
-    ESCO_2514_2 = "2514.2"
-    ESCO_2659_2_4 = "2659.2.4"
-    ESCO_8172_2 = "8172.2"
-    ESCO_7312_6_2 = "7312.6.2"
-    ESCO_0310_3 = "0310.3"
-    ESCO_1324_3_1_6_15 = "1324.3.1.6.15"
-    ESCO_3435_18 = "3435.18"
-    ESCO_2511_16 = "2511.16"
-    ESCO_8153_1_2 = "8153.1.2"
-    ESCO_3251_1 = "3251.1"
-    ESCO_4221_3 = "4221.3"
-    ESCO_5222_1 = "5222.1"
-    ESCO_3122_4_16 = "3122.4.16"
-    ESCO_8211_2 = "8211.2"
-    ESCO_2269_10 = "2269.10"
-    ESCO_2250_1 = "2250.1"
-    ESCO_5142_11 = "5142.11"
-    ESCO_2310_1_26 = "2310.1.26"
-    ESCO_3332_2_1 = "3332.2.1"
-    ESCO_2635_3_20 = "2635.3.20"
-    ESCO_2149_9_3 = "2149.9.3"
-    ESCO_9333_8 = "9333.8"
-    ESCO_1219_6 = "1219.6"
-    ESCO_8160_55 = "8160.55"
-    ESCO_3114_1_3 = "3114.1.3"
-    ESCO_9212_3 = "9212.3"
-    ESCO_2433_6_2 = "2433.6.2"
-    ESCO_8183_6 = "8183.6"
-    ESCO_5132_1_1 = "5132.1.1"
-    ESCO_2263_5 = "2263.5"
-    ESCO_5221_1 = "5221.1"
-    ESCO_3435_14 = "3435.14"
-    ESCO_2633_2 = "2633.2"
-    ESCO_8131_13 = "8131.13"
-    ESCO_3313_1 = "3313.1"
-    ESCO_2133_2 = "2133.2"
-    ESCO_2310_1_2 = "2310.1.2"
-    ESCO_2267_1 = "2267.1"
-    ESCO_2330_1_10 = "2330.1.10"
-    ESCO_3311_2 = "3311.2"
-    ESCO_1223_2_2 = "1223.2.2"
-    ESCO_7511_2 = "7511.2"
-    ESCO_3311_2_4 = "3311.2.4"
-    ESCO_2432_9 = "2432.9"
-    ESCO_3435_12 = "3435.12"
-    ESCO_7231_6 = "7231.6"
-    ESCO_5223_7_18 = "5223.7.18"
-    ESCO_7412_9 = "7412.9"
-    ESCO_6221_7 = "6221.7"
-    ESCO_7543_9_3 = "7543.9.3"
-    ESCO_7422_5 = "7422.5"
-    ESCO_8172_4 = "8172.4"
-    ESCO_7133_5 = "7133.5"
-    ESCO_7323_4 = "7323.4"
-    ESCO_3331_2_1_26 = "3331.2.1.26"
-    ESCO_1344_1 = "1344.1"
-    ESCO_3213_1 = "3213.1"
-    ESCO_1324_3_1_6_9 = "1324.3.1.6.9"
-    ESCO_8142_12 = "8142.12"
-    ESCO_3312_7 = "3312.7"
-    ESCO_2132_1 = "2132.1"
-    ESCO_2310_1_5 = "2310.1.5"
-    ESCO_1341_3 = "1341.3"
-    ESCO_9629_1 = "9629.1"
-    ESCO_5165_1_4 = "5165.1.4"
-    ESCO_2230_2 = "2230.2"
-    ESCO_8121_6 = "8121.6"
-    ESCO_2432_3 = "2432.3"
-    ESCO_2355_1 = "2355.1"
-    ESCO_3112_1_6 = "3112.1.6"
-    ESCO_8171_2 = "8171.2"
-    ESCO_3113_1_1 = "3113.1.1"
-    ESCO_2144_1_10 = "2144.1.10"
-    ESCO_4323_15 = "4323.15"
-    ESCO_2265_1_1 = "2265.1.1"
-    ESCO_3131_3_4 = "3131.3.4"
-    ESCO_3313_2 = "3313.2"
-    ESCO_4323_7 = "4323.7"
-    ESCO_2310_1_11 = "2310.1.11"
-    ESCO_2634_2_1 = "2634.2.1"
-    ESCO_8211_5_2 = "8211.5.2"
-    ESCO_3323_5 = "3323.5"
-    ESCO_3359_3 = "3359.3"
-    ESCO_3122_4_9 = "3122.4.9"
-    ESCO_2149_2_6 = "2149.2.6"
-    ESCO_2513_5 = "2513.5"
-    ESCO_2132_2 = "2132.2"
-    ESCO_2422_18 = "2422.18"
-    ESCO_1324_3_2_32 = "1324.3.2.32"
-    ESCO_8212_2_1 = "8212.2.1"
-    ESCO_2145_1_8 = "2145.1.8"
-    ESCO_2149_9_5 = "2149.9.5"
-    ESCO_7223_14 = "7223.14"
-    ESCO_8114_7 = "8114.7"
-    ESCO_7115_3 = "7115.3"
-    ESCO_5311_1_2 = "5311.1.2"
-    ESCO_2266_1 = "2266.1"
-    ESCO_3118_3_12 = "3118.3.12"
-    ESCO_1221_2 = "1221.2"
-    ESCO_2131_4_5 = "2131.4.5"
-    ESCO_2310_1_23 = "2310.1.23"
-    ESCO_6112_4 = "6112.4"
-    ESCO_3259_4 = "3259.4"
-    ESCO_7211_1_2 = "7211.1.2"
-    ESCO_2310_1_34 = "2310.1.34"
-    ESCO_7543_7_6 = "7543.7.6"
-    ESCO_4312_6 = "4312.6"
-    ESCO_2153_1_1 = "2153.1.1"
-    ESCO_8332_4 = "8332.4"
-    ESCO_2635_3_11 = "2635.3.11"
-    ESCO_2114_1 = "2114.1"
-    ESCO_3412_4_1 = "3412.4.1"
-    ESCO_7312_3 = "7312.3"
-    ESCO_1120_4 = "1120.4"
-    ESCO_5414_1_8 = "5414.1.8"
-    ESCO_0110_2 = "0110.2"
-    ESCO_1321_2_3 = "1321.2.3"
-    ESCO_2619_2 = "2619.2"
-    ESCO_0110_4 = "0110.4"
-    ESCO_8143_1 = "8143.1"
-    ESCO_1324_3_2_33 = "1324.3.2.33"
-    ESCO_2653_1_1 = "2653.1.1"
-    ESCO_8131_2_6 = "8131.2.6"
-    ESCO_3352_2 = "3352.2"
-    ESCO_5222_1_1 = "5222.1.1"
-    ESCO_3423_2 = "3423.2"
-    ESCO_3253_1 = "3253.1"
-    ESCO_7312_3_2 = "7312.3.2"
-    ESCO_8131_20 = "8131.20"
-    ESCO_3122_4_1 = "3122.4.1"
-    ESCO_3112_1_5 = "3112.1.5"
-    ESCO_3324_4_4 = "3324.4.4"
-    ESCO_7212_3_2 = "7212.3.2"
-    ESCO_5211_1 = "5211.1"
-    ESCO_9333_4 = "9333.4"
-    ESCO_4419_2 = "4419.2"
-    ESCO_3339_7 = "3339.7"
-    ESCO_3324_4_32 = "3324.4.32"
-    ESCO_3257_2 = "3257.2"
-    ESCO_7413_1 = "7413.1"
-    ESCO_3343_1_7 = "3343.1.7"
-    ESCO_2114_1_3 = "2114.1.3"
-    ESCO_6224_1 = "6224.1"
-    ESCO_3119_3 = "3119.3"
-    ESCO_2149_16 = "2149.16"
-    ESCO_2310_1_36 = "2310.1.36"
-    ESCO_1330_10 = "1330.10"
-    ESCO_9213_1 = "9213.1"
-    ESCO_8312_1 = "8312.1"
-    ESCO_7534_1 = "7534.1"
-    ESCO_8131_17 = "8131.17"
-    ESCO_0310_1 = "0310.1"
-    ESCO_1213_4 = "1213.4"
-    ESCO_3116_1_4 = "3116.1.4"
-    ESCO_2433_6 = "2433.6"
-    ESCO_3311_2_3 = "3311.2.3"
-    ESCO_2421_4 = "2421.4"
-    ESCO_7534_3_3 = "7534.3.3"
-    ESCO_2166_12 = "2166.12"
-    ESCO_3112_1_11 = "3112.1.11"
-    ESCO_3343_1_5 = "3343.1.5"
-    ESCO_1345_1_6 = "1345.1.6"
-    ESCO_7315_2 = "7315.2"
-    ESCO_8160_53 = "8160.53"
-    ESCO_1321_1 = "1321.1"
-    ESCO_2411_1_1 = "2411.1.1"
-    ESCO_7215_2_2 = "7215.2.2"
-    ESCO_8342_1 = "8342.1"
-    ESCO_2422_12 = "2422.12"
-    ESCO_7223_18 = "7223.18"
-    ESCO_0210_2 = "0210.2"
-    ESCO_8342_8 = "8342.8"
-    ESCO_1219_5_3 = "1219.5.3"
-    ESCO_2422_15 = "2422.15"
-    ESCO_3359_2 = "3359.2"
-    ESCO_8212_2_3 = "8212.2.3"
-    ESCO_9112_6 = "9112.6"
-    ESCO_2654_1 = "2654.1"
-    ESCO_9111_1 = "9111.1"
-    ESCO_2642_1_8 = "2642.1.8"
-    ESCO_3133_1_4 = "3133.1.4"
-    ESCO_3112_5 = "3112.5"
-    ESCO_2355_4 = "2355.4"
-    ESCO_3323_1 = "3323.1"
-    ESCO_7543_8 = "7543.8"
-    ESCO_1349_18 = "1349.18"
-    ESCO_2131_4_6_1 = "2131.4.6.1"
-    ESCO_1324_3_2_6 = "1324.3.2.6"
-    ESCO_5223_7_29 = "5223.7.29"
-    ESCO_3151_2 = "3151.2"
-    ESCO_7534_3_1 = "7534.3.1"
-    ESCO_2411_1_2 = "2411.1.2"
-    ESCO_1222_1 = "1222.1"
-    ESCO_3115_1_8 = "3115.1.8"
-    ESCO_9333_8_1 = "9333.8.1"
-    ESCO_2511_18 = "2511.18"
-    ESCO_7212_4 = "7212.4"
-    ESCO_3355_3 = "3355.3"
-    ESCO_2635_3_6 = "2635.3.6"
-    ESCO_7536_2_4 = "7536.2.4"
-    ESCO_8122_6 = "8122.6"
-    ESCO_1431_1_1 = "1431.1.1"
-    ESCO_2654_4 = "2654.4"
-    ESCO_2652_5 = "2652.5"
-    ESCO_7321_1_4 = "7321.1.4"
-    ESCO_3324_4_6 = "3324.4.6"
-    ESCO_7523_1 = "7523.1"
-    ESCO_3123_1_12 = "3123.1.12"
-    ESCO_1346_6 = "1346.6"
-    ESCO_3255_4 = "3255.4"
-    ESCO_3334_4 = "3334.4"
-    ESCO_2523_3 = "2523.3"
-    ESCO_7321_1_3 = "7321.1.3"
-    ESCO_8159_5 = "8159.5"
-    ESCO_2652_3_1_1 = "2652.3.1.1"
-    ESCO_2269_6 = "2269.6"
-    ESCO_1349_2 = "1349.2"
-    ESCO_1213_2_1 = "1213.2.1"
-    ESCO_5241_1 = "5241.1"
-    ESCO_7233_2 = "7233.2"
-    ESCO_7224_1 = "7224.1"
-    ESCO_7422_6 = "7422.6"
-    ESCO_3323_4 = "3323.4"
-    ESCO_2512_3 = "2512.3"
-    ESCO_7312_6_3 = "7312.6.3"
-    ESCO_3139_3 = "3139.3"
-    ESCO_1346_2 = "1346.2"
-    ESCO_2131_8_2 = "2131.8.2"
-    ESCO_2320_1_8 = "2320.1.8"
-    ESCO_4212_6 = "4212.6"
-    ESCO_3251_2 = "3251.2"
-    ESCO_7222_4 = "7222.4"
-    ESCO_2433_6_7 = "2433.6.7"
-    ESCO_2163_1_3_1 = "2163.1.3.1"
-    ESCO_2163_1_2 = "2163.1.2"
-    ESCO_3259_2 = "3259.2"
-    ESCO_5169_1 = "5169.1"
-    ESCO_7531_3 = "7531.3"
-    ESCO_6122_1 = "6122.1"
-    ESCO_2619_10 = "2619.10"
-    ESCO_1345_1_3 = "1345.1.3"
-    ESCO_2652_4 = "2652.4"
-    ESCO_3334_3_1 = "3334.3.1"
-    ESCO_3134_2 = "3134.2"
-    ESCO_3115_1_14 = "3115.1.14"
-    ESCO_2412_2 = "2412.2"
-    ESCO_2431_7 = "2431.7"
-    ESCO_2145_1_3 = "2145.1.3"
-    ESCO_3314_2 = "3314.2"
-    ESCO_1349_21_1 = "1349.21.1"
-    ESCO_8131_7 = "8131.7"
-    ESCO_2642_1_9 = "2642.1.9"
-    ESCO_9334_1 = "9334.1"
-    ESCO_6113_2 = "6113.2"
-    ESCO_2642_1_6 = "2642.1.6"
-    ESCO_3324_4_35 = "3324.4.35"
-    ESCO_1345_1_7 = "1345.1.7"
-    ESCO_5321_1 = "5321.1"
-    ESCO_3331_2_1_33 = "3331.2.1.33"
-    ESCO_8113_3 = "8113.3"
-    ESCO_7543_10_1 = "7543.10.1"
-    ESCO_2423_3 = "2423.3"
-    ESCO_2511_3 = "2511.3"
-    ESCO_5142_2 = "5142.2"
-    ESCO_8160_16 = "8160.16"
-    ESCO_3132_4 = "3132.4"
-    ESCO_8212_3_2 = "8212.3.2"
-    ESCO_1324_3_1_6_16 = "1324.3.1.6.16"
-    ESCO_6221_8 = "6221.8"
-    ESCO_7511_6_2 = "7511.6.2"
-    ESCO_3153_2_6 = "3153.2.6"
-    ESCO_7511_1_2 = "7511.1.2"
-    ESCO_5411_1_3 = "5411.1.3"
-    ESCO_2422_12_12 = "2422.12.12"
-    ESCO_1420_4_14 = "1420.4.14"
-    ESCO_3153_3 = "3153.3"
-    ESCO_8181_5 = "8181.5"
-    ESCO_2163_2 = "2163.2"
-    ESCO_7215_1_1 = "7215.1.1"
-    ESCO_5162_1 = "5162.1"
-    ESCO_2166_7 = "2166.7"
-    ESCO_8131_16 = "8131.16"
-    ESCO_2166_5 = "2166.5"
-    ESCO_5142_9 = "5142.9"
-    ESCO_5131_2 = "5131.2"
-    ESCO_1412_1 = "1412.1"
-    ESCO_1111_3 = "1111.3"
-    ESCO_8172_5_5 = "8172.5.5"
-    ESCO_2166_6 = "2166.6"
-    ESCO_3331_2_1_11 = "3331.2.1.11"
-    ESCO_3435_9 = "3435.9"
-    ESCO_5249_2_2_2 = "5249.2.2.2"
-    ESCO_2635_3_24 = "2635.3.24"
-    ESCO_2146_7 = "2146.7"
-    ESCO_2422_12_15 = "2422.12.15"
-    ESCO_3435_25_1 = "3435.25.1"
-    ESCO_2141_4_2 = "2141.4.2"
-    ESCO_5163_3 = "5163.3"
-    ESCO_7223_23 = "7223.23"
-    ESCO_1324_3_2_17 = "1324.3.2.17"
-    ESCO_4321_1 = "4321.1"
-    ESCO_2142_1 = "2142.1"
-    ESCO_2144_1_1 = "2144.1.1"
-    ESCO_8219_4 = "8219.4"
-    ESCO_4323_3 = "4323.3"
-    ESCO_3118_3_8 = "3118.3.8"
-    ESCO_3522_1 = "3522.1"
-    ESCO_6221_2 = "6221.2"
-    ESCO_1420_4_18 = "1420.4.18"
-    ESCO_8151_1 = "8151.1"
-    ESCO_2351_1 = "2351.1"
-    ESCO_2165_4 = "2165.4"
-    ESCO_1420_4_11 = "1420.4.11"
-    ESCO_4416_1 = "4416.1"
-    ESCO_2114_1_7 = "2114.1.7"
-    ESCO_2422_11 = "2422.11"
-    ESCO_3331_2_1_32 = "3331.2.1.32"
-    ESCO_1221_3_3 = "1221.3.3"
-    ESCO_2424_1 = "2424.1"
-    ESCO_1324_3_2_28 = "1324.3.2.28"
-    ESCO_2412_4_1 = "2412.4.1"
-    ESCO_2411_1_3 = "2411.1.3"
-    ESCO_9312_1_2 = "9312.1.2"
-    ESCO_3132_5 = "3132.5"
-    ESCO_7421_2 = "7421.2"
-    ESCO_8183_4 = "8183.4"
-    ESCO_3359_8 = "3359.8"
-    ESCO_5223_7_17 = "5223.7.17"
-    ESCO_8212_3_5 = "8212.3.5"
-    ESCO_2643_6_1 = "2643.6.1"
-    ESCO_3115_1_22 = "3115.1.22"
-    ESCO_8131_21 = "8131.21"
-    ESCO_1221_3_2_1_1 = "1221.3.2.1.1"
-    ESCO_2310_1_24 = "2310.1.24"
-    ESCO_3116_1_2 = "3116.1.2"
-    ESCO_5169_3 = "5169.3"
-    ESCO_8160_45 = "8160.45"
-    ESCO_7316_1_3 = "7316.1.3"
-    ESCO_2642_1_3 = "2642.1.3"
-    ESCO_1349_14 = "1349.14"
-    ESCO_1349_3 = "1349.3"
-    ESCO_8153_1_1 = "8153.1.1"
-    ESCO_2144_1_5 = "2144.1.5"
-    ESCO_3323_2_3 = "3323.2.3"
-    ESCO_7211_1 = "7211.1"
-    ESCO_1324_3_2_14 = "1324.3.2.14"
-    ESCO_1324_3_2_2 = "1324.3.2.2"
-    ESCO_5163_2 = "5163.2"
-    ESCO_7515_4 = "7515.4"
-    ESCO_7313_1_6 = "7313.1.6"
-    ESCO_3122_3_6 = "3122.3.6"
-    ESCO_2635_3_22 = "2635.3.22"
-    ESCO_3331_2_1_5 = "3331.2.1.5"
-    ESCO_3514_1 = "3514.1"
-    ESCO_8343_2 = "8343.2"
-    ESCO_1221_5 = "1221.5"
-    ESCO_7536_2_8 = "7536.2.8"
-    ESCO_2141_4_3 = "2141.4.3"
-    ESCO_3521_1_5 = "3521.1.5"
-    ESCO_3114_1_9 = "3114.1.9"
-    ESCO_1439_1 = "1439.1"
-    ESCO_7119_2 = "7119.2"
-    ESCO_3334_1 = "3334.1"
-    ESCO_3331_2_1_27 = "3331.2.1.27"
-    ESCO_8350_2 = "8350.2"
-    ESCO_9333_7 = "9333.7"
-    ESCO_1324_3_1_6_10 = "1324.3.1.6.10"
-    ESCO_3257_4_2 = "3257.4.2"
-    ESCO_5249_1 = "5249.1"
-    ESCO_3324_4_19 = "3324.4.19"
-    ESCO_3112_7 = "3112.7"
-    ESCO_2431_4 = "2431.4"
-    ESCO_2412_9 = "2412.9"
-    ESCO_7311_4 = "7311.4"
-    ESCO_3118_3_9 = "3118.3.9"
-    ESCO_8160_36 = "8160.36"
-    ESCO_8141_1_5 = "8141.1.5"
-    ESCO_1322_1_1 = "1322.1.1"
-    ESCO_2411_1_6 = "2411.1.6"
-    ESCO_8157_2 = "8157.2"
-    ESCO_7512_3 = "7512.3"
-    ESCO_2133_4 = "2133.4"
-    ESCO_2431_3 = "2431.3"
-    ESCO_2113_1_5 = "2113.1.5"
-    ESCO_5223_7_26 = "5223.7.26"
-    ESCO_1324_3_1_6_3 = "1324.3.1.6.3"
-    ESCO_2149_13 = "2149.13"
-    ESCO_1324_3_1_6_1 = "1324.3.1.6.1"
-    ESCO_6221_6 = "6221.6"
-    ESCO_3324_4_3 = "3324.4.3"
-    ESCO_8160_20 = "8160.20"
-    ESCO_2523_2 = "2523.2"
-    ESCO_8160_42 = "8160.42"
-    ESCO_3435_1 = "3435.1"
-    ESCO_5223_7_13 = "5223.7.13"
-    ESCO_2142_1_5 = "2142.1.5"
-    ESCO_3211_2 = "3211.2"
-    ESCO_7522_2 = "7522.2"
-    ESCO_2164_4 = "2164.4"
-    ESCO_7319_1 = "7319.1"
-    ESCO_1345_1 = "1345.1"
-    ESCO_2431_14 = "2431.14"
-    ESCO_9629_5 = "9629.5"
-    ESCO_8181_8 = "8181.8"
-    ESCO_3354_1 = "3354.1"
-    ESCO_2511_14 = "2511.14"
-    ESCO_1420_4_13 = "1420.4.13"
-    ESCO_9412_1 = "9412.1"
-    ESCO_2132_6 = "2132.6"
-    ESCO_3331_2_1_31 = "3331.2.1.31"
-    ESCO_5132_1_2 = "5132.1.2"
-    ESCO_3311_1 = "3311.1"
-    ESCO_1213_2_3 = "1213.2.3"
-    ESCO_1330_1 = "1330.1"
-    ESCO_2145_1_9 = "2145.1.9"
-    ESCO_1349_6 = "1349.6"
-    ESCO_3122_3_5 = "3122.3.5"
-    ESCO_8219_2 = "8219.2"
-    ESCO_9629_2 = "9629.2"
-    ESCO_2511_1 = "2511.1"
-    ESCO_3122_3_8 = "3122.3.8"
-    ESCO_8160_17 = "8160.17"
-    ESCO_2621_1 = "2621.1"
-    ESCO_2133_3 = "2133.3"
-    ESCO_8160_34 = "8160.34"
-    ESCO_3152_1 = "3152.1"
-    ESCO_3324_1_2 = "3324.1.2"
-    ESCO_2423_2 = "2423.2"
-    ESCO_7122_1 = "7122.1"
-    ESCO_0110_12 = "0110.12"
-    ESCO_7313_1_5 = "7313.1.5"
-    ESCO_1345_1_1 = "1345.1.1"
-    ESCO_0110_5 = "0110.5"
-    ESCO_3324_2 = "3324.2"
-    ESCO_9333_2 = "9333.2"
-    ESCO_3435_8 = "3435.8"
-    ESCO_1321_2_1_6_1 = "1321.2.1.6.1"
-    ESCO_2261_1 = "2261.1"
-    ESCO_3154_3 = "3154.3"
-    ESCO_9611_1 = "9611.1"
-    ESCO_2641_4_1 = "2641.4.1"
-    ESCO_3123_2 = "3123.2"
-    ESCO_3115_1_23 = "3115.1.23"
-    ESCO_2431_15 = "2431.15"
-    ESCO_9211_2 = "9211.2"
-    ESCO_2269_9_1 = "2269.9.1"
-    ESCO_8156_2_2 = "8156.2.2"
-    ESCO_5151_1 = "5151.1"
-    ESCO_7536_1_3 = "7536.1.3"
-    ESCO_2152_1_3 = "2152.1.3"
-    ESCO_2151_1_4 = "2151.1.4"
-    ESCO_3111_9 = "3111.9"
-    ESCO_2433_6_6 = "2433.6.6"
-    ESCO_2152_1_8 = "2152.1.8"
-    ESCO_7535_1 = "7535.1"
-    ESCO_3331_2_1_23 = "3331.2.1.23"
-    ESCO_2621_9 = "2621.9"
-    ESCO_2310_1_8 = "2310.1.8"
-    ESCO_8322_6 = "8322.6"
-    ESCO_3331_2_1_10 = "3331.2.1.10"
-    ESCO_2320_1_21 = "2320.1.21"
-    ESCO_6113_5 = "6113.5"
-    ESCO_8141_1_3 = "8141.1.3"
-    ESCO_1420_4_22 = "1420.4.22"
-    ESCO_8141_1_9_1 = "8141.1.9.1"
-    ESCO_2250_2 = "2250.2"
-    ESCO_1324_3_1_6_26 = "1324.3.1.6.26"
-    ESCO_2133_15 = "2133.15"
-    ESCO_7411_1_3 = "7411.1.3"
-    ESCO_2655_1_1 = "2655.1.1"
-    ESCO_2330_1_14 = "2330.1.14"
-    ESCO_1330_8 = "1330.8"
-    ESCO_2149_3 = "2149.3"
-    ESCO_3315_5 = "3315.5"
-    ESCO_3321_3 = "3321.3"
-    ESCO_3315_6 = "3315.6"
-    ESCO_6221_4 = "6221.4"
-    ESCO_1219_1_2 = "1219.1.2"
-    ESCO_3331_2_1_4 = "3331.2.1.4"
-    ESCO_4323_18 = "4323.18"
-    ESCO_3117_2 = "3117.2"
-    ESCO_4212_8 = "4212.8"
-    ESCO_2131_2 = "2131.2"
-    ESCO_5212_1 = "5212.1"
-    ESCO_1324_3_2_10 = "1324.3.2.10"
-    ESCO_7212_3_1 = "7212.3.1"
-    ESCO_1114_1 = "1114.1"
-    ESCO_8122_2 = "8122.2"
-    ESCO_2310_1_16 = "2310.1.16"
-    ESCO_5112_3 = "5112.3"
-    ESCO_6121_4 = "6121.4"
-    ESCO_7322_5 = "7322.5"
-    ESCO_5419_6 = "5419.6"
-    ESCO_7214_1 = "7214.1"
-    ESCO_6221_10 = "6221.10"
-    ESCO_3111_7 = "3111.7"
-    ESCO_4212_4 = "4212.4"
-    ESCO_2269_9_2 = "2269.9.2"
-    ESCO_8143_2 = "8143.2"
-    ESCO_7313_1_8 = "7313.1.8"
-    ESCO_3324_4_1 = "3324.4.1"
-    ESCO_2250_6 = "2250.6"
-    ESCO_2642_1_15 = "2642.1.15"
-    ESCO_1321_2_1 = "1321.2.1"
-    ESCO_5414_1_6 = "5414.1.6"
-    ESCO_7223_5 = "7223.5"
-    ESCO_2641_4_2 = "2641.4.2"
-    ESCO_7318_3 = "7318.3"
-    ESCO_2651_4 = "2651.4"
-    ESCO_2145_1 = "2145.1"
-    ESCO_8142_3 = "8142.3"
-    ESCO_2643_6_2 = "2643.6.2"
-    ESCO_2141_3 = "2141.3"
-    ESCO_2359_7 = "2359.7"
-    ESCO_7222_5 = "7222.5"
-    ESCO_2651_3 = "2651.3"
-    ESCO_7421_8 = "7421.8"
-    ESCO_8160_18 = "8160.18"
-    ESCO_8153_1_3 = "8153.1.3"
-    ESCO_2636_2 = "2636.2"
-    ESCO_7126_8 = "7126.8"
-    ESCO_8160_48 = "8160.48"
-    ESCO_3119_16_1 = "3119.16.1"
-    ESCO_2411_1 = "2411.1"
-    ESCO_1420_4_7 = "1420.4.7"
-    ESCO_3115_1_11 = "3115.1.11"
-    ESCO_8131_2_5 = "8131.2.5"
-    ESCO_1324_3_1_6_21 = "1324.3.1.6.21"
-    ESCO_3152_5 = "3152.5"
-    ESCO_1343_1 = "1343.1"
-    ESCO_8344_1 = "8344.1"
-    ESCO_8342_3 = "8342.3"
-    ESCO_2131_4 = "2131.4"
-    ESCO_7126_5 = "7126.5"
-    ESCO_1349_11 = "1349.11"
-    ESCO_1223_2_1_2 = "1223.2.1.2"
-    ESCO_1342_1 = "1342.1"
-    ESCO_3331_2_1_21 = "3331.2.1.21"
-    ESCO_3115_1_2 = "3115.1.2"
-    ESCO_2161_1_1 = "2161.1.1"
-    ESCO_2142_1_6 = "2142.1.6"
-    ESCO_9311_1 = "9311.1"
-    ESCO_4226_1_2 = "4226.1.2"
-    ESCO_2131_4_9 = "2131.4.9"
-    ESCO_1311_1 = "1311.1"
-    ESCO_7131_2 = "7131.2"
-    ESCO_1420_4_24 = "1420.4.24"
-    ESCO_3112_1_3 = "3112.1.3"
-    ESCO_3435_25 = "3435.25"
-    ESCO_1330_5 = "1330.5"
-    ESCO_2330_1_11 = "2330.1.11"
-    ESCO_3112_1_2 = "3112.1.2"
-    ESCO_7422_3_1 = "7422.3.1"
-    ESCO_2149_9_4 = "2149.9.4"
-    ESCO_7511_6_1 = "7511.6.1"
-    ESCO_2151_1_6 = "2151.1.6"
-    ESCO_3133_1_5 = "3133.1.5"
-    ESCO_3339_2 = "3339.2"
-    ESCO_3432_2 = "3432.2"
-    ESCO_5111_2_1 = "5111.2.1"
-    ESCO_5311_1_1 = "5311.1.1"
-    ESCO_2354_1 = "2354.1"
-    ESCO_1112_4 = "1112.4"
-    ESCO_9312_1_3 = "9312.1.3"
-    ESCO_3152_4 = "3152.4"
-    ESCO_2512_4 = "2512.4"
-    ESCO_0110_1 = "0110.1"
-    ESCO_7413_1_3 = "7413.1.3"
-    ESCO_1420_4_6 = "1420.4.6"
-    ESCO_8156_3_1 = "8156.3.1"
-    ESCO_1330_5_1 = "1330.5.1"
-    ESCO_3131_3_7 = "3131.3.7"
-    ESCO_3331_2_1_30 = "3331.2.1.30"
-    ESCO_3141_2_1 = "3141.2.1"
-    ESCO_3331_2_1_7 = "3331.2.1.7"
-    ESCO_2641_3 = "2641.3"
-    ESCO_3324_4_13 = "3324.4.13"
-    ESCO_2145_1_1 = "2145.1.1"
-    ESCO_4323_1 = "4323.1"
-    ESCO_7113_1 = "7113.1"
-    ESCO_3139_1_1 = "3139.1.1"
-    ESCO_3412_4_2 = "3412.4.2"
-    ESCO_3154_1_2 = "3154.1.2"
-    ESCO_6210_1 = "6210.1"
-    ESCO_7233_8_2 = "7233.8.2"
-    ESCO_7123_2 = "7123.2"
-    ESCO_9622_1 = "9622.1"
-    ESCO_5223_7_34 = "5223.7.34"
-    ESCO_8159_7 = "8159.7"
-    ESCO_1349_17 = "1349.17"
-    ESCO_8160_41 = "8160.41"
-    ESCO_1439_6 = "1439.6"
-    ESCO_7412_6 = "7412.6"
-    ESCO_2250_4_1 = "2250.4.1"
-    ESCO_1439_3 = "1439.3"
-    ESCO_3339_1 = "3339.1"
-    ESCO_8160_33 = "8160.33"
-    ESCO_1344_1_2 = "1344.1.2"
-    ESCO_7321_1_5 = "7321.1.5"
-    ESCO_7312_1 = "7312.1"
-    ESCO_1324_3_1_5 = "1324.3.1.5"
-    ESCO_4323_9 = "4323.9"
-    ESCO_3122_4_2 = "3122.4.2"
-    ESCO_8212_2_2 = "8212.2.2"
-    ESCO_9321_2 = "9321.2"
-    ESCO_6111_1 = "6111.1"
-    ESCO_1212_2 = "1212.2"
-    ESCO_5141_1_4 = "5141.1.4"
-    ESCO_3411_9 = "3411.9"
-    ESCO_4323_13 = "4323.13"
-    ESCO_2652_3 = "2652.3"
-    ESCO_2432_7 = "2432.7"
-    ESCO_2330_1_6 = "2330.1.6"
-    ESCO_8160_8 = "8160.8"
-    ESCO_5164_1_3 = "5164.1.3"
-    ESCO_1420_4_37 = "1420.4.37"
-    ESCO_7233_8_1 = "7233.8.1"
-    ESCO_3423_2_2 = "3423.2.2"
-    ESCO_3331_2_1_9 = "3331.2.1.9"
-    ESCO_8154_4 = "8154.4"
-    ESCO_2422_12_7 = "2422.12.7"
-    ESCO_9412_2 = "9412.2"
-    ESCO_4226_1 = "4226.1"
-    ESCO_3115_1_24 = "3115.1.24"
-    ESCO_2635_1_1 = "2635.1.1"
-    ESCO_2422_12_4 = "2422.12.4"
-    ESCO_5223_7_32 = "5223.7.32"
-    ESCO_3117_4 = "3117.4"
-    ESCO_9129_1 = "9129.1"
-    ESCO_5169_2 = "5169.2"
-    ESCO_4321_1_3 = "4321.1.3"
-    ESCO_5249_2_1_3 = "5249.2.1.3"
-    ESCO_3315_2 = "3315.2"
-    ESCO_3255_2 = "3255.2"
-    ESCO_8212_3_3 = "8212.3.3"
-    ESCO_1420_4_19 = "1420.4.19"
-    ESCO_2352_1_5 = "2352.1.5"
-    ESCO_7421_3 = "7421.3"
-    ESCO_2642_1_12 = "2642.1.12"
-    ESCO_7412_7 = "7412.7"
-    ESCO_1324_3_1_6_7 = "1324.3.1.6.7"
-    ESCO_5223_3 = "5223.3"
-    ESCO_5414_1_3 = "5414.1.3"
-    ESCO_7536_2 = "7536.2"
-    ESCO_4413_1 = "4413.1"
-    ESCO_8156_2_5 = "8156.2.5"
-    ESCO_2269_9 = "2269.9"
-    ESCO_2149_5 = "2149.5"
-    ESCO_7312_7 = "7312.7"
-    ESCO_3331_2_1_17 = "3331.2.1.17"
-    ESCO_3142_1_1 = "3142.1.1"
-    ESCO_5111_2_3 = "5111.2.3"
-    ESCO_6113_6 = "6113.6"
-    ESCO_2132_5 = "2132.5"
-    ESCO_8211_5_1 = "8211.5.1"
-    ESCO_4323_11 = "4323.11"
-    ESCO_2635_2 = "2635.2"
-    ESCO_2112_2 = "2112.2"
-    ESCO_1341_2 = "1341.2"
-    ESCO_2133_8 = "2133.8"
-    ESCO_3117_1 = "3117.1"
-    ESCO_3311_2_1 = "3311.2.1"
-    ESCO_5151_2 = "5151.2"
-    ESCO_1323_1 = "1323.1"
-    ESCO_2511_19 = "2511.19"
-    ESCO_2621_4 = "2621.4"
-    ESCO_2330_1_12 = "2330.1.12"
-    ESCO_9312_1_1 = "9312.1.1"
-    ESCO_4212_5 = "4212.5"
-    ESCO_3111_4 = "3111.4"
-    ESCO_7132_2 = "7132.2"
-    ESCO_7522_5 = "7522.5"
-    ESCO_9313_1 = "9313.1"
-    ESCO_2310_1_9 = "2310.1.9"
-    ESCO_2149_2_1 = "2149.2.1"
-    ESCO_9216_2 = "9216.2"
-    ESCO_3143_1 = "3143.1"
-    ESCO_5164_2_1 = "5164.2.1"
-    ESCO_1324_1 = "1324.1"
-    ESCO_3311_3_3 = "3311.3.3"
-    ESCO_3412_3 = "3412.3"
-    ESCO_8143_5 = "8143.5"
-    ESCO_3343_1_4 = "3343.1.4"
-    ESCO_8141_1_2 = "8141.1.2"
-    ESCO_2144_1_12 = "2144.1.12"
-    ESCO_7221_1 = "7221.1"
-    ESCO_2142_1_11 = "2142.1.11"
-    ESCO_1324_3_2_4 = "1324.3.2.4"
-    ESCO_4312_5 = "4312.5"
-    ESCO_7531_4 = "7531.4"
-    ESCO_3323_2_4 = "3323.2.4"
-    ESCO_2152_1_7_1 = "2152.1.7.1"
-    ESCO_7223_4_7 = "7223.4.7"
-    ESCO_2433_5 = "2433.5"
-    ESCO_3132_3 = "3132.3"
-    ESCO_7412_11 = "7412.11"
-    ESCO_3324_4_14 = "3324.4.14"
-    ESCO_5161_4 = "5161.4"
-    ESCO_1321_2_2 = "1321.2.2"
-    ESCO_0310_2 = "0310.2"
-    ESCO_2642_1_7 = "2642.1.7"
-    ESCO_7411_1_2 = "7411.1.2"
-    ESCO_2149_2 = "2149.2"
-    ESCO_4222_1_1 = "4222.1.1"
-    ESCO_2422_12_13 = "2422.12.13"
-    ESCO_2611_1_1 = "2611.1.1"
-    ESCO_2511_9 = "2511.9"
-    ESCO_3521_2 = "3521.2"
-    ESCO_2133_14 = "2133.14"
-    ESCO_2330_1_4 = "2330.1.4"
-    ESCO_2635_3_5 = "2635.3.5"
-    ESCO_3322_1_2 = "3322.1.2"
-    ESCO_7512_5 = "7512.5"
-    ESCO_3141_2_5 = "3141.2.5"
-    ESCO_8131_4 = "8131.4"
-    ESCO_6223_2_1 = "6223.2.1"
-    ESCO_2120_2 = "2120.2"
-    ESCO_9612_2 = "9612.2"
-    ESCO_5414_1_2 = "5414.1.2"
-    ESCO_2422_1 = "2422.1"
-    ESCO_8211_5 = "8211.5"
-
-
-class NaceCode(str, Enum):
-    NACE_01 = "01"
-    NACE_01_1 = "01.1"
-    NACE_01_11 = "01.11"
-    NACE_01_12 = "01.12"
-    NACE_01_13 = "01.13"
-    NACE_01_14 = "01.14"
-    NACE_01_15 = "01.15"
-    NACE_01_16 = "01.16"
-    NACE_01_19 = "01.19"
-    NACE_01_2 = "01.2"
-    NACE_01_21 = "01.21"
-    NACE_01_22 = "01.22"
-    NACE_01_23 = "01.23"
-    NACE_01_24 = "01.24"
-    NACE_01_25 = "01.25"
-    NACE_01_26 = "01.26"
-    NACE_01_27 = "01.27"
-    NACE_01_28 = "01.28"
-    NACE_01_29 = "01.29"
-    NACE_01_3 = "01.3"
-    NACE_01_30 = "01.30"
-    NACE_01_4 = "01.4"
-    NACE_01_41 = "01.41"
-    NACE_01_42 = "01.42"
-    NACE_01_43 = "01.43"
-    NACE_01_44 = "01.44"
-    NACE_01_45 = "01.45"
-    NACE_01_46 = "01.46"
-    NACE_01_47 = "01.47"
-    NACE_01_49 = "01.49"
-    NACE_01_5 = "01.5"
-    NACE_01_50 = "01.50"
-    NACE_01_6 = "01.6"
-    NACE_01_61 = "01.61"
-    NACE_01_62 = "01.62"
-    NACE_01_63 = "01.63"
-    NACE_01_64 = "01.64"
-    NACE_01_7 = "01.7"
-    NACE_01_70 = "01.70"
-    NACE_02 = "02"
-    NACE_02_1 = "02.1"
-    NACE_02_10 = "02.10"
-    NACE_02_2 = "02.2"
-    NACE_02_20 = "02.20"
-    NACE_02_3 = "02.3"
-    NACE_02_30 = "02.30"
-    NACE_02_4 = "02.4"
-    NACE_02_40 = "02.40"
-    NACE_03 = "03"
-    NACE_03_1 = "03.1"
-    NACE_03_11 = "03.11"
-    NACE_03_12 = "03.12"
-    NACE_03_2 = "03.2"
-    NACE_03_21 = "03.21"
-    NACE_03_22 = "03.22"
-    NACE_05 = "05"
-    NACE_05_1 = "05.1"
-    NACE_05_10 = "05.10"
-    NACE_05_2 = "05.2"
-    NACE_05_20 = "05.20"
-    NACE_06 = "06"
-    NACE_06_1 = "06.1"
-    NACE_06_10 = "06.10"
-    NACE_06_2 = "06.2"
-    NACE_06_20 = "06.20"
-    NACE_07 = "07"
-    NACE_07_1 = "07.1"
-    NACE_07_10 = "07.10"
-    NACE_07_2 = "07.2"
-    NACE_07_21 = "07.21"
-    NACE_07_29 = "07.29"
-    NACE_08 = "08"
-    NACE_08_1 = "08.1"
-    NACE_08_11 = "08.11"
-    NACE_08_12 = "08.12"
-    NACE_08_9 = "08.9"
-    NACE_08_91 = "08.91"
-    NACE_08_92 = "08.92"
-    NACE_08_93 = "08.93"
-    NACE_08_99 = "08.99"
-    NACE_09 = "09"
-    NACE_09_1 = "09.1"
-    NACE_09_10 = "09.10"
-    NACE_09_9 = "09.9"
-    NACE_09_90 = "09.90"
-    NACE_10 = "10"
-    NACE_10_1 = "10.1"
-    NACE_10_11 = "10.11"
-    NACE_10_12 = "10.12"
-    NACE_10_13 = "10.13"
-    NACE_10_2 = "10.2"
-    NACE_10_20 = "10.20"
-    NACE_10_3 = "10.3"
-    NACE_10_31 = "10.31"
-    NACE_10_32 = "10.32"
-    NACE_10_39 = "10.39"
-    NACE_10_4 = "10.4"
-    NACE_10_41 = "10.41"
-    NACE_10_42 = "10.42"
-    NACE_10_5 = "10.5"
-    NACE_10_51 = "10.51"
-    NACE_10_52 = "10.52"
-    NACE_10_6 = "10.6"
-    NACE_10_61 = "10.61"
-    NACE_10_62 = "10.62"
-    NACE_10_7 = "10.7"
-    NACE_10_71 = "10.71"
-    NACE_10_72 = "10.72"
-    NACE_10_73 = "10.73"
-    NACE_10_8 = "10.8"
-    NACE_10_81 = "10.81"
-    NACE_10_82 = "10.82"
-    NACE_10_83 = "10.83"
-    NACE_10_84 = "10.84"
-    NACE_10_85 = "10.85"
-    NACE_10_86 = "10.86"
-    NACE_10_89 = "10.89"
-    NACE_10_9 = "10.9"
-    NACE_10_91 = "10.91"
-    NACE_10_92 = "10.92"
-    NACE_11 = "11"
-    NACE_11_0 = "11.0"
-    NACE_11_01 = "11.01"
-    NACE_11_02 = "11.02"
-    NACE_11_03 = "11.03"
-    NACE_11_04 = "11.04"
-    NACE_11_05 = "11.05"
-    NACE_11_06 = "11.06"
-    NACE_11_07 = "11.07"
-    NACE_12 = "12"
-    NACE_12_0 = "12.0"
-    NACE_12_00 = "12.00"
-    NACE_13 = "13"
-    NACE_13_1 = "13.1"
-    NACE_13_10 = "13.10"
-    NACE_13_2 = "13.2"
-    NACE_13_20 = "13.20"
-    NACE_13_3 = "13.3"
-    NACE_13_30 = "13.30"
-    NACE_13_9 = "13.9"
-    NACE_13_91 = "13.91"
-    NACE_13_92 = "13.92"
-    NACE_13_93 = "13.93"
-    NACE_13_94 = "13.94"
-    NACE_13_95 = "13.95"
-    NACE_13_96 = "13.96"
-    NACE_13_99 = "13.99"
-    NACE_14 = "14"
-    NACE_14_1 = "14.1"
-    NACE_14_11 = "14.11"
-    NACE_14_12 = "14.12"
-    NACE_14_13 = "14.13"
-    NACE_14_14 = "14.14"
-    NACE_14_19 = "14.19"
-    NACE_14_2 = "14.2"
-    NACE_14_20 = "14.20"
-    NACE_14_3 = "14.3"
-    NACE_14_31 = "14.31"
-    NACE_14_39 = "14.39"
-    NACE_15 = "15"
-    NACE_15_1 = "15.1"
-    NACE_15_11 = "15.11"
-    NACE_15_12 = "15.12"
-    NACE_15_2 = "15.2"
-    NACE_15_20 = "15.20"
-    NACE_16 = "16"
-    NACE_16_1 = "16.1"
-    NACE_16_10 = "16.10"
-    NACE_16_2 = "16.2"
-    NACE_16_21 = "16.21"
-    NACE_16_22 = "16.22"
-    NACE_16_23 = "16.23"
-    NACE_16_24 = "16.24"
-    NACE_16_29 = "16.29"
-    NACE_17 = "17"
-    NACE_17_1 = "17.1"
-    NACE_17_11 = "17.11"
-    NACE_17_12 = "17.12"
-    NACE_17_2 = "17.2"
-    NACE_17_21 = "17.21"
-    NACE_17_22 = "17.22"
-    NACE_17_23 = "17.23"
-    NACE_17_24 = "17.24"
-    NACE_17_29 = "17.29"
-    NACE_18 = "18"
-    NACE_18_1 = "18.1"
-    NACE_18_11 = "18.11"
-    NACE_18_12 = "18.12"
-    NACE_18_13 = "18.13"
-    NACE_18_14 = "18.14"
-    NACE_18_2 = "18.2"
-    NACE_18_20 = "18.20"
-    NACE_19 = "19"
-    NACE_19_1 = "19.1"
-    NACE_19_10 = "19.10"
-    NACE_19_2 = "19.2"
-    NACE_19_20 = "19.20"
-    NACE_20 = "20"
-    NACE_20_1 = "20.1"
-    NACE_20_11 = "20.11"
-    NACE_20_12 = "20.12"
-    NACE_20_13 = "20.13"
-    NACE_20_14 = "20.14"
-    NACE_20_15 = "20.15"
-    NACE_20_16 = "20.16"
-    NACE_20_17 = "20.17"
-    NACE_20_2 = "20.2"
-    NACE_20_20 = "20.20"
-    NACE_20_3 = "20.3"
-    NACE_20_30 = "20.30"
-    NACE_20_4 = "20.4"
-    NACE_20_41 = "20.41"
-    NACE_20_42 = "20.42"
-    NACE_20_5 = "20.5"
-    NACE_20_51 = "20.51"
-    NACE_20_52 = "20.52"
-    NACE_20_53 = "20.53"
-    NACE_20_59 = "20.59"
-    NACE_20_6 = "20.6"
-    NACE_20_60 = "20.60"
-    NACE_21 = "21"
-    NACE_21_1 = "21.1"
-    NACE_21_10 = "21.10"
-    NACE_21_2 = "21.2"
-    NACE_21_20 = "21.20"
-    NACE_22 = "22"
-    NACE_22_1 = "22.1"
-    NACE_22_11 = "22.11"
-    NACE_22_19 = "22.19"
-    NACE_22_2 = "22.2"
-    NACE_22_21 = "22.21"
-    NACE_22_22 = "22.22"
-    NACE_22_23 = "22.23"
-    NACE_22_29 = "22.29"
-    NACE_23 = "23"
-    NACE_23_1 = "23.1"
-    NACE_23_11 = "23.11"
-    NACE_23_12 = "23.12"
-    NACE_23_13 = "23.13"
-    NACE_23_14 = "23.14"
-    NACE_23_19 = "23.19"
-    NACE_23_2 = "23.2"
-    NACE_23_20 = "23.20"
-    NACE_23_3 = "23.3"
-    NACE_23_31 = "23.31"
-    NACE_23_32 = "23.32"
-    NACE_23_4 = "23.4"
-    NACE_23_41 = "23.41"
-    NACE_23_42 = "23.42"
-    NACE_23_43 = "23.43"
-    NACE_23_44 = "23.44"
-    NACE_23_49 = "23.49"
-    NACE_23_5 = "23.5"
-    NACE_23_51 = "23.51"
-    NACE_23_52 = "23.52"
-    NACE_23_6 = "23.6"
-    NACE_23_61 = "23.61"
-    NACE_23_62 = "23.62"
-    NACE_23_63 = "23.63"
-    NACE_23_64 = "23.64"
-    NACE_23_65 = "23.65"
-    NACE_23_69 = "23.69"
-    NACE_23_7 = "23.7"
-    NACE_23_70 = "23.70"
-    NACE_23_9 = "23.9"
-    NACE_23_91 = "23.91"
-    NACE_23_99 = "23.99"
-    NACE_24 = "24"
-    NACE_24_1 = "24.1"
-    NACE_24_10 = "24.10"
-    NACE_24_2 = "24.2"
-    NACE_24_20 = "24.20"
-    NACE_24_3 = "24.3"
-    NACE_24_31 = "24.31"
-    NACE_24_32 = "24.32"
-    NACE_24_33 = "24.33"
-    NACE_24_34 = "24.34"
-    NACE_24_4 = "24.4"
-    NACE_24_41 = "24.41"
-    NACE_24_42 = "24.42"
-    NACE_24_43 = "24.43"
-    NACE_24_44 = "24.44"
-    NACE_24_45 = "24.45"
-    NACE_24_46 = "24.46"
-    NACE_24_5 = "24.5"
-    NACE_24_51 = "24.51"
-    NACE_24_52 = "24.52"
-    NACE_24_53 = "24.53"
-    NACE_24_54 = "24.54"
-    NACE_25 = "25"
-    NACE_25_1 = "25.1"
-    NACE_25_11 = "25.11"
-    NACE_25_12 = "25.12"
-    NACE_25_2 = "25.2"
-    NACE_25_21 = "25.21"
-    NACE_25_29 = "25.29"
-    NACE_25_3 = "25.3"
-    NACE_25_30 = "25.30"
-    NACE_25_4 = "25.4"
-    NACE_25_40 = "25.40"
-    NACE_25_5 = "25.5"
-    NACE_25_50 = "25.50"
-    NACE_25_6 = "25.6"
-    NACE_25_61 = "25.61"
-    NACE_25_62 = "25.62"
-    NACE_25_7 = "25.7"
-    NACE_25_71 = "25.71"
-    NACE_25_72 = "25.72"
-    NACE_25_73 = "25.73"
-    NACE_25_9 = "25.9"
-    NACE_25_91 = "25.91"
-    NACE_25_92 = "25.92"
-    NACE_25_93 = "25.93"
-    NACE_25_94 = "25.94"
-    NACE_25_99 = "25.99"
-    NACE_26 = "26"
-    NACE_26_1 = "26.1"
-    NACE_26_11 = "26.11"
-    NACE_26_12 = "26.12"
-    NACE_26_2 = "26.2"
-    NACE_26_20 = "26.20"
-    NACE_26_3 = "26.3"
-    NACE_26_30 = "26.30"
-    NACE_26_4 = "26.4"
-    NACE_26_40 = "26.40"
-    NACE_26_5 = "26.5"
-    NACE_26_51 = "26.51"
-    NACE_26_52 = "26.52"
-    NACE_26_6 = "26.6"
-    NACE_26_60 = "26.60"
-    NACE_26_7 = "26.7"
-    NACE_26_70 = "26.70"
-    NACE_26_8 = "26.8"
-    NACE_26_80 = "26.80"
-    NACE_27 = "27"
-    NACE_27_1 = "27.1"
-    NACE_27_11 = "27.11"
-    NACE_27_12 = "27.12"
-    NACE_27_2 = "27.2"
-    NACE_27_20 = "27.20"
-    NACE_27_3 = "27.3"
-    NACE_27_31 = "27.31"
-    NACE_27_32 = "27.32"
-    NACE_27_33 = "27.33"
-    NACE_27_4 = "27.4"
-    NACE_27_40 = "27.40"
-    NACE_27_5 = "27.5"
-    NACE_27_51 = "27.51"
-    NACE_27_52 = "27.52"
-    NACE_27_9 = "27.9"
-    NACE_27_90 = "27.90"
-    NACE_28 = "28"
-    NACE_28_1 = "28.1"
-    NACE_28_11 = "28.11"
-    NACE_28_12 = "28.12"
-    NACE_28_13 = "28.13"
-    NACE_28_14 = "28.14"
-    NACE_28_15 = "28.15"
-    NACE_28_2 = "28.2"
-    NACE_28_21 = "28.21"
-    NACE_28_22 = "28.22"
-    NACE_28_23 = "28.23"
-    NACE_28_24 = "28.24"
-    NACE_28_25 = "28.25"
-    NACE_28_29 = "28.29"
-    NACE_28_3 = "28.3"
-    NACE_28_30 = "28.30"
-    NACE_28_4 = "28.4"
-    NACE_28_41 = "28.41"
-    NACE_28_49 = "28.49"
-    NACE_28_9 = "28.9"
-    NACE_28_91 = "28.91"
-    NACE_28_92 = "28.92"
-    NACE_28_93 = "28.93"
-    NACE_28_94 = "28.94"
-    NACE_28_95 = "28.95"
-    NACE_28_96 = "28.96"
-    NACE_28_99 = "28.99"
-    NACE_29 = "29"
-    NACE_29_1 = "29.1"
-    NACE_29_10 = "29.10"
-    NACE_29_2 = "29.2"
-    NACE_29_20 = "29.20"
-    NACE_29_3 = "29.3"
-    NACE_29_31 = "29.31"
-    NACE_29_32 = "29.32"
-    NACE_30 = "30"
-    NACE_30_1 = "30.1"
-    NACE_30_11 = "30.11"
-    NACE_30_12 = "30.12"
-    NACE_30_2 = "30.2"
-    NACE_30_20 = "30.20"
-    NACE_30_3 = "30.3"
-    NACE_30_30 = "30.30"
-    NACE_30_4 = "30.4"
-    NACE_30_40 = "30.40"
-    NACE_30_9 = "30.9"
-    NACE_30_91 = "30.91"
-    NACE_30_92 = "30.92"
-    NACE_30_99 = "30.99"
-    NACE_31 = "31"
-    NACE_31_0 = "31.0"
-    NACE_31_01 = "31.01"
-    NACE_31_02 = "31.02"
-    NACE_31_03 = "31.03"
-    NACE_31_09 = "31.09"
-    NACE_32 = "32"
-    NACE_32_1 = "32.1"
-    NACE_32_11 = "32.11"
-    NACE_32_12 = "32.12"
-    NACE_32_13 = "32.13"
-    NACE_32_2 = "32.2"
-    NACE_32_20 = "32.20"
-    NACE_32_3 = "32.3"
-    NACE_32_30 = "32.30"
-    NACE_32_4 = "32.4"
-    NACE_32_40 = "32.40"
-    NACE_32_5 = "32.5"
-    NACE_32_50 = "32.50"
-    NACE_32_9 = "32.9"
-    NACE_32_91 = "32.91"
-    NACE_32_99 = "32.99"
-    NACE_33 = "33"
-    NACE_33_1 = "33.1"
-    NACE_33_11 = "33.11"
-    NACE_33_12 = "33.12"
-    NACE_33_13 = "33.13"
-    NACE_33_14 = "33.14"
-    NACE_33_15 = "33.15"
-    NACE_33_16 = "33.16"
-    NACE_33_17 = "33.17"
-    NACE_33_19 = "33.19"
-    NACE_33_2 = "33.2"
-    NACE_33_20 = "33.20"
-    NACE_35 = "35"
-    NACE_35_1 = "35.1"
-    NACE_35_11 = "35.11"
-    NACE_35_12 = "35.12"
-    NACE_35_13 = "35.13"
-    NACE_35_14 = "35.14"
-    NACE_35_2 = "35.2"
-    NACE_35_21 = "35.21"
-    NACE_35_22 = "35.22"
-    NACE_35_23 = "35.23"
-    NACE_35_3 = "35.3"
-    NACE_35_30 = "35.30"
-    NACE_36 = "36"
-    NACE_36_0 = "36.0"
-    NACE_36_00 = "36.00"
-    NACE_37 = "37"
-    NACE_37_0 = "37.0"
-    NACE_37_00 = "37.00"
-    NACE_38 = "38"
-    NACE_38_1 = "38.1"
-    NACE_38_11 = "38.11"
-    NACE_38_12 = "38.12"
-    NACE_38_2 = "38.2"
-    NACE_38_21 = "38.21"
-    NACE_38_22 = "38.22"
-    NACE_38_3 = "38.3"
-    NACE_38_31 = "38.31"
-    NACE_38_32 = "38.32"
-    NACE_39 = "39"
-    NACE_39_0 = "39.0"
-    NACE_39_00 = "39.00"
-    NACE_41 = "41"
-    NACE_41_1 = "41.1"
-    NACE_41_10 = "41.10"
-    NACE_41_2 = "41.2"
-    NACE_41_20 = "41.20"
-    NACE_42 = "42"
-    NACE_42_1 = "42.1"
-    NACE_42_11 = "42.11"
-    NACE_42_12 = "42.12"
-    NACE_42_13 = "42.13"
-    NACE_42_2 = "42.2"
-    NACE_42_21 = "42.21"
-    NACE_42_22 = "42.22"
-    NACE_42_9 = "42.9"
-    NACE_42_91 = "42.91"
-    NACE_42_99 = "42.99"
-    NACE_43 = "43"
-    NACE_43_1 = "43.1"
-    NACE_43_11 = "43.11"
-    NACE_43_12 = "43.12"
-    NACE_43_13 = "43.13"
-    NACE_43_2 = "43.2"
-    NACE_43_21 = "43.21"
-    NACE_43_22 = "43.22"
-    NACE_43_29 = "43.29"
-    NACE_43_3 = "43.3"
-    NACE_43_31 = "43.31"
-    NACE_43_32 = "43.32"
-    NACE_43_33 = "43.33"
-    NACE_43_34 = "43.34"
-    NACE_43_39 = "43.39"
-    NACE_43_9 = "43.9"
-    NACE_43_91 = "43.91"
-    NACE_43_99 = "43.99"
-    NACE_45 = "45"
-    NACE_45_1 = "45.1"
-    NACE_45_11 = "45.11"
-    NACE_45_19 = "45.19"
-    NACE_45_2 = "45.2"
-    NACE_45_20 = "45.20"
-    NACE_45_3 = "45.3"
-    NACE_45_31 = "45.31"
-    NACE_45_32 = "45.32"
-    NACE_45_4 = "45.4"
-    NACE_45_40 = "45.40"
-    NACE_46 = "46"
-    NACE_46_1 = "46.1"
-    NACE_46_11 = "46.11"
-    NACE_46_12 = "46.12"
-    NACE_46_13 = "46.13"
-    NACE_46_14 = "46.14"
-    NACE_46_15 = "46.15"
-    NACE_46_16 = "46.16"
-    NACE_46_17 = "46.17"
-    NACE_46_18 = "46.18"
-    NACE_46_19 = "46.19"
-    NACE_46_2 = "46.2"
-    NACE_46_21 = "46.21"
-    NACE_46_22 = "46.22"
-    NACE_46_23 = "46.23"
-    NACE_46_24 = "46.24"
-    NACE_46_3 = "46.3"
-    NACE_46_31 = "46.31"
-    NACE_46_32 = "46.32"
-    NACE_46_33 = "46.33"
-    NACE_46_34 = "46.34"
-    NACE_46_35 = "46.35"
-    NACE_46_36 = "46.36"
-    NACE_46_37 = "46.37"
-    NACE_46_38 = "46.38"
-    NACE_46_39 = "46.39"
-    NACE_46_4 = "46.4"
-    NACE_46_41 = "46.41"
-    NACE_46_42 = "46.42"
-    NACE_46_43 = "46.43"
-    NACE_46_44 = "46.44"
-    NACE_46_45 = "46.45"
-    NACE_46_46 = "46.46"
-    NACE_46_47 = "46.47"
-    NACE_46_48 = "46.48"
-    NACE_46_49 = "46.49"
-    NACE_46_5 = "46.5"
-    NACE_46_51 = "46.51"
-    NACE_46_52 = "46.52"
-    NACE_46_6 = "46.6"
-    NACE_46_61 = "46.61"
-    NACE_46_62 = "46.62"
-    NACE_46_63 = "46.63"
-    NACE_46_64 = "46.64"
-    NACE_46_65 = "46.65"
-    NACE_46_66 = "46.66"
-    NACE_46_69 = "46.69"
-    NACE_46_7 = "46.7"
-    NACE_46_71 = "46.71"
-    NACE_46_72 = "46.72"
-    NACE_46_73 = "46.73"
-    NACE_46_74 = "46.74"
-    NACE_46_75 = "46.75"
-    NACE_46_76 = "46.76"
-    NACE_46_77 = "46.77"
-    NACE_46_9 = "46.9"
-    NACE_46_90 = "46.90"
-    NACE_47 = "47"
-    NACE_47_1 = "47.1"
-    NACE_47_11 = "47.11"
-    NACE_47_19 = "47.19"
-    NACE_47_2 = "47.2"
-    NACE_47_21 = "47.21"
-    NACE_47_22 = "47.22"
-    NACE_47_23 = "47.23"
-    NACE_47_24 = "47.24"
-    NACE_47_25 = "47.25"
-    NACE_47_26 = "47.26"
-    NACE_47_29 = "47.29"
-    NACE_47_3 = "47.3"
-    NACE_47_30 = "47.30"
-    NACE_47_4 = "47.4"
-    NACE_47_41 = "47.41"
-    NACE_47_42 = "47.42"
-    NACE_47_43 = "47.43"
-    NACE_47_5 = "47.5"
-    NACE_47_51 = "47.51"
-    NACE_47_52 = "47.52"
-    NACE_47_53 = "47.53"
-    NACE_47_54 = "47.54"
-    NACE_47_59 = "47.59"
-    NACE_47_6 = "47.6"
-    NACE_47_61 = "47.61"
-    NACE_47_62 = "47.62"
-    NACE_47_63 = "47.63"
-    NACE_47_64 = "47.64"
-    NACE_47_65 = "47.65"
-    NACE_47_7 = "47.7"
-    NACE_47_71 = "47.71"
-    NACE_47_72 = "47.72"
-    NACE_47_73 = "47.73"
-    NACE_47_74 = "47.74"
-    NACE_47_75 = "47.75"
-    NACE_47_76 = "47.76"
-    NACE_47_77 = "47.77"
-    NACE_47_78 = "47.78"
-    NACE_47_79 = "47.79"
-    NACE_47_8 = "47.8"
-    NACE_47_81 = "47.81"
-    NACE_47_82 = "47.82"
-    NACE_47_89 = "47.89"
-    NACE_47_9 = "47.9"
-    NACE_47_91 = "47.91"
-    NACE_47_99 = "47.99"
-    NACE_49 = "49"
-    NACE_49_1 = "49.1"
-    NACE_49_10 = "49.10"
-    NACE_49_2 = "49.2"
-    NACE_49_20 = "49.20"
-    NACE_49_3 = "49.3"
-    NACE_49_31 = "49.31"
-    NACE_49_32 = "49.32"
-    NACE_49_39 = "49.39"
-    NACE_49_4 = "49.4"
-    NACE_49_41 = "49.41"
-    NACE_49_42 = "49.42"
-    NACE_49_5 = "49.5"
-    NACE_49_50 = "49.50"
-    NACE_50 = "50"
-    NACE_50_1 = "50.1"
-    NACE_50_10 = "50.10"
-    NACE_50_2 = "50.2"
-    NACE_50_20 = "50.20"
-    NACE_50_3 = "50.3"
-    NACE_50_30 = "50.30"
-    NACE_50_4 = "50.4"
-    NACE_50_40 = "50.40"
-    NACE_51 = "51"
-    NACE_51_1 = "51.1"
-    NACE_51_10 = "51.10"
-    NACE_51_2 = "51.2"
-    NACE_51_21 = "51.21"
-    NACE_51_22 = "51.22"
-    NACE_52 = "52"
-    NACE_52_1 = "52.1"
-    NACE_52_10 = "52.10"
-    NACE_52_2 = "52.2"
-    NACE_52_21 = "52.21"
-    NACE_52_22 = "52.22"
-    NACE_52_23 = "52.23"
-    NACE_52_24 = "52.24"
-    NACE_52_29 = "52.29"
-    NACE_53 = "53"
-    NACE_53_1 = "53.1"
-    NACE_53_10 = "53.10"
-    NACE_53_2 = "53.2"
-    NACE_53_20 = "53.20"
-    NACE_55 = "55"
-    NACE_55_1 = "55.1"
-    NACE_55_10 = "55.10"
-    NACE_55_2 = "55.2"
-    NACE_55_20 = "55.20"
-    NACE_55_3 = "55.3"
-    NACE_55_30 = "55.30"
-    NACE_55_9 = "55.9"
-    NACE_55_90 = "55.90"
-    NACE_56 = "56"
-    NACE_56_1 = "56.1"
-    NACE_56_10 = "56.10"
-    NACE_56_2 = "56.2"
-    NACE_56_21 = "56.21"
-    NACE_56_29 = "56.29"
-    NACE_56_3 = "56.3"
-    NACE_56_30 = "56.30"
-    NACE_58 = "58"
-    NACE_58_1 = "58.1"
-    NACE_58_11 = "58.11"
-    NACE_58_12 = "58.12"
-    NACE_58_13 = "58.13"
-    NACE_58_14 = "58.14"
-    NACE_58_19 = "58.19"
-    NACE_58_2 = "58.2"
-    NACE_58_21 = "58.21"
-    NACE_58_29 = "58.29"
-    NACE_59 = "59"
-    NACE_59_1 = "59.1"
-    NACE_59_11 = "59.11"
-    NACE_59_12 = "59.12"
-    NACE_59_13 = "59.13"
-    NACE_59_14 = "59.14"
-    NACE_59_2 = "59.2"
-    NACE_59_20 = "59.20"
-    NACE_60 = "60"
-    NACE_60_1 = "60.1"
-    NACE_60_10 = "60.10"
-    NACE_60_2 = "60.2"
-    NACE_60_20 = "60.20"
-    NACE_61 = "61"
-    NACE_61_1 = "61.1"
-    NACE_61_10 = "61.10"
-    NACE_61_2 = "61.2"
-    NACE_61_20 = "61.20"
-    NACE_61_3 = "61.3"
-    NACE_61_30 = "61.30"
-    NACE_61_9 = "61.9"
-    NACE_61_90 = "61.90"
-    NACE_62 = "62"
-    NACE_62_0 = "62.0"
-    NACE_62_01 = "62.01"
-    NACE_62_02 = "62.02"
-    NACE_62_03 = "62.03"
-    NACE_62_09 = "62.09"
-    NACE_63 = "63"
-    NACE_63_1 = "63.1"
-    NACE_63_11 = "63.11"
-    NACE_63_12 = "63.12"
-    NACE_63_9 = "63.9"
-    NACE_63_91 = "63.91"
-    NACE_63_99 = "63.99"
-    NACE_64 = "64"
-    NACE_64_1 = "64.1"
-    NACE_64_11 = "64.11"
-    NACE_64_19 = "64.19"
-    NACE_64_2 = "64.2"
-    NACE_64_20 = "64.20"
-    NACE_64_3 = "64.3"
-    NACE_64_30 = "64.30"
-    NACE_64_9 = "64.9"
-    NACE_64_91 = "64.91"
-    NACE_64_92 = "64.92"
-    NACE_64_99 = "64.99"
-    NACE_65 = "65"
-    NACE_65_1 = "65.1"
-    NACE_65_11 = "65.11"
-    NACE_65_12 = "65.12"
-    NACE_65_2 = "65.2"
-    NACE_65_20 = "65.20"
-    NACE_65_3 = "65.3"
-    NACE_65_30 = "65.30"
-    NACE_66 = "66"
-    NACE_66_1 = "66.1"
-    NACE_66_11 = "66.11"
-    NACE_66_12 = "66.12"
-    NACE_66_19 = "66.19"
-    NACE_66_2 = "66.2"
-    NACE_66_21 = "66.21"
-    NACE_66_22 = "66.22"
-    NACE_66_29 = "66.29"
-    NACE_66_3 = "66.3"
-    NACE_66_30 = "66.30"
-    NACE_68 = "68"
-    NACE_68_1 = "68.1"
-    NACE_68_10 = "68.10"
-    NACE_68_2 = "68.2"
-    NACE_68_20 = "68.20"
-    NACE_68_3 = "68.3"
-    NACE_68_31 = "68.31"
-    NACE_68_32 = "68.32"
-    NACE_69 = "69"
-    NACE_69_1 = "69.1"
-    NACE_69_10 = "69.10"
-    NACE_69_2 = "69.2"
-    NACE_69_20 = "69.20"
-    NACE_70 = "70"
-    NACE_70_1 = "70.1"
-    NACE_70_10 = "70.10"
-    NACE_70_2 = "70.2"
-    NACE_70_21 = "70.21"
-    NACE_70_22 = "70.22"
-    NACE_71 = "71"
-    NACE_71_1 = "71.1"
-    NACE_71_11 = "71.11"
-    NACE_71_12 = "71.12"
-    NACE_71_2 = "71.2"
-    NACE_71_20 = "71.20"
-    NACE_72 = "72"
-    NACE_72_1 = "72.1"
-    NACE_72_11 = "72.11"
-    NACE_72_19 = "72.19"
-    NACE_72_2 = "72.2"
-    NACE_72_20 = "72.20"
-    NACE_73 = "73"
-    NACE_73_1 = "73.1"
-    NACE_73_11 = "73.11"
-    NACE_73_12 = "73.12"
-    NACE_73_2 = "73.2"
-    NACE_73_20 = "73.20"
-    NACE_74 = "74"
-    NACE_74_1 = "74.1"
-    NACE_74_10 = "74.10"
-    NACE_74_2 = "74.2"
-    NACE_74_20 = "74.20"
-    NACE_74_3 = "74.3"
-    NACE_74_30 = "74.30"
-    NACE_74_9 = "74.9"
-    NACE_74_90 = "74.90"
-    NACE_75 = "75"
-    NACE_75_0 = "75.0"
-    NACE_75_00 = "75.00"
-    NACE_77 = "77"
-    NACE_77_1 = "77.1"
-    NACE_77_11 = "77.11"
-    NACE_77_12 = "77.12"
-    NACE_77_2 = "77.2"
-    NACE_77_21 = "77.21"
-    NACE_77_22 = "77.22"
-    NACE_77_29 = "77.29"
-    NACE_77_3 = "77.3"
-    NACE_77_31 = "77.31"
-    NACE_77_32 = "77.32"
-    NACE_77_33 = "77.33"
-    NACE_77_34 = "77.34"
-    NACE_77_35 = "77.35"
-    NACE_77_39 = "77.39"
-    NACE_77_4 = "77.4"
-    NACE_77_40 = "77.40"
-    NACE_78 = "78"
-    NACE_78_1 = "78.1"
-    NACE_78_10 = "78.10"
-    NACE_78_2 = "78.2"
-    NACE_78_20 = "78.20"
-    NACE_78_3 = "78.3"
-    NACE_78_30 = "78.30"
-    NACE_79 = "79"
-    NACE_79_1 = "79.1"
-    NACE_79_11 = "79.11"
-    NACE_79_12 = "79.12"
-    NACE_79_9 = "79.9"
-    NACE_79_90 = "79.90"
-    NACE_80 = "80"
-    NACE_80_1 = "80.1"
-    NACE_80_10 = "80.10"
-    NACE_80_2 = "80.2"
-    NACE_80_20 = "80.20"
-    NACE_80_3 = "80.3"
-    NACE_80_30 = "80.30"
-    NACE_81 = "81"
-    NACE_81_1 = "81.1"
-    NACE_81_10 = "81.10"
-    NACE_81_2 = "81.2"
-    NACE_81_21 = "81.21"
-    NACE_81_22 = "81.22"
-    NACE_81_29 = "81.29"
-    NACE_81_3 = "81.3"
-    NACE_81_30 = "81.30"
-    NACE_82 = "82"
-    NACE_82_1 = "82.1"
-    NACE_82_11 = "82.11"
-    NACE_82_19 = "82.19"
-    NACE_82_2 = "82.2"
-    NACE_82_20 = "82.20"
-    NACE_82_3 = "82.3"
-    NACE_82_30 = "82.30"
-    NACE_82_9 = "82.9"
-    NACE_82_91 = "82.91"
-    NACE_82_92 = "82.92"
-    NACE_82_99 = "82.99"
-    NACE_84 = "84"
-    NACE_84_1 = "84.1"
-    NACE_84_11 = "84.11"
-    NACE_84_12 = "84.12"
-    NACE_84_13 = "84.13"
-    NACE_84_2 = "84.2"
-    NACE_84_21 = "84.21"
-    NACE_84_22 = "84.22"
-    NACE_84_23 = "84.23"
-    NACE_84_24 = "84.24"
-    NACE_84_25 = "84.25"
-    NACE_84_3 = "84.3"
-    NACE_84_30 = "84.30"
-    NACE_85 = "85"
-    NACE_85_1 = "85.1"
-    NACE_85_10 = "85.10"
-    NACE_85_2 = "85.2"
-    NACE_85_20 = "85.20"
-    NACE_85_3 = "85.3"
-    NACE_85_31 = "85.31"
-    NACE_85_32 = "85.32"
-    NACE_85_4 = "85.4"
-    NACE_85_41 = "85.41"
-    NACE_85_42 = "85.42"
-    NACE_85_5 = "85.5"
-    NACE_85_51 = "85.51"
-    NACE_85_52 = "85.52"
-    NACE_85_53 = "85.53"
-    NACE_85_59 = "85.59"
-    NACE_85_6 = "85.6"
-    NACE_85_60 = "85.60"
-    NACE_86 = "86"
-    NACE_86_1 = "86.1"
-    NACE_86_10 = "86.10"
-    NACE_86_2 = "86.2"
-    NACE_86_21 = "86.21"
-    NACE_86_22 = "86.22"
-    NACE_86_23 = "86.23"
-    NACE_86_9 = "86.9"
-    NACE_86_90 = "86.90"
-    NACE_87 = "87"
-    NACE_87_1 = "87.1"
-    NACE_87_10 = "87.10"
-    NACE_87_2 = "87.2"
-    NACE_87_20 = "87.20"
-    NACE_87_3 = "87.3"
-    NACE_87_30 = "87.30"
-    NACE_87_9 = "87.9"
-    NACE_87_90 = "87.90"
-    NACE_88 = "88"
-    NACE_88_1 = "88.1"
-    NACE_88_10 = "88.10"
-    NACE_88_9 = "88.9"
-    NACE_88_91 = "88.91"
-    NACE_88_99 = "88.99"
-    NACE_90 = "90"
-    NACE_90_0 = "90.0"
-    NACE_90_01 = "90.01"
-    NACE_90_02 = "90.02"
-    NACE_90_03 = "90.03"
-    NACE_90_04 = "90.04"
-    NACE_91 = "91"
-    NACE_91_0 = "91.0"
-    NACE_91_01 = "91.01"
-    NACE_91_02 = "91.02"
-    NACE_91_03 = "91.03"
-    NACE_91_04 = "91.04"
-    NACE_92 = "92"
-    NACE_92_0 = "92.0"
-    NACE_92_00 = "92.00"
-    NACE_93 = "93"
-    NACE_93_1 = "93.1"
-    NACE_93_11 = "93.11"
-    NACE_93_12 = "93.12"
-    NACE_93_13 = "93.13"
-    NACE_93_19 = "93.19"
-    NACE_93_2 = "93.2"
-    NACE_93_21 = "93.21"
-    NACE_93_29 = "93.29"
-    NACE_94 = "94"
-    NACE_94_1 = "94.1"
-    NACE_94_11 = "94.11"
-    NACE_94_12 = "94.12"
-    NACE_94_2 = "94.2"
-    NACE_94_20 = "94.20"
-    NACE_94_9 = "94.9"
-    NACE_94_91 = "94.91"
-    NACE_94_92 = "94.92"
-    NACE_94_99 = "94.99"
-    NACE_95 = "95"
-    NACE_95_1 = "95.1"
-    NACE_95_11 = "95.11"
-    NACE_95_12 = "95.12"
-    NACE_95_2 = "95.2"
-    NACE_95_21 = "95.21"
-    NACE_95_22 = "95.22"
-    NACE_95_23 = "95.23"
-    NACE_95_24 = "95.24"
-    NACE_95_25 = "95.25"
-    NACE_95_29 = "95.29"
-    NACE_96 = "96"
-    NACE_96_0 = "96.0"
-    NACE_96_01 = "96.01"
-    NACE_96_02 = "96.02"
-    NACE_96_03 = "96.03"
-    NACE_96_04 = "96.04"
-    NACE_96_09 = "96.09"
-    NACE_97 = "97"
-    NACE_97_0 = "97.0"
-    NACE_97_00 = "97.00"
-    NACE_98 = "98"
-    NACE_98_1 = "98.1"
-    NACE_98_10 = "98.10"
-    NACE_98_2 = "98.2"
-    NACE_98_20 = "98.20"
-    NACE_99 = "99"
-    NACE_99_0 = "99.0"
-    NACE_99_00 = "99.00"
-
-
-class EducationLevel(str, Enum):
-    ISCED_LEVEL_0 = "0"
-    ISCED_LEVEL_1 = "1"
-    ISCED_LEVEL_2 = "2"
-    ISCED_LEVEL_3 = "3"
-    ISCED_LEVEL_4 = "4"
-    ISCED_LEVEL_5 = "5"
-    ISCED_LEVEL_6 = "6"
-    ISCED_LEVEL_7 = "7"
-    ISCED_LEVEL_8 = "8"
-    ISCED_LEVEL_9 = "9"
-
-
-class EducationField(str, Enum):
-    ISCED_FIELD_00 = "00"
-    ISCED_FIELD_001 = "001"
-    ISCED_FIELD_0011 = "0011"
-    ISCED_FIELD_01 = "01"
-    ISCED_FIELD_011 = "011"
-    ISCED_FIELD_0110 = "0110"
-    ISCED_FIELD_0111 = "0111"
-    ISCED_FIELD_0112 = "0112"
-    ISCED_FIELD_0113 = "0113"
-    ISCED_FIELD_0114 = "0114"
-    ISCED_FIELD_0118 = "0118"
-    ISCED_FIELD_02 = "02"
-    ISCED_FIELD_020 = "020"
-    ISCED_FIELD_0200 = "0200"
-    ISCED_FIELD_021 = "021"
-    ISCED_FIELD_0210 = "0210"
-    ISCED_FIELD_0211 = "0211"
-    ISCED_FIELD_0212 = "0212"
-    ISCED_FIELD_0213 = "0213"
-    ISCED_FIELD_0214 = "0214"
-    ISCED_FIELD_0215 = "0215"
-    ISCED_FIELD_0218 = "0218"
-    ISCED_FIELD_022 = "022"
-    ISCED_FIELD_0220 = "0220"
-    ISCED_FIELD_0221 = "0221"
-    ISCED_FIELD_0222 = "0222"
-    ISCED_FIELD_0223 = "0223"
-    ISCED_FIELD_023 = "023"
-    ISCED_FIELD_0231 = "0231"
-    ISCED_FIELD_0232 = "0232"
-    ISCED_FIELD_03 = "03"
-    ISCED_FIELD_031 = "031"
-    ISCED_FIELD_0310 = "0310"
-    ISCED_FIELD_0311 = "0311"
-    ISCED_FIELD_0312 = "0312"
-    ISCED_FIELD_0313 = "0313"
-    ISCED_FIELD_0314 = "0314"
-    ISCED_FIELD_0318 = "0318"
-    ISCED_FIELD_032 = "032"
-    ISCED_FIELD_0321 = "0321"
-    ISCED_FIELD_0322 = "0322"
-    ISCED_FIELD_04 = "04"
-    ISCED_FIELD_041 = "041"
-    ISCED_FIELD_0410 = "0410"
-    ISCED_FIELD_0411 = "0411"
-    ISCED_FIELD_0412 = "0412"
-    ISCED_FIELD_0413 = "0413"
-    ISCED_FIELD_0414 = "0414"
-    ISCED_FIELD_0415 = "0415"
-    ISCED_FIELD_0416 = "0416"
-    ISCED_FIELD_0418 = "0418"
-    ISCED_FIELD_042 = "042"
-    ISCED_FIELD_0421 = "0421"
-    ISCED_FIELD_05 = "05"
-    ISCED_FIELD_050 = "050"
-    ISCED_FIELD_0500 = "0500"
-    ISCED_FIELD_051 = "051"
-    ISCED_FIELD_0511 = "0511"
-    ISCED_FIELD_0512 = "0512"
-    ISCED_FIELD_052 = "052"
-    ISCED_FIELD_0521 = "0521"
-    ISCED_FIELD_0522 = "0522"
-    ISCED_FIELD_0528 = "0528"
-    ISCED_FIELD_053 = "053"
-    ISCED_FIELD_0531 = "0531"
-    ISCED_FIELD_0532 = "0532"
-    ISCED_FIELD_0533 = "0533"
-    ISCED_FIELD_054 = "054"
-    ISCED_FIELD_0541 = "0541"
-    ISCED_FIELD_0542 = "0542"
-    ISCED_FIELD_06 = "06"
-    ISCED_FIELD_061 = "061"
-    ISCED_FIELD_0618 = "0618"
-    ISCED_FIELD_07 = "07"
-    ISCED_FIELD_071 = "071"
-    ISCED_FIELD_0710 = "0710"
-    ISCED_FIELD_0711 = "0711"
-    ISCED_FIELD_0712 = "0712"
-    ISCED_FIELD_0713 = "0713"
-    ISCED_FIELD_0714 = "0714"
-    ISCED_FIELD_0715 = "0715"
-    ISCED_FIELD_0716 = "0716"
-    ISCED_FIELD_0718 = "0718"
-    ISCED_FIELD_072 = "072"
-    ISCED_FIELD_0721 = "0721"
-    ISCED_FIELD_0722 = "0722"
-    ISCED_FIELD_0723 = "0723"
-    ISCED_FIELD_0724 = "0724"
-    ISCED_FIELD_0728 = "0728"
-    ISCED_FIELD_073 = "073"
-    ISCED_FIELD_0731 = "0731"
-    ISCED_FIELD_0732 = "0732"
-    ISCED_FIELD_08 = "08"
-    ISCED_FIELD_080 = "080"
-    ISCED_FIELD_0800 = "0800"
-    ISCED_FIELD_081 = "081"
-    ISCED_FIELD_0811 = "0811"
-    ISCED_FIELD_0812 = "0812"
-    ISCED_FIELD_0818 = "0818"
-    ISCED_FIELD_082 = "082"
-    ISCED_FIELD_0820 = "0820"
-    ISCED_FIELD_0821 = "0821"
-    ISCED_FIELD_0828 = "0828"
-    ISCED_FIELD_083 = "083"
-    ISCED_FIELD_0831 = "0831"
-    ISCED_FIELD_084 = "084"
-    ISCED_FIELD_0841 = "0841"
-    ISCED_FIELD_09 = "09"
-    ISCED_FIELD_090 = "090"
-    ISCED_FIELD_0900 = "0900"
-    ISCED_FIELD_091 = "091"
-    ISCED_FIELD_0911 = "0911"
-    ISCED_FIELD_0912 = "0912"
-    ISCED_FIELD_0913 = "0913"
-    ISCED_FIELD_0914 = "0914"
-    ISCED_FIELD_0915 = "0915"
-    ISCED_FIELD_0916 = "0916"
-    ISCED_FIELD_0918 = "0918"
-    ISCED_FIELD_092 = "092"
-    ISCED_FIELD_0920 = "0920"
-    ISCED_FIELD_0921 = "0921"
-    ISCED_FIELD_0922 = "0922"
-    ISCED_FIELD_0923 = "0923"
-    ISCED_FIELD_0928 = "0928"
-    ISCED_FIELD_10 = "10"
-    ISCED_FIELD_100 = "100"
-    ISCED_FIELD_1000 = "1000"
-    ISCED_FIELD_101 = "101"
-    ISCED_FIELD_1010 = "1010"
-    ISCED_FIELD_1011 = "1011"
-    ISCED_FIELD_1012 = "1012"
-    ISCED_FIELD_1013 = "1013"
-    ISCED_FIELD_1014 = "1014"
-    ISCED_FIELD_1015 = "1015"
-    ISCED_FIELD_1018 = "1018"
-    ISCED_FIELD_103 = "103"
-    ISCED_FIELD_1030 = "1030"
-    ISCED_FIELD_1031 = "1031"
-    ISCED_FIELD_1032 = "1032"
-    ISCED_FIELD_104 = "104"
-    ISCED_FIELD_1041 = "1041"
-    ISCED_FIELD_1048 = "1048"
-    ISCED_FIELD_99 = "99"
-    ISCED_FIELD_999 = "999"
-    ISCED_FIELD_9999 = "9999"
-
-
 class CERFLevel(str, Enum):
     NATIVE = "native"
     A1 = "A1"
@@ -4182,634 +42,6 @@ class EmploymentType(str, Enum):
     SUMMER_JOB = "summerJob"
 
 
-class WorkingTime(str, Enum):
-    DAY_SHIFT = "01"
-    EVENING_SHIFT = "02"
-    NIGHT_SHIFT = "03"
-    WORK_IN_EPISODES = "04"
-    FLEXIBLE_HOURS = "05"
-    NORMAL_DAYS = "06"
-    WEEKEND_HOURS = "07"
-    WORK_IN_SHIFTS = "08"
-
-
-class ISO_639_1(str, Enum):
-    AA = "aa"
-    AB = "ab"
-    AE = "ae"
-    AF = "af"
-    AK = "ak"
-    AM = "am"
-    AN = "an"
-    AR = "ar"
-    AS = "as"
-    AV = "av"
-    AY = "ay"
-    AZ = "az"
-    BA = "ba"
-    BE = "be"
-    BG = "bg"
-    BI = "bi"
-    BM = "bm"
-    BN = "bn"
-    BO = "bo"
-    BR = "br"
-    BS = "bs"
-    CA = "ca"
-    CE = "ce"
-    CH = "ch"
-    CO = "co"
-    CR = "cr"
-    CS = "cs"
-    CU = "cu"
-    CV = "cv"
-    CY = "cy"
-    DA = "da"
-    DE = "de"
-    DV = "dv"
-    DZ = "dz"
-    EE = "ee"
-    EL = "el"
-    EN = "en"
-    EO = "eo"
-    ES = "es"
-    ET = "et"
-    EU = "eu"
-    FA = "fa"
-    FF = "ff"
-    FI = "fi"
-    FJ = "fj"
-    FO = "fo"
-    FR = "fr"
-    FY = "fy"
-    GA = "ga"
-    GD = "gd"
-    GL = "gl"
-    GN = "gn"
-    GU = "gu"
-    GV = "gv"
-    HA = "ha"
-    HE = "he"
-    HI = "hi"
-    HO = "ho"
-    HR = "hr"
-    HT = "ht"
-    HU = "hu"
-    HY = "hy"
-    HZ = "hz"
-    IA = "ia"
-    ID = "id"
-    IE = "ie"
-    IG = "ig"
-    II = "ii"
-    IK = "ik"
-    IO = "io"
-    IS = "is"
-    IT = "it"
-    IU = "iu"
-    JA = "ja"
-    JV = "jv"
-    KA = "ka"
-    KG = "kg"
-    KI = "ki"
-    KJ = "kj"
-    KK = "kk"
-    KL = "kl"
-    KM = "km"
-    KN = "kn"
-    KO = "ko"
-    KR = "kr"
-    KS = "ks"
-    KU = "ku"
-    KV = "kv"
-    KW = "kw"
-    KY = "ky"
-    LA = "la"
-    LB = "lb"
-    LG = "lg"
-    LI = "li"
-    LN = "ln"
-    LO = "lo"
-    LT = "lt"
-    LU = "lu"
-    LV = "lv"
-    MG = "mg"
-    MH = "mh"
-    MI = "mi"
-    MK = "mk"
-    ML = "ml"
-    MN = "mn"
-    MR = "mr"
-    MS = "ms"
-    MT = "mt"
-    MY = "my"
-    NA = "na"
-    NB = "nb"
-    ND = "nd"
-    NE = "ne"
-    NG = "ng"
-    NL = "nl"
-    NN = "nn"
-    NO = "no"
-    NR = "nr"
-    NV = "nv"
-    NY = "ny"
-    OC = "oc"
-    OJ = "oj"
-    OM = "om"
-    OR = "or"
-    OS = "os"
-    PA = "pa"
-    PI = "pi"
-    PL = "pl"
-    PS = "ps"
-    PT = "pt"
-    QU = "qu"
-    RM = "rm"
-    RN = "rn"
-    RO = "ro"
-    RU = "ru"
-    RW = "rw"
-    SA = "sa"
-    SC = "sc"
-    SD = "sd"
-    SE = "se"
-    SG = "sg"
-    SI = "si"
-    SK = "sk"
-    SL = "sl"
-    SM = "sm"
-    SN = "sn"
-    SO = "so"
-    SQ = "sq"
-    SR = "sr"
-    SS = "ss"
-    ST = "st"
-    SU = "su"
-    SV = "sv"
-    SW = "sw"
-    TA = "ta"
-    TE = "te"
-    TG = "tg"
-    TH = "th"
-    TI = "ti"
-    TK = "tk"
-    TL = "tl"
-    TN = "tn"
-    TO = "to"
-    TR = "tr"
-    TS = "ts"
-    TT = "tt"
-    TW = "tw"
-    TY = "ty"
-    UG = "ug"
-    UK = "uk"
-    UR = "ur"
-    UZ = "uz"
-    VE = "ve"
-    VI = "vi"
-    VO = "vo"
-    WA = "wa"
-    WO = "wo"
-    XH = "xh"
-    YI = "yi"
-    YO = "yo"
-    ZA = "za"
-    ZH = "zh"
-
-
-class ISO_3166_2_FI(str, Enum):
-    FI_01 = "FI-01"
-    FI_02 = "FI-02"
-    FI_03 = "FI-03"
-    FI_04 = "FI-04"
-    FI_05 = "FI-05"
-    FI_06 = "FI-06"
-    FI_07 = "FI-07"
-    FI_08 = "FI-08"
-    FI_09 = "FI-09"
-    FI_10 = "FI-10"
-    FI_11 = "FI-11"
-    FI_12 = "FI-12"
-    FI_13 = "FI-13"
-    FI_14 = "FI-14"
-    FI_15 = "FI-15"
-    FI_16 = "FI-16"
-    FI_17 = "FI-17"
-    FI_18 = "FI-18"
-    FI_19 = "FI-19"
-
-
-class FinnishMunicipality(str, Enum):
-    AKAA = "020"
-    ALAJARVI = "005"
-    ALAVIESKA = "009"
-    ALAVUS = "010"
-    ASIKKALA = "016"
-    ASKOLA = "018"
-    AURA = "019"
-    BRANDO = "035"
-    ECKERO = "043"
-    ENONKOSKI = "046"
-    ENONTEKIO = "047"
-    ESPOO = "049"
-    EURA = "050"
-    EURAJOKI = "051"
-    EVIJARVI = "052"
-    FINSTROM = "060"
-    FORSSA = "061"
-    FOGLO = "062"
-    GETA = "065"
-    HAAPAJARVI = "069"
-    HAAPAVESI = "071"
-    HAILUOTO = "072"
-    HALSUA = "074"
-    HAMINA = "075"
-    HAMMARLAND = "076"
-    HANKASALMI = "077"
-    HANKO = "078"
-    HARJAVALTA = "079"
-    HARTOLA = "081"
-    HATTULA = "082"
-    HAUSJARVI = "086"
-    HEINOLA = "111"
-    HEINAVESI = "090"
-    HELSINKI = "091"
-    HIRVENSALMI = "097"
-    HOLLOLA = "098"
-    HUITTINEN = "102"
-    HUMPPILA = "103"
-    HYRYNSALMI = "105"
-    HYVINKAA = "106"
-    HAMEENKYRO = "108"
-    HAMEENLINNA = "109"
-    II = "139"
-    IISALMI = "140"
-    IITTI = "142"
-    IKAALINEN = "143"
-    ILMAJOKI = "145"
-    ILOMANTSI = "146"
-    IMATRA = "153"
-    INARI = "148"
-    INKOO = "149"
-    ISOJOKI = "151"
-    ISOKYRO = "152"
-    JANAKKALA = "165"
-    JOENSUU = "167"
-    JOKIOINEN = "169"
-    JOMALA = "170"
-    JOROINEN = "171"
-    JOUTSA = "172"
-    JUUKA = "176"
-    JUUPAJOKI = "177"
-    JUVA = "178"
-    JYVASKYLA = "179"
-    JAMIJARVI = "181"
-    JAMSA = "182"
-    JARVENPAA = "186"
-    KAARINA = "202"
-    KAAVI = "204"
-    KAJAANI = "205"
-    KALAJOKI = "208"
-    KANGASALA = "211"
-    KANGASNIEMI = "213"
-    KANKAANPAA = "214"
-    KANNONKOSKI = "216"
-    KANNUS = "217"
-    KARIJOKI = "218"
-    KARKKILA = "224"
-    KARSTULA = "226"
-    KARVIA = "230"
-    KASKINEN = "231"
-    KAUHAJOKI = "232"
-    KAUHAVA = "233"
-    KAUNIAINEN = "235"
-    KAUSTINEN = "236"
-    KEITELE = "239"
-    KEMI = "240"
-    KEMIJARVI = "320"
-    KEMINMAA = "241"
-    KEMIONSAARI = "322"
-    KEMPELE = "244"
-    KERAVA = "245"
-    KEURUU = "249"
-    KIHNIO = "250"
-    KINNULA = "256"
-    KIRKKONUMMI = "257"
-    KITEE = "260"
-    KITTILA = "261"
-    KIURUVESI = "263"
-    KIVIJARVI = "265"
-    KOKEMAKI = "271"
-    KOKKOLA = "272"
-    KOLARI = "273"
-    KONNEVESI = "275"
-    KONTIOLAHTI = "276"
-    KORSNAS = "280"
-    KOSKI_TL = "284"
-    KOTKA = "285"
-    KOUVOLA = "286"
-    KRISTIINANKAUPUNKI = "287"
-    KRUUNUPYY = "288"
-    KUHMO = "290"
-    KUHMOINEN = "291"
-    KUMLINGE = "295"
-    KUOPIO = "297"
-    KUORTANE = "300"
-    KURIKKA = "301"
-    KUSTAVI = "304"
-    KUUSAMO = "305"
-    KYYJARVI = "312"
-    KARKOLA = "316"
-    KARSAMAKI = "317"
-    KOKAR = "318"
-    LAHTI = "398"
-    LAIHIA = "399"
-    LAITILA = "400"
-    LAPINJARVI = "407"
-    LAPINLAHTI = "402"
-    LAPPAJARVI = "403"
-    LAPPEENRANTA = "405"
-    LAPUA = "408"
-    LAUKAA = "410"
-    LEMI = "416"
-    LEMLAND = "417"
-    LEMPAALA = "418"
-    LEPPAVIRTA = "420"
-    LESTIJARVI = "421"
-    LIEKSA = "422"
-    LIETO = "423"
-    LIMINKA = "425"
-    LIPERI = "426"
-    LOHJA = "444"
-    LOIMAA = "430"
-    LOPPI = "433"
-    LOVIISA = "434"
-    LUHANKA = "435"
-    LUMIJOKI = "436"
-    LUMPARLAND = "438"
-    LUOTO = "440"
-    LUUMAKI = "441"
-    MAALAHTI = "475"
-    MAARIANHAMINA = "478"
-    MARTTILA = "480"
-    MASKU = "481"
-    MERIJARVI = "483"
-    MERIKARVIA = "484"
-    MIEHIKKALA = "489"
-    MIKKELI = "491"
-    MUHOS = "494"
-    MULTIA = "495"
-    MUONIO = "498"
-    MUSTASAARI = "499"
-    MUURAME = "500"
-    MYNAMAKI = "503"
-    MYRSKYLA = "504"
-    MANTSALA = "505"
-    MANTTA_VILPPULA = "508"
-    MANTYHARJU = "507"
-    NAANTALI = "529"
-    NAKKILA = "531"
-    NIVALA = "535"
-    NOKIA = "536"
-    NOUSIAINEN = "538"
-    NURMES = "541"
-    NURMIJARVI = "543"
-    NARPIO = "545"
-    ORIMATTILA = "560"
-    ORIPAA = "561"
-    ORIVESI = "562"
-    OULAINEN = "563"
-    OULU = "564"
-    OUTOKUMPU = "309"
-    PADASJOKI = "576"
-    PAIMIO = "577"
-    PALTAMO = "578"
-    PARAINEN = "445"
-    PARIKKALA = "580"
-    PARKANO = "581"
-    PEDERSOREN_KUNTA = "599"
-    PELKOSENNIEMI = "583"
-    PELLO = "854"
-    PERHO = "584"
-    PERTUNMAA = "588"
-    PETAJAVESI = "592"
-    PIEKSAMAKI = "593"
-    PIELAVESI = "595"
-    PIETARSAARI = "598"
-    PIHTIPUDAS = "601"
-    PIRKKALA = "604"
-    POLVIJARVI = "607"
-    POMARKKU = "608"
-    PORI = "609"
-    PORNAINEN = "611"
-    PORVOO = "638"
-    POSIO = "614"
-    PUDASJARVI = "615"
-    PUKKILA = "616"
-    PUNKALAIDUN = "619"
-    PUOLANKA = "620"
-    PUUMALA = "623"
-    PYHTAA = "624"
-    PYHAJOKI = "625"
-    PYHAJARVI = "626"
-    PYHANTA = "630"
-    PYHARANTA = "631"
-    PALKANE = "635"
-    POYTYA = "636"
-    RAAHE = "678"
-    RAASEPORI = "710"
-    RAISIO = "680"
-    RANTASALMI = "681"
-    RANUA = "683"
-    RAUMA = "684"
-    RAUTALAMPI = "686"
-    RAUTAVAARA = "687"
-    RAUTJARVI = "689"
-    REISJARVI = "691"
-    RIIHIMAKI = "694"
-    RISTIJARVI = "697"
-    ROVANIEMI = "698"
-    RUOKOLAHTI = "700"
-    RUOVESI = "702"
-    RUSKO = "704"
-    RAAKKYLA = "707"
-    SAARIJARVI = "729"
-    SALLA = "732"
-    SALO = "734"
-    SALTVIK = "736"
-    SASTAMALA = "790"
-    SAUVO = "738"
-    SAVITAIPALE = "739"
-    SAVONLINNA = "740"
-    SAVUKOSKI = "742"
-    SEINAJOKI = "743"
-    SIEVI = "746"
-    SIIKAINEN = "747"
-    SIIKAJOKI = "748"
-    SIIKALATVA = "791"
-    SIILINJARVI = "749"
-    SIMO = "751"
-    SIPOO = "753"
-    SIUNTIO = "755"
-    SODANKYLA = "758"
-    SOINI = "759"
-    SOMERO = "761"
-    SONKAJARVI = "762"
-    SOTKAMO = "765"
-    SOTTUNGA = "766"
-    SULKAVA = "768"
-    SUND = "771"
-    SUOMUSSALMI = "777"
-    SUONENJOKI = "778"
-    SYSMA = "781"
-    SAKYLA = "783"
-    TAIPALSAARI = "831"
-    TAIVALKOSKI = "832"
-    TAIVASSALO = "833"
-    TAMMELA = "834"
-    TAMPERE = "837"
-    TERVO = "844"
-    TERVOLA = "845"
-    TEUVA = "846"
-    TOHMAJARVI = "848"
-    TOHOLAMPI = "849"
-    TOIVAKKA = "850"
-    TORNIO = "851"
-    TURKU = "853"
-    TUUSNIEMI = "857"
-    TUUSULA = "858"
-    TYRNAVA = "859"
-    ULVILA = "886"
-    URJALA = "887"
-    UTAJARVI = "889"
-    UTSJOKI = "890"
-    UURAINEN = "892"
-    UUSIKAARLEPYY = "893"
-    UUSIKAUPUNKI = "895"
-    VAALA = "785"
-    VAASA = "905"
-    VALKEAKOSKI = "908"
-    VANTAA = "092"
-    VARKAUS = "915"
-    VEHMAA = "918"
-    VESANTO = "921"
-    VESILAHTI = "922"
-    VETELI = "924"
-    VIEREMA = "925"
-    VIHTI = "927"
-    VIITASAARI = "931"
-    VIMPELI = "934"
-    VIROLAHTI = "935"
-    VIRRAT = "936"
-    VARDO = "941"
-    VOYRI = "946"
-    YLITORNIO = "976"
-    YLIVIESKA = "977"
-    YLOJARVI = "980"
-    YPAJA = "981"
-    AHTARI = "989"
-    AANEKOSKI = "992"
-
-
-class Permit(str, Enum):
-    PERMIT_001 = "001"
-    PERMIT_002 = "002"
-    PERMIT_003 = "003"
-    PERMIT_004 = "004"
-    PERMIT_005 = "005"
-    PERMIT_006 = "006"
-    PERMIT_007 = "007"
-    PERMIT_008 = "008"
-    PERMIT_009 = "009"
-    PERMIT_010 = "010"
-    PERMIT_011 = "011"
-    PERMIT_012 = "012"
-    PERMIT_013 = "013"
-    PERMIT_014 = "014"
-    PERMIT_015 = "015"
-    PERMIT_016 = "016"
-    PERMIT_017 = "017"
-    PERMIT_018 = "018"
-    PERMIT_019 = "019"
-    PERMIT_020 = "020"
-    PERMIT_021 = "021"
-    PERMIT_022 = "022"
-    PERMIT_023 = "023"
-    PERMIT_024 = "024"
-    PERMIT_025 = "025"
-    PERMIT_026 = "026"
-    PERMIT_027 = "027"
-    PERMIT_028 = "028"
-    PERMIT_029 = "029"
-    PERMIT_030 = "030"
-    PERMIT_031 = "031"
-    PERMIT_032 = "032"
-    PERMIT_033 = "033"
-    PERMIT_034 = "034"
-    PERMIT_035 = "035"
-    PERMIT_036 = "036"
-    PERMIT_037 = "037"
-    PERMIT_038 = "038"
-    PERMIT_039 = "039"
-    PERMIT_040 = "040"
-    PERMIT_041 = "041"
-    PERMIT_042 = "042"
-    PERMIT_043 = "043"
-    PERMIT_044 = "044"
-    PERMIT_045 = "045"
-    PERMIT_046 = "046"
-    PERMIT_047 = "047"
-    PERMIT_048 = "048"
-    PERMIT_049 = "049"
-    PERMIT_050 = "050"
-    PERMIT_051 = "051"
-    PERMIT_052 = "052"
-    PERMIT_053 = "053"
-    PERMIT_054 = "054"
-    PERMIT_055 = "055"
-    PERMIT_056 = "056"
-    PERMIT_057 = "057"
-    PERMIT_058 = "058"
-    PERMIT_059 = "059"
-    PERMIT_060 = "060"
-    PERMIT_061 = "061"
-    PERMIT_062 = "062"
-    PERMIT_063 = "063"
-    PERMIT_064 = "064"
-    PERMIT_065 = "065"
-    PERMIT_066 = "066"
-    PERMIT_067 = "067"
-    PERMIT_068 = "068"
-    PERMIT_069 = "069"
-    PERMIT_070 = "070"
-    PERMIT_071 = "071"
-    PERMIT_072 = "072"
-    PERMIT_073 = "073"
-    PERMIT_074 = "074"
-    PERMIT_075 = "075"
-    PERMIT_076 = "076"
-    PERMIT_077 = "077"
-    PERMIT_078 = "078"
-    PERMIT_079 = "079"
-    PERMIT_080 = "080"
-    PERMIT_081 = "081"
-    PERMIT_082 = "082"
-    PERMIT_083 = "083"
-    PERMIT_084 = "084"
-    PERMIT_085 = "085"
-    PERMIT_086 = "086"
-    PERMIT_087 = "087"
-    PERMIT_088 = "088"
-    PERMIT_089 = "089"
-    PERMIT_090 = "090"
-    PERMIT_091 = "091"
-    PERMIT_092 = "092"
-    PERMIT_093 = "093"
-    PERMIT_094 = "094"
-    PERMIT_095 = "095"
-
-
 class Occupation(CamelCaseModel):
     esco_identifier: Optional[HttpUrl] = Field(
         None,
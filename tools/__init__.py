@@ -0,0 +1,5 @@
+"""
+Helper tooling for converting and validating the data product definitions kept in
+this repository. Run the commands from the repository root, e.g.
+``python -m tools.convert src DataProducts``.
+"""
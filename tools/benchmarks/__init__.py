@@ -0,0 +1,4 @@
+"""
+Benchmarks of the definitions and the tooling, run from the repository root, e.g.
+``python -m tools.benchmarks.imports src``.
+"""
@@ -0,0 +1,265 @@
+"""
+Benchmark of converting and validating the definitions, with a history of results.
+
+The scenarios are run over the real sources and specs of the repository. Conversion
+always uses a temporary manifest and validation a temporary cache, so the results
+don't depend on the state of the local caches. Every run is appended as a line of
+JSON to the results file, keyed by the git commit and the versions of the tooling,
+and any two runs can be compared afterwards.
+"""
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from definition_tooling.log import print_error, print_table
+from typer import Argument, Exit, Option, Typer
+
+from tools.convert import convert_data_product_definitions
+from tools.manifest import Manifest, package_versions, tooling_version
+from tools.sources import definition_name, find_definitions
+from tools.validate import validate_specs
+
+cli = Typer()
+
+RESULTS_PATH = Path("tools/benchmarks/results.jsonl")
+
+
+def git_commit() -> str:
+    """
+    Get the current commit, with a "-dirty" suffix if there are uncommitted changes
+    """
+    commit = subprocess.run(
+        ["git", "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return f"{commit}-dirty" if status.strip() else commit
+
+
+def _timed(func: Callable[[], object]) -> float:
+    # The commands print a line per definition, which is not part of the benchmark
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+
+def run_scenarios(src: Path, dest: Path, jobs: int) -> Dict[str, float]:
+    """
+    Run every scenario once and time it
+
+    :param src: Path to python sources of definitions
+    :param dest: Path to definitions output
+    :param jobs: Number of worker processes for the full conversion and validation
+    :return: Seconds taken by each scenario
+    """
+    # The biggest definition is the one converted incrementally
+    sources = find_definitions(src)
+    biggest = definition_name(max(sources, key=lambda p: p.stat().st_size), src)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest_path = Path(tmp) / "manifest.json"
+        cache_path = Path(tmp) / "validation.json"
+
+        def convert(**kwargs) -> None:
+            convert_data_product_definitions(
+                src, dest, manifest_path=manifest_path, **kwargs
+            )
+
+        def convert_one() -> None:
+            manifest = Manifest.load(manifest_path)
+            manifest.remove(biggest)
+            manifest.save()
+            convert()
+
+        def validate() -> None:
+            validate_specs(dest, jobs=jobs, cache_path=cache_path)
+
+        return {
+            "full_conversion": _timed(lambda: convert(force=True, jobs=jobs)),
+            "noop_conversion": _timed(convert),
+            "incremental_conversion": _timed(convert_one),
+            "full_validation": _timed(validate),
+            "cached_validation": _timed(validate),
+        }
+
+
+def run_benchmark(src: Path, dest: Path, jobs: int, repeat: int) -> dict:
+    """
+    Run the scenarios the given number of times and describe the environment
+
+    :return: The record of the run, with the median time of each scenario
+    """
+    runs = [run_scenarios(src, dest, jobs) for _ in range(repeat)]
+    return {
+        "commit": git_commit(),
+        "tooling": ";".join(
+            [tooling_version(), *package_versions(["openapi-to-fastapi"])]
+        ),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "definitions": len(find_definitions(src)),
+        "jobs": jobs,
+        "repeat": repeat,
+        "results": {
+            scenario: round(statistics.median(run[scenario] for run in runs), 4)
+            for scenario in runs[0]
+        },
+    }
+
+
+def load_results(path: Path) -> List[dict]:
+    if not path.exists():
+        return []
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def append_result(path: Path, record: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def find_result(results: List[dict], ref: str) -> Optional[dict]:
+    """
+    Find the latest result of a commit by a prefix of its hash, or by index in the
+    results prefixed with @, e.g. @-1 for the latest one
+    """
+    if ref.startswith("@"):
+        try:
+            return results[int(ref[1:])]
+        except (ValueError, IndexError):
+            return None
+    matching = [r for r in results if r["commit"].startswith(ref)]
+    return matching[-1] if matching else None
+
+
+def print_comparison(base: dict, head: dict, threshold: float) -> bool:
+    """
+    Print the speedup of each scenario between the two results
+
+    :return: True if any scenario got slower by more than the threshold
+    """
+    rows = []
+    regressed = False
+    for scenario, head_seconds in head["results"].items():
+        base_seconds = base["results"].get(scenario)
+        if base_seconds is None:
+            rows.append([scenario, "-", f"{head_seconds:.3f}", "-", "new"])
+            continue
+        speedup = base_seconds / head_seconds if head_seconds else float("inf")
+        if head_seconds > base_seconds * (1 + threshold):
+            status = "[red]regression[/red]"
+            regressed = True
+        elif base_seconds > head_seconds * (1 + threshold):
+            status = "[green]faster[/green]"
+        else:
+            status = "same"
+        rows.append(
+            [
+                scenario,
+                f"{base_seconds:.3f}",
+                f"{head_seconds:.3f}",
+                f"{speedup:.2f}x",
+                status,
+            ]
+        )
+
+    print(f"Base: {base['commit'][:12]} ({base['date']}), {base['tooling']}")
+    print(f"Head: {head['commit'][:12]} ({head['date']}), {head['tooling']}")
+    if base["machine"] != head["machine"]:
+        print_error("The results were measured on different machines")
+    print_table(["Scenario", "Base (s)", "Head (s)", "Speedup", ""], rows)
+    return regressed
+
+
+@cli.command()
+def run(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions output",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        min=0,
+        help="Number of worker processes for full conversion and validation",
+    ),
+    repeat: int = Option(
+        1, "--repeat", min=1, help="Number of runs, the median time is recorded"
+    ),
+    results: Path = Option(
+        RESULTS_PATH, "--results", help="File to append the results to"
+    ),
+):
+    """
+    Run the benchmark and append the results to the results file
+    """
+    record = run_benchmark(src, dest, jobs, repeat)
+    append_result(results, record)
+    print_table(
+        ["Scenario", "Seconds"],
+        [[scenario, f"{s:.3f}"] for scenario, s in record["results"].items()],
+    )
+    print(f"Results of {record['commit'][:12]} appended to {results}")
+
+
+@cli.command()
+def compare(
+    base: str = Argument(
+        "@-2", help="Commit hash prefix, or @index of the base result"
+    ),
+    head: str = Argument("@-1", help="Commit hash prefix, or @index of the new result"),
+    threshold: float = Option(
+        0.1, "--threshold", min=0, help="Relative change considered significant"
+    ),
+    results: Path = Option(
+        RESULTS_PATH, "--results", help="File the results were appended to"
+    ),
+):
+    """
+    Compare two results, by default the two latest ones
+    """
+    history = load_results(results)
+    base_result = find_result(history, base)
+    head_result = find_result(history, head)
+    if base_result is None or head_result is None:
+        missing = base if base_result is None else head
+        print_error(f"No results found for {missing} in {results}")
+        raise Exit(code=2)
+
+    if print_comparison(base_result, head_result, threshold):
+        raise Exit(code=1)
+
+
+if __name__ == "__main__":
+    cli()
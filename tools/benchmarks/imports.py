@@ -0,0 +1,168 @@
+"""
+Benchmark of importing each definition module on its own.
+
+Every module is imported in a fresh interpreter in which only the shared dependencies
+(pydantic, FastAPI and the definition tooling) were imported beforehand, so the
+numbers are what each definition adds to the startup of a process that serves it.
+"""
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Optional
+
+from definition_tooling.log import print_error, print_success, print_table
+from typer import Argument, Exit, Option, Typer
+
+from tools.sources import definition_name, find_definitions
+
+cli = Typer()
+
+# Run in the fresh interpreter, prints the measurement as JSON
+WORKER = (
+    "import json, sys\n"
+    "from tools.benchmarks.imports import measure_import\n"
+    "trace = sys.argv[3] == 'trace'\n"
+    "print(json.dumps(measure_import(sys.argv[1], sys.argv[2], trace)))\n"
+)
+
+
+def measure_import(path: str, src: str, trace: bool = False) -> dict:
+    """
+    Import the definition module and measure the time it takes, or the peak of the
+    memory allocated while doing so. Meant to be run in a fresh interpreter.
+
+    Tracing with tracemalloc slows the import down considerably, so the time and the
+    memory are measured in separate interpreters. Both measure the first import, as
+    a second one would reuse the shared code lists already imported by the first.
+    """
+    # The shared dependencies are not counted
+    import definition_tooling.converter  # noqa: F401
+
+    from tools.convert import load_definition_module
+
+    if trace:
+        tracemalloc.start()
+        load_definition_module(Path(path), Path(src))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"peak_bytes": peak}
+
+    start = time.perf_counter()
+    load_definition_module(Path(path), Path(src))
+    return {"seconds": time.perf_counter() - start}
+
+
+def _run_worker(path: Path, src: Path, mode: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, str(path), str(src), mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def benchmark_import(path: Path, src: Path, repeat: int) -> dict:
+    """
+    Measure the import of a definition in fresh interpreters, keeping the fastest of
+    the repeated runs. The memory is traced once, it's the same on every run.
+    """
+    runs = [_run_worker(path, src, "time") for _ in range(repeat)]
+    return {
+        "seconds": min(run["seconds"] for run in runs),
+        "peak_bytes": _run_worker(path, src, "trace")["peak_bytes"],
+    }
+
+
+def benchmark_imports(
+    src: Path,
+    time_budget: float,
+    memory_budget: float,
+    repeat: int = 1,
+    pattern: Optional[str] = None,
+) -> List[dict]:
+    """
+    Benchmark importing every definition module in the sources
+
+    :param src: Path to python sources of definitions
+    :param time_budget: Maximum import time of a module in milliseconds
+    :param memory_budget: Maximum peak allocation of a module in megabytes
+    :param repeat: Number of fresh interpreters to measure each module in
+    :param pattern: Only benchmark the definitions whose names match the glob pattern
+    :return: The results sorted by the import time, slowest first
+    """
+    results = []
+    for p in find_definitions(src):
+        name = definition_name(p, src)
+        if pattern and not Path(name).match(pattern):
+            continue
+        measured = benchmark_import(p, src, repeat)
+        milliseconds = measured["seconds"] * 1000
+        megabytes = measured["peak_bytes"] / 1024 / 1024
+        results.append(
+            {
+                "name": name,
+                "milliseconds": round(milliseconds, 1),
+                "megabytes": round(megabytes, 2),
+                "over_budget": milliseconds > time_budget or megabytes > memory_budget,
+            }
+        )
+    return sorted(results, key=lambda r: r["milliseconds"], reverse=True)
+
+
+@cli.command()
+def imports(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    time_budget: float = Option(
+        150, "--time-budget", min=0, help="Maximum import time of a module in ms"
+    ),
+    memory_budget: float = Option(
+        10, "--memory-budget", min=0, help="Maximum peak allocation of a module in MB"
+    ),
+    repeat: int = Option(
+        1, "--repeat", min=1, help="Number of runs per module, the fastest one counts"
+    ),
+    pattern: Optional[str] = Option(
+        None, "--only", help='Glob of definition names, e.g. "Person/*"'
+    ),
+    output: Optional[Path] = Option(
+        None, "--output", "-o", help="Write the results in JSON format to a file"
+    ),
+):
+    results = benchmark_imports(src, time_budget, memory_budget, repeat, pattern)
+    print_table(
+        ["Module", "Import (ms)", "Peak (MB)", "Budget"],
+        [
+            [
+                r["name"],
+                r["milliseconds"],
+                r["megabytes"],
+                "[red]EXCEEDED[/red]" if r["over_budget"] else "OK",
+            ]
+            for r in results
+        ],
+    )
+    if output:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    over_budget = [r["name"] for r in results if r["over_budget"]]
+    if over_budget:
+        print_error(
+            f"{len(over_budget)} modules exceed the budget of {time_budget} ms and "
+            f"{memory_budget} MB"
+        )
+        raise Exit(code=1)
+    print_success(f"All {len(results)} modules are within the budget")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,288 @@
+"""
+Benchmark of the memory used by the whole catalog of definitions in one process.
+
+All the definitions are imported one after another into the same interpreter and kept
+alive, like in a process serving every data product. When openapi-to-fastapi is
+installed, the models it generates from each spec in DataProducts are loaded as well.
+The memory retained by each definition and by each enum class or code type of the
+shared code lists is measured with tracemalloc, and the ones with identical values are
+grouped to show how much memory the copies of the same code lists take.
+"""
+import enum
+import functools
+import gc
+import hashlib
+import json
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional
+
+from definition_tooling.log import print_table
+from rich import print
+from typer import Argument, Option, Typer
+
+from tools.convert import import_codelists_base, load_definition_module
+from tools.sources import definition_name, find_definitions, output_path
+
+try:
+    from openapi_to_fastapi.routes import SpecRouter
+except ImportError:  # pragma: no cover
+    SpecRouter = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    resource = None
+
+cli = Typer()
+
+
+def _retained(collect: bool = False) -> int:
+    """
+    Get the size of the memory currently allocated, optionally after collecting the
+    garbage left behind by the previous steps
+    """
+    if collect:
+        gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _fingerprint(values: List[Any]) -> str:
+    return hashlib.sha256(json.dumps(values, default=str).encode()).hexdigest()
+
+
+@contextmanager
+def trace_enums(
+    enums: List[dict],
+    owner: Dict[str, str],
+    codelists_base: Optional[ModuleType] = None,
+) -> Iterator[None]:
+    """
+    Record the memory retained by every enum class, and every code type of the shared
+    code lists, created in the block
+
+    :param enums: List to add the records of the created enums and code types to
+    :param owner: The definition and the kind of module currently loaded, added to
+    the records
+    :param codelists_base: The module whose code_type() creates the code types
+    """
+
+    def record(cls: type, values: List[Any], size: int) -> None:
+        enums.append(
+            {
+                **owner,
+                "name": cls.__name__,
+                "members": len(values),
+                "fingerprint": _fingerprint(values),
+                "bytes": size,
+            }
+        )
+
+    original = enum.EnumMeta.__dict__["__new__"]
+    func = original.__func__
+
+    @functools.wraps(func)
+    def traced(*args, **kwargs):
+        before = _retained()
+        enum_class = func(*args, **kwargs)
+        size = _retained() - before
+        record(enum_class, [member.value for member in enum_class], size)
+        return enum_class
+
+    # The code types are not enums, and the frozenset of their codes is built before
+    # the class, so the function creating them is traced instead of their metaclass
+    code_type = codelists_base.code_type if codelists_base else None
+
+    @functools.wraps(code_type)
+    def traced_code_type(*args, **kwargs):
+        before = _retained()
+        created = code_type(*args, **kwargs)
+        size = _retained() - before
+        # Iterating a code enum would build its members, the codes are enough
+        record(created, list(created.code_list), size)
+        return created
+
+    enum.EnumMeta.__new__ = staticmethod(traced)
+    if codelists_base:
+        codelists_base.code_type = traced_code_type
+    try:
+        yield
+    finally:
+        enum.EnumMeta.__new__ = original
+        if codelists_base:
+            codelists_base.code_type = code_type
+
+
+def group_enums(enums: List[dict]) -> List[dict]:
+    """
+    Group the enums and code types with identical values, the biggest groups first
+
+    :return: For each group the names and definitions of the copies, and the number
+    of bytes taken by all of them and by the copies beyond the first one
+    """
+    groups = defaultdict(list)
+    for e in enums:
+        groups[e["fingerprint"]].append(e)
+
+    result = []
+    for copies in groups.values():
+        total = sum(c["bytes"] for c in copies)
+        result.append(
+            {
+                "names": sorted({c["name"] for c in copies}),
+                "members": copies[0]["members"],
+                "copies": [
+                    {
+                        "definition": c["definition"],
+                        "kind": c["kind"],
+                        "name": c["name"],
+                    }
+                    for c in copies
+                ],
+                "bytes": total,
+                "duplicated_bytes": total - copies[0]["bytes"],
+            }
+        )
+    return sorted(result, key=lambda g: g["bytes"], reverse=True)
+
+
+def measure_catalog(src: Path, dest: Path, generated: bool = True) -> dict:
+    """
+    Load all the definitions into this process and measure the memory they retain
+
+    :param src: Path to python sources of definitions
+    :param dest: Path to the definitions in JSON format
+    :param generated: Also load the models generated from the specs
+    :return: The report with the memory per definition and per group of enums and
+    code types
+    """
+    generated = generated and SpecRouter is not None
+    # Everything is kept alive until the end, like in a server
+    loaded: List[Any] = []
+    definitions = {}
+    enums: List[dict] = []
+    owner: Dict[str, str] = {}
+
+    # The garbage is only collected between the steps, so freeing the leftovers of
+    # one step doesn't show up as negative memory use in another one
+    gc.disable()
+    tracemalloc.start()
+    try:
+        with trace_enums(enums, owner, import_codelists_base(src)):
+            for p in find_definitions(src):
+                name = definition_name(p, src)
+                owner.update(definition=name, kind="definition")
+                before = _retained(collect=True)
+                loaded.append(load_definition_module(p, src))
+                module_bytes = _retained(collect=True) - before
+
+                generated_bytes = 0
+                spec_path = output_path(p, src, dest)
+                if generated and spec_path.exists():
+                    owner.update(kind="generated")
+                    before = _retained(collect=True)
+                    loaded.append(SpecRouter(spec_path))
+                    generated_bytes = _retained(collect=True) - before
+
+                definitions[name] = {
+                    "module_bytes": module_bytes,
+                    "generated_bytes": generated_bytes,
+                    "bytes": module_bytes + generated_bytes,
+                }
+        total = _retained(collect=True)
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    groups = group_enums(enums)
+    report = {
+        "total_bytes": total,
+        "enum_bytes": sum(g["bytes"] for g in groups),
+        "duplicated_enum_bytes": sum(g["duplicated_bytes"] for g in groups),
+        "definitions": definitions,
+        "enums": groups,
+    }
+    if resource is not None:
+        # Kilobytes on Linux
+        report["max_rss_bytes"] = (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        )
+    return report
+
+
+def _mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.2f}"
+
+
+def print_report(report: dict, limit: int) -> None:
+    definitions = sorted(
+        report["definitions"].items(), key=lambda item: item[1]["bytes"], reverse=True
+    )
+    print_table(
+        ["Definition", "Module (MB)", "Generated (MB)", "Total (MB)"],
+        [
+            [name, _mb(d["module_bytes"]), _mb(d["generated_bytes"]), _mb(d["bytes"])]
+            for name, d in definitions[:limit]
+        ],
+    )
+    print_table(
+        ["Enum or code type", "Members", "Copies", "Total (MB)", "Duplicated (MB)"],
+        [
+            [
+                ", ".join(g["names"]),
+                g["members"],
+                len(g["copies"]),
+                _mb(g["bytes"]),
+                _mb(g["duplicated_bytes"]),
+            ]
+            for g in report["enums"][:limit]
+        ],
+    )
+
+    print(f"Retained by the catalog: {_mb(report['total_bytes'])} MB")
+    print(
+        f"Retained by enums and code types: {_mb(report['enum_bytes'])} MB, of which "
+        f"{_mb(report['duplicated_enum_bytes'])} MB by duplicate copies"
+    )
+    if "max_rss_bytes" in report:
+        print(f"Peak resident memory of the process: {_mb(report['max_rss_bytes'])} MB")
+
+
+@cli.command()
+def memory(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions in JSON format",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    generated: bool = Option(
+        True,
+        "--generated/--no-generated",
+        help="Also load the models openapi-to-fastapi generates from the specs",
+    ),
+    limit: int = Option(20, "--limit", min=1, help="Number of rows to print"),
+    output: Optional[Path] = Option(
+        None, "--output", "-o", help="Write the report in JSON format to a file"
+    ),
+):
+    report = measure_catalog(src, dest, generated)
+    print_report(report, limit)
+    if output:
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    cli()
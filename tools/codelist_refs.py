@@ -0,0 +1,295 @@
+"""
+Specs with the big code lists as references to separately published code lists.
+
+Most of the size of some specs is the enums of the big code lists, e.g. ``EscoCode``
+in Employment/EscoOccupations_v1.0. Externalizing a folder of specs replaces every
+enum with more values than the threshold with a pattern the values match and an
+``x-codelist`` reference to the code list, e.g.::
+
+    "EscoCode": {
+      "type": "string",
+      "pattern": "^(?:\\d{4}|\\d{4}\\.\\d{1,2}|...)$",
+      "title": "EscoCode",
+      "x-codelist": {"name": "EscoCode", "sha256": "...", "count": 3007}
+    }
+
+The code lists are written to ``_codelists`` next to the externalized specs, named by
+their hash, and to the local code list cache in ``.definitions-cache/codelists``. The
+pattern only checks the shape of the values, the exact list is found by its hash in
+the cache when the specs are resolved back to self-contained ones, e.g. to validate
+them, which gives the original specs byte for byte.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from definition_tooling.log import print_error
+from rich import print
+from typer import Argument, Exit, Option, Typer
+
+from tools.components import check_split_dest
+from tools.jsonformat import dumps, json_size, write_json
+from tools.manifest import CACHE_DIR
+
+cli = Typer()
+
+CODELIST_CACHE_PATH = CACHE_DIR / "codelists"
+CODELISTS_DIR = "_codelists"
+X_CODELIST = "x-codelist"
+DEFAULT_THRESHOLD = 100
+
+_TOKEN = re.compile(r"\d+|[A-Z]+|[a-z]+|.", re.DOTALL)
+_CLASSES = {"digits": r"\d", "upper": "[A-Z]", "lower": "[a-z]"}
+
+
+class CodeListNotFound(Exception):
+    pass
+
+
+def _shape(code: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Describe a code as runs of digits, upper and lower case letters, and the other
+    characters as they are, e.g. "2654.1" is 4 digits, ".", and 1 digit
+    """
+    shape = []
+    for token in _TOKEN.findall(code):
+        if token.isdigit():
+            shape.append(("digits", len(token)))
+        elif token.isascii() and token.isupper():
+            shape.append(("upper", len(token)))
+        elif token.isascii() and token.islower():
+            shape.append(("lower", len(token)))
+        else:
+            shape.append((re.escape(token), 1))
+    return tuple(shape)
+
+
+def code_pattern(codes: Iterable[str]) -> str:
+    """
+    Make a regular expression matching all the codes, by the shapes of the codes.
+    The codes with the same kinds of runs are combined with the range of the lengths
+    of each run, e.g. "\\d{4}\\.\\d{1,2}" for "2654.1" and "2654.10".
+    """
+    ranges: Dict[Tuple[str, ...], List[List[int]]] = {}
+    for shape in map(_shape, codes):
+        kinds = tuple(kind for kind, _ in shape)
+        lengths = ranges.setdefault(kinds, [[n, n] for _, n in shape])
+        for length, (_, n) in zip(lengths, shape):
+            length[0] = min(length[0], n)
+            length[1] = max(length[1], n)
+
+    alternatives = []
+    for kinds, lengths in ranges.items():
+        parts = []
+        for kind, (low, high) in zip(kinds, lengths):
+            if kind not in _CLASSES:
+                parts.append(kind)
+            elif low == high:
+                parts.append(
+                    f"{_CLASSES[kind]}{{{low}}}" if low > 1 else _CLASSES[kind]
+                )
+            else:
+                parts.append(f"{_CLASSES[kind]}{{{low},{high}}}")
+        alternatives.append("".join(parts))
+    if len(alternatives) == 1:
+        return f"^{alternatives[0]}$"
+    return f"^(?:{'|'.join(alternatives)})$"
+
+
+def _codelist_hash(codes: List[str]) -> str:
+    return hashlib.sha256(json.dumps(codes).encode()).hexdigest()
+
+
+def _codelist_path(path: Path, digest: str) -> Path:
+    return path / f"{digest}.json"
+
+
+def _write_codelist(path: Path, digest: str, name: str, codes: List[str]) -> None:
+    out_file = _codelist_path(path, digest)
+    if not out_file.exists():
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        out_file.write_text(dumps({"name": name, "codes": codes}), encoding="utf-8")
+
+
+def externalize_spec(spec: dict, threshold: int, codelists: Dict[str, dict]) -> dict:
+    """
+    Replace the enums of the component schemas with more values than the threshold
+    with patterns and references to the code lists
+
+    :param spec: The self-contained spec
+    :param threshold: The largest number of values kept in an enum
+    :param codelists: Dict to add the replaced code lists to, by their hashes
+    :return: The externalized spec
+    """
+    schemas = spec.get("components", {}).get("schemas", {})
+    externalized = {}
+    for name, schema in schemas.items():
+        enum = schema.get("enum")
+        if (
+            not isinstance(enum, list)
+            or len(enum) <= threshold
+            or "pattern" in schema
+            or not all(isinstance(value, str) for value in enum)
+        ):
+            externalized[name] = schema
+            continue
+        digest = _codelist_hash(enum)
+        codelists[digest] = {"name": name, "codes": enum}
+        replaced = {}
+        for key, value in schema.items():
+            if key == "enum":
+                replaced["pattern"] = code_pattern(enum)
+            else:
+                replaced[key] = value
+        replaced[X_CODELIST] = {"name": name, "sha256": digest, "count": len(enum)}
+        externalized[name] = replaced
+
+    if not schemas:
+        return spec
+    result = dict(spec)
+    result["components"] = dict(spec["components"], schemas=externalized)
+    return result
+
+
+def resolve_spec(spec: dict, cache_path: Path = CODELIST_CACHE_PATH) -> dict:
+    """
+    Replace the references to code lists with the enums of the code lists from the
+    local cache
+
+    :raises CodeListNotFound: If a code list is not in the cache
+    """
+    schemas = spec.get("components", {}).get("schemas", {})
+    if not any(X_CODELIST in schema for schema in schemas.values()):
+        return spec
+
+    resolved = {}
+    for name, schema in schemas.items():
+        if X_CODELIST not in schema:
+            resolved[name] = schema
+            continue
+        reference = schema[X_CODELIST]
+        codelist_file = _codelist_path(cache_path, reference["sha256"])
+        if not codelist_file.exists():
+            raise CodeListNotFound(
+                f"Code list {reference['name']} ({reference['sha256']}) is not in "
+                f"{cache_path}"
+            )
+        codes = json.loads(codelist_file.read_text(encoding="utf-8"))["codes"]
+        restored = {}
+        for key, value in schema.items():
+            if key == "pattern":
+                restored["enum"] = codes
+            elif key != X_CODELIST:
+                restored[key] = value
+        resolved[name] = restored
+    result = dict(spec)
+    result["components"] = dict(spec["components"], schemas=resolved)
+    return result
+
+
+def externalize_catalog(
+    src: Path,
+    dest: Path,
+    threshold: int = DEFAULT_THRESHOLD,
+    cache_path: Path = CODELIST_CACHE_PATH,
+) -> List[Path]:
+    """
+    Write the specs with the big code lists externalized, and the code lists
+
+    :param src: Path to the self-contained specs
+    :param dest: Path to write the externalized specs and code lists to
+    :param threshold: The largest number of values kept in an enum
+    :param cache_path: Path to the local code list cache
+    :return: The specs that were written, the unchanged ones are left untouched
+    """
+    check_split_dest(src, dest)
+    codelists: Dict[str, dict] = {}
+    written = []
+    for spec_path in sorted(src.glob("**/*.json")):
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        out_file = dest / spec_path.relative_to(src)
+        if write_json(out_file, externalize_spec(spec, threshold, codelists)):
+            written.append(out_file)
+    for digest, codelist in codelists.items():
+        for path in (dest / CODELISTS_DIR, cache_path):
+            _write_codelist(path, digest, codelist["name"], codelist["codes"])
+    return written
+
+
+def resolve_catalog(
+    src: Path, dest: Path, cache_path: Path = CODELIST_CACHE_PATH
+) -> List[Path]:
+    """
+    Write the self-contained specs from the externalized ones
+
+    :return: The specs that were written, the unchanged ones are left untouched
+    """
+    written = []
+    for spec_path in sorted(src.glob("**/*.json")):
+        if CODELISTS_DIR in spec_path.relative_to(src).parts:
+            continue
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        out_file = dest / spec_path.relative_to(src)
+        if write_json(out_file, resolve_spec(spec, cache_path)):
+            written.append(out_file)
+    return written
+
+
+@cli.command()
+def externalize(
+    src: Path = Argument(
+        ...,
+        help="Path to the self-contained specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to write the externalized specs to"),
+    threshold: int = Option(
+        DEFAULT_THRESHOLD,
+        "--threshold",
+        min=0,
+        help="Largest number of values kept in an enum",
+    ),
+):
+    """
+    Replace the big enums of the specs with references to the code lists
+    """
+    try:
+        written = externalize_catalog(src, dest, threshold)
+    except ValueError as e:
+        print_error(str(e))
+        raise Exit(code=2)
+    print(f"Wrote {len(written)} specs to {dest}")
+    print(
+        f"Size of the specs: {json_size(src, [CODELISTS_DIR])} bytes, "
+        f"externalized: {json_size(dest, [CODELISTS_DIR])} bytes"
+    )
+
+
+@cli.command()
+def resolve(
+    src: Path = Argument(
+        ...,
+        help="Path to the externalized specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to write the self-contained specs to"),
+):
+    """
+    Resolve the references to code lists through the local code list cache
+    """
+    try:
+        written = resolve_catalog(src, dest)
+    except CodeListNotFound as e:
+        print_error(str(e))
+        raise Exit(code=1)
+    print(f"Wrote {len(written)} specs to {dest}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,339 @@
+"""
+Generate the shared code list modules in src/codelists from the snapshots of the code
+schemes checked in to src/codelists/snapshots.
+
+A snapshot is a CSV file with a header, or a JSON file with a list of objects, with a
+"code" column and optionally a "name" column giving the name of the enum member. Other
+columns can be generated as a table of labels by code, e.g. the names of the
+municipalities in Finnish and Swedish. The codes are deduplicated, and sorted unless
+the order published in the specs differs from the sorted one. Each generated module is
+only written when its contents change.
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from rich import print
+from typer import Exit, Option, Typer
+
+cli = Typer()
+
+CODELISTS_PATH = Path("src/codelists")
+SNAPSHOTS_PATH = CODELISTS_PATH / "snapshots"
+LINE_LENGTH = 88
+INDENT = "    "
+
+HEADER = (
+    "# Generated by `python -m tools.codelists` from the snapshots in\n"
+    "# src/codelists/snapshots, edit the snapshots instead of this file.\n"
+)
+
+
+@dataclass
+class CodeListSpec:
+    """
+    A code list generated from a snapshot
+    """
+
+    constant: str
+    snapshot: str
+    prefix: str = ""
+    # Keep the order of the snapshot, for the lists published in the specs unsorted
+    keep_order: bool = False
+    # Tables of the labels of the codes to generate, the names of the constants and
+    # the columns the labels are taken from
+    labels: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+
+@dataclass
+class ModuleSpec:
+    """
+    A generated code list module and the types it provides
+    """
+
+    module: str
+    docstring: str
+    code_lists: List[CodeListSpec]
+    enums: Dict[str, str] = field(default_factory=dict)
+    code_types: Dict[str, str] = field(default_factory=dict)
+    comment: Optional[str] = None
+
+
+MODULES = [
+    ModuleSpec(
+        "esco",
+        "ESCO occupations, https://esco.ec.europa.eu/en/classification/occupation_main",
+        [CodeListSpec("ESCO_OCCUPATIONS", "esco.csv", "ESCO_", keep_order=True)],
+        code_types={"EscoCode": "ESCO_OCCUPATIONS"},
+    ),
+    ModuleSpec(
+        "isced",
+        "ISCED education levels and fields of education\n\n"
+        "https://koodistot.suomi.fi/codescheme;registryCode=dataecon;schemeCode=educationlevel\n"
+        "https://koodistot.suomi.fi/codescheme;registryCode=jhs;schemeCode=isced_ala_1_20110101",
+        [
+            CodeListSpec("EDUCATION_LEVELS", "educationlevel.csv", "ISCED_LEVEL_"),
+            CodeListSpec("EDUCATION_FIELDS", "isced_ala.csv", "ISCED_FIELD_"),
+        ],
+        enums={
+            "EducationLevel": "EDUCATION_LEVELS",
+            "EducationField": "EDUCATION_FIELDS",
+        },
+    ),
+    ModuleSpec(
+        "iso3166",
+        "ISO 3166 country and subdivision codes",
+        [
+            CodeListSpec("COUNTRY_CODES_ALPHA_2", "iso3166_1_alpha_2.csv"),
+            CodeListSpec(
+                "COUNTRY_CODES_ALPHA_3",
+                "iso3166_1_alpha_3.csv",
+                keep_order=True,
+                labels={"ALPHA_3_TO_ALPHA_2": ("alpha_2",)},
+            ),
+            CodeListSpec("FINNISH_REGIONS", "iso3166_2_fi.csv"),
+        ],
+        enums={
+            "ISO_3166_1_Alpha_2": "COUNTRY_CODES_ALPHA_2",
+            "ISO_3166_1_Alpha_3": "COUNTRY_CODES_ALPHA_3",
+            "ISO_3166_2_FI": "FINNISH_REGIONS",
+        },
+    ),
+    ModuleSpec(
+        "iso639",
+        "ISO 639-1 language codes",
+        [CodeListSpec("LANGUAGE_CODES", "iso639_1.csv")],
+        enums={"ISO_639_1": "LANGUAGE_CODES"},
+    ),
+    ModuleSpec(
+        "legal_forms",
+        "Legal forms of entities",
+        [
+            CodeListSpec(
+                "ENTITY_LEGAL_FORMS", "iso20275.csv", "ISO_20275_", keep_order=True
+            ),
+            CodeListSpec(
+                "NORDIC_LEGAL_FORMS", "nordic_legal_forms.csv", keep_order=True
+            ),
+        ],
+        enums={
+            "EntityLegalForm": "ENTITY_LEGAL_FORMS",
+            "NordicLegalForm": "NORDIC_LEGAL_FORMS",
+        },
+    ),
+    ModuleSpec(
+        "municipalities",
+        "Finnish municipalities, with their names in Finnish and Swedish and their "
+        "regions",
+        [
+            CodeListSpec(
+                "FINNISH_MUNICIPALITIES",
+                "municipalities.csv",
+                keep_order=True,
+                labels={
+                    "FINNISH_MUNICIPALITY_NAMES": ("name_fi", "name_sv"),
+                    "FINNISH_MUNICIPALITY_REGIONS": ("region",),
+                },
+            )
+        ],
+        code_types={"FinnishMunicipality": "FINNISH_MUNICIPALITIES"},
+    ),
+    ModuleSpec(
+        "nace",
+        "NACE Rev. 2 statistical classification of economic activities",
+        [CodeListSpec("NACE_ACTIVITIES", "nace.csv", "NACE_")],
+        enums={"IndustrySector": "NACE_ACTIVITIES", "Activity": "NACE_ACTIVITIES"},
+        code_types={"NaceCode": "NACE_ACTIVITIES"},
+        comment=(
+            "The same classification is used under different names in some of the "
+            "definitions"
+        ),
+    ),
+    ModuleSpec(
+        "permits",
+        "Permits\n\n"
+        "https://koodistot.suomi.fi/codescheme;registryCode=dataecon;schemeCode=permit",
+        [CodeListSpec("PERMITS", "permit.csv", "PERMIT_")],
+        code_types={"Permit": "PERMITS"},
+    ),
+    ModuleSpec(
+        "working_time",
+        "Working times",
+        [CodeListSpec("WORKING_TIMES", "workingtime.csv")],
+        enums={"WorkingTime": "WORKING_TIMES"},
+    ),
+]
+
+
+Row = Dict[str, str]
+
+
+def read_snapshot(path: Path) -> List[Row]:
+    """
+    Read the rows of a snapshot, with the empty values left out
+    """
+    if path.suffix == ".json":
+        rows = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        with path.open(encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+    return [
+        {key: str(value).strip() for key, value in row.items() if value} for row in rows
+    ]
+
+
+def dedupe(path: Path, rows: List[Row]) -> List[Row]:
+    """
+    Drop the repeated codes, making sure the repeats don't conflict
+    """
+    by_code: Dict[str, Row] = {}
+    for row in rows:
+        code = row["code"]
+        if code in by_code and by_code[code] != row:
+            raise ValueError(f"{path}: code {code!r} has conflicting rows")
+        by_code.setdefault(code, row)
+    names = [row["name"] for row in by_code.values() if "name" in row]
+    if names and len(set(names)) != len(by_code):
+        raise ValueError(f"{path}: the names of the codes are not unique")
+    return list(by_code.values())
+
+
+def _quote(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_code_list(spec: CodeListSpec, rows: List[Row]) -> str:
+    lines = [f"{spec.constant} = CodeList("]
+    if spec.prefix:
+        lines.append(f"{INDENT}prefix={_quote(spec.prefix)},")
+    if any("name" in row for row in rows):
+        lines.append(f"{INDENT}names={{")
+        lines.extend(
+            f"{INDENT * 2}{_quote(row['name'])}: {_quote(row['code'])}," for row in rows
+        )
+        lines.append(f"{INDENT}}},")
+    else:
+        lines.append(f"{INDENT}codes=(")
+        lines.extend(f"{INDENT * 2}{_quote(row['code'])}," for row in rows)
+        lines.append(f"{INDENT}),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def format_labels(constant: str, columns: Tuple[str, ...], rows: List[Row]) -> str:
+    """
+    Format the table of the labels of the codes, in the order of the code list. With
+    a single column the labels are plain strings, and the codes without one are left
+    out, e.g. for a mapping to the codes of another code list.
+    """
+    lines = [f"{constant} = {{"]
+    for row in rows:
+        if len(columns) == 1:
+            if columns[0] not in row:
+                continue
+            labels = _quote(row[columns[0]])
+        else:
+            labels = "(" + ", ".join(_quote(row.get(c, "")) for c in columns) + ")"
+        lines.append(f"{INDENT}{_quote(row['code'])}: {labels},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _dict(items: Dict[str, str]) -> str:
+    return "{" + ", ".join(f"{_quote(k)}: {v}" for k, v in items.items()) + "}"
+
+
+def format_getattr(spec: ModuleSpec) -> str:
+    """
+    Format the ``__getattr__`` assignment the same way black does
+    """
+    args = ["__name__"]
+    if spec.enums:
+        args.append(f"enums={_dict(spec.enums)}")
+    if spec.code_types:
+        args.append(f"code_types={_dict(spec.code_types)}")
+
+    start = "__getattr__ = lazy_code_lists("
+    one_line = start + ", ".join(args) + ")"
+    if len(one_line) <= LINE_LENGTH:
+        return one_line + "\n"
+    indented = INDENT + ", ".join(args)
+    if len(indented) <= LINE_LENGTH:
+        return f"{start}\n{indented}\n)\n"
+
+    lines = [start]
+    for arg in args:
+        if len(INDENT + arg + ",") <= LINE_LENGTH:
+            lines.append(f"{INDENT}{arg},")
+            continue
+        key, items = arg.split("=", 1)
+        lines.append(f"{INDENT}{key}={{")
+        items_dict = spec.enums if key == "enums" else spec.code_types
+        lines.extend(f"{INDENT * 2}{_quote(k)}: {v}," for k, v in items_dict.items())
+        lines.append(f"{INDENT}}},")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def generate_module(spec: ModuleSpec, snapshots: Path) -> str:
+    """
+    Generate the source of a code list module from the snapshots
+    """
+    parts = [
+        f'"""\n{spec.docstring}\n"""\n'
+        + HEADER
+        + "from codelists.base import CodeList, lazy_code_lists\n"
+    ]
+    for code_list in spec.code_lists:
+        path = snapshots / code_list.snapshot
+        rows = dedupe(path, read_snapshot(path))
+        if not code_list.keep_order:
+            rows.sort(key=lambda row: row["code"])
+        parts.append(format_code_list(code_list, rows))
+        for constant, columns in code_list.labels.items():
+            parts.append(format_labels(constant, columns, rows))
+    comment = f"# {spec.comment}\n" if spec.comment else ""
+    parts.append(comment + format_getattr(spec))
+    return "\n".join(parts)
+
+
+def generate_code_lists(
+    dest: Path = CODELISTS_PATH, snapshots: Path = SNAPSHOTS_PATH, check: bool = False
+) -> List[Path]:
+    """
+    Generate all the code list modules
+
+    :param dest: Path to the code list package
+    :param snapshots: Path to the snapshots of the code schemes
+    :param check: Only check if the modules are up to date, without writing them
+    :return: The modules that changed
+    """
+    changed = []
+    for spec in MODULES:
+        out_file = dest / f"{spec.module}.py"
+        content = generate_module(spec, snapshots)
+        if out_file.exists() and out_file.read_text(encoding="utf-8") == content:
+            continue
+        changed.append(out_file)
+        if not check:
+            out_file.write_text(content, encoding="utf-8")
+    return changed
+
+
+@cli.command()
+def codelists(
+    check: bool = Option(
+        False, "--check", help="Only check that the modules are up to date"
+    ),
+):
+    changed = generate_code_lists(check=check)
+    for out_file in changed:
+        print(f"{'Outdated' if check else 'Generated'} {out_file}")
+    print(f"{len(changed)} of {len(MODULES)} code list modules changed")
+    raise Exit(code=int(bool(changed)))
+
+
+if __name__ == "__main__":
+    cli()
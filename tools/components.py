@@ -0,0 +1,267 @@
+"""
+Shared components of the OpenAPI specs, and bundling the specs back together.
+
+Most specs contain copies of the same components: the error schemas of every product,
+and the big code lists like ``EscoCode`` in many of them. Splitting a folder of specs
+writes one shared ``_components.json`` document with a single copy of each component
+used by several specs, and a copy of every spec where those components are replaced
+by a reference to the shared document, e.g.::
+
+    "EscoCode": {"$ref": "../_components.json#/components/schemas/EscoCode"}
+
+The references inside the specs are left as they are, so the order and layout of the
+specs are kept, and bundling a split spec reproduces the original one byte for byte.
+
+When a component has different variants in different specs, the one used by most
+specs is shared and the others stay in their specs. A component is only replaced when
+the components it refers to are the same in the spec and the shared document too.
+"""
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from definition_tooling.log import print_error
+from rich import print
+from typer import Argument, Exit, Typer
+
+from tools.jsonformat import json_size, write_json
+
+cli = Typer()
+
+COMPONENTS_FILE = "_components.json"
+_LOCAL_REF = "#/components/"
+
+# A component by its section and name, e.g. ("schemas", "EscoCode")
+Key = Tuple[str, str]
+
+
+def _refs(value) -> Iterator[Key]:
+    """
+    Find the components a value refers to within the same document
+    """
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_LOCAL_REF):
+            section, name = ref[len(_LOCAL_REF) :].split("/", 1)
+            yield section, name
+        for item in value.values():
+            yield from _refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _refs(item)
+
+
+def _components(spec: dict) -> Dict[Key, str]:
+    """
+    Get the components of a spec as JSON, for comparing them. The order of the keys
+    counts, so the bundled specs come out exactly as they were.
+    """
+    return {
+        (section, name): json.dumps(component)
+        for section, items in spec.get("components", {}).items()
+        for name, component in items.items()
+    }
+
+
+def _closure(key: Key, refs: Dict[Key, Set[Key]]) -> Set[Key]:
+    """
+    Get the component and all the components it refers to, directly or indirectly
+    """
+    seen = set()
+    stack = [key]
+    while stack:
+        current = stack.pop()
+        if current not in seen:
+            seen.add(current)
+            stack.extend(refs.get(current, ()))
+    return seen
+
+
+def find_shared(specs: Dict[str, dict]) -> Tuple[dict, Dict[str, Set[Key]]]:
+    """
+    Choose the components to share between the specs
+
+    :param specs: The specs by their paths relative to the folder of specs
+    :return: The shared components document, and for each spec the components to
+    replace with references to it
+    """
+    components = {path: _components(spec) for path, spec in specs.items()}
+
+    # The most common variant of each component, if several specs use it
+    variants = Counter(v for c in components.values() for v in c.items())
+    shared: Dict[Key, str] = {}
+    for (key, content), count in variants.most_common():
+        if count > 1 and key not in shared:
+            shared[key] = content
+    shared_values = {key: json.loads(content) for key, content in shared.items()}
+    refs = {key: set(_refs(value)) for key, value in shared_values.items()}
+
+    # Drop the components referring to components that aren't shared, until the
+    # shared document refers only to itself
+    while True:
+        dangling = {key for key in shared if not refs[key] <= shared.keys()}
+        if not dangling:
+            break
+        for key in dangling:
+            del shared[key]
+
+    replaced = {}
+    for path, spec_components in components.items():
+        same = {k for k, v in spec_components.items() if shared.get(k) == v}
+        replaced[path] = {k for k in same if _closure(k, refs) <= same}
+
+    document: dict = {"components": {}}
+    for section, name in sorted(shared):
+        items = document["components"].setdefault(section, {})
+        items[name] = shared_values[(section, name)]
+    return document, replaced
+
+
+def _components_ref(path: str, key: Key) -> str:
+    relative = os.path.relpath(COMPONENTS_FILE, os.path.dirname(path) or ".")
+    return f"{Path(relative).as_posix()}#/components/{key[0]}/{key[1]}"
+
+
+def split_spec(path: str, spec: dict, replaced: Set[Key]) -> dict:
+    """
+    Replace the shared components of a spec with references to the shared document
+    """
+    split = dict(spec)
+    split["components"] = {
+        section: {
+            name: (
+                {"$ref": _components_ref(path, (section, name))}
+                if (section, name) in replaced
+                else component
+            )
+            for name, component in items.items()
+        }
+        for section, items in spec.get("components", {}).items()
+    }
+    return split
+
+
+def bundle_spec(spec: dict, document: dict) -> dict:
+    """
+    Replace the references to the shared document with the shared components
+    """
+    if "components" not in spec:
+        return spec
+    bundled = dict(spec)
+    bundled["components"] = {}
+    for section, items in spec["components"].items():
+        bundled["components"][section] = {}
+        for name, component in items.items():
+            ref = component.get("$ref", "") if len(component) == 1 else ""
+            if ref.split("#", 1)[0].endswith(COMPONENTS_FILE):
+                component = document["components"][section][name]
+            bundled["components"][section][name] = component
+    return bundled
+
+
+def load_specs(path: Path) -> Dict[str, dict]:
+    """
+    Load the specs in a folder, by their paths relative to it
+    """
+    return {
+        p.relative_to(path).as_posix(): json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(path.glob("**/*.json"))
+        if p.name != COMPONENTS_FILE
+    }
+
+
+def check_split_dest(src: Path, dest: Path) -> None:
+    """
+    Make sure the split specs are not written among the self-contained ones, where
+    they would be validated and served as specs of definitions themselves
+    """
+    if dest.resolve() == src.resolve() or src.resolve() in dest.resolve().parents:
+        raise ValueError(f"The copies of the specs can't be written inside {src}")
+
+
+def split_catalog(src: Path, dest: Path) -> List[Path]:
+    """
+    Write the shared components document and the split specs
+
+    :param src: Path to the self-contained specs
+    :param dest: Path to write the shared document and the split specs to
+    :return: The files that were written, the unchanged ones are left untouched
+    """
+    check_split_dest(src, dest)
+    specs = load_specs(src)
+    document, replaced = find_shared(specs)
+    written = []
+    if write_json(dest / COMPONENTS_FILE, document):
+        written.append(dest / COMPONENTS_FILE)
+    for path, spec in specs.items():
+        if write_json(dest / path, split_spec(path, spec, replaced[path])):
+            written.append(dest / path)
+    return written
+
+
+def bundle_catalog(src: Path, dest: Path) -> List[Path]:
+    """
+    Write the self-contained specs from the split specs and the shared document
+
+    :param src: Path to the shared document and the split specs
+    :param dest: Path to write the self-contained specs to
+    :return: The files that were written, the unchanged ones are left untouched
+    """
+    document = json.loads((src / COMPONENTS_FILE).read_text(encoding="utf-8"))
+    written = []
+    for path, spec in load_specs(src).items():
+        if write_json(dest / path, bundle_spec(spec, document)):
+            written.append(dest / path)
+    return written
+
+
+@cli.command()
+def split(
+    src: Path = Argument(
+        ...,
+        help="Path to the self-contained specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ..., help="Path to write the shared document and split specs to"
+    ),
+):
+    """
+    Split the specs into a shared components document and specs referring to it
+    """
+    try:
+        written = split_catalog(src, dest)
+    except ValueError as e:
+        print_error(str(e))
+        raise Exit(code=2)
+    print(f"Wrote {len(written)} files to {dest}")
+    print(
+        f"Size of the specs: {json_size(src)} bytes, "
+        f"when split: {json_size(dest)} bytes"
+    )
+
+
+@cli.command()
+def bundle(
+    src: Path = Argument(
+        ...,
+        help="Path to the shared document and split specs",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to write the self-contained specs to"),
+):
+    """
+    Bundle the split specs back to self-contained specs
+    """
+    written = bundle_catalog(src, dest)
+    print(f"Wrote {len(written)} files to {dest}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,142 @@
+"""
+Precompressed copies of the specs, for serving them without compressing on the fly.
+
+Every spec gets a ``.json.gz`` sibling, and a ``.json.br`` sibling when the brotli
+package is installed. A manifest of the sizes, ``compressed.jsonl`` in the folder of
+the specs, records the hash of each spec the copies were made from, so a spec is only
+compressed again when it changes. The manifest is JSON lines, so the tools looking for
+``*.json`` specs don't pick it up.
+"""
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from definition_tooling.log import print_error
+from rich import print
+from typer import Argument, Typer
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+cli = Typer()
+
+MANIFEST_NAME = "compressed.jsonl"
+BROTLI_MISSING = (
+    "The brotli package is not installed, only wrote the gzip files. Install it with "
+    "pip install brotli"
+)
+# Suffixes of all the compressed copies, including the ones of missing compressors
+SUFFIXES = (".gz", ".br")
+
+
+def _gzip(data: bytes) -> bytes:
+    # Without the modification time, the same spec always compresses the same way
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    Get the available compressions, by the suffix of the compressed files
+    """
+    available = {".gz": _gzip}
+    if brotli is not None:
+        available[".br"] = brotli.compress
+    return available
+
+
+def load_manifest(path: Path) -> Dict[str, dict]:
+    manifest_path = path / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    lines = manifest_path.read_text(encoding="utf-8").splitlines()
+    entries = [json.loads(line) for line in lines if line.strip()]
+    return {entry["path"]: entry for entry in entries}
+
+
+def save_manifest(path: Path, manifest: Dict[str, dict]) -> bool:
+    """
+    Write the manifest, if it changed
+
+    :return: True if the file was written
+    """
+    content = "".join(
+        json.dumps(manifest[name], sort_keys=True) + "\n" for name in sorted(manifest)
+    )
+    manifest_path = path / MANIFEST_NAME
+    if manifest_path.exists() and manifest_path.read_text(encoding="utf-8") == content:
+        return False
+    manifest_path.write_text(content, encoding="utf-8")
+    return True
+
+
+def compress_specs(path: Path) -> List[Path]:
+    """
+    Write the compressed copies of the specs that changed since they were last
+    compressed, and remove the copies of the removed specs and the copies made with
+    compressors no longer available, which would be left stale
+
+    :param path: Path to the specs in JSON format
+    :return: The compressed files that were written
+    """
+    previous = load_manifest(path)
+    manifest = {}
+    written = []
+    suffixes = compressors()
+    for spec_path in sorted(path.glob("**/*.json")):
+        name = spec_path.relative_to(path).as_posix()
+        data = spec_path.read_bytes()
+        entry = {
+            "path": name,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+        }
+        old = previous.get(name, {})
+        for suffix, compress in suffixes.items():
+            out_file = spec_path.with_name(spec_path.name + suffix)
+            key = f"size_{suffix[1:]}"
+            if (
+                old.get("sha256") == entry["sha256"]
+                and key in old
+                and out_file.exists()
+            ):
+                entry[key] = old[key]
+                continue
+            compressed = compress(data)
+            if not out_file.exists() or out_file.read_bytes() != compressed:
+                out_file.write_bytes(compressed)
+                written.append(out_file)
+            entry[key] = len(compressed)
+        for suffix in SUFFIXES:
+            if suffix not in suffixes:
+                spec_path.with_name(spec_path.name + suffix).unlink(missing_ok=True)
+        manifest[name] = entry
+
+    for name in previous.keys() - manifest.keys():
+        for suffix in SUFFIXES:
+            (path / (name + suffix)).unlink(missing_ok=True)
+    save_manifest(path, manifest)
+    return written
+
+
+@cli.command()
+def compress(
+    path: Path = Argument(
+        ...,
+        help="Path to definitions in JSON format",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+):
+    written = compress_specs(path)
+    if brotli is None:
+        print_error(BROTLI_MISSING)
+    print(f"Compressed {len(written)} files, see {path / MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,425 @@
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from definition_tooling.converter import export_openapi_spec
+from definition_tooling.converter.converter import styled_error
+from definition_tooling.log import print_error
+from pydantic import ValidationError
+from rich import print
+from typer import Argument, Exit, Option, Typer
+
+from tools.codelist_refs import externalize_catalog
+from tools.components import check_split_dest, split_catalog
+from tools.compress import BROTLI_MISSING, MANIFEST_NAME, compress_specs, compressors
+from tools.jsonformat import dumps
+from tools.manifest import MANIFEST_PATH, Manifest, file_hash
+from tools.sources import (
+    CODELISTS_PACKAGE,
+    codelist_dependencies,
+    definition_name,
+    find_definitions,
+    module_name,
+    output_path,
+)
+
+cli = Typer()
+
+# Hashes of the sources of the code list modules imported by this process
+_codelist_hashes: Dict[str, str] = {}
+
+
+def _codelist_modules() -> Dict[str, ModuleType]:
+    return {
+        name: module
+        for name, module in sys.modules.items()
+        if name == CODELISTS_PACKAGE or name.startswith(CODELISTS_PACKAGE + ".")
+    }
+
+
+def _record_codelist_hashes() -> None:
+    for name, module in _codelist_modules().items():
+        path = getattr(module, "__file__", None)
+        if name not in _codelist_hashes and path:
+            _codelist_hashes[name] = file_hash(Path(path))
+
+
+def evict_changed_codelists() -> None:
+    """
+    Forget the imported code list modules if the source of any of them changed, so
+    a long running process, like the watch mode, imports the new code lists. They
+    import each other, so they are all imported again.
+    """
+    modules = _codelist_modules()
+    for name, module in modules.items():
+        path = Path(getattr(module, "__file__", None) or "")
+        if name not in _codelist_hashes:
+            continue
+        if not path.is_file() or file_hash(path) != _codelist_hashes[name]:
+            for evicted in modules:
+                del sys.modules[evicted]
+            _codelist_hashes.clear()
+            return
+
+
+def add_sources_to_path(src: Path) -> None:
+    """
+    Make the shared code lists importable, the definitions import them as top level
+    modules
+    """
+    src_path = str(src.resolve())
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
+
+
+def import_codelists_base(src: Path) -> Optional[ModuleType]:
+    """
+    Import the module creating the code types of the shared code lists, if the
+    sources have one
+    """
+    add_sources_to_path(src)
+    try:
+        return importlib.import_module(f"{CODELISTS_PACKAGE}.base")
+    except ImportError:
+        return None
+
+
+def load_definition_module(path: Path, src: Path) -> ModuleType:
+    """
+    Import the python source of a definition as a module
+    """
+    add_sources_to_path(src)
+    spec = importlib.util.spec_from_file_location(
+        name=module_name(definition_name(path, src)), location=str(path)
+    )
+    if not spec.loader:
+        raise RuntimeError(f"Failed to import {path} module")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        _record_codelist_hashes()
+    return module
+
+
+def source_hash(path: Path, src: Path) -> str:
+    """
+    Hash the source of a definition together with the code lists it imports, so the
+    definition is converted again when any of them changes
+    """
+    digest = hashlib.sha256(file_hash(path).encode())
+    for dependency in codelist_dependencies(path, src):
+        digest.update(file_hash(dependency).encode())
+    return digest.hexdigest()
+
+
+def sort_unique_items(value: Any) -> Any:
+    """
+    Sort the examples and defaults of the arrays with unique items, i.e. the set
+    fields, in place. Sets are iterated in an order that depends on the hash seed of
+    the interpreter, so without this the specs would change from run to run.
+    """
+    if isinstance(value, dict):
+        if value.get("uniqueItems") is True:
+            examples = value.get("examples")
+            if isinstance(examples, list):
+                value["examples"] = [
+                    _sorted_items(example) if isinstance(example, list) else example
+                    for example in examples
+                ]
+            if isinstance(value.get("default"), list):
+                value["default"] = _sorted_items(value["default"])
+        for item in value.values():
+            sort_unique_items(item)
+    elif isinstance(value, list):
+        for item in value:
+            sort_unique_items(item)
+    return value
+
+
+def _sorted_items(items: list) -> list:
+    return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+
+
+@dataclass
+class Conversion:
+    """
+    Result of converting a single definition. Errors are kept as text, so the result
+    can be passed back from a worker process.
+    """
+
+    path: Path
+    openapi: Optional[dict] = None
+    error: Optional[str] = None
+    detail: Optional[str] = None
+    should_fail_hook: bool = False
+
+
+def convert_definition(path: Path, src: Path) -> Conversion:
+    """
+    Import the definition and export its OpenAPI spec
+    """
+    try:
+        module = load_definition_module(path, src)
+    except ValidationError as e:
+        return Conversion(
+            path, error="Validation error", detail=str(e), should_fail_hook=True
+        )
+    except Exception:
+        # E.g. a syntax error in a source saved halfway, which must not stop the
+        # conversion of the other definitions or the watch mode
+        return Conversion(
+            path,
+            error="Error importing the definition",
+            detail=traceback.format_exc(),
+            should_fail_hook=True,
+        )
+
+    definition = getattr(module, "DEFINITION", None)
+    if definition is None:
+        return Conversion(path, error="Error finding DEFINITION variable")
+
+    try:
+        openapi = export_openapi_spec(definition, definition_name(path, src))
+    except Exception:
+        return Conversion(
+            path,
+            error="Error exporting the OpenAPI spec",
+            detail=traceback.format_exc(),
+            should_fail_hook=True,
+        )
+    return Conversion(path, openapi=sort_unique_items(openapi))
+
+
+def convert_definitions_in_pool(
+    paths: List[Path], src: Path, jobs: int
+) -> Iterator[Conversion]:
+    """
+    Convert the definitions in a pool of worker processes, one definition per task
+
+    :param paths: Paths of the definition sources to convert
+    :param src: Path to python sources of definitions
+    :param jobs: Number of worker processes, 0 to use one per CPU
+    :return: Iterator of the results in the same order as the paths
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(paths) < 2:
+        for p in paths:
+            yield convert_definition(p, src)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as executor:
+        # Submit the biggest sources first so they don't end up alone in the tail
+        by_size = sorted(paths, key=lambda p: p.stat().st_size, reverse=True)
+        futures = {p: executor.submit(convert_definition, p, src) for p in by_size}
+        for p in paths:
+            yield futures[p].result()
+
+
+def write_spec(out_file: Path, openapi: dict) -> bool:
+    """
+    Write the OpenAPI spec to the output file in its canonical form, if the contents
+    of the file changed
+
+    :return: True if the file was written
+    """
+    content = dumps(openapi)
+    if out_file.exists() and out_file.read_text(encoding="utf-8") == content:
+        return False
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(content, encoding="utf-8")
+    return True
+
+
+def untracked_files(path: Path) -> Set[Path]:
+    """
+    Find the files in a folder that are untracked in git, with a single git call.
+    Nothing is untracked in a folder outside of a git repository.
+    """
+    completed_process = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard", "-z", str(path)],
+        capture_output=True,
+        encoding="utf-8",
+    )
+    if completed_process.returncode != 0:
+        return set()
+    return {
+        Path(name).resolve() for name in completed_process.stdout.split("\0") if name
+    }
+
+
+def convert_data_product_definitions(
+    src: Path,
+    dest: Path,
+    force: bool = False,
+    jobs: int = 1,
+    manifest_path: Path = MANIFEST_PATH,
+    shared_components: Optional[Path] = None,
+    compress: bool = False,
+    external_codelists: Optional[Path] = None,
+) -> bool:
+    """
+    Convert the definitions whose sources changed since the previous conversion to
+    the corresponding OpenAPI specs in the output folder.
+
+    :param src: Path to python sources of definitions
+    :param dest: Path to definitions output
+    :param force: Convert all definitions regardless of the manifest
+    :param jobs: Number of worker processes to convert with, 0 to use one per CPU
+    :param manifest_path: Path to the manifest of previous conversions
+    :param shared_components: Also write the specs split into a shared components
+    document and specs referring to it to this path
+    :param compress: Also write the compressed copies of the changed specs
+    :param external_codelists: Also write the specs with the big code lists as
+    references to separately published code lists to this path
+    :return: True if the pre-commit hook should fail
+    """
+    manifest = Manifest.load(manifest_path)
+    sources = find_definitions(src)
+    # Before converting here or forking the worker processes
+    evict_changed_codelists()
+
+    should_fail_hook = False
+    converted = []
+    source_hashes = {p: source_hash(p, src) for p in sources}
+    stale = [
+        p
+        for p in sources
+        if force
+        or not manifest.is_fresh(
+            definition_name(p, src), source_hashes[p], output_path(p, src, dest)
+        )
+    ]
+    untracked = untracked_files(dest)
+
+    for conversion in convert_definitions_in_pool(stale, src, jobs):
+        p = conversion.path
+        if conversion.error:
+            should_fail_hook = should_fail_hook or conversion.should_fail_hook
+            print(styled_error(conversion.error, p))
+            if conversion.detail:
+                print(conversion.detail)
+            continue
+
+        out_file = output_path(p, src, dest)
+        if write_spec(out_file, conversion.openapi):
+            print(f"Exporting {out_file}")
+            # Hook should fail as we modified the file.
+            should_fail_hook = True
+        elif out_file.resolve() in untracked:
+            print(f"Untracked {out_file}")
+            should_fail_hook = True
+        else:
+            print(f"Skipping {out_file}")
+        converted.append(p)
+
+    # The specs that are up to date must still be committed, like upstream checks
+    for p in sorted(set(sources) - set(stale)):
+        out_file = output_path(p, src, dest)
+        if out_file.resolve() in untracked:
+            print(f"Untracked {out_file}")
+            should_fail_hook = True
+
+    for p in converted:
+        out_file = output_path(p, src, dest)
+        manifest.update(definition_name(p, src), source_hashes[p], file_hash(out_file))
+    names = {definition_name(p, src) for p in sources}
+    for name in list(manifest.entries):
+        if name not in names:
+            manifest.remove(name)
+    manifest.save()
+
+    print(f"Converted {len(converted)} of {len(sources)} definitions")
+
+    if shared_components:
+        written = split_catalog(dest, shared_components)
+        print(
+            f"Wrote {len(written)} files with shared components to {shared_components}"
+        )
+    if compress:
+        written = compress_specs(dest)
+        if ".br" not in compressors():
+            print_error(BROTLI_MISSING)
+        print(f"Compressed {len(written)} files, see {dest / MANIFEST_NAME}")
+    if external_codelists:
+        written = externalize_catalog(dest, external_codelists)
+        print(
+            f"Wrote {len(written)} specs with external code lists to "
+            f"{external_codelists}"
+        )
+    return should_fail_hook
+
+
+@cli.command()
+def convert_definitions(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions output",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    force: bool = Option(
+        False, "--force", help="Convert all definitions, even the unchanged ones"
+    ),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        min=0,
+        help="Number of worker processes to convert with, 0 to use one per CPU",
+    ),
+    shared_components: Optional[Path] = Option(
+        None,
+        "--shared-components",
+        help="Also write the specs with their shared components split out to a path",
+    ),
+    compress: bool = Option(
+        False,
+        "--compress",
+        help="Also write gzip and brotli compressed specs, brotli needs the package",
+    ),
+    external_codelists: Optional[Path] = Option(
+        None,
+        "--external-codelists",
+        help="Also write the specs with the big code lists as references to a path",
+    ),
+):
+    for extra_dest in (shared_components, external_codelists):
+        if extra_dest:
+            try:
+                check_split_dest(dest, extra_dest)
+            except ValueError as e:
+                print_error(str(e))
+                raise Exit(code=2)
+
+    should_fail_hook = convert_data_product_definitions(
+        src,
+        dest,
+        force=force,
+        jobs=jobs,
+        shared_components=shared_components,
+        compress=compress,
+        external_codelists=external_codelists,
+    )
+    raise Exit(code=int(should_fail_hook))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,150 @@
+import ast
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from typer import Argument, Option, Typer
+
+from tools.sources import CODELISTS_PACKAGE, definition_name, find_definitions
+
+cli = Typer()
+
+# Defaults of the DataProductDefinition fields that are optional
+DEFINITION_DEFAULTS = {
+    "version": "0.0.1",
+    "deprecated": False,
+    "requires_authorization": False,
+    "requires_consent": False,
+    "error_responses": {},
+}
+
+
+def _name(node: ast.AST) -> Optional[str]:
+    """
+    Get the (dotted) name a node refers to, e.g. "Enum" or "pydantic.BaseModel"
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _name(node.value)
+        return f"{value}.{node.attr}" if value else None
+    return None
+
+
+def _value(node: ast.AST) -> Any:
+    """
+    Evaluate a keyword value of the definition without running any code. Names of
+    classes are returned as strings.
+    """
+    if isinstance(node, ast.Dict):
+        return {
+            str(_value(key)): _value(value)
+            for key, value in zip(node.keys, node.values)
+            if key is not None
+        }
+    name = _name(node)
+    if name is not None:
+        return name
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return ast.unparse(node)
+
+
+def _referenced_names(node: ast.AST) -> List[str]:
+    return [n.id for n in ast.walk(node) if isinstance(n, ast.Name)]
+
+
+def scan_class(node: ast.ClassDef, class_names: set) -> dict:
+    """
+    Describe a class of the definition: its bases, and either the number of members
+    of an enum or the classes a model refers to in its fields, both the other classes
+    of the module and the shared code lists it imports.
+    """
+    bases = [_name(base) or ast.unparse(base) for base in node.bases]
+    info = {"bases": bases}
+    if any(base.split(".")[-1] == "Enum" for base in bases):
+        info["members"] = sum(isinstance(stmt, ast.Assign) for stmt in node.body)
+        return info
+
+    references = set()
+    for stmt in node.body:
+        if isinstance(stmt, ast.AnnAssign):
+            references.update(_referenced_names(stmt.annotation))
+    info["references"] = sorted(references & class_names)
+    return info
+
+
+def scan_definition(path: Path, src: Path) -> dict:
+    """
+    Extract the metadata of a definition from its source without importing it
+
+    :param path: Path to the definition source
+    :param src: Path to python sources of definitions
+    :return: The DEFINITION keywords, the classes and the imported modules
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    class_names = {node.name for node in class_nodes}
+
+    definition = None
+    imports = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module:
+            imports.add(node.module)
+            if node.module.split(".")[0] == CODELISTS_PACKAGE:
+                class_names.update(alias.asname or alias.name for alias in node.names)
+        elif isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif (
+            isinstance(node, ast.Assign)
+            and any(_name(target) == "DEFINITION" for target in node.targets)
+            and isinstance(node.value, ast.Call)
+        ):
+            definition = dict(DEFINITION_DEFAULTS)
+            for keyword in node.value.keywords:
+                if keyword.arg:
+                    definition[keyword.arg] = _value(keyword.value)
+
+    return {
+        "path": path.as_posix(),
+        "name": definition_name(path, src),
+        "definition": definition,
+        "classes": {node.name: scan_class(node, class_names) for node in class_nodes},
+        "imports": sorted(imports),
+    }
+
+
+def build_index(src: Path) -> Dict[str, dict]:
+    """
+    Build an index of all the definitions in the sources, keyed by definition name
+    """
+    index = {}
+    for p in find_definitions(src):
+        entry = scan_definition(p, src)
+        index[entry["name"]] = entry
+    return index
+
+
+@cli.command()
+def index(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    output: Optional[Path] = Option(
+        None, "--output", "-o", help="Write the index to a file instead of stdout"
+    ),
+):
+    content = json.dumps(build_index(src), indent=2, ensure_ascii=False) + "\n"
+    if output:
+        output.write_text(content, encoding="utf-8")
+    else:
+        print(content, end="")
+
+
+if __name__ == "__main__":
+    cli()
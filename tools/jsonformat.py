@@ -0,0 +1,155 @@
+"""
+Canonical JSON formatting of the generated OpenAPI specs.
+
+The layout is the same one prettier produces for JSON files with the settings in
+.prettierrc.js, so the specs are written in their final form right away:
+
+- non-empty objects are always expanded, one property per line
+- arrays are kept on one line if they fit in the print width, otherwise each item goes
+  on its own line, except for arrays of numbers which are filled line by line
+- arrays of several objects or of several arrays are always expanded
+
+Keys are kept in the order the converter produces them, which is deterministic.
+"""
+import json
+import unicodedata
+from pathlib import Path
+from typing import Any, Collection, List, Optional
+
+PRINT_WIDTH = 88
+INDENT = "  "
+
+
+def _width(text: str) -> int:
+    """
+    Width of the text in columns, counting wide characters twice like prettier
+    """
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def _scalar(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _must_break(items: list) -> bool:
+    """
+    Arrays with several items that are all objects or all arrays with more than one
+    element are always expanded
+    """
+    if len(items) < 2:
+        return False
+    first_type = type(items[0])
+    if first_type not in (dict, list):
+        return False
+    return all(type(item) is first_type and len(item) > 1 for item in items)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _flat(value: Any) -> Optional[str]:
+    """
+    Print the value on a single line, or return None if that's not possible
+    """
+    if isinstance(value, dict):
+        return None if value else "{}"
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        if _must_break(value):
+            return None
+        parts = []
+        for item in value:
+            flat = _flat(item)
+            if flat is None:
+                return None
+            parts.append(flat)
+        return "[" + ", ".join(parts) + "]"
+    return _scalar(value)
+
+
+def _print(value: Any, level: int, prefix: str, suffix: str, out: List[str]) -> None:
+    """
+    Print the value with the given prefix (indentation and key) and suffix (comma)
+    """
+    indent = INDENT * level
+    flat = _flat(value)
+    if flat is not None and (
+        not isinstance(value, list)
+        or _width(indent + prefix + flat + suffix) <= PRINT_WIDTH
+    ):
+        out.append(indent + prefix + flat + suffix)
+        return
+
+    if isinstance(value, dict):
+        out.append(indent + prefix + "{")
+        last = len(value) - 1
+        for i, (key, item) in enumerate(value.items()):
+            comma = "," if i < last else ""
+            _print(item, level + 1, _scalar(key) + ": ", comma, out)
+        out.append(indent + "}" + suffix)
+        return
+
+    out.append(indent + prefix + "[")
+    if len(value) > 1 and all(_is_number(item) for item in value):
+        _fill([_scalar(item) for item in value], level + 1, out)
+    else:
+        last = len(value) - 1
+        for i, item in enumerate(value):
+            _print(item, level + 1, "", "," if i < last else "", out)
+    out.append(indent + "]" + suffix)
+
+
+def _fill(parts: List[str], level: int, out: List[str]) -> None:
+    """
+    Print the items like prettier's fill, as many on each line as fit
+    """
+    indent = INDENT * level
+    line = indent + parts[0]
+    for part in parts[1:]:
+        if _width(line + ", " + part) <= PRINT_WIDTH:
+            line += ", " + part
+        else:
+            out.append(line + ",")
+            line = indent + part
+    out.append(line)
+
+
+def dumps(value: Any) -> str:
+    """
+    Serialize the value to canonical JSON, including the final newline
+    """
+    out: List[str] = []
+    _print(value, 0, "", "", out)
+    return "\n".join(out) + "\n"
+
+
+def write_json(out_file: Path, value: Any) -> bool:
+    """
+    Write the value to the file as canonical JSON, if the contents of the file changed
+
+    :return: True if the file was written
+    """
+    content = dumps(value)
+    if out_file.exists() and out_file.read_text(encoding="utf-8") == content:
+        return False
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_text(content, encoding="utf-8")
+    return True
+
+
+def json_size(path: Path, exclude: Collection[str] = ()) -> int:
+    """
+    Get the total size of the JSON files in a folder, in bytes
+
+    :param path: Path to the folder
+    :param exclude: Names of the subfolders to leave out
+    """
+    return sum(
+        p.stat().st_size
+        for p in path.glob("**/*.json")
+        if not set(exclude).intersection(p.relative_to(path).parts)
+    )
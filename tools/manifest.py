@@ -0,0 +1,98 @@
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Dict, List
+
+CACHE_DIR = Path(".definitions-cache")
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+
+# Bump whenever the way the tools produce outputs changes, to invalidate manifests
+FORMAT_VERSION = "2"
+
+# Packages that affect the generated OpenAPI specs
+TOOLING_PACKAGES = ["ioxio-data-product-definition-tooling", "fastapi", "pydantic"]
+
+
+def file_hash(path: Path) -> str:
+    """
+    Calculate the SHA-256 hex digest of the file contents
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def package_versions(packages: List[str]) -> List[str]:
+    """
+    List the installed versions of the packages, e.g. ["pydantic==2.5.3"]
+    """
+    versions = []
+    for package in packages:
+        try:
+            versions.append(f"{package}=={version(package)}")
+        except PackageNotFoundError:
+            versions.append(f"{package}==?")
+    return versions
+
+
+def tooling_version() -> str:
+    """
+    Describe the versions of everything that affects the conversion output
+    """
+    return ";".join([f"tools=={FORMAT_VERSION}", *package_versions(TOOLING_PACKAGES)])
+
+
+class Manifest:
+    """
+    Record of the source hash and output hash of each converted definition, used to
+    skip the definitions that have not changed since the previous conversion.
+
+    The manifest is discarded as a whole when the tooling version changes.
+    """
+
+    def __init__(self, path: Path, tooling: str, entries: Dict[str, dict]):
+        self.path = path
+        self.tooling = tooling
+        self.entries = entries
+
+    @classmethod
+    def load(cls, path: Path = MANIFEST_PATH) -> "Manifest":
+        tooling = tooling_version()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict) or data.get("tooling") != tooling:
+            return cls(path, tooling, {})
+        return cls(path, tooling, data.get("definitions", {}))
+
+    def is_fresh(self, name: str, source_hash: str, out_file: Path) -> bool:
+        """
+        Check if the output of the definition is up to date with its source
+
+        :param name: Definition name
+        :param source_hash: Hash of the current definition source
+        :param out_file: Path to the generated OpenAPI spec
+        :return: True if the definition does not need to be converted again
+        """
+        entry = self.entries.get(name)
+        if not entry or entry.get("source") != source_hash:
+            return False
+        if not out_file.exists():
+            return False
+        return entry.get("output") == file_hash(out_file)
+
+    def update(self, name: str, source_hash: str, output_hash: str) -> None:
+        self.entries[name] = {"source": source_hash, "output": output_hash}
+
+    def remove(self, name: str) -> None:
+        self.entries.pop(name, None)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "tooling": self.tooling,
+            "definitions": dict(sorted(self.entries.items())),
+        }
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
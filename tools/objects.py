@@ -0,0 +1,183 @@
+"""
+Content-addressed store of the specs, keeping every identical part of them once.
+
+Many specs have parts in common: the versioned and draft versions of a product are
+nearly the same, and the error schemas and code lists are the same in most specs.
+Each spec is stored as objects named by the sha256 hash of their contents: one object
+for each path and each component, and one for the rest of the spec referring to them
+with ``{"$object": "<hash>"}``. An object used by several specs is stored once::
+
+    objects/6a/f1f0f2db67...json
+    products.json   (the hash of the root object of each product)
+
+``ObjectStore`` loads the specs back, parsing each object only once, so the parts the
+specs have in common are also the same python objects in memory. They are shared, so
+the loaded specs must not be modified.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple
+
+from rich import print
+from typer import Argument, Typer
+
+from tools.sources import definition_name
+
+cli = Typer()
+
+PRODUCTS_FILE = "products.json"
+OBJECTS_DIR = "objects"
+_OBJECT = "$object"
+
+
+def _encode(value: Any) -> bytes:
+    # The order of the keys is kept, so the specs load exactly as they were
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _object_path(store: Path, digest: str) -> Path:
+    return store / OBJECTS_DIR / digest[:2] / f"{digest[2:]}.json"
+
+
+class ObjectWriter:
+    """
+    Writes the objects of the specs to a store, skipping the existing ones
+    """
+
+    def __init__(self, store: Path):
+        self.store = store
+        self.referenced: Set[str] = set()
+        self.written = 0
+
+    def put(self, value: Any) -> Dict[str, str]:
+        """
+        Store a value as an object
+
+        :return: The reference to the object
+        """
+        data = _encode(value)
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self.referenced:
+            self.referenced.add(digest)
+            path = _object_path(self.store, digest)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(data)
+                self.written += 1
+        return {_OBJECT: digest}
+
+    def put_spec(self, spec: dict) -> str:
+        """
+        Store the paths, components and the rest of a spec as objects
+
+        :return: The hash of the root object of the spec
+        """
+        root = dict(spec)
+        if "paths" in spec:
+            root["paths"] = {p: self.put(item) for p, item in spec["paths"].items()}
+        if "components" in spec:
+            root["components"] = {
+                section: {name: self.put(c) for name, c in items.items()}
+                for section, items in spec["components"].items()
+            }
+        return self.put(root)[_OBJECT]
+
+
+def store_catalog(src: Path, store: Path) -> Tuple[int, int]:
+    """
+    Store all the specs in a folder, and remove the objects no longer used
+
+    :param src: Path to the specs in JSON format
+    :param store: Path to the object store
+    :return: The number of objects written and removed
+    """
+    writer = ObjectWriter(store)
+    products = {}
+    for spec_path in sorted(src.glob("**/*.json")):
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        products[definition_name(spec_path, src)] = writer.put_spec(spec)
+
+    content = json.dumps(products, indent=2) + "\n"
+    products_path = store / PRODUCTS_FILE
+    if (
+        not products_path.exists()
+        or products_path.read_text(encoding="utf-8") != content
+    ):
+        products_path.write_text(content, encoding="utf-8")
+
+    removed = 0
+    for path in store.glob(f"{OBJECTS_DIR}/*/*.json"):
+        if path.parent.name + path.stem not in writer.referenced:
+            path.unlink()
+            removed += 1
+    return writer.written, removed
+
+
+class ObjectStore:
+    """
+    Loads the specs of the products from a store::
+
+        store = ObjectStore(Path("build/objects"))
+        spec = store.load("Employment/EscoOccupations_v1.0")
+    """
+
+    def __init__(self, store: Path):
+        self.store = store
+        self.products: Dict[str, str] = json.loads(
+            (store / PRODUCTS_FILE).read_text(encoding="utf-8")
+        )
+        self._objects: Dict[str, Any] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.products
+
+    def _resolve(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and _OBJECT in value:
+                return self.object(value[_OBJECT])
+            return {key: self._resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        return value
+
+    def object(self, digest: str) -> Any:
+        """
+        Get an object with the objects it refers to, parsed on the first use
+        """
+        if digest not in self._objects:
+            data = _object_path(self.store, digest).read_bytes()
+            self._objects[digest] = self._resolve(json.loads(data))
+        return self._objects[digest]
+
+    def load(self, name: str) -> dict:
+        """
+        Get the spec of a product, e.g. "Employment/EscoOccupations_v1.0"
+        """
+        return self.object(self.products[name])
+
+
+@cli.command()
+def store(
+    src: Path = Argument(
+        ...,
+        help="Path to definitions in JSON format",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(..., help="Path to the object store"),
+):
+    """
+    Store the specs in a content-addressed object store
+    """
+    dest.mkdir(parents=True, exist_ok=True)
+    written, removed = store_catalog(src, dest)
+    objects = list(dest.glob(f"{OBJECTS_DIR}/*/*.json"))
+    size = sum(p.stat().st_size for p in objects)
+    print(f"Wrote {written} and removed {removed} objects in {dest}")
+    print(f"The store has {len(objects)} objects, {size} bytes in total")
+
+
+if __name__ == "__main__":
+    cli()
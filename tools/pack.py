@@ -0,0 +1,203 @@
+"""
+Packed catalog of all the specs in a single file, with an index for random access.
+
+The file starts with a fixed size header, the magic bytes and the length of the
+index, followed by the index as JSON and the specs one after another::
+
+    b"DPCATLG1" | length of the index (8 bytes, little endian) | index | specs
+
+For each spec the index has the name of the product, e.g.
+"Employment/EscoOccupations_v1.0", its version, and the offset of the spec from the
+end of the index, its length and its sha256 hash. A reader maps the file into memory
+and takes a slice of it to get a spec, so loading the specs of the products a gateway
+serves only reads the pages they are on.
+"""
+import hashlib
+import json
+import mmap
+import struct
+import weakref
+from contextlib import suppress
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from definition_tooling.log import print_table
+from rich import print
+from typer import Argument, Option, Typer
+
+from tools.sources import definition_name
+
+cli = Typer()
+
+MAGIC = b"DPCATLG1"
+_HEADER = struct.Struct("<8sQ")
+
+
+def pack_catalog(src: Path) -> bytes:
+    """
+    Pack the specs in a folder, in the order of their names
+
+    :param src: Path to the specs in JSON format
+    :return: The contents of the packed catalog
+    """
+    index = []
+    specs = []
+    offset = 0
+    for spec_path in sorted(src.glob("**/*.json")):
+        data = spec_path.read_bytes()
+        info = json.loads(data).get("info", {})
+        index.append(
+            {
+                "name": definition_name(spec_path, src),
+                "version": info.get("version"),
+                "offset": offset,
+                "length": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+        )
+        specs.append(data)
+        offset += len(data)
+
+    index_data = json.dumps(index, separators=(",", ":")).encode()
+    return b"".join([_HEADER.pack(MAGIC, len(index_data)), index_data, *specs])
+
+
+def write_catalog(src: Path, out_file: Path) -> bool:
+    """
+    Write the packed catalog of the specs, if its contents changed
+
+    :return: True if the file was written
+    """
+    content = pack_catalog(src)
+    if out_file.exists() and out_file.read_bytes() == content:
+        return False
+    out_file.parent.mkdir(parents=True, exist_ok=True)
+    out_file.write_bytes(content)
+    return True
+
+
+class PackedCatalog:
+    """
+    Reader of a packed catalog, mapping the file into memory::
+
+        with PackedCatalog(Path("build/catalog.pack")) as catalog:
+            spec = catalog.load("Employment/EscoOccupations_v1.0")
+    """
+
+    def __init__(self, path: Path):
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a packed catalog")
+        index_end = _HEADER.size + index_length
+        self._data_offset = index_end
+        index = json.loads(self._mmap[_HEADER.size : index_end])
+        self.entries: Dict[str, dict] = {entry["name"]: entry for entry in index}
+        # The views handed out by get(), by their ids, so closing can release them
+        self._views: "weakref.WeakValueDictionary[int, memoryview]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __enter__(self) -> "PackedCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the views of the specs still held and unmap the file
+        """
+        for view in list(self._views.values()):
+            # A view with buffers exported from it can't be released
+            with suppress(BufferError):
+                view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views or buffers made from the views of get() are still alive, the
+            # file stays mapped until both they and the catalog are freed
+            pass
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def names(self) -> List[str]:
+        return list(self.entries)
+
+    def get(self, name: str) -> memoryview:
+        """
+        Get the spec of a product as it is stored, without copying it
+
+        :param name: Name of the product, e.g. "Employment/EscoOccupations_v1.0"
+        :return: View of the bytes of the spec in the mapped file. Closing the catalog
+        releases it, after which it can't be used anymore.
+        """
+        entry = self.entries[name]
+        start = self._data_offset + entry["offset"]
+        with memoryview(self._mmap) as mapped:
+            view = mapped[start : start + entry["length"]]
+        self._views[id(view)] = view
+        return view
+
+    def load(self, name: str, verify: bool = False) -> dict:
+        """
+        Parse the spec of a product
+
+        :param name: Name of the product
+        :param verify: Check the hash of the spec before parsing it
+        """
+        view = self.get(name)
+        try:
+            if verify:
+                digest = hashlib.sha256(view).hexdigest()
+                if digest != self.entries[name]["sha256"]:
+                    raise ValueError(f"The spec of {name} is corrupted")
+            return json.loads(bytes(view))
+        finally:
+            view.release()
+
+
+@cli.command()
+def pack(
+    src: Path = Argument(
+        ...,
+        help="Path to definitions in JSON format",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    out_file: Path = Argument(..., help="Path of the packed catalog to write"),
+):
+    """
+    Pack all the specs into a single file
+    """
+    written = write_catalog(src, out_file)
+    print(f"{'Wrote' if written else 'Unchanged'} {out_file}")
+
+
+@cli.command()
+def show(
+    catalog_file: Path = Argument(
+        ..., help="Path of the packed catalog", exists=True, dir_okay=False
+    ),
+    only: Optional[str] = Option(
+        None, "--only", help="Only show the products whose names start with this"
+    ),
+):
+    """
+    List the products in a packed catalog
+    """
+    with PackedCatalog(catalog_file) as catalog:
+        rows = [
+            [name, e["version"], e["offset"], e["length"], e["sha256"][:12]]
+            for name, e in catalog.entries.items()
+            if only is None or name.startswith(only)
+        ]
+    print_table(["Product", "Version", "Offset", "Length", "Hash"], rows)
+
+
+if __name__ == "__main__":
+    cli()
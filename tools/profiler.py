@@ -0,0 +1,266 @@
+"""
+Profile the conversion of the definitions stage by stage.
+
+Every definition is converted in this process, and the time spent in each stage is
+recorded exclusively, i.e. the time of a nested stage is not counted in its parent:
+
+- import: executing the module of the definition, apart from the classes below
+- enums: creating the enum classes and the code types of the shared code lists
+- models: constructing the pydantic models
+- schema: generating the JSON schemas of the models
+- openapi: the rest of building the OpenAPI spec with FastAPI
+- serialize: formatting the spec to canonical JSON
+- write: comparing to and writing the output file
+"""
+import enum
+import functools
+import hashlib
+import json
+import time
+import traceback
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from definition_tooling.converter import export_openapi_spec
+from definition_tooling.converter.converter import styled_error
+from definition_tooling.log import print_table
+from pydantic import ValidationError
+from pydantic._internal._model_construction import ModelMetaclass
+from pydantic.json_schema import GenerateJsonSchema
+from rich import print
+from typer import Argument, Option, Typer
+
+import tools.convert
+from tools.convert import (
+    import_codelists_base,
+    load_definition_module,
+    sort_unique_items,
+    write_spec,
+)
+from tools.jsonformat import dumps
+from tools.manifest import tooling_version
+from tools.sources import definition_name, find_definitions, output_path
+
+cli = Typer()
+
+STAGES = ["import", "enums", "models", "schema", "openapi", "serialize", "write"]
+
+
+class StageTimer:
+    """
+    Accumulates the time spent in each stage, excluding the nested stages
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = defaultdict(float)
+        self._nested: List[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def reset(self) -> Dict[str, float]:
+        totals = {name: self.totals.get(name, 0.0) for name in STAGES}
+        self.totals.clear()
+        return totals
+
+
+@contextmanager
+def instrument(owner: Any, attr: str, timer: StageTimer, stage: str) -> Iterator[None]:
+    """
+    Temporarily time every call of a function of a class or a module as a stage
+    """
+    original = owner.__dict__[attr]
+    is_static = isinstance(original, staticmethod)
+    func = original.__func__ if is_static else original
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        with timer.stage(stage):
+            return func(*args, **kwargs)
+
+    setattr(owner, attr, staticmethod(timed) if is_static else timed)
+    try:
+        yield
+    finally:
+        setattr(owner, attr, original)
+
+
+def component_sizes(openapi: dict) -> Dict[str, Tuple[str, int]]:
+    """
+    Get the hash of the schema of every component of the spec, with its size
+    """
+    sizes = {}
+    for name, schema in openapi.get("components", {}).get("schemas", {}).items():
+        content = dumps(schema).encode("utf-8")
+        sizes[name] = (hashlib.sha256(content).hexdigest(), len(content))
+    return sizes
+
+
+def profile_definitions(src: Path, dest: Path) -> dict:
+    """
+    Convert all the definitions, timing each stage of the conversion
+
+    :param src: Path to python sources of definitions
+    :param dest: Path to definitions output
+    :return: The report with the timings per definition and the components of the
+    specs aggregated over all the definitions
+    """
+    timer = StageTimer()
+    definitions = {}
+    components = defaultdict(lambda: {"definitions": [], "variants": set(), "bytes": 0})
+
+    with ExitStack() as stack:
+        stack.enter_context(instrument(enum.EnumMeta, "__new__", timer, "enums"))
+        # The shared code lists are mostly code types, which are not enums
+        codelists_base = import_codelists_base(src)
+        if codelists_base:
+            stack.enter_context(instrument(codelists_base, "code_type", timer, "enums"))
+        stack.enter_context(instrument(ModelMetaclass, "__new__", timer, "models"))
+        stack.enter_context(
+            instrument(GenerateJsonSchema, "generate_definitions", timer, "schema")
+        )
+        stack.enter_context(instrument(tools.convert, "dumps", timer, "serialize"))
+
+        for p in find_definitions(src):
+            name = definition_name(p, src)
+            try:
+                with timer.stage("import"):
+                    module = load_definition_module(p, src)
+            except ValidationError as e:
+                print(styled_error("Validation error", p))
+                print(e)
+                timer.reset()
+                continue
+            except Exception:
+                # E.g. a syntax error, the other definitions are still profiled
+                print(styled_error("Error importing the definition", p))
+                print(traceback.format_exc())
+                timer.reset()
+                continue
+            definition = getattr(module, "DEFINITION", None)
+            if definition is None:
+                print(styled_error("Error finding DEFINITION variable", p))
+                timer.reset()
+                continue
+
+            try:
+                with timer.stage("openapi"):
+                    openapi = sort_unique_items(export_openapi_spec(definition, name))
+            except Exception:
+                print(styled_error("Error exporting the OpenAPI spec", p))
+                print(traceback.format_exc())
+                timer.reset()
+                continue
+            out_file = output_path(p, src, dest)
+            with timer.stage("write"):
+                write_spec(out_file, openapi)
+
+            stages = timer.reset()
+            definitions[name] = {
+                "stages": stages,
+                "total": sum(stages.values()),
+                "bytes": out_file.stat().st_size,
+            }
+            for component, (digest, size) in component_sizes(openapi).items():
+                entry = components[component]
+                entry["definitions"].append(name)
+                entry["variants"].add(digest)
+                entry["bytes"] += size
+
+    return {
+        "tooling": tooling_version(),
+        "stages": {
+            stage: sum(d["stages"][stage] for d in definitions.values())
+            for stage in STAGES
+        },
+        "definitions": definitions,
+        "components": {
+            name: {
+                "definitions": entry["definitions"],
+                "count": len(entry["definitions"]),
+                "variants": len(entry["variants"]),
+                "bytes": entry["bytes"],
+            }
+            for name, entry in sorted(components.items())
+        },
+    }
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+def print_report(report: dict, limit: int) -> None:
+    definitions = sorted(
+        report["definitions"].items(), key=lambda item: item[1]["total"], reverse=True
+    )
+    rows = [
+        [name, *[_ms(d["stages"][stage]) for stage in STAGES], _ms(d["total"])]
+        for name, d in definitions[:limit]
+    ]
+    rows.append(
+        [
+            "All definitions",
+            *[_ms(report["stages"][stage]) for stage in STAGES],
+            _ms(sum(report["stages"].values())),
+        ]
+    )
+    print_table(["Definition (ms)", *STAGES, "total"], rows)
+
+    # The components repeated in several specs, by the total size of their copies
+    duplicated = sorted(
+        [(name, c) for name, c in report["components"].items() if c["count"] > 1],
+        key=lambda item: item[1]["bytes"],
+        reverse=True,
+    )
+    print_table(
+        ["Component", "Definitions", "Variants", "Bytes"],
+        [
+            [name, c["count"], c["variants"], c["bytes"]]
+            for name, c in duplicated[:limit]
+        ],
+    )
+
+
+@cli.command()
+def profile(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions output",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    output: Optional[Path] = Option(
+        None, "--output", "-o", help="Write the report in JSON format to a file"
+    ),
+    limit: int = Option(20, "--limit", min=1, help="Number of rows to print"),
+):
+    report = profile_definitions(src, dest)
+    print_report(report, limit)
+    if output:
+        output.write_text(
+            json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,69 @@
+import re
+from pathlib import Path
+from typing import List
+
+# Package of the code lists shared by the definitions, it's not a definition itself
+CODELISTS_PACKAGE = "codelists"
+
+_CODELISTS_IMPORT = re.compile(
+    rf"^\s*(?:from|import)\s+({CODELISTS_PACKAGE}(?:\.\w+)*)", re.MULTILINE
+)
+
+
+def find_definitions(src: Path) -> List[Path]:
+    """
+    Find all python sources of definitions in a deterministic order
+
+    :param src: Path to python sources of definitions
+    :return: Sorted list of definition source files
+    """
+    codelists = src / CODELISTS_PACKAGE
+    return sorted(p for p in src.glob("**/*.py") if codelists not in p.parents)
+
+
+def codelist_dependencies(path: Path, src: Path) -> List[Path]:
+    """
+    Find the sources of the shared code list modules a definition imports, directly
+    or through other code list modules
+
+    :param path: Path to the definition source
+    :param src: Path to python sources of definitions
+    :return: Sorted list of the code list sources
+    """
+    dependencies = set()
+    pending = [path]
+    while pending:
+        text = pending.pop().read_text(encoding="utf-8")
+        for module in _CODELISTS_IMPORT.findall(text):
+            base = src.joinpath(*module.split("."))
+            candidates = [base.with_suffix(".py"), base / "__init__.py"]
+            if module == CODELISTS_PACKAGE:
+                # The package imports the modules of the enums on demand
+                candidates.extend(base.glob("*.py"))
+            for candidate in candidates:
+                if candidate.exists() and candidate not in dependencies:
+                    dependencies.add(candidate)
+                    pending.append(candidate)
+    return sorted(dependencies)
+
+
+def definition_name(path: Path, src: Path) -> str:
+    """
+    Get the definition name based on the file path, e.g. "AirQuality/Current_v1.0"
+    """
+    return path.relative_to(src).with_suffix("").as_posix()
+
+
+def module_name(name: str) -> str:
+    """
+    Generate a python module name based on the definition name, the same way the
+    definition tooling does it
+    """
+    return name.replace(".", "_").replace("/", ".")
+
+
+def output_path(path: Path, src: Path, dest: Path) -> Path:
+    """
+    Get the path of the OpenAPI spec generated from the given definition source
+    """
+    return (dest / path.relative_to(src)).with_suffix(".json")
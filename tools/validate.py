@@ -0,0 +1,226 @@
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from definition_tooling.log import print_error, print_success, print_table
+from definition_tooling.validator.cli import header, print_dashes
+from definition_tooling.validator.core import DefinitionValidator
+from definition_tooling.validator.errors import ValidatorError
+from rich import print
+from typer import Argument, Exit, Option, Typer
+
+from tools.codelist_refs import (
+    CODELISTS_DIR,
+    X_CODELIST,
+    CodeListNotFound,
+    resolve_spec,
+)
+from tools.jsonformat import dumps
+from tools.manifest import CACHE_DIR, file_hash, package_versions
+
+try:
+    from openapi_to_fastapi.routes import SpecRouter
+    from openapi_to_fastapi.validator.core import DefaultValidator
+except ImportError:  # pragma: no cover
+    # openapi-to-fastapi is optional, the specs are then only validated with the
+    # definition validator
+    SpecRouter = None
+
+cli = Typer()
+
+VALIDATION_CACHE_PATH = CACHE_DIR / "validation.json"
+
+# Packages whose validators are run on the specs
+VALIDATOR_PACKAGES = ["ioxio-data-product-definition-tooling", "openapi-to-fastapi"]
+
+
+def validator_version() -> str:
+    return ";".join(package_versions(VALIDATOR_PACKAGES))
+
+
+class ValidationCache:
+    """
+    Record of the specs that passed the validation, by the hash of their contents.
+
+    Only passing specs are recorded, so failing ones are always validated again. The
+    cache is discarded as a whole when the version of the validators changes.
+    """
+
+    def __init__(self, path: Path, validator: str, passed: Dict[str, str]):
+        self.path = path
+        self.validator = validator
+        self.passed = passed
+
+    @classmethod
+    def load(cls, path: Path = VALIDATION_CACHE_PATH) -> "ValidationCache":
+        validator = validator_version()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict) or data.get("validator") != validator:
+            return cls(path, validator, {})
+        return cls(path, validator, data.get("passed", {}))
+
+    def has_passed(self, name: str, spec_hash: str) -> bool:
+        return self.passed.get(name) == spec_hash
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "validator": self.validator,
+            "passed": dict(sorted(self.passed.items())),
+        }
+        self.path.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+
+
+@contextmanager
+def resolved_codelists(spec_path: Path, root_path: Path) -> Iterator[Tuple[Path, Path]]:
+    """
+    Resolve the references to external code lists of a spec through the local code
+    list cache, into a temporary root of definitions with the spec at the same path
+
+    :return: The paths to the spec and the root of definitions to validate
+    """
+    data = spec_path.read_bytes()
+    if X_CODELIST.encode() not in data:
+        yield spec_path, root_path
+        return
+
+    with TemporaryDirectory() as tmp:
+        resolved_path = Path(tmp) / spec_path.relative_to(root_path)
+        resolved_path.parent.mkdir(parents=True, exist_ok=True)
+        resolved_path.write_text(
+            dumps(resolve_spec(json.loads(data))), encoding="utf-8"
+        )
+        yield resolved_path, Path(tmp)
+
+
+def validate_spec(spec_path: Path, root_path: Path) -> Optional[str]:
+    """
+    Validate a spec with the definition validator, and with the openapi-to-fastapi
+    validator if it's installed
+
+    :param spec_path: Path to the actual definition
+    :param root_path: Path to the root of definitions
+    :return: Description of the error, or None if the spec is valid
+    """
+    try:
+        with resolved_codelists(spec_path, root_path) as (spec_path, root_path):
+            DefinitionValidator(spec_path=spec_path, root_path=root_path).validate()
+            if SpecRouter is not None:
+                SpecRouter(spec_path, [DefaultValidator])
+    except Exception as exc:
+        if isinstance(exc, (ValidatorError, CodeListNotFound)):
+            detail = ": " + str(exc) if str(exc) else ""
+            return f"{exc.__class__.__name__}{detail}"
+        return "\n" + traceback.format_exc()
+    return None
+
+
+def validate_in_pool(
+    spec_paths: List[Path], root_path: Path, jobs: int
+) -> Iterator[Optional[str]]:
+    """
+    Validate the specs in a pool of worker processes
+
+    :return: Iterator of the errors in the same order as the spec paths
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(spec_paths) < 2:
+        for spec_path in spec_paths:
+            yield validate_spec(spec_path, root_path)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(spec_paths))) as executor:
+        yield from executor.map(validate_spec, spec_paths, repeat(root_path))
+
+
+def validate_specs(
+    path: Path, jobs: int = 1, cache_path: Path = VALIDATION_CACHE_PATH
+) -> int:
+    """
+    Validate the specs that are new or changed since they last passed the validation
+
+    :param path: Path to directory with definitions in JSON format
+    :param jobs: Number of worker processes to validate with, 0 to use one per CPU
+    :param cache_path: Path to the cache of passed validations
+    :return: Exit code, 1 if any spec failed the validation
+    """
+    with header():
+        print(f"OpenAPI specs root path: {path}")
+
+    cache = ValidationCache.load(cache_path)
+    spec_paths = [
+        p
+        for p in sorted(path.glob("**/*.json"))
+        if CODELISTS_DIR not in p.relative_to(path).parts
+    ]
+    names = {p: p.relative_to(path).as_posix() for p in spec_paths}
+    hashes = {p: file_hash(p) for p in spec_paths}
+    pending = [p for p in spec_paths if not cache.has_passed(names[p], hashes[p])]
+
+    passed, failed = 0, 0
+    for spec_path, error in zip(pending, validate_in_pool(pending, path, jobs)):
+        print(f"File: {spec_path}")
+        if error:
+            print(error)
+            print_error("[FAILED]")
+            cache.passed.pop(names[spec_path], None)
+            failed += 1
+        else:
+            print_success("[PASSED]")
+            cache.passed[names[spec_path]] = hashes[spec_path]
+            passed += 1
+        print_dashes("-")
+
+    # Forget the specs that no longer exist
+    existing = set(names.values())
+    cache.passed = {name: h for name, h in cache.passed.items() if name in existing}
+    cache.save()
+
+    cached = len(spec_paths) - len(pending)
+    print_table(
+        ["Summary", "#"],
+        [
+            ["Passed", passed],
+            ["Cached", cached],
+            ["Failed", failed],
+            ["Total", passed + cached + failed],
+        ],
+        "green" if not failed else "red",
+    )
+
+    return 1 if failed else 0
+
+
+@cli.command()
+def validate(
+    path: Path = Argument(
+        ...,
+        help="Path to directory with definitions in JSON format",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    jobs: int = Option(
+        1,
+        "--jobs",
+        "-j",
+        min=0,
+        help="Number of worker processes to validate with, 0 to use one per CPU",
+    ),
+):
+    raise Exit(code=validate_specs(path, jobs=jobs))
+
+
+if __name__ == "__main__":
+    cli()
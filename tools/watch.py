@@ -0,0 +1,93 @@
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, Tuple
+
+from definition_tooling.log import print_error
+from rich import print
+from typer import Argument, Option, Typer
+
+from tools.convert import convert_data_product_definitions
+
+cli = Typer()
+
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+def take_snapshot(src: Path) -> Snapshot:
+    """
+    Collect the modification time and size of every python file in the sources
+    """
+    snapshot = {}
+    for p in src.glob("**/*.py"):
+        try:
+            stat = p.stat()
+        except FileNotFoundError:
+            # Removed while we were looking at it
+            continue
+        snapshot[p] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def watch_definitions(src: Path, dest: Path, interval: float) -> None:
+    """
+    Convert the definitions whenever their sources change, until interrupted.
+
+    The process stays alive between the conversions, so pydantic, FastAPI and the
+    definition tooling are imported only once, and each change only costs importing
+    and converting the modified definitions.
+
+    :param src: Path to python sources of definitions
+    :param dest: Path to definitions output
+    :param interval: Seconds to wait between checking the sources for changes
+    """
+    convert_data_product_definitions(src, dest)
+    snapshot = take_snapshot(src)
+    print(f"Watching {src} for changes, press Ctrl+C to stop")
+
+    while True:
+        time.sleep(interval)
+        current = take_snapshot(src)
+        if current == snapshot:
+            continue
+        snapshot = current
+
+        start = time.perf_counter()
+        try:
+            convert_data_product_definitions(src, dest)
+        except Exception:
+            # Keep watching, the next save will most likely fix it
+            print_error(traceback.format_exc())
+            continue
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"[{time.strftime('%H:%M:%S')}] Done in {elapsed:.0f} ms")
+
+
+@cli.command()
+def watch(
+    src: Path = Argument(
+        ...,
+        help="Path to python sources of definitions",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    dest: Path = Argument(
+        ...,
+        help="Path to definitions output",
+        dir_okay=True,
+        file_okay=False,
+        exists=True,
+    ),
+    interval: float = Option(
+        0.1, "--interval", min=0.01, help="Seconds between checks for changes"
+    ),
+):
+    try:
+        watch_definitions(src, dest, interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    cli()